@@ -0,0 +1,193 @@
+import math
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, field_validator
+
+from app.domain.fii_domain import FiiDomain
+from app.domain.fii_snapshot import FiiSnapshot
+
+OPERATORS = (">", ">=", "<", "<=")
+
+
+class FiiAlertRule(BaseModel):
+    id: str
+    field: str
+    operator: str
+    threshold: float
+    ticker: Optional[str] = None
+    segment: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    @field_validator("field")
+    @classmethod
+    def _known_field(cls, value: str) -> str:
+        if value not in FiiSnapshot.NUMERIC_FIELDS:
+            raise ValueError(f"field must be one of {', '.join(FiiSnapshot.NUMERIC_FIELDS)}")
+        return value
+
+    @field_validator("operator")
+    @classmethod
+    def _known_operator(cls, value: str) -> str:
+        if value not in OPERATORS:
+            raise ValueError(f"operator must be one of {', '.join(OPERATORS)}")
+        return value
+
+    @field_validator("threshold")
+    @classmethod
+    def _finite_threshold(cls, value: float) -> float:
+        if not math.isfinite(value):
+            raise ValueError("threshold must be a finite number")
+        return value
+
+    @field_validator("ticker", "segment")
+    @classmethod
+    def _normalized_scope(cls, value: Optional[str]) -> Optional[str]:
+        return (value.strip().lower() or None) if value is not None else None
+
+    @property
+    def scope(self) -> Tuple[str, str]:
+        if self.ticker is not None:
+            return ("ticker", self.ticker)
+        if self.segment is not None:
+            return ("segment", self.segment)
+        return ("all", "")
+
+
+class FiiAlert(BaseModel):
+    id: str
+    rule_id: str
+    ticker: str
+    field: str
+    operator: str
+    threshold: float
+    value: float
+    previous_value: Optional[float] = None
+    fired_at: datetime
+
+
+class FiiAlertPage(BaseModel):
+    alerts: List[FiiAlert]
+    next_after: Optional[str] = None
+    has_more: bool
+
+
+def _value(fii: Optional[FiiDomain], field: str) -> Optional[float]:
+    if fii is None or getattr(fii, field) is None:
+        return None
+
+    value = float(getattr(fii, field))
+    return value if math.isfinite(value) else None
+
+
+class _SortedThresholds:
+    """Rule ids of one scope, field and operator kept sorted by threshold."""
+
+    def __init__(self) -> None:
+        self.thresholds: List[float] = []
+        self.rule_ids: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.thresholds)
+
+    def add(self, threshold: float, rule_id: str) -> None:
+        position = bisect_right(self.thresholds, threshold)
+        self.thresholds.insert(position, threshold)
+        self.rule_ids.insert(position, rule_id)
+
+    def remove(self, threshold: float, rule_id: str) -> None:
+        position = bisect_left(self.thresholds, threshold)
+        while position < len(self.thresholds) and self.thresholds[position] == threshold:
+            if self.rule_ids[position] == rule_id:
+                del self.thresholds[position]
+                del self.rule_ids[position]
+                return
+            position += 1
+
+    def crossed(self, operator: str, previous: Optional[float], current: float) -> List[str]:
+        """Rules whose condition is false for ``previous`` and true for ``current``, found by bisection."""
+        thresholds = self.thresholds
+        if operator == ">":
+            # previous <= t < current
+            low = 0 if previous is None else bisect_left(thresholds, previous)
+            high = bisect_left(thresholds, current)
+        elif operator == ">=":
+            # previous < t <= current
+            low = 0 if previous is None else bisect_right(thresholds, previous)
+            high = bisect_right(thresholds, current)
+        elif operator == "<":
+            # current < t <= previous
+            low = bisect_right(thresholds, current)
+            high = len(thresholds) if previous is None else bisect_right(thresholds, previous)
+        else:
+            # current <= t < previous
+            low = bisect_left(thresholds, current)
+            high = len(thresholds) if previous is None else bisect_left(thresholds, previous)
+
+        return self.rule_ids[low:high] if low < high else []
+
+
+class FiiAlertIndex:
+    """Alert rules indexed by scope, field and operator, each with its thresholds sorted.
+
+    Alerts are edge triggered: a rule fires when a write moves its field across the threshold, not on
+    every write that keeps satisfying it. A write only visits the ticker's, the segment's and the global
+    scopes, and within them finds the crossed thresholds by bisection, so the work depends on the fields
+    that changed and the rules that fire, not on how many rules are registered.
+    """
+
+    def __init__(self, rules: Optional[List[FiiAlertRule]] = None) -> None:
+        self.rules: Dict[str, FiiAlertRule] = {}
+        self._index: Dict[Tuple[str, str], Dict[Tuple[str, str], _SortedThresholds]] = {}
+        for rule in rules or []:
+            self.add(rule)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def add(self, rule: FiiAlertRule) -> None:
+        if rule.id in self.rules:
+            self.remove(rule.id)
+
+        self.rules[rule.id] = rule
+        fields = self._index.setdefault(rule.scope, {})
+        fields.setdefault((rule.field, rule.operator), _SortedThresholds()).add(rule.threshold, rule.id)
+
+    def remove(self, rule_id: str) -> Optional[FiiAlertRule]:
+        rule = self.rules.pop(rule_id, None)
+        if rule is None:
+            return None
+
+        fields = self._index[rule.scope]
+        thresholds = fields[(rule.field, rule.operator)]
+        thresholds.remove(rule.threshold, rule.id)
+        if not thresholds:
+            del fields[(rule.field, rule.operator)]
+        if not fields:
+            del self._index[rule.scope]
+
+        return rule
+
+    def matches(
+        self, previous: Optional[FiiDomain], current: FiiDomain
+    ) -> Iterator[Tuple[FiiAlertRule, float, Optional[float]]]:
+        """Yields ``(rule, value, previous_value)`` for every rule the write fires."""
+        scopes = [
+            ("ticker", current.ticker.strip().lower()),
+            ("segment", (current.segment or "").strip().lower()),
+            ("all", ""),
+        ]
+        values: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+
+        for scope in scopes:
+            for (field, operator), thresholds in self._index.get(scope, {}).items():
+                if field not in values:
+                    values[field] = (_value(previous, field), _value(current, field))
+
+                before, after = values[field]
+                if after is None or before == after:
+                    continue
+
+                for rule_id in thresholds.crossed(operator, before, after):
+                    yield self.rules[rule_id], after, before
@@ -0,0 +1,105 @@
+from datetime import date
+from typing import Dict, List, Mapping
+
+import numpy as np
+from pydantic import BaseModel
+
+from app.domain.fii_history import FiiHistorySeries
+from app.domain.fii_history_panel import FiiHistoryPanel
+from app.domain.fii_validator import FiiValidator
+
+
+class FiiBacktestPerformance(BaseModel):
+    profile: str
+    average_holdings: float
+    total_return: float
+    price_return: float
+    dividend_yield: float
+    annualized_return: float
+    excess_return: float
+    holdings: List[int]
+    monthly_returns: List[float]
+
+
+class FiiBacktestResult(BaseModel):
+    start: date
+    end: date
+    months: int
+    tickers: int
+    universe: FiiBacktestPerformance
+    profiles: List[FiiBacktestPerformance]
+
+
+class FiiBacktester:
+    """Replays rule profiles over a history panel, rebalancing an equal-weight portfolio every month.
+
+    At each month end a profile selects the FIIs passing its rules with that month's values; the
+    selection earns the next month's price change plus the dividend paid over the month-end price.
+    Every month and FII is evaluated at once through ``FiiValidator.mask`` on 2D columns. The
+    universe benchmark holds every FII with prices in both months. Returns are percentages.
+    """
+
+    UNIVERSE = "universe"
+
+    def run(
+        self, panel: FiiHistoryPanel, static_columns: Mapping[str, np.ndarray], profiles: Mapping[str, FiiValidator]
+    ) -> FiiBacktestResult:
+        if len(panel.months) < 2:
+            raise ValueError("A backtest needs at least two months of history")
+
+        prices = panel.values["last_price"]
+        dividends = panel.values["last_dividend"]
+        current, following = prices[:-1], prices[1:]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tradable = np.isfinite(current) & (current > 0) & np.isfinite(following)
+            price_returns = np.where(tradable, following / current - 1, 0.0)
+            dividend_yields = np.where(tradable & np.isfinite(dividends[1:]), dividends[1:] / current, 0.0)
+
+        columns: Dict[str, np.ndarray] = {field: panel.values[field][:-1] for field in FiiHistorySeries.FIELDS}
+        columns.update({field: values[np.newaxis, :] for field, values in static_columns.items()})
+        as_of = panel.month_ends[:-1, np.newaxis]
+
+        universe = self._performance(self.UNIVERSE, tradable, price_returns, dividend_yields)
+        results = [
+            self._performance(name, validator.mask(columns, as_of) & tradable, price_returns, dividend_yields)
+            for name, validator in profiles.items()
+        ]
+        for result in results:
+            result.excess_return = round(result.total_return - universe.total_return, 4)
+
+        return FiiBacktestResult(
+            start=panel.month_ends[0].item(),
+            end=panel.month_ends[-1].item(),
+            months=len(panel.months) - 1,
+            tickers=len(panel.tickers),
+            universe=universe,
+            profiles=results,
+        )
+
+    @staticmethod
+    def _performance(
+        name: str, selected: np.ndarray, price_returns: np.ndarray, dividend_yields: np.ndarray
+    ) -> FiiBacktestPerformance:
+        holdings = selected.sum(axis=1)
+        weights = np.divide(
+            selected, holdings[:, np.newaxis], out=np.zeros(selected.shape), where=holdings[:, np.newaxis] > 0
+        )
+        monthly_price = (weights * price_returns).sum(axis=1)
+        monthly_dividends = (weights * dividend_yields).sum(axis=1)
+        monthly = monthly_price + monthly_dividends
+
+        total = np.prod(1 + monthly) - 1
+        months = len(monthly)
+
+        return FiiBacktestPerformance(
+            profile=name,
+            average_holdings=round(float(holdings.mean()), 2),
+            total_return=round(float(total) * 100, 4),
+            price_return=round(float(np.prod(1 + monthly_price) - 1) * 100, 4),
+            dividend_yield=round(float(monthly_dividends.mean()) * 12 * 100, 4),
+            annualized_return=round(float((1 + total) ** (12 / months) - 1) * 100, 4),
+            excess_return=0.0,
+            holdings=holdings.astype(int).tolist(),
+            monthly_returns=np.round(monthly * 100, 4).tolist(),
+        )
@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from app.domain.fii_domain import FiiDomain
+
+# derived values such as rolling_stats are not part of a scrape, so they never count as a change
+TRACKED_FIELDS = tuple(field for field in FiiDomain.model_fields if field != "rolling_stats")
+
+
+class FiiFieldChange(BaseModel):
+    field: str
+    previous: Any = None
+    current: Any = None
+
+
+class FiiChange(BaseModel):
+    version: int = 0
+    ticker: str
+    kind: str
+    changed_at: datetime
+    fields: List[FiiFieldChange]
+
+
+class FiiChangeEvent(BaseModel):
+    """Compact form of a change for push clients: the current value of every changed field."""
+
+    version: int
+    ticker: str
+    kind: str
+    values: Dict[str, Any]
+
+    @classmethod
+    def of(cls, change: FiiChange) -> "FiiChangeEvent":
+        return cls(
+            version=change.version,
+            ticker=change.ticker,
+            kind=change.kind,
+            values={field_change.field: field_change.current for field_change in change.fields},
+        )
+
+
+class FiiChangePage(BaseModel):
+    since: int
+    next_since: int
+    latest_version: int
+    has_more: bool
+    changes: List[FiiChange]
+
+
+def diff_fii(previous: Optional[FiiDomain], current: FiiDomain) -> List[FiiFieldChange]:
+    """Fields whose value differs between two writes of a FII, with JSON values as served by the API."""
+    before = previous.model_dump(mode="json", include=set(TRACKED_FIELDS)) if previous is not None else {}
+    after = current.model_dump(mode="json", include=set(TRACKED_FIELDS))
+
+    return [
+        FiiFieldChange(field=field, previous=before.get(field), current=after[field])
+        for field in TRACKED_FIELDS
+        if previous is None or before[field] != after[field]
+    ]
+
+
+def change_of(previous: Optional[FiiDomain], current: FiiDomain, changed_at: datetime) -> Optional[FiiChange]:
+    fields = diff_fii(previous, current)
+    if previous is not None and not fields:
+        return None
+
+    return FiiChange(
+        ticker=current.ticker,
+        kind="added" if previous is None else "updated",
+        changed_at=changed_at,
+        fields=fields,
+    )
@@ -0,0 +1,52 @@
+import base64
+import binascii
+import json
+from typing import Union
+
+import numpy as np
+from pydantic import BaseModel, ValidationError
+
+from app.domain.fii_snapshot import FiiSnapshot
+
+
+class FiiCursor(BaseModel):
+    """Keyset position in a sorted listing: the sort it belongs to and the key of the last row returned.
+
+    The next page starts after that key in the current order, so a cursor keeps working across data versions
+    even when the row it points at changed or disappeared.
+    """
+
+    sort: str
+    descending: bool
+    value: Union[float, str]
+    ticker: str
+
+    @classmethod
+    def after(cls, snapshot: FiiSnapshot, position: int, sort: str, descending: bool) -> "FiiCursor":
+        value = snapshot.columns[sort][position]
+        return cls(
+            sort=sort,
+            descending=descending,
+            value=value if isinstance(value, str) else float(value),
+            ticker=snapshot.columns["ticker"][position],
+        )
+
+    @classmethod
+    def decode(cls, token: str) -> "FiiCursor":
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            return cls.model_validate(json.loads(base64.urlsafe_b64decode(padded)))
+        except (binascii.Error, UnicodeDecodeError, ValueError, ValidationError):
+            raise ValueError("invalid cursor")
+
+    def encode(self) -> str:
+        payload = json.dumps(self.model_dump(), separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+    def start(self, snapshot: FiiSnapshot, order: np.ndarray) -> int:
+        """Index in ``order`` of the first row sorting after this cursor."""
+        values = snapshot.columns[self.sort][order]
+        tickers = snapshot.columns["ticker"][order]
+        before = values > self.value if self.descending else values < self.value
+        # rows at or before the cursor are a prefix of the order, so counting them gives the start
+        return int((before | ((values == self.value) & (tickers <= self.ticker))).sum())
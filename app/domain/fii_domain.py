@@ -5,6 +5,13 @@ from typing import Optional
 from pydantic import BaseModel
 
 
+class FiiRollingStats(BaseModel):
+    observations: int
+    price_moving_average: Optional[float] = None
+    dividend_volatility: Optional[float] = None
+    dy_trend: Optional[float] = None
+
+
 class FiiDomain(BaseModel):
     ticker: str
     p_vp: Decimal
@@ -17,3 +24,9 @@ class FiiDomain(BaseModel):
     dy_12: Decimal
     start_date: Optional[date] = None
     dialy_liquidity: Optional[Decimal] = Decimal(0)
+    rolling_stats: Optional[FiiRollingStats] = None
+
+
+def ticker_key(ticker: str) -> str:
+    """Case-insensitive key of a ticker; the gateway stores them lower-cased, clients usually write them upper."""
+    return ticker.strip().lower()
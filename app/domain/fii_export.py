@@ -0,0 +1,152 @@
+import csv
+import io
+import json
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Sequence, Tuple
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional: only the Parquet export needs it
+    pyarrow = None
+
+# column name and kind: "text", "number", "date" or "datetime"
+FiiExportColumn = Tuple[str, str]
+
+
+class FiiExportUnavailableError(RuntimeError):
+    pass
+
+
+class FiiExportWriter(ABC):
+    """Turns chunks of rows into bytes of one export format, so a whole export never sits in memory.
+
+    Rows are tuples in ``columns`` order, with Decimal, float, date, datetime, str or None values.
+    """
+
+    media_type = "application/octet-stream"
+    extension = ""
+
+    def __init__(self, columns: Sequence[FiiExportColumn]) -> None:
+        self.columns = tuple(columns)
+        self.names = [name for name, _ in self.columns]
+
+    def header(self) -> bytes:
+        return b""
+
+    @abstractmethod
+    def write(self, rows: List[tuple]) -> bytes:
+        pass
+
+    def close(self) -> bytes:
+        return b""
+
+
+class NdjsonExportWriter(FiiExportWriter):
+    media_type = "application/x-ndjson"
+    extension = "ndjson"
+
+    def write(self, rows: List[tuple]) -> bytes:
+        lines = [json.dumps(dict(zip(self.names, row)), default=_json_value, ensure_ascii=False) for row in rows]
+        return "".join(f"{line}\n" for line in lines).encode()
+
+
+class CsvExportWriter(FiiExportWriter):
+    media_type = "text/csv; charset=utf-8"
+    extension = "csv"
+
+    def header(self) -> bytes:
+        return self._lines([self.names])
+
+    def write(self, rows: List[tuple]) -> bytes:
+        return self._lines([["" if value is None else _text_value(value) for value in row] for row in rows])
+
+    @staticmethod
+    def _lines(rows: List[list]) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue().encode()
+
+
+class ParquetExportWriter(FiiExportWriter):
+    """One row group per chunk; the bytes of each group are handed out as soon as it is written."""
+
+    media_type = "application/vnd.apache.parquet"
+    extension = "parquet"
+
+    def __init__(self, columns: Sequence[FiiExportColumn]) -> None:
+        if pyarrow is None:
+            raise FiiExportUnavailableError("Parquet export needs the pyarrow package")
+
+        super().__init__(columns)
+        types = {
+            "text": pyarrow.string(),
+            "number": pyarrow.float64(),
+            "date": pyarrow.date32(),
+            "datetime": pyarrow.timestamp("s", tz="UTC"),
+        }
+        self.schema = pyarrow.schema([(name, types[kind]) for name, kind in self.columns])
+        self._sink = _StreamSink()
+        self._writer = pyarrow.parquet.ParquetWriter(self._sink, self.schema)
+
+    def write(self, rows: List[tuple]) -> bytes:
+        arrays = []
+        for index, (_, kind) in enumerate(self.columns):
+            values = [row[index] for row in rows]
+            if kind == "number":
+                values = [None if value is None else float(value) for value in values]
+            arrays.append(values)
+
+        self._writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self.schema))
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+class _StreamSink(io.RawIOBase):
+    """Write-only file whose bytes are taken out as they come; ``tell`` still counts everything written,
+    which the Parquet footer offsets rely on."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.position = 0
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self.position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+WRITERS = {writer.extension: writer for writer in (NdjsonExportWriter, CsvExportWriter, ParquetExportWriter)}
+
+
+def _json_value(value: Any) -> Any:
+    # Decimals keep their exact text, as in the JSON API
+    if isinstance(value, (Decimal, date, datetime)):
+        return _text_value(value)
+
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _text_value(value: Any) -> str:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+
+    return str(value)
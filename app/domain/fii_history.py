@@ -0,0 +1,122 @@
+import struct
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from app.domain.fii_domain import FiiDomain
+
+
+class FiiHistoryPoint(BaseModel):
+    scraped_at: datetime
+    last_price: float
+    last_dividend: float
+    p_vp: float
+    dy_12: float
+    last_12_month_evaluation: float
+    current_month_evaluation: float
+    dialy_liquidity: float
+
+
+class FiiHistorySeries:
+    """Append-only observations of one ticker stored as columns sorted by ``scraped_at``.
+
+    Timestamps are epoch seconds (UTC). ``encode`` stores every column as delta-encoded integers
+    (values in millionths) compressed with zlib, so slowly moving series take a few bytes per point.
+    """
+
+    FIELDS = (
+        "last_price",
+        "last_dividend",
+        "p_vp",
+        "dy_12",
+        "last_12_month_evaluation",
+        "current_month_evaluation",
+        "dialy_liquidity",
+    )
+    SCALE = 10**6
+    _HEADER = struct.Struct("<4sBI")
+    _MAGIC = b"FHS1"
+
+    def __init__(self, ticker: str, timestamps: np.ndarray, columns: Dict[str, np.ndarray]) -> None:
+        self.ticker = ticker
+        self.timestamps = timestamps
+        self.columns = columns
+
+    @classmethod
+    def empty(cls, ticker: str) -> "FiiHistorySeries":
+        return cls(ticker, np.empty(0, dtype=np.int64), {field: np.empty(0) for field in cls.FIELDS})
+
+    @classmethod
+    def concat(cls, ticker: str, series: Iterable["FiiHistorySeries"]) -> "FiiHistorySeries":
+        series = [item for item in series if len(item)]
+        if not series:
+            return cls.empty(ticker)
+
+        timestamps = np.concatenate([item.timestamps for item in series])
+        order = np.argsort(timestamps, kind="stable")
+        columns = {field: np.concatenate([item.columns[field] for item in series])[order] for field in cls.FIELDS}
+        return cls(ticker, timestamps[order], columns)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, fii: FiiDomain, scraped_at: datetime) -> "FiiHistorySeries":
+        """Returns a new series with the observation inserted in time order."""
+        timestamp = to_timestamp(scraped_at)
+        position = int(np.searchsorted(self.timestamps, timestamp, side="right"))
+        columns = {
+            field: np.insert(self.columns[field], position, float(getattr(fii, field) or 0)) for field in self.FIELDS
+        }
+        return FiiHistorySeries(self.ticker, np.insert(self.timestamps, position, timestamp), columns)
+
+    def between(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> "FiiHistorySeries":
+        """Observations with ``start <= scraped_at <= end``; slices share memory with this series."""
+        first = 0 if start is None else int(np.searchsorted(self.timestamps, to_timestamp(start), side="left"))
+        last = len(self) if end is None else int(np.searchsorted(self.timestamps, to_timestamp(end), side="right"))
+        columns = {field: values[first:last] for field, values in self.columns.items()}
+        return FiiHistorySeries(self.ticker, self.timestamps[first:last], columns)
+
+    def points(self) -> List[FiiHistoryPoint]:
+        columns = {field: self.columns[field].tolist() for field in self.FIELDS}
+        return [
+            FiiHistoryPoint(
+                scraped_at=datetime.fromtimestamp(timestamp, tz=timezone.utc),
+                **{field: columns[field][position] for field in self.FIELDS},
+            )
+            for position, timestamp in enumerate(self.timestamps.tolist())
+        ]
+
+    def encode(self) -> bytes:
+        encoded = [np.diff(self.timestamps, prepend=0).astype("<i8")]
+        for field in self.FIELDS:
+            scaled = np.rint(self.columns[field] * self.SCALE).astype(np.int64)
+            encoded.append(np.diff(scaled, prepend=0).astype("<i8"))
+
+        header = self._HEADER.pack(self._MAGIC, len(self.FIELDS), len(self))
+        return header + zlib.compress(b"".join(column.tobytes() for column in encoded))
+
+    @classmethod
+    def decode(cls, ticker: str, payload: bytes) -> "FiiHistorySeries":
+        magic, field_count, size = cls._HEADER.unpack_from(payload)
+        if magic != cls._MAGIC or field_count != len(cls.FIELDS):
+            raise ValueError(f"Unsupported history payload for FII {ticker}")
+
+        values = np.frombuffer(zlib.decompress(payload[cls._HEADER.size :]), dtype="<i8").reshape(field_count + 1, size)
+        restored = np.cumsum(values, axis=1)
+        columns = {field: restored[index + 1] / cls.SCALE for index, field in enumerate(cls.FIELDS)}
+        return cls(ticker, restored[0].astype(np.int64), columns)
+
+
+def as_utc(moment: datetime) -> datetime:
+    """Naive datetimes are taken to be UTC already; aware ones are converted to it."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+
+    return moment.astimezone(timezone.utc)
+
+
+def to_timestamp(moment: datetime) -> int:
+    return int(as_utc(moment).timestamp())
@@ -0,0 +1,69 @@
+from datetime import date
+from typing import Dict, List, Mapping
+
+import numpy as np
+
+from app.domain.fii_history import FiiHistorySeries
+
+
+class FiiHistoryPanel:
+    """Month-end values of many tickers as ``(months, tickers)`` matrices.
+
+    Each cell holds the last observation of that month. Months without a scrape repeat the previous value
+    for at most ``MAX_FILL_MONTHS``; older gaps stay NaN so delisted funds drop out instead of freezing.
+    """
+
+    MAX_FILL_MONTHS = 2
+
+    def __init__(self, months: np.ndarray, tickers: List[str], values: Dict[str, np.ndarray]) -> None:
+        self.months = months
+        self.tickers = tickers
+        self.values = values
+
+    @property
+    def month_ends(self) -> np.ndarray:
+        return (self.months + 1).astype("datetime64[D]") - np.timedelta64(1, "D")
+
+    @classmethod
+    def build(cls, histories: Mapping[str, FiiHistorySeries], start: date, end: date) -> "FiiHistoryPanel":
+        months = np.arange(np.datetime64(start, "M"), np.datetime64(end, "M") + 1)
+        tickers = list(histories)
+        values = {field: np.full((len(months), len(tickers)), np.nan) for field in FiiHistorySeries.FIELDS}
+
+        for column, ticker in enumerate(tickers):
+            series = histories[ticker]
+            if not len(series):
+                continue
+
+            rows = (series.timestamps.astype("datetime64[s]").astype("datetime64[M]") - months[0]).astype(np.int64)
+            # observations are sorted, so the last one of each month is where the month changes
+            last = np.append(rows[1:] != rows[:-1], True) & (rows >= 0) & (rows < len(months))
+            for field in FiiHistorySeries.FIELDS:
+                values[field][rows[last], column] = series.columns[field][last]
+
+        return cls(months, tickers, {field: cls._forward_fill(matrix) for field, matrix in values.items()})
+
+    @classmethod
+    def _forward_fill(cls, matrix: np.ndarray) -> np.ndarray:
+        rows = np.arange(matrix.shape[0])[:, np.newaxis]
+        observed = np.where(np.isnan(matrix), -1, rows)
+        latest = np.maximum.accumulate(observed, axis=0)
+        filled = np.take_along_axis(matrix, np.maximum(latest, 0), axis=0)
+        stale = (latest < 0) | (rows - latest > cls.MAX_FILL_MONTHS)
+        return np.where(stale, np.nan, filled)
+
+    def monthly_volatility(self, field: str, min_changes: int = 2) -> np.ndarray:
+        """Sample deviation of the month-over-month log changes of ``field`` per ticker.
+
+        Only changes between two positive months count; tickers with fewer than ``min_changes`` of them get NaN.
+        """
+        matrix = self.values[field]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            changes = np.diff(np.log(np.where(matrix > 0, matrix, np.nan)), axis=0)
+
+        observed = ~np.isnan(changes)
+        counts = observed.sum(axis=0)
+        mean = np.where(observed, changes, 0.0).sum(axis=0) / np.maximum(counts, 1)
+        squares = (np.where(observed, changes - mean, 0.0) ** 2).sum(axis=0)
+        volatility = np.sqrt(squares / np.maximum(counts - 1, 1))
+        return np.where(counts >= max(min_changes, 2), volatility, np.nan)
@@ -0,0 +1,120 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class FiiMonteCarloBands:
+    def __init__(self, percentiles: Sequence[float], income: np.ndarray, value: np.ndarray, paths: int) -> None:
+        self.percentiles = list(percentiles)
+        self.income = income
+        self.value = value
+        self.paths = paths
+
+
+class FiiMonteCarloSimulator:
+    """Samples lognormal dividend and price paths per FII and reduces them to portfolio percentile bands.
+
+    Every position follows an independent driftless geometric random walk with its own monthly
+    volatility. Paths are split into chunks whose size depends only on the problem, each seeded
+    from ``SeedSequence(seed).spawn``, so results are identical whatever the number of workers.
+    Chunks run on a shared process pool, which is reused across calls. Its workers are spawned rather than
+    forked: the pool is created lazily from a thread of the running server, and a fork would copy whatever
+    locks the event loop and the other threads hold at that moment.
+    """
+
+    CHUNK_ELEMENTS = 1_000_000
+    MAX_MONTHS = 30 * 12
+    MAX_PATHS = 100_000
+    _executor: Optional[ProcessPoolExecutor] = None
+    _executor_workers: Optional[int] = None
+
+    def __init__(self, seed: int = 42, max_workers: Optional[int] = None) -> None:
+        self.seed = seed
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def simulate(
+        self,
+        quotas: np.ndarray,
+        prices: np.ndarray,
+        dividends: np.ndarray,
+        dividend_volatility: np.ndarray,
+        price_volatility: np.ndarray,
+        months: int,
+        paths: int,
+        percentiles: Sequence[float] = (5, 25, 50, 75, 95),
+    ) -> FiiMonteCarloBands:
+        if not 0 < months <= self.MAX_MONTHS:
+            raise ValueError(f"months must be between 1 and {self.MAX_MONTHS}")
+        if not 0 < paths <= self.MAX_PATHS:
+            raise ValueError(f"paths must be between 1 and {self.MAX_PATHS}")
+
+        # positions without quotas contribute nothing, so they are not sampled at all
+        held = np.asarray(quotas, dtype=np.float64) > 0
+        quotas = np.asarray(quotas, dtype=np.float64)[held]
+        dividend_inputs = (
+            np.asarray(dividend_volatility, dtype=np.float64)[held],
+            quotas * np.asarray(dividends)[held],
+        )
+        price_inputs = (np.asarray(price_volatility, dtype=np.float64)[held], quotas * np.asarray(prices)[held])
+
+        chunk_paths = max(1, self.CHUNK_ELEMENTS // (months * max(len(quotas), 1)))
+        chunk_sizes = [min(chunk_paths, paths - start) for start in range(0, paths, chunk_paths)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(chunk_sizes))
+        arguments = [(seed, chunk, months, dividend_inputs, price_inputs) for seed, chunk in zip(seeds, chunk_sizes)]
+
+        if self.max_workers == 1 or len(arguments) == 1:
+            results = [_simulate_chunk(*argument) for argument in arguments]
+        else:
+            results = list(self._pool().map(_simulate_chunk, *zip(*arguments)))
+
+        income = np.concatenate([result[0] for result in results], axis=1)
+        value = np.concatenate([result[1] for result in results], axis=1)
+
+        return FiiMonteCarloBands(
+            percentiles=percentiles,
+            income=np.percentile(income, percentiles, axis=1),
+            value=np.percentile(value, percentiles, axis=1),
+            paths=paths,
+        )
+
+    def _pool(self) -> ProcessPoolExecutor:
+        cls = FiiMonteCarloSimulator
+        if cls._executor is None or cls._executor_workers != self.max_workers:
+            cls.shutdown()
+            cls._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            cls._executor_workers = self.max_workers
+
+        return cls._executor
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(cancel_futures=True)
+            cls._executor = None
+            cls._executor_workers = None
+
+
+def _simulate_chunk(
+    seed: np.random.SeedSequence, paths: int, months: int, *inputs: Tuple[np.ndarray, np.ndarray]
+) -> List[np.ndarray]:
+    """Returns one (months, paths) matrix per (volatilities, weights) input for a chunk of paths."""
+    rng = np.random.Generator(np.random.SFC64(seed))
+    elapsed = np.arange(1, months + 1, dtype=np.float64)[:, np.newaxis]
+    results = []
+
+    for volatility, weights in inputs:
+        # the -sigma^2/2 drift keeps each path a martingale; it is folded into per-month weights
+        monthly_weights = (weights * np.exp(-0.5 * elapsed * volatility**2)).astype(np.float32)
+        shocks = np.empty((months, paths, len(weights)), dtype=np.float32)
+        rng.standard_normal(out=shocks, dtype=np.float32)
+        np.cumsum(shocks, axis=0, out=shocks)
+        shocks *= volatility.astype(np.float32)
+        np.exp(shocks, out=shocks)
+        results.append(np.matmul(shocks, monthly_weights[:, :, np.newaxis])[:, :, 0])
+
+    return results
@@ -0,0 +1,198 @@
+import time
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from app.domain.fii_domain import FiiDomain, ticker_key
+
+
+class FiiAllocation(BaseModel):
+    ticker: str
+    segment: str
+    quotas: int
+    cost: Decimal
+    monthly_dividends: Decimal
+
+
+class FiiPortfolioAllocation(BaseModel):
+    budget: int
+    total_cost: Decimal
+    leftover: Decimal
+    monthly_dividends: Decimal
+    optimal: bool
+    explored_nodes: int
+    allocations: List[FiiAllocation]
+
+
+class FiiPortfolioOptimizer:
+    """Integer quota allocation maximizing monthly dividends under a budget and optional caps.
+
+    Branch-and-bound over FIIs sorted by dividend/price ratio. The bound is the fractional
+    (LP) relaxation filled greedily by ratio, which stays valid with per-FII and per-segment
+    caps. All money is handled in integer cents, so the budget has R$1 granularity or finer.
+    When the node or time budget runs out the best allocation found so far is returned with
+    ``optimal=False``.
+    """
+
+    CENTS = 100
+    EPSILON = 1e-9
+
+    def __init__(self, max_nodes: int = 500_000, time_limit_seconds: float = 0.5) -> None:
+        self.max_nodes = max_nodes
+        self.time_limit_seconds = time_limit_seconds
+
+    def optimize(
+        self,
+        fiis: List[FiiDomain],
+        budget: int,
+        max_per_fii: Optional[int] = None,
+        fii_caps: Optional[Dict[str, int]] = None,
+        segment_caps: Optional[Dict[str, int]] = None,
+    ) -> FiiPortfolioAllocation:
+        fii_caps = {ticker_key(ticker): cap for ticker, cap in (fii_caps or {}).items()}
+        segment_caps = {segment.lower(): cap for segment, cap in (segment_caps or {}).items()}
+        budget_cents = max(budget, 0) * self.CENTS
+
+        candidates = [fii for fii in fiis if fii.last_price > 0 and fii.last_dividend > 0]
+        candidates.sort(key=lambda fii: (-(fii.last_dividend / fii.last_price), fii.last_price, fii.ticker))
+
+        segments = sorted({fii.segment.lower() for fii in candidates})
+        segment_index = {segment: position for position, segment in enumerate(segments)}
+        segment_remaining = [
+            segment_caps[segment] * self.CENTS if segment in segment_caps else budget_cents for segment in segments
+        ]
+
+        prices, dividends, ratios, caps, item_segments = [], [], [], [], []
+        for fii in candidates:
+            price = int((fii.last_price * self.CENTS).to_integral_value(rounding="ROUND_CEILING"))
+            cap = budget_cents // price
+            if max_per_fii is not None:
+                cap = min(cap, max_per_fii * self.CENTS // price)
+            if ticker_key(fii.ticker) in fii_caps:
+                cap = min(cap, fii_caps[ticker_key(fii.ticker)] * self.CENTS // price)
+
+            prices.append(price)
+            dividends.append(float(fii.last_dividend))
+            ratios.append(float(fii.last_dividend) / price)
+            caps.append(max(cap, 0))
+            item_segments.append(segment_index[fii.segment.lower()])
+
+        search = _BranchAndBound(
+            prices, dividends, ratios, caps, item_segments, segment_remaining, self.max_nodes, self.time_limit_seconds
+        )
+        quotas = search.run(budget_cents)
+
+        allocations = []
+        for fii, quantity in zip(candidates, quotas):
+            if quantity > 0:
+                allocations.append(
+                    FiiAllocation(
+                        ticker=fii.ticker,
+                        segment=fii.segment,
+                        quotas=quantity,
+                        cost=quantity * fii.last_price,
+                        monthly_dividends=quantity * fii.last_dividend,
+                    )
+                )
+
+        total_cost = sum((allocation.cost for allocation in allocations), Decimal(0))
+        return FiiPortfolioAllocation(
+            budget=budget,
+            total_cost=total_cost,
+            leftover=Decimal(max(budget, 0)) - total_cost,
+            monthly_dividends=sum((allocation.monthly_dividends for allocation in allocations), Decimal(0)),
+            optimal=search.optimal,
+            explored_nodes=search.nodes,
+            allocations=allocations,
+        )
+
+
+class _BranchAndBound:
+    TIME_CHECK_INTERVAL = 1024
+
+    def __init__(self, prices, dividends, ratios, caps, item_segments, segment_remaining, max_nodes, time_limit):
+        self.prices = prices
+        self.dividends = dividends
+        self.ratios = ratios
+        self.caps = caps
+        self.item_segments = item_segments
+        self.segment_remaining = segment_remaining
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.size = len(prices)
+
+        self.cheapest_from = [0] * (self.size + 1)
+        self.cheapest_from[self.size] = float("inf")
+        for position in range(self.size - 1, -1, -1):
+            self.cheapest_from[position] = min(prices[position], self.cheapest_from[position + 1])
+
+        self.chosen = [0] * self.size
+        self.best_value = -1.0
+        self.best_quotas = [0] * self.size
+        self.nodes = 0
+        self.optimal = True
+        self._deadline = 0.0
+
+    def run(self, budget_cents: int) -> List[int]:
+        self._deadline = time.perf_counter() + self.time_limit
+        self._search(0, budget_cents, 0.0)
+        return self.best_quotas
+
+    def _bound(self, start: int, remaining: int) -> float:
+        value = 0.0
+        used: Dict[int, int] = {}
+
+        for position in range(start, self.size):
+            if remaining <= 0:
+                break
+
+            segment = self.item_segments[position]
+            available = min(
+                remaining,
+                self.segment_remaining[segment] - used.get(segment, 0),
+                self.caps[position] * self.prices[position],
+            )
+            if available <= 0:
+                continue
+
+            value += available * self.ratios[position]
+            remaining -= available
+            used[segment] = used.get(segment, 0) + available
+
+        return value
+
+    def _search(self, position: int, remaining: int, value: float) -> None:
+        if value > self.best_value + FiiPortfolioOptimizer.EPSILON:
+            self.best_value = value
+            self.best_quotas = self.chosen[:position] + [0] * (self.size - position)
+
+        if position >= self.size or remaining < self.cheapest_from[position] or not self.optimal:
+            return
+
+        self.nodes += 1
+        if self.nodes >= self.max_nodes or (
+            self.nodes % self.TIME_CHECK_INTERVAL == 0 and time.perf_counter() > self._deadline
+        ):
+            self.optimal = False
+            return
+
+        price = self.prices[position]
+        segment = self.item_segments[position]
+        most = min(self.caps[position], remaining // price, self.segment_remaining[segment] // price)
+
+        for quantity in range(most, -1, -1):
+            cost = quantity * price
+            gained = value + quantity * self.dividends[position]
+            self.segment_remaining[segment] -= cost
+
+            # lowering the quantity of the best-ratio item never raises the bound, so stop at the first prune
+            if gained + self._bound(position + 1, remaining - cost) <= self.best_value + FiiPortfolioOptimizer.EPSILON:
+                self.segment_remaining[segment] += cost
+                break
+
+            self.chosen[position] = quantity
+            self._search(position + 1, remaining - cost, gained)
+            self.segment_remaining[segment] += cost
+
+        self.chosen[position] = 0
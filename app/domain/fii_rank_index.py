@@ -0,0 +1,112 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from app.domain.fii_snapshot import FiiSnapshot
+
+
+class FiiRank(BaseModel):
+    ticker: str
+    field: str
+    segment: Optional[str] = None
+    value: float
+    rank: int
+    total: int
+    percentile: float
+
+
+class FiiRankEntry(BaseModel):
+    ticker: str
+    segment: str
+    value: float
+    rank: int
+
+
+class _SortedColumn:
+    """Values of one field, ascending, with the snapshot position of each value."""
+
+    def __init__(self, positions: np.ndarray, values: np.ndarray) -> None:
+        order = np.argsort(values, kind="stable")
+        self.positions = positions[order]
+        self.values = values[order]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def rank(self, value: float) -> int:
+        # competition ranking from the highest value: ties share the best rank
+        return len(self.values) - int(np.searchsorted(self.values, value, side="right")) + 1
+
+    def percentile(self, value: float) -> float:
+        below = int(np.searchsorted(self.values, value, side="left"))
+        equal = int(np.searchsorted(self.values, value, side="right")) - below
+        return (below + 0.5 * equal) / len(self.values) * 100
+
+    def top(self, k: int, descending: bool) -> Tuple[np.ndarray, np.ndarray]:
+        if descending:
+            return self.positions[::-1][:k], self.values[::-1][:k]
+
+        return self.positions[:k], self.values[:k]
+
+
+class FiiRankIndex:
+    """Sorted numeric columns of a snapshot, for the whole universe and per segment.
+
+    A column is sorted the first time it is asked for and kept for the snapshot version, so rank and
+    percentile are two binary searches and top-K is a slice.
+    """
+
+    def __init__(self, snapshot: FiiSnapshot) -> None:
+        self.snapshot = snapshot
+        self._columns: Dict[Tuple[str, Optional[str]], _SortedColumn] = {}
+
+    @classmethod
+    def for_snapshot(cls, snapshot: FiiSnapshot) -> "FiiRankIndex":
+        return snapshot.memoize("rank_index", lambda: cls(snapshot))
+
+    def column(self, field: str, segment: Optional[str] = None) -> _SortedColumn:
+        if field not in FiiSnapshot.NUMERIC_FIELDS:
+            raise ValueError(f"field must be one of {', '.join(FiiSnapshot.NUMERIC_FIELDS)}")
+
+        segment = segment.strip().lower() if segment else None
+        key = (field, segment)
+        if key not in self._columns:
+            positions = np.arange(len(self.snapshot))
+            if segment is not None:
+                positions = positions[self.snapshot.columns["segment"] == segment]
+            self._columns[key] = _SortedColumn(positions, self.snapshot.columns[field][positions])
+
+        return self._columns[key]
+
+    def rank(self, ticker: str, field: str, within_segment: bool = False) -> Optional[FiiRank]:
+        position = self.snapshot.position(ticker)
+        if position is None:
+            return None
+
+        fii = self.snapshot.fiis[position]
+        segment = fii.segment if within_segment else None
+        column = self.column(field, segment)
+        value = float(self.snapshot.columns[field][position])
+
+        return FiiRank(
+            ticker=fii.ticker,
+            field=field,
+            segment=segment,
+            value=value,
+            rank=column.rank(value),
+            total=len(column),
+            percentile=round(column.percentile(value), 2),
+        )
+
+    def top(self, field: str, k: int, segment: Optional[str] = None, descending: bool = True) -> List[FiiRankEntry]:
+        column = self.column(field, segment)
+        positions, values = column.top(k, descending)
+
+        entries = []
+        for position, value in zip(positions.tolist(), values.tolist()):
+            fii = self.snapshot.fiis[position]
+            rank = column.rank(value) if descending else int(np.searchsorted(column.values, value, side="left")) + 1
+            entries.append(FiiRankEntry(ticker=fii.ticker, segment=fii.segment, value=value, rank=rank))
+
+        return entries
@@ -0,0 +1,133 @@
+from typing import Iterable, Optional
+
+import numpy as np
+
+from app.domain.fii_domain import FiiDomain, FiiRollingStats
+
+
+class RollingWindow:
+    """Fixed-capacity ring buffer keeping the sums needed for mean, deviation and trend of its values.
+
+    Pushing a value evicts the oldest one once full and adjusts the sums in O(1). The sums are rebuilt from
+    the buffer every ``capacity`` pushes so floating point drift stays bounded, which is still O(1) amortized.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 2:
+            raise ValueError("A rolling window needs a capacity of at least 2")
+
+        self.capacity = capacity
+        self._values = np.zeros(capacity)
+        self._start = 0
+        self._count = 0
+        self._pushes = 0
+        self._sum = 0.0
+        self._squares = 0.0
+        # sum of position * value, positions 0..count-1 from the oldest value
+        self._weighted = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def push(self, value: float) -> None:
+        if self._count == self.capacity:
+            oldest = self._values[self._start]
+            self._values[self._start] = value
+            self._start = (self._start + 1) % self.capacity
+            self._sum -= oldest
+            self._squares -= oldest * oldest
+            # every remaining value moves one position closer to the start
+            self._weighted -= self._sum
+            self._weighted += (self._count - 1) * value
+        else:
+            self._values[(self._start + self._count) % self.capacity] = value
+            self._weighted += self._count * value
+            self._count += 1
+
+        self._sum += value
+        self._squares += value * value
+        self._pushes += 1
+        if self._pushes % self.capacity == 0:
+            self._resum()
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.push(float(value))
+
+    def values(self) -> np.ndarray:
+        return np.roll(self._values, -self._start)[: self._count]
+
+    def mean(self) -> Optional[float]:
+        if not self._count:
+            return None
+
+        return self._sum / self._count
+
+    def std(self) -> Optional[float]:
+        if self._count < 2:
+            return None
+
+        mean = self._sum / self._count
+        return float(np.sqrt(max(self._squares / self._count - mean * mean, 0.0)))
+
+    def slope(self) -> Optional[float]:
+        """Least-squares slope of the values against their position, per observation."""
+        n = self._count
+        if n < 2:
+            return None
+
+        positions = n * (n - 1) / 2
+        squared_positions = (n - 1) * n * (2 * n - 1) / 6
+        return (n * self._weighted - positions * self._sum) / (n * squared_positions - positions * positions)
+
+    def _resum(self) -> None:
+        values = self.values()
+        self._sum = float(values.sum())
+        self._squares = float(np.dot(values, values))
+        self._weighted = float(np.dot(np.arange(self._count), values))
+
+
+class FiiRollingAccumulator:
+    """Rolling windows of one ticker, fed with every stored scrape.
+
+    Windows count observations, not days: with the scheduler scraping every 8 hours the price average covers
+    about a month, the dividend volatility about a year and the DY trend about three months.
+    """
+
+    PRICE_WINDOW = 90
+    DIVIDEND_WINDOW = 1095
+    DY_WINDOW = 270
+
+    def __init__(self) -> None:
+        self.observations = 0
+        self.prices = RollingWindow(self.PRICE_WINDOW)
+        self.dividends = RollingWindow(self.DIVIDEND_WINDOW)
+        self.dy = RollingWindow(self.DY_WINDOW)
+
+    def push(self, fii: FiiDomain) -> None:
+        self.push_values(fii.last_price, fii.last_dividend, fii.dy_12)
+
+    def push_values(self, price, dividend, dy) -> None:
+        self.observations += 1
+        for window, value in ((self.prices, price), (self.dividends, dividend), (self.dy, dy)):
+            if value is not None and np.isfinite(float(value)):
+                window.push(float(value))
+
+    def stats(self) -> FiiRollingStats:
+        mean_dividend = self.dividends.mean()
+        dividend_std = self.dividends.std()
+        dy_slope = self.dy.slope()
+        price_average = self.prices.mean()
+
+        return FiiRollingStats(
+            observations=self.observations,
+            price_moving_average=None if price_average is None else round(price_average, 4),
+            # coefficient of variation, so funds paying different amounts compare on the same scale
+            dividend_volatility=(
+                round(dividend_std / mean_dividend, 4)
+                if dividend_std is not None and mean_dividend is not None and mean_dividend > 0
+                else None
+            ),
+            # change of DY 12 across the window according to the fitted line, in percentage points
+            dy_trend=None if dy_slope is None else round(dy_slope * (len(self.dy) - 1), 4),
+        )
@@ -0,0 +1,12 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class FiiScrapeProgress(BaseModel):
+    run_id: str
+    state: str
+    total: int
+    done: int = 0
+    failed: int = 0
+    ticker: Optional[str] = None
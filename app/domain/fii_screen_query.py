@@ -0,0 +1,247 @@
+import operator
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.domain.fii_snapshot import FiiSnapshot
+
+Columns = Dict[str, np.ndarray]
+Predicate = Callable[[Columns], np.ndarray]
+
+
+class FiiScreenQueryError(ValueError):
+    pass
+
+
+class CompiledFiiScreenQuery:
+    def __init__(
+        self,
+        expression: str,
+        predicate: Optional[Predicate],
+        order_by: List[Tuple[str, bool]],
+        limit: Optional[int],
+    ) -> None:
+        self.expression = expression
+        self.predicate = predicate
+        self.order_by = order_by
+        self.limit = limit
+
+    def select(self, snapshot: FiiSnapshot) -> np.ndarray:
+        """Returns snapshot positions matching the query, ordered and limited."""
+        if len(snapshot) == 0 or self.limit == 0:
+            return np.empty(0, dtype=np.int64)
+
+        if self.predicate is None:
+            positions = np.arange(len(snapshot))
+        else:
+            positions = np.flatnonzero(self.predicate(snapshot.columns))
+
+        if not self.order_by:
+            return positions[: self.limit]
+
+        keys = [self._sort_key(snapshot.columns[field][positions], descending) for field, descending in self.order_by]
+
+        if self.limit is not None and self.limit < len(positions):
+            # top-N: partial selection on the primary key, keeping ties so secondary keys still apply
+            primary = keys[0]
+            threshold = np.partition(primary, self.limit - 1)[self.limit - 1]
+            candidates = np.flatnonzero(primary <= threshold)
+            positions = positions[candidates]
+            keys = [key[candidates] for key in keys]
+
+        order = np.lexsort(keys[::-1])
+        return positions[order][: self.limit]
+
+    @staticmethod
+    def _sort_key(values: np.ndarray, descending: bool) -> np.ndarray:
+        if values.dtype == object:
+            values = np.unique(values, return_inverse=True)[1]
+
+        return -values if descending else values
+
+
+class FiiScreenQuery:
+    """Compiles expressions such as ``dy_12>=8 and p_vp<1 order by dy_12 desc limit 20``.
+
+    Plans are vectorized over FiiSnapshot columns and cached by normalized expression.
+    """
+
+    CACHE_SIZE = 256
+    NUMERIC_OPERATORS = {
+        ">=": operator.ge,
+        "<=": operator.le,
+        ">": operator.gt,
+        "<": operator.lt,
+        "=": operator.eq,
+        "==": operator.eq,
+        "!=": operator.ne,
+    }
+    TEXT_OPERATORS = {"=": operator.eq, "==": operator.eq, "!=": operator.ne}
+    TOKEN_PATTERN = re.compile(
+        r"\s*(?:(?P<number>-?\d+(?:\.\d+)?)"
+        r"|(?P<string>'[^']*'|\"[^\"]*\")"
+        r"|(?P<operator>>=|<=|!=|==|=|>|<)"
+        r"|(?P<punctuation>[(),])"
+        r"|(?P<word>[^\W\d]\w*))"
+    )
+
+    @classmethod
+    def compile(cls, expression: str) -> CompiledFiiScreenQuery:
+        return cls._compile_normalized(cls.normalize(expression))
+
+    @classmethod
+    def normalize(cls, expression: str) -> str:
+        return " ".join(cls._render(kind, value) for kind, value in cls._tokenize(expression))
+
+    @classmethod
+    def cache_info(cls):
+        return cls._compile_normalized.cache_info()
+
+    @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def _compile_normalized(normalized: str) -> CompiledFiiScreenQuery:
+        return _Parser(FiiScreenQuery._tokenize(normalized), normalized).parse()
+
+    @classmethod
+    def _tokenize(cls, expression: str) -> List[Tuple[str, str]]:
+        tokens = []
+        position = 0
+        expression = expression.strip()
+
+        while position < len(expression):
+            match = cls.TOKEN_PATTERN.match(expression, position)
+            if match is None or match.end() == position:
+                raise FiiScreenQueryError(f"Unexpected input at position {position}: {expression[position:]!r}")
+
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == "string":
+                value = value[1:-1]
+            if kind in ("word", "string"):
+                value = value.lower()
+            tokens.append((kind, value))
+            position = match.end()
+
+        return tokens
+
+    @staticmethod
+    def _render(kind: str, value: str) -> str:
+        return f"'{value}'" if kind == "string" else value
+
+
+class _Parser:
+    FIELDS = FiiSnapshot.NUMERIC_FIELDS + FiiSnapshot.TEXT_FIELDS
+
+    def __init__(self, tokens: List[Tuple[str, str]], expression: str) -> None:
+        self.tokens = tokens
+        self.expression = expression
+        self.position = 0
+
+    def parse(self) -> CompiledFiiScreenQuery:
+        predicate = None
+        if self._peek() not in (None, ("word", "order"), ("word", "limit")):
+            predicate = self._parse_or()
+
+        order_by = []
+        if self._accept("word", "order"):
+            self._expect("word", "by")
+            order_by.append(self._parse_order_key())
+            while self._accept("punctuation", ","):
+                order_by.append(self._parse_order_key())
+
+        limit = None
+        if self._accept("word", "limit"):
+            kind, value = self._next()
+            if kind != "number" or not value.isdigit():
+                raise FiiScreenQueryError(f"LIMIT expects a non-negative integer, got {value!r}")
+            limit = int(value)
+
+        if self._peek() is not None:
+            raise FiiScreenQueryError(f"Unexpected token {self._peek()[1]!r}")
+
+        return CompiledFiiScreenQuery(self.expression, predicate, order_by, limit)
+
+    def _parse_or(self) -> Predicate:
+        predicates = [self._parse_and()]
+        while self._accept("word", "or"):
+            predicates.append(self._parse_and())
+
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda columns: np.logical_or.reduce([predicate(columns) for predicate in predicates])
+
+    def _parse_and(self) -> Predicate:
+        predicates = [self._parse_not()]
+        while self._accept("word", "and"):
+            predicates.append(self._parse_not())
+
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda columns: np.logical_and.reduce([predicate(columns) for predicate in predicates])
+
+    def _parse_not(self) -> Predicate:
+        if self._accept("word", "not"):
+            predicate = self._parse_not()
+            return lambda columns: ~predicate(columns)
+
+        if self._accept("punctuation", "("):
+            predicate = self._parse_or()
+            self._expect("punctuation", ")")
+            return predicate
+
+        return self._parse_comparison()
+
+    def _parse_comparison(self) -> Predicate:
+        field = self._parse_field()
+        kind, symbol = self._next()
+        if kind != "operator":
+            raise FiiScreenQueryError(f"Expected a comparison operator after {field!r}, got {symbol!r}")
+
+        kind, value = self._next()
+        if field in FiiSnapshot.NUMERIC_FIELDS:
+            if kind != "number":
+                raise FiiScreenQueryError(f"Field {field!r} must be compared with a number, got {value!r}")
+            compare = FiiScreenQuery.NUMERIC_OPERATORS[symbol]
+            number = float(value)
+            return lambda columns: compare(columns[field], number)
+
+        if kind not in ("string", "word") or symbol not in FiiScreenQuery.TEXT_OPERATORS:
+            raise FiiScreenQueryError(f"Field {field!r} only supports = and != with a text value")
+        compare = FiiScreenQuery.TEXT_OPERATORS[symbol]
+        return lambda columns: compare(columns[field], value)
+
+    def _parse_order_key(self) -> Tuple[str, bool]:
+        field = self._parse_field()
+        if self._accept("word", "desc"):
+            return field, True
+        self._accept("word", "asc")
+        return field, False
+
+    def _parse_field(self) -> str:
+        kind, value = self._next()
+        if kind != "word" or value not in self.FIELDS:
+            raise FiiScreenQueryError(f"Unknown field {value!r}; expected one of {', '.join(self.FIELDS)}")
+        return value
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self) -> Tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise FiiScreenQueryError("Unexpected end of expression")
+        self.position += 1
+        return token
+
+    def _accept(self, kind: str, value: str) -> bool:
+        if self._peek() == (kind, value):
+            self.position += 1
+            return True
+        return False
+
+    def _expect(self, kind: str, value: str) -> None:
+        if not self._accept(kind, value):
+            found = self._peek()
+            raise FiiScreenQueryError(f"Expected {value!r}, got {found[1] if found else 'end of expression'!r}")
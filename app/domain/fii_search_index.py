@@ -0,0 +1,179 @@
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from app.domain.fii_domain import FiiDomain
+from app.domain.fii_snapshot import FiiSnapshot
+
+
+class FiiSearchResult(BaseModel):
+    ticker: str
+    segment: Optional[str] = None
+    match: str
+    score: float
+
+
+def normalize(text: str) -> str:
+    """Lower-case alphanumeric text without accents, so "Papéis" and "papeis" are the same term."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(char for char in decomposed if char.isalnum() or char.isspace()).lower().strip()
+
+
+def trigrams(term: str) -> Set[str]:
+    padded = f"  {term} "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+class _TrieNode:
+    __slots__ = ("children", "tickers")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.tickers: Set[str] = set()
+
+
+class _Trie:
+    """Every node keeps the tickers having a term with that prefix, so a prefix lookup is one walk."""
+
+    def __init__(self) -> None:
+        self.root = _TrieNode()
+
+    def add(self, term: str, ticker: str) -> None:
+        node = self.root
+        for char in term:
+            node = node.children.setdefault(char, _TrieNode())
+            node.tickers.add(ticker)
+
+    def remove(self, term: str, ticker: str) -> None:
+        path = []
+        node = self.root
+        for char in term:
+            child = node.children.get(char)
+            if child is None:
+                return
+            path.append((node, char, child))
+            node = child
+
+        for parent, char, child in reversed(path):
+            child.tickers.discard(ticker)
+            if not child.tickers:
+                del parent.children[char]
+
+    def prefixed(self, prefix: str) -> Set[str]:
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+
+        return node.tickers
+
+
+class FiiSearchIndex:
+    """Ticker and text search for typeahead: a prefix trie plus a trigram index for typos.
+
+    Tickers rank first (exact, then prefix), then FIIs with a word of their other terms starting with the
+    query, then trigram matches on the ticker scored by similarity. Adding or replacing a FII only touches
+    its own terms.
+    """
+
+    MIN_SIMILARITY = 0.3
+    EXACT, PREFIX, TERM, FUZZY = 100.0, 80.0, 40.0, 30.0
+
+    def __init__(self, fiis: Iterable[FiiDomain] = ()) -> None:
+        self._tickers = _Trie()
+        self._terms = _Trie()
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._entries: Dict[str, Tuple[str, List[str], Optional[str]]] = {}
+        for fii in fiis:
+            self.add(fii)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def for_snapshot(cls, snapshot: FiiSnapshot) -> "FiiSearchIndex":
+        return snapshot.memoize("search_index", lambda: cls(snapshot.fiis))
+
+    def add(self, fii: FiiDomain) -> None:
+        ticker = normalize(fii.ticker)
+        terms = self._text_terms(fii)
+        entry = self._entries.get(fii.ticker)
+        if entry is not None:
+            if entry[0] == ticker and entry[1] == terms and entry[2] == fii.segment:
+                return
+            self.remove(fii.ticker)
+
+        self._entries[fii.ticker] = (ticker, terms, fii.segment)
+        self._tickers.add(ticker, fii.ticker)
+        for term in terms:
+            self._terms.add(term, fii.ticker)
+        for gram in trigrams(ticker):
+            self._trigrams.setdefault(gram, set()).add(fii.ticker)
+
+    def remove(self, ticker: str) -> None:
+        entry = self._entries.pop(ticker, None)
+        if entry is None:
+            return
+
+        normalized, terms, _ = entry
+        self._tickers.remove(normalized, ticker)
+        for term in terms:
+            self._terms.remove(term, ticker)
+        for gram in trigrams(normalized):
+            holders = self._trigrams.get(gram)
+            if holders is not None:
+                holders.discard(ticker)
+                if not holders:
+                    del self._trigrams[gram]
+
+    def search(self, query: str, limit: int = 10) -> List[FiiSearchResult]:
+        query = normalize(query)
+        if not query:
+            return []
+
+        scores: Dict[str, Tuple[float, str]] = {}
+
+        def offer(ticker: str, score: float, match: str) -> None:
+            if ticker not in scores or scores[ticker][0] < score:
+                scores[ticker] = (score, match)
+
+        compact = query.replace(" ", "")
+        for ticker in self._tickers.prefixed(compact):
+            normalized = self._entries[ticker][0]
+            if normalized == compact:
+                offer(ticker, self.EXACT, "exact")
+            else:
+                # shorter completions first: "hglg" ranks HGLG11 above HGLG11B
+                offer(ticker, self.PREFIX - (len(normalized) - len(compact)) / 10, "prefix")
+
+        words = query.split()
+        matching = None
+        for word in words:
+            found = self._terms.prefixed(word)
+            matching = set(found) if matching is None else matching & found
+        for ticker in matching or ():
+            offer(ticker, self.TERM, "term")
+
+        if len(compact) >= 3:
+            grams = trigrams(compact)
+            counts: Dict[str, int] = {}
+            for gram in grams:
+                for ticker in self._trigrams.get(gram, ()):
+                    counts[ticker] = counts.get(ticker, 0) + 1
+            for ticker, shared in counts.items():
+                similarity = shared / len(grams | trigrams(self._entries[ticker][0]))
+                if similarity >= self.MIN_SIMILARITY:
+                    offer(ticker, round(self.FUZZY * similarity, 4), "fuzzy")
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1][0], item[0]))[:limit]
+        return [
+            FiiSearchResult(ticker=ticker, segment=self._entries[ticker][2], match=match, score=score)
+            for ticker, (score, match) in ranked
+        ]
+
+    @staticmethod
+    def _text_terms(fii: FiiDomain) -> List[str]:
+        # searchable words besides the ticker; fund names belong here once the gateway scrapes them
+        return sorted(set(normalize(fii.segment or "").split()))
@@ -0,0 +1,185 @@
+import math
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional
+
+from pydantic import BaseModel
+
+from app.domain.fii_domain import FiiDomain
+from app.domain.fii_snapshot import FiiSnapshot
+
+
+class FiiSegmentSummary(BaseModel):
+    segment: str
+    count: int
+    mean_dy: Optional[float] = None
+    median_dy: Optional[float] = None
+    dy_p25: Optional[float] = None
+    dy_p75: Optional[float] = None
+    mean_p_vp: Optional[float] = None
+    median_p_vp: Optional[float] = None
+    total_liquidity: float
+
+
+class FiiQuantileSketch:
+    """Quantile sketch with relative error guarantees that also supports removing values.
+
+    Values fall into logarithmic buckets where every bucket spans a factor ``gamma`` (the DDSketch layout),
+    so any quantile is answered within ``relative_accuracy`` of the true value. Adding or removing a value
+    only touches the count of its bucket, which is what lets an aggregate follow FIIs being replaced.
+    """
+
+    MIN_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zeros = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float) -> None:
+        self._update(value, 1)
+
+    def remove(self, value: float) -> None:
+        self._update(value, -1)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.count:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+        # most negative values first: larger keys of the negative side hold larger magnitudes
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._value(key)
+
+        seen += self._zeros
+        if seen > rank:
+            return 0.0
+
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._value(key)
+
+        return self._value(max(self._positive)) if self._positive else 0.0
+
+    def _update(self, value: float, delta: int) -> None:
+        if value > self.MIN_VALUE:
+            self._bump(self._positive, self._key(value), delta)
+        elif value < -self.MIN_VALUE:
+            self._bump(self._negative, self._key(-value), delta)
+        else:
+            if self._zeros + delta < 0:
+                raise ValueError(f"{value} is not in the sketch")
+            self._zeros += delta
+
+        self.count += delta
+
+    @staticmethod
+    def _bump(buckets: Dict[int, int], key: int, delta: int) -> None:
+        count = buckets.get(key, 0) + delta
+        if count < 0:
+            raise ValueError("Value is not in the sketch")
+
+        if count:
+            buckets[key] = count
+        else:
+            buckets.pop(key, None)
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        # the point of the bucket (gamma^(key-1), gamma^key] with the smallest relative error to both ends
+        return 2 * self.gamma**key / (self.gamma + 1)
+
+
+class FiiSegmentAggregate:
+    """Counts, exact sums and quantile sketches of the FIIs of one segment, updated per FII in O(1)."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.dy_sum = Decimal(0)
+        self.p_vp_sum = Decimal(0)
+        self.liquidity_sum = Decimal(0)
+        self.dy = FiiQuantileSketch()
+        self.p_vp = FiiQuantileSketch()
+
+    def add(self, fii: FiiDomain) -> None:
+        self._update(fii, 1)
+
+    def remove(self, fii: FiiDomain) -> None:
+        self._update(fii, -1)
+
+    def summary(self, segment: str) -> FiiSegmentSummary:
+        def rounded(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value, 4)
+
+        return FiiSegmentSummary(
+            segment=segment,
+            count=self.count,
+            mean_dy=rounded(float(self.dy_sum / self.count)) if self.count else None,
+            median_dy=rounded(self.dy.quantile(0.5)),
+            dy_p25=rounded(self.dy.quantile(0.25)),
+            dy_p75=rounded(self.dy.quantile(0.75)),
+            mean_p_vp=rounded(float(self.p_vp_sum / self.count)) if self.count else None,
+            median_p_vp=rounded(self.p_vp.quantile(0.5)),
+            total_liquidity=float(self.liquidity_sum),
+        )
+
+    def _update(self, fii: FiiDomain, delta: int) -> None:
+        dy = fii.dy_12 or Decimal(0)
+        p_vp = fii.p_vp or Decimal(0)
+
+        self.count += delta
+        # Decimal sums stay exact no matter how many times a FII is replaced
+        self.dy_sum += delta * dy
+        self.p_vp_sum += delta * p_vp
+        self.liquidity_sum += delta * (fii.dialy_liquidity or Decimal(0))
+
+        if delta > 0:
+            self.dy.add(float(dy))
+            self.p_vp.add(float(p_vp))
+        else:
+            self.dy.remove(float(dy))
+            self.p_vp.remove(float(p_vp))
+
+
+class FiiSegmentAggregates:
+    """Aggregates of every segment of a snapshot, built at most once per data version.
+
+    Segments are keyed stripped and lower-cased, like the screen and rank code, so "Logística" and
+    "logística" are one segment.
+    """
+
+    UNKNOWN_SEGMENT = "sem segmento"
+
+    def __init__(self, fiis: Iterable[FiiDomain]) -> None:
+        self.segments: Dict[str, FiiSegmentAggregate] = {}
+        for fii in fiis:
+            self.segments.setdefault(self.segment_key(fii.segment), FiiSegmentAggregate()).add(fii)
+
+        self.summaries: List[FiiSegmentSummary] = [
+            self.segments[segment].summary(segment) for segment in sorted(self.segments)
+        ]
+
+    @classmethod
+    def for_snapshot(cls, snapshot: FiiSnapshot) -> "FiiSegmentAggregates":
+        return snapshot.memoize("segment_aggregates", lambda: cls(snapshot.fiis))
+
+    @classmethod
+    def segment_key(cls, segment: Optional[str]) -> str:
+        return (segment or "").strip().lower() or cls.UNKNOWN_SEGMENT
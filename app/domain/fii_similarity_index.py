@@ -0,0 +1,168 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from app.domain.fii_snapshot import FiiSnapshot
+
+
+class FiiSimilarity(BaseModel):
+    ticker: str
+    segment: str
+    distance: float
+
+
+class _KDTree:
+    """KD-tree over the rows of ``points``, split at the median of the widest dimension.
+
+    Nodes live in flat lists and leaves are scanned with one vectorized distance computation, so a query
+    visits O(log n) nodes in Python and the rest is numpy.
+    """
+
+    LEAF_SIZE = 32
+
+    def __init__(self, points: np.ndarray, positions: np.ndarray) -> None:
+        order = np.arange(len(points))
+        self._dims: List[int] = []
+        self._values: List[float] = []
+        self._children: List[Tuple[int, int]] = []
+        self._ranges: List[Tuple[int, int]] = []
+
+        stack = [(0, len(order), self._node())]
+        while stack:
+            start, end, node = stack.pop()
+            self._ranges[node] = (start, end)
+            if end - start <= self.LEAF_SIZE:
+                continue
+
+            chunk = points[order[start:end]]
+            dim = int(np.argmax(chunk.max(axis=0) - chunk.min(axis=0)))
+            middle = (end - start) // 2
+            split = np.argpartition(chunk[:, dim], middle)
+            order[start:end] = order[start:end][split]
+
+            self._dims[node] = dim
+            self._values[node] = float(points[order[start + middle], dim])
+            left, right = self._node(), self._node()
+            self._children[node] = (left, right)
+            stack.append((start, start + middle, left))
+            stack.append((start + middle, end, right))
+
+        self.points = points[order]
+        self.positions = positions[order]
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _node(self) -> int:
+        self._dims.append(-1)
+        self._values.append(0.0)
+        self._children.append((-1, -1))
+        self._ranges.append((0, 0))
+        return len(self._dims) - 1
+
+    def query(self, point: np.ndarray, k: int, heap: list, offset: float = 0.0, exclude: int = -1) -> None:
+        """Pushes the rows nearer than the current k-th best into ``heap``, a max-heap of (-distance², position).
+
+        ``offset`` is added to every squared distance, which is how rows of another segment are penalized.
+        """
+        if not len(self.points):
+            return
+
+        coordinates = point.tolist()
+        stack = [(0, 0.0)]
+        while stack:
+            node, plane = stack.pop()
+            if len(heap) == k and plane + offset >= -heap[0][0]:
+                continue
+
+            dim = self._dims[node]
+            if dim < 0:
+                start, end = self._ranges[node]
+                distances = ((self.points[start:end] - point) ** 2).sum(axis=1) + offset
+                positions = self.positions[start:end]
+                if len(heap) == k:
+                    # most leaf rows are no better than the current k-th best; drop them before the Python loop
+                    closer = distances < -heap[0][0]
+                    distances, positions = distances[closer], positions[closer]
+                for distance, position in zip(distances.tolist(), positions.tolist()):
+                    if position == exclude:
+                        continue
+                    if len(heap) < k:
+                        heapq.heappush(heap, (-distance, position))
+                    elif distance < -heap[0][0]:
+                        heapq.heapreplace(heap, (-distance, position))
+                continue
+
+            diff = coordinates[dim] - self._values[node]
+            left, right = self._children[node]
+            near, far = (left, right) if diff < 0 else (right, left)
+            # the far side is pushed first so the near side is explored first
+            stack.append((far, max(plane, diff * diff)))
+            stack.append((near, plane))
+
+
+class FiiSimilarityIndex:
+    """Nearest FIIs by z-score normalized P/VP, DY, liquidity and valuation trends, and segment.
+
+    The segment counts like a one-hot coordinate of weight ``SEGMENT_WEIGHT``: FIIs of another segment
+    are ``2 * SEGMENT_WEIGHT²`` further away in squared distance. Instead of adding one dimension per
+    segment, which defeats a KD-tree, every segment gets its own tree over the numeric features and the
+    other trees are searched with that penalty, which gives the same neighbours.
+    """
+
+    FEATURES = ("p_vp", "dy_12", "dialy_liquidity", "last_12_month_evaluation", "current_month_evaluation")
+    LOG_FEATURES = ("dialy_liquidity",)
+    SEGMENT_WEIGHT = 1.0
+
+    def __init__(self, snapshot: FiiSnapshot) -> None:
+        self.snapshot = snapshot
+        self.vectors = self._normalized(snapshot)
+        self.segment_penalty = 2 * self.SEGMENT_WEIGHT**2
+        self.segments = snapshot.columns["segment"]
+
+        self._trees: Dict[str, _KDTree] = {}
+        for segment in sorted(set(self.segments.tolist())):
+            positions = np.flatnonzero(self.segments == segment)
+            self._trees[segment] = _KDTree(self.vectors[positions], positions)
+
+    @classmethod
+    def for_snapshot(cls, snapshot: FiiSnapshot) -> "FiiSimilarityIndex":
+        return snapshot.memoize("similarity_index", lambda: cls(snapshot))
+
+    def similar(self, ticker: str, k: int, same_segment: bool = False) -> Optional[List[FiiSimilarity]]:
+        position = self.snapshot.position(ticker)
+        if position is None:
+            return None
+
+        point = self.vectors[position]
+        segment = self.segments[position]
+        heap: list = []
+        self._trees[segment].query(point, k, heap, exclude=position)
+        if not same_segment:
+            for other, tree in self._trees.items():
+                if other != segment:
+                    tree.query(point, k, heap, offset=self.segment_penalty)
+
+        return [
+            FiiSimilarity(
+                ticker=self.snapshot.fiis[neighbour].ticker,
+                segment=self.snapshot.fiis[neighbour].segment,
+                distance=round(float(np.sqrt(-distance)), 6),
+            )
+            for distance, neighbour in sorted(heap, key=lambda item: (-item[0], item[1]))
+        ]
+
+    @classmethod
+    def _normalized(cls, snapshot: FiiSnapshot) -> np.ndarray:
+        columns = []
+        for field in cls.FEATURES:
+            column = snapshot.columns[field]
+            if field in cls.LOG_FEATURES:
+                # liquidity spans orders of magnitude; the log keeps a few huge funds from flattening the rest
+                column = np.log1p(np.clip(column, 0, None))
+            std = column.std() if len(column) else 0.0
+            columns.append((column - column.mean()) / std if std > 0 else np.zeros_like(column))
+
+        return np.column_stack(columns) if columns else np.zeros((0, 0))
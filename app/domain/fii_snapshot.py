@@ -0,0 +1,77 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from app.domain.fii_domain import FiiDomain, ticker_key
+
+
+class FiiSnapshot:
+    """Immutable, versioned view of the FII universe with columnar arrays for vectorized work."""
+
+    NUMERIC_FIELDS = (
+        "p_vp",
+        "last_12_month_evaluation",
+        "current_month_evaluation",
+        "last_price",
+        "last_dividend",
+        "dy_12",
+        "dialy_liquidity",
+    )
+    TEXT_FIELDS = ("ticker", "segment", "duration")
+    SORT_FIELDS = TEXT_FIELDS + NUMERIC_FIELDS
+
+    def __init__(self, version: int, fiis: Iterable[FiiDomain]) -> None:
+        self.version = version
+        self.fiis = tuple(fiis)
+        self.positions = {fii.ticker: position for position, fii in enumerate(self.fiis)}
+        self._keys = {ticker_key(fii.ticker): position for position, fii in enumerate(self.fiis)}
+        self.columns: Dict[str, np.ndarray] = {}
+        self._derived: Dict[str, Any] = {}
+
+        for field in self.NUMERIC_FIELDS:
+            self.columns[field] = np.array([float(getattr(fii, field) or 0) for fii in self.fiis], dtype=np.float64)
+
+        # text columns are lower-cased so comparisons do not depend on how the ticker was scraped
+        for field in self.TEXT_FIELDS:
+            self.columns[field] = np.array([(getattr(fii, field) or "").lower() for fii in self.fiis], dtype=object)
+
+    def __len__(self) -> int:
+        return len(self.fiis)
+
+    def position(self, ticker: str) -> Optional[int]:
+        """Position of a ticker written in any case; ``positions`` is keyed by the stored ticker as is."""
+        return self._keys.get(ticker_key(ticker))
+
+    def get(self, ticker: str) -> Optional[FiiDomain]:
+        position = self.position(ticker)
+        return None if position is None else self.fiis[position]
+
+    def memoize(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Builds derived data (indexes, precomputed tables) at most once per snapshot version."""
+        if key not in self._derived:
+            self._derived[key] = factory()
+
+        return self._derived[key]
+
+    def take(self, positions: Iterable[int]) -> List[FiiDomain]:
+        return [self.fiis[position] for position in positions]
+
+    def sort_key(self, field: str) -> np.ndarray:
+        if field not in self.SORT_FIELDS:
+            raise ValueError(f"sort must be one of {', '.join(self.SORT_FIELDS)}")
+
+        column = self.columns[field]
+        if column.dtype != object:
+            return column
+
+        # text columns are ranked so they sort like numbers, in either direction
+        return np.unique(column, return_inverse=True)[1].reshape(-1) if len(column) else np.zeros(0, dtype=np.int64)
+
+    def order(self, field: str = "ticker", descending: bool = False) -> np.ndarray:
+        """Positions sorted by ``field``; ties keep ticker order in both directions. Kept for the version."""
+
+        def build() -> np.ndarray:
+            values = self.sort_key(field)
+            return np.lexsort((self.sort_key("ticker"), -values if descending else values))
+
+        return self.memoize(f"order:{field}:{descending}", build)
@@ -0,0 +1,31 @@
+from datetime import date, datetime, time, timezone
+from typing import Iterable, List
+
+from pydantic import BaseModel
+
+from app.domain.fii_domain import FiiDomain
+
+
+class FiiDelta(BaseModel):
+    recorded_at: datetime
+    fii: FiiDomain
+
+
+class FiiCheckpoint(BaseModel):
+    """Full FII universe at ``recorded_at``; later states are this plus the deltas recorded after it."""
+
+    recorded_at: datetime
+    fiis: List[FiiDomain]
+
+    def replay(self, deltas: Iterable[FiiDelta]) -> List[FiiDomain]:
+        fiis = {fii.ticker: fii for fii in self.fiis}
+        for delta in sorted(deltas, key=lambda delta: delta.recorded_at):
+            if delta.recorded_at > self.recorded_at:
+                fiis[delta.fii.ticker] = delta.fii
+
+        return list(fiis.values())
+
+
+def end_of_day(as_of: date) -> datetime:
+    """An ``as_of`` date covers everything recorded until the end of that day (UTC)."""
+    return datetime.combine(as_of, time.max, tzinfo=timezone.utc)
@@ -1,4 +1,7 @@
-from typing import List
+from functools import reduce
+from typing import Dict, List, Mapping, Tuple, Type
+
+import numpy as np
 
 from app.domain.fii_domain import FiiDomain
 from app.domain.rules.current_month_evaluation_rule import CurrentMonthEvaluationRule
@@ -25,11 +28,19 @@ class FiiValidator:
 
         return True
 
+    def rejection_reasons(self, fii: FiiDomain) -> List[str]:
+        return [rule.MESSAGE for rule in self.rules if not rule.validate(fii)]
+
+    def mask(self, columns: Mapping[str, np.ndarray], as_of: np.ndarray) -> np.ndarray:
+        """Rows (and months, for 2D columns) passing every rule, evaluated with array operations."""
+        masks = [np.asarray(rule.mask(columns, as_of), dtype=bool) for rule in self.rules]
+        return reduce(np.logical_and, masks) if masks else np.ones(np.shape(columns["last_price"]), dtype=bool)
+
 
 class FiiValidatorFactory:
-    @staticmethod
-    def build() -> FiiValidator:
-        return FiiValidator(
+    DEFAULT_PROFILE = "default"
+    PROFILES: Dict[str, Tuple[Type[FiiRule], ...]] = {
+        DEFAULT_PROFILE: (
             CurrentMonthEvaluationRule,
             Last12MonthEvaluationRule,
             PVPRule,
@@ -38,4 +49,19 @@ class FiiValidatorFactory:
             DailyLiquidityRule,
             PositiveDividendRule,
             MinimumDyRule,
-        )
+        ),
+        "dividend": (PositiveDividendRule, MinimumDyRule, DailyLiquidityRule),
+        "value": (PVPRule, PositiveDividendRule, Last12MonthEvaluationRule),
+        "stability": (CurrentMonthEvaluationRule, Last12MonthEvaluationRule, DailyLiquidityRule, PositiveDividendRule),
+    }
+
+    @staticmethod
+    def build() -> FiiValidator:
+        return FiiValidatorFactory.build_profile(FiiValidatorFactory.DEFAULT_PROFILE)
+
+    @staticmethod
+    def build_profile(name: str) -> FiiValidator:
+        if name not in FiiValidatorFactory.PROFILES:
+            raise ValueError(f"Unknown rule profile: {name}")
+
+        return FiiValidator(*FiiValidatorFactory.PROFILES[name])
@@ -1,4 +1,7 @@
 from decimal import Decimal
+from typing import Mapping
+
+import numpy as np
 
 from app.domain.fii_domain import FiiDomain
 from app.domain.rules.fii_rule import FiiRule
@@ -11,3 +14,7 @@ class CurrentMonthEvaluationRule(FiiRule):
     @classmethod
     def validate(cls, fii: FiiDomain) -> bool:
         return fii.current_month_evaluation >= Decimal(cls.ACCEPTABLE_DEVALUATION)
+
+    @classmethod
+    def mask(cls, columns: Mapping[str, np.ndarray], as_of: np.ndarray) -> np.ndarray:
+        return columns["current_month_evaluation"] >= cls.ACCEPTABLE_DEVALUATION
@@ -1,4 +1,7 @@
 from decimal import Decimal
+from typing import Mapping
+
+import numpy as np
 
 from app.domain.fii_domain import FiiDomain
 from app.domain.rules.fii_rule import FiiRule
@@ -14,3 +17,8 @@ class DailyLiquidityRule(FiiRule):
             return True
 
         return fii.dialy_liquidity >= cls.ACCEPTABLE_DAILY_LIQUIDITY
+
+    @classmethod
+    def mask(cls, columns: Mapping[str, np.ndarray], as_of: np.ndarray) -> np.ndarray:
+        # unknown liquidity passes, as in validate
+        return ~(columns["dialy_liquidity"] < float(cls.ACCEPTABLE_DAILY_LIQUIDITY))
@@ -0,0 +1,23 @@
+from typing import Mapping
+
+import numpy as np
+
+from app.domain.fii_domain import FiiDomain
+from app.domain.rules.fii_rule import FiiRule
+
+
+class DividendStabilityRule(FiiRule):
+    MAXIMUM_DIVIDEND_VOLATILITY = 0.25
+    MESSAGE = f"Trailing dividend volatility must be at most {MAXIMUM_DIVIDEND_VOLATILITY}"
+
+    @classmethod
+    def validate(cls, fii: FiiDomain) -> bool:
+        if fii.rolling_stats is None or fii.rolling_stats.dividend_volatility is None:
+            return True
+
+        return fii.rolling_stats.dividend_volatility <= cls.MAXIMUM_DIVIDEND_VOLATILITY
+
+    @classmethod
+    def mask(cls, columns: Mapping[str, np.ndarray], as_of: np.ndarray) -> np.ndarray:
+        # unknown volatility passes, as in validate
+        return ~(columns["dividend_volatility"] > cls.MAXIMUM_DIVIDEND_VOLATILITY)
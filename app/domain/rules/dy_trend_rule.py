@@ -0,0 +1,23 @@
+from typing import Mapping
+
+import numpy as np
+
+from app.domain.fii_domain import FiiDomain
+from app.domain.rules.fii_rule import FiiRule
+
+
+class DyTrendRule(FiiRule):
+    MINIMUM_DY_TREND = -1.0
+    MESSAGE = f"DY 12 months must not fall more than {-MINIMUM_DY_TREND} points over the rolling window"
+
+    @classmethod
+    def validate(cls, fii: FiiDomain) -> bool:
+        if fii.rolling_stats is None or fii.rolling_stats.dy_trend is None:
+            return True
+
+        return fii.rolling_stats.dy_trend >= cls.MINIMUM_DY_TREND
+
+    @classmethod
+    def mask(cls, columns: Mapping[str, np.ndarray], as_of: np.ndarray) -> np.ndarray:
+        # unknown trend passes, as in validate
+        return ~(columns["dy_trend"] < cls.MINIMUM_DY_TREND)
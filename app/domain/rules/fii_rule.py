@@ -1,8 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Mapping
+
+import numpy as np
+
 from app.domain.fii_domain import FiiDomain
 
 
-class FiiRule:
+class FiiRule(ABC):
+    """Screening condition used as a class: ``validate`` checks one FII and ``mask`` the same condition over columns.
+
+    Rules are never instantiated, so a subclass leaving either method abstract is rejected when it is defined.
+    """
+
     MESSAGE: str = None
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        missing = [name for name in ("validate", "mask") if getattr(getattr(cls, name), "__isabstractmethod__", False)]
+        if missing:
+            raise TypeError(f"{cls.__name__} must implement {', '.join(missing)}")
+
+    @classmethod
+    @abstractmethod
+    def validate(cls, fii: FiiDomain) -> bool:
+        pass
+
     @classmethod
-    def validate(cls, fii: FiiDomain) -> bool: ...
+    @abstractmethod
+    def mask(cls, columns: Mapping[str, np.ndarray], as_of: np.ndarray) -> np.ndarray:
+        """Vectorized ``validate`` over column arrays of any broadcastable shape; missing numbers are NaN."""
+        pass
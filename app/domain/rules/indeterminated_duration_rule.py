@@ -1,3 +1,7 @@
+from typing import Mapping
+
+import numpy as np
+
 from app.domain.fii_domain import FiiDomain
 from app.domain.rules.fii_rule import FiiRule
 
@@ -10,3 +14,7 @@ class IndeterminatedDurationRule(FiiRule):
     @classmethod
     def validate(cls, fii: FiiDomain) -> bool:
         return fii.duration in [cls.INDETERMINADO, cls.INDETERMINADA]
+
+    @classmethod
+    def mask(cls, columns: Mapping[str, np.ndarray], as_of: np.ndarray) -> np.ndarray:
+        return np.isin(columns["duration"], [cls.INDETERMINADO, cls.INDETERMINADA])
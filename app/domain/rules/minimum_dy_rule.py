@@ -1,4 +1,7 @@
 from decimal import Decimal
+from typing import Mapping
+
+import numpy as np
 
 from app.domain.fii_domain import FiiDomain
 from app.domain.rules.fii_rule import FiiRule
@@ -14,3 +17,7 @@ class MinimumDyRule(FiiRule):
             return False
 
         return fii.dy_12 >= cls.MINIMUM_DY
+
+    @classmethod
+    def mask(cls, columns: Mapping[str, np.ndarray], as_of: np.ndarray) -> np.ndarray:
+        return columns["dy_12"] >= float(cls.MINIMUM_DY)
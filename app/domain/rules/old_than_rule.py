@@ -1,5 +1,8 @@
 import datetime
 from datetime import timedelta
+from typing import Mapping
+
+import numpy as np
 
 from app.domain.fii_domain import FiiDomain
 from app.domain.rules.fii_rule import FiiRule
@@ -16,3 +19,8 @@ class OldThanRule(FiiRule):
 
         today = datetime.today().date()
         return fii.start_date <= today - cls.ONE_YEAR
+
+    @classmethod
+    def mask(cls, columns: Mapping[str, np.ndarray], as_of: np.ndarray) -> np.ndarray:
+        start_dates = columns["start_date"]
+        return np.isnat(start_dates) | (start_dates <= as_of - np.timedelta64(cls.ONE_YEAR.days, "D"))
@@ -1,3 +1,7 @@
+from typing import Mapping
+
+import numpy as np
+
 from app.domain.fii_domain import FiiDomain
 from app.domain.rules.fii_rule import FiiRule
 
@@ -8,3 +12,7 @@ class PositiveDividendRule(FiiRule):
     @classmethod
     def validate(cls, fii: FiiDomain) -> bool:
         return fii.last_dividend > 0
+
+    @classmethod
+    def mask(cls, columns: Mapping[str, np.ndarray], as_of: np.ndarray) -> np.ndarray:
+        return columns["last_dividend"] > 0
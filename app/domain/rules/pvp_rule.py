@@ -1,3 +1,7 @@
+from typing import Mapping
+
+import numpy as np
+
 from app.domain.fii_domain import FiiDomain
 from app.domain.rules.fii_rule import FiiRule
 
@@ -10,3 +14,7 @@ class PVPRule(FiiRule):
     @classmethod
     def validate(cls, fii: FiiDomain) -> bool:
         return fii.p_vp >= cls.MIN_P_VPA and fii.p_vp <= cls.MAX_P_VPA
+
+    @classmethod
+    def mask(cls, columns: Mapping[str, np.ndarray], as_of: np.ndarray) -> np.ndarray:
+        return (columns["p_vp"] >= cls.MIN_P_VPA) & (columns["p_vp"] <= cls.MAX_P_VPA)
@@ -0,0 +1,165 @@
+import gzip
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Response
+
+from app.libs.single_flight import SingleFlight
+
+try:
+    import brotli
+except ImportError:  # optional: without it bodies are offered as gzip and identity only
+    brotli = None
+
+# cached copies may be kept but are revalidated on every use, which costs a 304 while the data is unchanged
+API_CACHE_CONTROL = "public, no-cache"
+PAGE_CACHE_CONTROL = "private, no-cache"
+# content codings EncodedBody can produce, in order of preference
+CONTENT_CODINGS = ("br", "gzip")
+
+
+def strong_etag(tag: str) -> str:
+    return f'"{tag}"'
+
+
+def coded_etag(etag: str, coding: Optional[str]) -> str:
+    """ETag of one content coding of a representation, since a strong ETag names the exact bytes sent."""
+    return etag if coding is None else f'{etag[:-1]}-{coding}"'
+
+
+def is_not_modified(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match matches with the weak comparison of RFC 9110, so W/ prefixes added by proxies still match.
+
+    The ETag of any content coding matches too: all of them name the same version of the data.
+    """
+    if not if_none_match:
+        return False
+
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    if "*" in candidates:
+        return True
+
+    candidates = {candidate[2:] if candidate.startswith("W/") else candidate for candidate in candidates}
+    return any(coded_etag(etag, coding) in candidates for coding in (None,) + CONTENT_CODINGS)
+
+
+def cache_headers(etag: str, cache_control: str) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag, cache_control))
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """Codings of an Accept-Encoding header with their q-values; ``*`` is kept as is."""
+    accepted = {}
+    for item in (accept_encoding or "").split(","):
+        coding, _, parameters = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        name, _, value = parameters.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+
+    return accepted
+
+
+class EncodedBody:
+    """A JSON body serialized once, with its compressed variants built on first demand and then kept.
+
+    ``headers`` travel with the body, for what is computed together with it. Bodies shorter than
+    ``MIN_COMPRESS_SIZE`` are always sent as they are. A compressed response gets the ETag of its coding.
+    """
+
+    MIN_COMPRESS_SIZE = 512
+    GZIP_LEVEL = 9
+    BROTLI_QUALITY = 9
+
+    def __init__(
+        self, body: bytes, headers: Optional[Dict[str, str]] = None, media_type: str = "application/json"
+    ) -> None:
+        self.body = body
+        self.headers = headers or {}
+        self.media_type = media_type
+        self._variants: Dict[str, bytes] = {}
+
+    @classmethod
+    def encodings(cls) -> Tuple[str, ...]:
+        return CONTENT_CODINGS if brotli is not None else ("gzip",)
+
+    def negotiate(self, accept_encoding: Optional[str]) -> Optional[str]:
+        if len(self.body) < self.MIN_COMPRESS_SIZE:
+            return None
+
+        accepted = accepted_encodings(accept_encoding)
+        for coding in self.encodings():
+            if accepted.get(coding, accepted.get("*", 0.0)) > 0:
+                return coding
+
+        return None
+
+    def encoded(self, coding: Optional[str]) -> bytes:
+        if coding is None:
+            return self.body
+
+        if coding not in self._variants:
+            if coding == "gzip":
+                # mtime=0 makes the bytes depend on the body only
+                self._variants[coding] = gzip.compress(self.body, compresslevel=self.GZIP_LEVEL, mtime=0)
+            elif coding == "br" and brotli is not None:
+                self._variants[coding] = brotli.compress(self.body, quality=self.BROTLI_QUALITY)
+            else:
+                raise ValueError(f"unsupported content coding {coding}")
+
+        return self._variants[coding]
+
+    def response(self, accept_encoding: Optional[str], headers: Optional[Dict[str, str]] = None) -> Response:
+        coding = self.negotiate(accept_encoding)
+        headers = {**self.headers, **(headers or {}), "Vary": "Accept-Encoding"}
+        if coding is not None:
+            headers["Content-Encoding"] = coding
+            if "ETag" in headers:
+                headers["ETag"] = coded_etag(headers["ETag"], coding)
+
+        return Response(content=self.encoded(coding), media_type=self.media_type, headers=headers)
+
+
+class EncodedBodyCache:
+    """The most recently used encoded bodies by tag; a tag names one version of one response.
+
+    Concurrent misses of one tag wait for a single encoding.
+    """
+
+    MAX_ENTRIES = 32
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, name: str = "encoded_bodies") -> None:
+        self.max_entries = max_entries
+        self._bodies: "OrderedDict[str, EncodedBody]" = OrderedDict()
+        self._encodings = SingleFlight(name)
+
+    async def get_or_encode(self, tag: str, encode: Callable[[], Awaitable[EncodedBody]]) -> EncodedBody:
+        body = self._bodies.get(tag)
+        if body is not None:
+            self._bodies.move_to_end(tag)
+            return body
+
+        return await self._encodings.do(tag, lambda: self._encode(tag, encode))
+
+    async def _encode(self, tag: str, encode: Callable[[], Awaitable[EncodedBody]]) -> EncodedBody:
+        body = await encode()
+        self._bodies[tag] = body
+        if len(self._bodies) > self.max_entries:
+            self._bodies.popitem(last=False)
+
+        return body
+
+
+encoded_bodies = EncodedBodyCache()
@@ -0,0 +1,62 @@
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, List
+
+from pydantic import BaseModel
+
+
+class SingleFlightStats(BaseModel):
+    name: str
+    calls: int
+    executions: int
+    coalesced: int
+    in_flight: int
+
+
+class SingleFlight:
+    """Concurrent calls with the same key share one in-flight execution and its result (or error).
+
+    The shared call runs as its own task, so a caller that gives up does not cancel it for the others.
+    Nothing is cached: once the call finishes, the next one with that key starts a new execution.
+    """
+
+    _instances: "weakref.WeakValueDictionary[str, SingleFlight]" = weakref.WeakValueDictionary()
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._calls = 0
+        self._executions = 0
+        SingleFlight._instances[name] = self
+
+    @classmethod
+    def all_stats(cls) -> List[SingleFlightStats]:
+        return [flight.stats() for _, flight in sorted(cls._instances.items())]
+
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            name=self.name,
+            calls=self._calls,
+            executions=self._executions,
+            coalesced=self._calls - self._executions,
+            in_flight=len(self._in_flight),
+        )
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        self._calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            self._executions += 1
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+        # marks the error as retrieved when every caller was cancelled before it was raised
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,159 @@
+from typing import List, Optional
+
+from aioboto3 import Session
+
+from app.config.database import DatabaseConfig
+from app.domain.fii_alert import FiiAlert, FiiAlertRule
+from app.libs.logger import logger
+from app.repositories.fii_alert_repository import FiiAlertRepository
+
+
+class FiiAlertDynamoDBRepository(FiiAlertRepository):
+    """Alert rules and fired alerts in one table.
+
+    Rules share the ``rule`` partition keyed by id. Fired alerts share the ``fired`` partition sorted by their
+    id, which starts with the firing time, so paging after an id is a single key-range query.
+    """
+
+    RULE_PARTITION = "rule"
+    FIRED_PARTITION = "fired"
+
+    def __init__(self, table_name: str = None):
+        self.table_name = table_name or f"{DatabaseConfig.get_dynamodb_table_name()}_alerts"
+        self.region_name = DatabaseConfig.get_aws_region()
+        self.endpoint_url = DatabaseConfig.get_dynamodb_endpoint()
+        credentials = DatabaseConfig.get_aws_credentials()
+
+        # Filter out None values to avoid conflicts
+        self.aws_config = {k: v for k, v in credentials.items() if v is not None}
+        self._session = Session()
+        self._table_ready = False
+
+    async def _get_table(self):
+        async with self._session.resource("dynamodb", endpoint_url=self.endpoint_url, **self.aws_config) as dynamodb:
+            return await dynamodb.Table(self.table_name)
+
+    async def _ensure_table_exists(self):
+        if self._table_ready:
+            return
+
+        try:
+            async with self._session.client("dynamodb", endpoint_url=self.endpoint_url, **self.aws_config) as client:
+                try:
+                    await client.describe_table(TableName=self.table_name)
+                except client.exceptions.ResourceNotFoundException:
+                    logger.info(f"Creating table {self.table_name}")
+                    await client.create_table(
+                        TableName=self.table_name,
+                        KeySchema=[
+                            {"AttributeName": "partition", "KeyType": "HASH"},
+                            {"AttributeName": "position", "KeyType": "RANGE"},
+                        ],
+                        AttributeDefinitions=[
+                            {"AttributeName": "partition", "AttributeType": "S"},
+                            {"AttributeName": "position", "AttributeType": "S"},
+                        ],
+                        BillingMode="PAY_PER_REQUEST",
+                    )
+                    waiter = client.get_waiter("table_exists")
+                    await waiter.wait(TableName=self.table_name)
+                    logger.info(f"Table {self.table_name} created successfully")
+        except Exception as e:
+            logger.error(f"Error ensuring table exists: {e}")
+            raise
+
+        self._table_ready = True
+
+    async def add_rule(self, rule: FiiAlertRule) -> int:
+        await self._ensure_table_exists()
+
+        try:
+            table = await self._get_table()
+            await table.put_item(
+                Item={"partition": self.RULE_PARTITION, "position": rule.id, "payload": rule.model_dump_json()}
+            )
+            logger.info(f"Alert rule {rule.id} stored")
+        except Exception as e:
+            logger.error(f"Error storing alert rule {rule.id}: {e}")
+            raise
+
+        return 1
+
+    async def remove_rule(self, rule_id: str) -> int:
+        await self._ensure_table_exists()
+
+        try:
+            table = await self._get_table()
+            response = await table.delete_item(
+                Key={"partition": self.RULE_PARTITION, "position": rule_id}, ReturnValues="ALL_OLD"
+            )
+        except Exception as e:
+            logger.error(f"Error removing alert rule {rule_id}: {e}")
+            raise
+
+        return 1 if response.get("Attributes") else 0
+
+    async def rules(self) -> List[FiiAlertRule]:
+        await self._ensure_table_exists()
+        items = await self._query(self.RULE_PARTITION, None, None)
+        return [FiiAlertRule.model_validate_json(item["payload"]) for item in items]
+
+    async def add_alerts(self, alerts: List[FiiAlert]) -> int:
+        if not alerts:
+            return 0
+
+        await self._ensure_table_exists()
+
+        try:
+            table = await self._get_table()
+            async with table.batch_writer() as batch:
+                for alert in alerts:
+                    await batch.put_item(
+                        Item={
+                            "partition": self.FIRED_PARTITION,
+                            "position": alert.id,
+                            "payload": alert.model_dump_json(),
+                        }
+                    )
+        except Exception as e:
+            logger.error(f"Error storing {len(alerts)} fired alerts: {e}")
+            raise
+
+        return len(alerts)
+
+    async def alerts(self, after: Optional[str], limit: int) -> List[FiiAlert]:
+        await self._ensure_table_exists()
+        items = await self._query(self.FIRED_PARTITION, after, limit)
+        return [FiiAlert.model_validate_json(item["payload"]) for item in items]
+
+    async def _query(self, partition: str, after: Optional[str], limit: Optional[int]) -> List[dict]:
+        condition = "#partition = :partition"
+        names = {"#partition": "partition"}
+        values = {":partition": partition}
+        if after is not None:
+            condition += " AND #position > :after"
+            names["#position"] = "position"
+            values[":after"] = after
+
+        arguments = {
+            "KeyConditionExpression": condition,
+            "ExpressionAttributeNames": names,
+            "ExpressionAttributeValues": values,
+        }
+        items: List[dict] = []
+
+        try:
+            table = await self._get_table()
+            while limit is None or len(items) < limit:
+                if limit is not None:
+                    arguments["Limit"] = limit - len(items)
+                response = await table.query(**arguments)
+                items.extend(response.get("Items", []))
+                if "LastEvaluatedKey" not in response:
+                    break
+                arguments["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except Exception as e:
+            logger.error(f"Error querying {partition} items: {e}")
+            raise
+
+        return items
@@ -0,0 +1,130 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+
+from app.domain.fii_alert import FiiAlert, FiiAlertIndex, FiiAlertRule
+from app.domain.fii_domain import FiiDomain
+from app.libs.logger import logger
+from app.repositories.fii_alert_repository import FiiAlertRepository
+from app.repositories.fii_alert_repository_factory import FiiAlertRepositoryFactory
+from app.repositories.fii_event_stream import FiiEventStream
+from app.repositories.fii_repository import FiiRepository
+
+
+class FiiAlertEngine:
+    """Evaluates the registered alert rules on every stored write between ``start`` and ``stop``.
+
+    Rules are loaded once into a ``FiiAlertIndex``; registrations made through the engine keep it current.
+    Fired alerts are stored and fanned out through the engine's own ``FiiEventStream``, which closes
+    subscribers that fall behind so they reconnect and catch up from the stored alerts.
+    """
+
+    TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+    def __init__(
+        self,
+        fii_alert_repository: FiiAlertRepository = None,
+        fii_repository: FiiRepository = None,
+        clock: Callable[[], datetime] = None,
+    ) -> None:
+        self._fii_alert_repository = fii_alert_repository
+        self._fii_repository = fii_repository
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._index: Optional[FiiAlertIndex] = None
+        self._lock = asyncio.Lock()
+        self._alert_stream = FiiEventStream()
+
+    @property
+    def fii_alert_repository(self) -> FiiAlertRepository:
+        if self._fii_alert_repository is None:
+            self._fii_alert_repository = FiiAlertRepositoryFactory.create()
+
+        return self._fii_alert_repository
+
+    def start(self) -> None:
+        FiiRepository.add_write_listener(self._on_write)
+
+    def stop(self) -> None:
+        FiiRepository.remove_write_listener(self._on_write)
+
+    async def index(self) -> FiiAlertIndex:
+        if self._index is None:
+            async with self._lock:
+                if self._index is None:
+                    self._index = FiiAlertIndex(await self.fii_alert_repository.rules())
+                    logger.info(f"Alert engine loaded {len(self._index)} rules")
+
+        return self._index
+
+    async def register(self, rule: FiiAlertRule) -> FiiAlertRule:
+        index = await self.index()
+        await self.fii_alert_repository.add_rule(rule)
+        index.add(rule)
+        return rule
+
+    async def unregister(self, rule_id: str) -> bool:
+        index = await self.index()
+        removed = await self.fii_alert_repository.remove_rule(rule_id)
+        index.remove(rule_id)
+        return bool(removed)
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._alert_stream.subscriber_count
+
+    def subscribe(self) -> asyncio.Queue:
+        return self._alert_stream.subscribe()
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._alert_stream.unsubscribe(queue)
+
+    async def evaluate(self, previous: Optional[FiiDomain], fii: FiiDomain) -> List[FiiAlert]:
+        index = await self.index()
+        fired_at = self._clock()
+        moment = fired_at.astimezone(timezone.utc).strftime(self.TIME_FORMAT)
+
+        alerts = [
+            FiiAlert(
+                # starts with the firing time so ids sort chronologically and work as a cursor
+                id=f"{moment}#{fii.ticker}#{rule.id}",
+                rule_id=rule.id,
+                ticker=fii.ticker,
+                field=rule.field,
+                operator=rule.operator,
+                threshold=rule.threshold,
+                value=value,
+                previous_value=previous_value,
+                fired_at=fired_at,
+            )
+            for rule, value, previous_value in index.matches(previous, fii)
+        ]
+        if not alerts:
+            return alerts
+
+        await self.fii_alert_repository.add_alerts(alerts)
+        for alert in alerts:
+            self._alert_stream.publish(alert)
+        logger.info(f"{len(alerts)} alerts fired for FII {fii.ticker}")
+        return alerts
+
+    async def _on_write(self, repository: FiiRepository, fii: FiiDomain, previous: Optional[FiiDomain]) -> None:
+        if self._fii_repository is not None and repository is not self._fii_repository:
+            return
+
+        if fii == previous:
+            return
+
+        await self.evaluate(previous, fii)
+
+
+fii_alert_engine = FiiAlertEngine()
+
+
+class FiiAlertEngineFactory:
+
+    @staticmethod
+    def create(fii_alert_repository: FiiAlertRepository = None) -> FiiAlertEngine:
+        if fii_alert_repository is None:
+            return fii_alert_engine
+
+        return FiiAlertEngine(fii_alert_repository=fii_alert_repository)
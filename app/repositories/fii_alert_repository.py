@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from app.domain.fii_alert import FiiAlert, FiiAlertRule
+
+
+class FiiAlertRepository(ABC):
+
+    @abstractmethod
+    async def add_rule(self, rule: FiiAlertRule) -> int:
+        pass
+
+    @abstractmethod
+    async def remove_rule(self, rule_id: str) -> int:
+        pass
+
+    @abstractmethod
+    async def rules(self) -> List[FiiAlertRule]:
+        pass
+
+    @abstractmethod
+    async def add_alerts(self, alerts: List[FiiAlert]) -> int:
+        pass
+
+    @abstractmethod
+    async def alerts(self, after: Optional[str], limit: int) -> List[FiiAlert]:
+        """Fired alerts with an id greater than ``after``, in id order."""
+        pass
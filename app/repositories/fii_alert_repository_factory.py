@@ -0,0 +1,9 @@
+from app.repositories.fii_alert_dynamodb_repository import FiiAlertDynamoDBRepository
+from app.repositories.fii_alert_repository import FiiAlertRepository
+
+
+class FiiAlertRepositoryFactory:
+
+    @staticmethod
+    def create() -> FiiAlertRepository:
+        return FiiAlertDynamoDBRepository()
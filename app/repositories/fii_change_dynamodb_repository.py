@@ -0,0 +1,146 @@
+import asyncio
+from typing import List, Optional
+
+from aioboto3 import Session
+from botocore.exceptions import ClientError
+
+from app.config.database import DatabaseConfig
+from app.domain.fii_change import FiiChange
+from app.libs.logger import logger
+from app.repositories.fii_change_repository import FiiChangeRepository
+
+
+class FiiChangeDynamoDBRepository(FiiChangeRepository):
+    """The change feed as one partition sorted by version, so reading after a version is a single key range.
+
+    Versions are assigned by conditional puts: a writer that loses a race reloads the latest version and retries.
+    """
+
+    FEED_PARTITION = "changes"
+    MAX_APPEND_ATTEMPTS = 5
+
+    def __init__(self, table_name: str = None):
+        self.table_name = table_name or f"{DatabaseConfig.get_dynamodb_table_name()}_changes"
+        self.region_name = DatabaseConfig.get_aws_region()
+        self.endpoint_url = DatabaseConfig.get_dynamodb_endpoint()
+        credentials = DatabaseConfig.get_aws_credentials()
+
+        # Filter out None values to avoid conflicts
+        self.aws_config = {k: v for k, v in credentials.items() if v is not None}
+        self._session = Session()
+        self._table_ready = False
+        self._version: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    async def _get_table(self):
+        async with self._session.resource("dynamodb", endpoint_url=self.endpoint_url, **self.aws_config) as dynamodb:
+            return await dynamodb.Table(self.table_name)
+
+    async def _ensure_table_exists(self):
+        if self._table_ready:
+            return
+
+        try:
+            async with self._session.client("dynamodb", endpoint_url=self.endpoint_url, **self.aws_config) as client:
+                try:
+                    await client.describe_table(TableName=self.table_name)
+                except client.exceptions.ResourceNotFoundException:
+                    logger.info(f"Creating table {self.table_name}")
+                    await client.create_table(
+                        TableName=self.table_name,
+                        KeySchema=[
+                            {"AttributeName": "feed", "KeyType": "HASH"},
+                            {"AttributeName": "version", "KeyType": "RANGE"},
+                        ],
+                        AttributeDefinitions=[
+                            {"AttributeName": "feed", "AttributeType": "S"},
+                            {"AttributeName": "version", "AttributeType": "N"},
+                        ],
+                        BillingMode="PAY_PER_REQUEST",
+                    )
+                    waiter = client.get_waiter("table_exists")
+                    await waiter.wait(TableName=self.table_name)
+                    logger.info(f"Table {self.table_name} created successfully")
+        except Exception as e:
+            logger.error(f"Error ensuring table exists: {e}")
+            raise
+
+        self._table_ready = True
+
+    async def append(self, change: FiiChange) -> FiiChange:
+        await self._ensure_table_exists()
+
+        async with self._lock:
+            table = await self._get_table()
+            if self._version is None:
+                self._version = await self._query_latest_version(table)
+
+            for _ in range(self.MAX_APPEND_ATTEMPTS):
+                versioned = change.model_copy(update={"version": self._version + 1})
+                try:
+                    await table.put_item(
+                        Item={
+                            "feed": self.FEED_PARTITION,
+                            "version": versioned.version,
+                            "payload": versioned.model_dump_json(),
+                        },
+                        ConditionExpression="attribute_not_exists(#version)",
+                        ExpressionAttributeNames={"#version": "version"},
+                    )
+                    self._version = versioned.version
+                    return versioned
+                except ClientError as e:
+                    if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                        logger.error(f"Error appending change of FII {change.ticker}: {e}")
+                        raise
+
+                    # another process took this version
+                    self._version = await self._query_latest_version(table)
+
+        raise RuntimeError(f"Gave up appending change of FII {change.ticker} after concurrent updates")
+
+    async def since(self, version: int, limit: int) -> List[FiiChange]:
+        await self._ensure_table_exists()
+        changes: List[FiiChange] = []
+
+        try:
+            table = await self._get_table()
+            arguments = {
+                "KeyConditionExpression": "#feed = :feed AND #version > :version",
+                "ExpressionAttributeNames": {"#feed": "feed", "#version": "version"},
+                "ExpressionAttributeValues": {":feed": self.FEED_PARTITION, ":version": version},
+                "Limit": limit,
+            }
+            while len(changes) < limit:
+                response = await table.query(**arguments)
+                changes.extend(FiiChange.model_validate_json(item["payload"]) for item in response.get("Items", []))
+                if "LastEvaluatedKey" not in response:
+                    break
+                arguments["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                arguments["Limit"] = limit - len(changes)
+        except Exception as e:
+            logger.error(f"Error querying changes since version {version}: {e}")
+            raise
+
+        return changes[:limit]
+
+    async def latest_version(self) -> int:
+        await self._ensure_table_exists()
+        return await self._query_latest_version(await self._get_table())
+
+    async def _query_latest_version(self, table) -> int:
+        try:
+            response = await table.query(
+                KeyConditionExpression="#feed = :feed",
+                ExpressionAttributeNames={"#feed": "feed", "#version": "version"},
+                ExpressionAttributeValues={":feed": self.FEED_PARTITION},
+                ProjectionExpression="#version",
+                ScanIndexForward=False,
+                Limit=1,
+            )
+        except Exception as e:
+            logger.error(f"Error querying latest change version: {e}")
+            raise
+
+        items = response.get("Items", [])
+        return int(items[0]["version"]) if items else 0
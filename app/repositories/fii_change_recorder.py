@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from app.domain.fii_change import FiiChangeEvent, change_of
+from app.domain.fii_domain import FiiDomain
+from app.repositories.fii_change_repository import FiiChangeRepository
+from app.repositories.fii_change_repository_factory import FiiChangeRepositoryFactory
+from app.repositories.fii_event_stream import FiiEventStream, FiiEventStreamFactory
+from app.repositories.fii_repository import FiiRepository
+
+
+class FiiChangeRecorder:
+    """Publishes the per-field delta of every changed write to the change feed between ``start`` and ``stop``.
+
+    Once stored, the change is also pushed to the event stream with its feed version.
+    """
+
+    def __init__(
+        self,
+        fii_change_repository: FiiChangeRepository = None,
+        fii_repository: FiiRepository = None,
+        clock: Callable[[], datetime] = None,
+        fii_event_stream: FiiEventStream = None,
+    ) -> None:
+        self._fii_change_repository = fii_change_repository
+        self._fii_repository = fii_repository
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self.fii_event_stream = fii_event_stream or FiiEventStreamFactory.create()
+
+    @property
+    def fii_change_repository(self) -> FiiChangeRepository:
+        if self._fii_change_repository is None:
+            self._fii_change_repository = FiiChangeRepositoryFactory.create()
+
+        return self._fii_change_repository
+
+    def start(self) -> None:
+        FiiRepository.add_write_listener(self._on_write)
+
+    def stop(self) -> None:
+        FiiRepository.remove_write_listener(self._on_write)
+
+    async def _on_write(self, repository: FiiRepository, fii: FiiDomain, previous: Optional[FiiDomain]) -> None:
+        if self._fii_repository is not None and repository is not self._fii_repository:
+            return
+
+        change = change_of(previous, fii, self._clock())
+        if change is not None:
+            stored = await self.fii_change_repository.append(change)
+            self.fii_event_stream.publish(FiiChangeEvent.of(stored))
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from app.domain.fii_change import FiiChange
+
+
+class FiiChangeRepository(ABC):
+
+    @abstractmethod
+    async def append(self, change: FiiChange) -> FiiChange:
+        """Stores the change under the next feed version and returns it with that version."""
+        pass
+
+    @abstractmethod
+    async def since(self, version: int, limit: int) -> List[FiiChange]:
+        pass
+
+    @abstractmethod
+    async def latest_version(self) -> int:
+        pass
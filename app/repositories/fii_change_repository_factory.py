@@ -0,0 +1,9 @@
+from app.repositories.fii_change_dynamodb_repository import FiiChangeDynamoDBRepository
+from app.repositories.fii_change_repository import FiiChangeRepository
+
+
+class FiiChangeRepositoryFactory:
+
+    @staticmethod
+    def create() -> FiiChangeRepository:
+        return FiiChangeDynamoDBRepository()
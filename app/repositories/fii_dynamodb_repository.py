@@ -1,16 +1,24 @@
+import asyncio
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from aioboto3 import Session
 
 from app.config.database import DatabaseConfig
 from app.domain.fii_domain import FiiDomain
 from app.libs.logger import logger
+from app.libs.single_flight import SingleFlight
 from app.repositories.fii_repository import FiiRepository
 
+# shared by every instance, since the factory creates one per use case
+dynamodb_reads = SingleFlight("fii_repository")
+
 
 class FiiDynamoDBRepository(FiiRepository):
+    BATCH_SIZE = 100  # BatchGetItem limit
+    MAX_BATCH_ATTEMPTS = 5
+
     def __init__(self, table_name: str = None):
         self.table_name = table_name or DatabaseConfig.get_dynamodb_table_name()
         self.region_name = DatabaseConfig.get_aws_region()
@@ -87,14 +95,58 @@ class FiiDynamoDBRepository(FiiRepository):
             table = await self._get_table()
             item = self._fii_to_dynamodb_item(fii)
 
-            await table.put_item(Item=item)
+            response = await table.put_item(Item=item, ReturnValues="ALL_OLD")
             logger.info(f"FII {fii.ticker} added successfully to DynamoDB")
-            return 1
         except Exception as e:
             logger.error(f"Error adding FII {fii.ticker} to DynamoDB: {e}")
             raise
 
+        previous_item = response.get("Attributes")
+        previous = self._dynamodb_item_to_fii(previous_item) if previous_item else None
+        await self._notify_write(fii, previous)
+        return 1
+
     async def get(self, ticker: str) -> Optional[FiiDomain]:
+        return await dynamodb_reads.do(("get", self.table_name, ticker), lambda: self._get_item(ticker))
+
+    async def list(self) -> List[FiiDomain]:
+        # concurrent identical scans share one; every caller gets its own list
+        return list(await dynamodb_reads.do(("list", self.table_name), self._scan))
+
+    async def get_many(self, tickers: Iterable[str]) -> Dict[str, FiiDomain]:
+        await self._ensure_table_exists()
+        tickers = list(dict.fromkeys(tickers))
+        fiis: Dict[str, FiiDomain] = {}
+
+        try:
+            async with self._session.resource(
+                "dynamodb", endpoint_url=self.endpoint_url, **self.aws_config
+            ) as dynamodb:
+                for offset in range(0, len(tickers), self.BATCH_SIZE):
+                    keys = [{"ticker": ticker} for ticker in tickers[offset : offset + self.BATCH_SIZE]]
+                    for attempt in range(self.MAX_BATCH_ATTEMPTS):
+                        response = await dynamodb.batch_get_item(RequestItems={self.table_name: {"Keys": keys}})
+                        for item in response.get("Responses", {}).get(self.table_name, []):
+                            fii = self._dynamodb_item_to_fii(item)
+                            fiis[fii.ticker] = fii
+
+                        # throttled keys come back unprocessed and are retried with backoff
+                        keys = response.get("UnprocessedKeys", {}).get(self.table_name, {}).get("Keys", [])
+                        if not keys:
+                            break
+                        await asyncio.sleep(0.05 * 2**attempt)
+                    else:
+                        raise RuntimeError(
+                            f"{len(keys)} FIIs still unprocessed after {self.MAX_BATCH_ATTEMPTS} attempts"
+                        )
+
+            logger.info(f"Retrieved {len(fiis)} of {len(tickers)} requested FIIs from DynamoDB")
+            return fiis
+        except Exception as e:
+            logger.error(f"Error batch getting FIIs from DynamoDB: {e}")
+            raise
+
+    async def _get_item(self, ticker: str) -> Optional[FiiDomain]:
         await self._ensure_table_exists()
 
         try:
@@ -112,7 +164,7 @@ class FiiDynamoDBRepository(FiiRepository):
             logger.error(f"Error getting FII {ticker} from DynamoDB: {e}")
             raise
 
-    async def list(self) -> List[FiiDomain]:
+    async def _scan(self) -> List[FiiDomain]:
         await self._ensure_table_exists()
 
         try:
@@ -0,0 +1,58 @@
+import asyncio
+from typing import Set, Union
+
+from pydantic import BaseModel
+
+from app.domain.fii_change import FiiChangeEvent
+from app.domain.fii_scrape_progress import FiiScrapeProgress
+from app.libs.logger import logger
+
+FiiEvent = Union[FiiChangeEvent, FiiScrapeProgress]
+
+
+class FiiEventStream:
+    """Fan-out of push events to the connected clients: data deltas and scrape progress, or fired alerts.
+
+    Every subscriber gets its own bounded queue. A subscriber that falls ``SUBSCRIBER_QUEUE_SIZE`` events
+    behind is unsubscribed and receives ``CLOSED`` after the events it already has, so its stream ends and
+    the client reconnects from its last change instead of silently missing the newest ones.
+    """
+
+    SUBSCRIBER_QUEUE_SIZE = 1000
+    CLOSED = object()
+
+    def __init__(self) -> None:
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        # one slot beyond the limit is kept for CLOSED
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.SUBSCRIBER_QUEUE_SIZE + 1)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def publish(self, event: BaseModel) -> None:
+        for queue in list(self._subscribers):
+            if queue.qsize() < self.SUBSCRIBER_QUEUE_SIZE:
+                queue.put_nowait(event)
+                continue
+
+            logger.warning("Event subscriber is too slow, closing its stream")
+            self.unsubscribe(queue)
+            queue.put_nowait(self.CLOSED)
+
+
+fii_event_stream = FiiEventStream()
+
+
+class FiiEventStreamFactory:
+
+    @staticmethod
+    def create() -> FiiEventStream:
+        return fii_event_stream
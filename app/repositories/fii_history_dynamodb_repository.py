@@ -0,0 +1,173 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from aioboto3 import Session
+from botocore.exceptions import ClientError
+
+from app.config.database import DatabaseConfig
+from app.domain.fii_domain import FiiDomain, ticker_key
+from app.domain.fii_history import FiiHistorySeries
+from app.libs.logger import logger
+from app.repositories.fii_history_repository import FiiHistoryRepository
+
+
+class FiiHistoryDynamoDBRepository(FiiHistoryRepository):
+    """One item per (ticker, month) holding that month's observations as an encoded columnar payload.
+
+    A range read is a single key-range query per ticker returning one item per month, so "24 months of
+    300 tickers" is 300 concurrent queries of at most 24 small items each. Items are keyed by the normalized
+    (lowercase) ticker, so reads find a FII's history whatever case the caller spells it in.
+    """
+
+    MAX_CONCURRENT_QUERIES = 32
+    MAX_APPEND_ATTEMPTS = 5
+
+    def __init__(self, table_name: str = None):
+        self.table_name = table_name or f"{DatabaseConfig.get_dynamodb_table_name()}_history"
+        self.region_name = DatabaseConfig.get_aws_region()
+        self.endpoint_url = DatabaseConfig.get_dynamodb_endpoint()
+        credentials = DatabaseConfig.get_aws_credentials()
+
+        # Filter out None values to avoid conflicts
+        self.aws_config = {k: v for k, v in credentials.items() if v is not None}
+        self._session = Session()
+        self._table_ready = False
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def _get_table(self):
+        async with self._session.resource("dynamodb", endpoint_url=self.endpoint_url, **self.aws_config) as dynamodb:
+            return await dynamodb.Table(self.table_name)
+
+    async def _ensure_table_exists(self):
+        if self._table_ready:
+            return
+
+        try:
+            async with self._session.client("dynamodb", endpoint_url=self.endpoint_url, **self.aws_config) as client:
+                try:
+                    await client.describe_table(TableName=self.table_name)
+                except client.exceptions.ResourceNotFoundException:
+                    logger.info(f"Creating table {self.table_name}")
+                    await client.create_table(
+                        TableName=self.table_name,
+                        KeySchema=[
+                            {"AttributeName": "ticker", "KeyType": "HASH"},
+                            {"AttributeName": "bucket", "KeyType": "RANGE"},
+                        ],
+                        AttributeDefinitions=[
+                            {"AttributeName": "ticker", "AttributeType": "S"},
+                            {"AttributeName": "bucket", "AttributeType": "S"},
+                        ],
+                        BillingMode="PAY_PER_REQUEST",
+                    )
+                    waiter = client.get_waiter("table_exists")
+                    await waiter.wait(TableName=self.table_name)
+                    logger.info(f"Table {self.table_name} created successfully")
+        except Exception as e:
+            logger.error(f"Error ensuring table exists: {e}")
+            raise
+
+        self._table_ready = True
+
+    @staticmethod
+    def _bucket(moment: datetime) -> str:
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(timezone.utc)
+
+        return moment.strftime("%Y-%m")
+
+    async def append(self, fii: FiiDomain, scraped_at: datetime) -> int:
+        await self._ensure_table_exists()
+        bucket = self._bucket(scraped_at)
+        key = ticker_key(fii.ticker)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+
+        async with lock:
+            table = await self._get_table()
+
+            for _ in range(self.MAX_APPEND_ATTEMPTS):
+                response = await table.get_item(Key={"ticker": key, "bucket": bucket})
+                item = response.get("Item")
+                revision = int(item["revision"]) if item else 0
+                series = self._item_to_series(item) if item else FiiHistorySeries.empty(fii.ticker)
+                series = series.append(fii, scraped_at)
+
+                try:
+                    # optimistic concurrency between processes: the bucket must not have changed since the read
+                    await table.put_item(
+                        Item={
+                            "ticker": key,
+                            "bucket": bucket,
+                            "revision": revision + 1,
+                            "count": len(series),
+                            "payload": series.encode(),
+                        },
+                        ConditionExpression="attribute_not_exists(revision) OR revision = :revision",
+                        ExpressionAttributeValues={":revision": revision},
+                    )
+                    return 1
+                except ClientError as e:
+                    if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                        logger.error(f"Error appending history for FII {fii.ticker}: {e}")
+                        raise
+
+        logger.error(f"Gave up appending history for FII {fii.ticker} after concurrent updates")
+        return 0
+
+    async def range(
+        self, ticker: str, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> FiiHistorySeries:
+        await self._ensure_table_exists()
+        table = await self._get_table()
+        return await self._query(table, ticker, start, end)
+
+    async def range_many(
+        self, tickers: Iterable[str], start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Dict[str, FiiHistorySeries]:
+        await self._ensure_table_exists()
+        table = await self._get_table()
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_QUERIES)
+        tickers = list(dict.fromkeys(tickers))
+
+        async def query(ticker: str) -> FiiHistorySeries:
+            async with semaphore:
+                return await self._query(table, ticker, start, end)
+
+        results = await asyncio.gather(*(query(ticker) for ticker in tickers))
+        logger.info(f"Retrieved history of {len(tickers)} FIIs from DynamoDB")
+        return dict(zip(tickers, results))
+
+    async def _query(self, table, ticker: str, start: Optional[datetime], end: Optional[datetime]) -> FiiHistorySeries:
+        values = {":ticker": ticker_key(ticker)}
+        condition = "ticker = :ticker"
+        if start is not None and end is not None:
+            condition += " AND bucket BETWEEN :start AND :end"
+            values.update({":start": self._bucket(start), ":end": self._bucket(end)})
+        elif start is not None:
+            condition += " AND bucket >= :start"
+            values[":start"] = self._bucket(start)
+        elif end is not None:
+            condition += " AND bucket <= :end"
+            values[":end"] = self._bucket(end)
+
+        try:
+            items: List[dict] = []
+            arguments = {"KeyConditionExpression": condition, "ExpressionAttributeValues": values}
+            while True:
+                response = await table.query(**arguments)
+                items.extend(response.get("Items", []))
+                if "LastEvaluatedKey" not in response:
+                    break
+                arguments["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except Exception as e:
+            logger.error(f"Error querying history for FII {ticker} from DynamoDB: {e}")
+            raise
+
+        series = FiiHistorySeries.concat(ticker, (self._item_to_series(item) for item in items))
+        return series.between(start, end)
+
+    @staticmethod
+    def _item_to_series(item: dict) -> FiiHistorySeries:
+        payload = item["payload"]
+        return FiiHistorySeries.decode(item["ticker"], bytes(getattr(payload, "value", payload)))
@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from app.domain.fii_domain import FiiDomain
+from app.repositories.fii_history_repository import FiiHistoryRepository
+from app.repositories.fii_history_repository_factory import FiiHistoryRepositoryFactory
+from app.repositories.fii_repository import FiiRepository
+
+
+class FiiHistoryRecorder:
+    """Appends every stored FII write to the history store between ``start`` and ``stop``."""
+
+    def __init__(
+        self,
+        fii_history_repository: FiiHistoryRepository = None,
+        fii_repository: FiiRepository = None,
+        clock: Callable[[], datetime] = None,
+    ) -> None:
+        self._fii_history_repository = fii_history_repository
+        self._fii_repository = fii_repository
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+
+    @property
+    def fii_history_repository(self) -> FiiHistoryRepository:
+        if self._fii_history_repository is None:
+            self._fii_history_repository = FiiHistoryRepositoryFactory.create()
+
+        return self._fii_history_repository
+
+    def start(self) -> None:
+        FiiRepository.add_write_listener(self._on_write)
+
+    def stop(self) -> None:
+        FiiRepository.remove_write_listener(self._on_write)
+
+    async def _on_write(self, repository: FiiRepository, fii: FiiDomain, previous: Optional[FiiDomain]) -> None:
+        if self._fii_repository is not None and repository is not self._fii_repository:
+            return
+
+        await self.fii_history_repository.append(fii, self._clock())
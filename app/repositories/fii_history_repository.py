@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from app.domain.fii_domain import FiiDomain
+from app.domain.fii_history import FiiHistorySeries
+
+
+class FiiHistoryRepository(ABC):
+
+    @abstractmethod
+    async def append(self, fii: FiiDomain, scraped_at: datetime) -> int:
+        pass
+
+    @abstractmethod
+    async def range(
+        self, ticker: str, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> FiiHistorySeries:
+        pass
+
+    @abstractmethod
+    async def range_many(
+        self, tickers: Iterable[str], start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Dict[str, FiiHistorySeries]:
+        pass
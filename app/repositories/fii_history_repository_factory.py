@@ -0,0 +1,11 @@
+from app.repositories.fii_history_dynamodb_repository import (
+    FiiHistoryDynamoDBRepository,
+)
+from app.repositories.fii_history_repository import FiiHistoryRepository
+
+
+class FiiHistoryRepositoryFactory:
+
+    @staticmethod
+    def create() -> FiiHistoryRepository:
+        return FiiHistoryDynamoDBRepository()
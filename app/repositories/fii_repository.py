@@ -1,10 +1,19 @@
+import asyncio
+import inspect
+import weakref
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Union
 
 from app.domain.fii_domain import FiiDomain
+from app.libs.logger import logger
+
+# listener(repository, fii, previous) - previous is the stored FII replaced by the write, if any
+WriteListener = Callable[["FiiRepository", FiiDomain, Optional[FiiDomain]], Union[None, Awaitable[None]]]
 
 
 class FiiRepository(ABC):
+    _write_listeners: List[weakref.ReferenceType] = []
+
     @abstractmethod
     async def add(self, fii: FiiDomain) -> int:
         pass
@@ -16,3 +25,42 @@ class FiiRepository(ABC):
     @abstractmethod
     async def list(self) -> List[FiiDomain]:
         pass
+
+    async def get_many(self, tickers: Iterable[str]) -> Dict[str, FiiDomain]:
+        """The stored FIIs among ``tickers``, by ticker; missing tickers are left out.
+
+        Concurrent single reads by default; repositories with a batched read override it.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        fiis = await asyncio.gather(*(self.get(ticker) for ticker in tickers))
+        return {ticker: fii for ticker, fii in zip(tickers, fiis) if fii is not None}
+
+    @staticmethod
+    def add_write_listener(listener: WriteListener) -> None:
+        """Registers a listener called after every stored write. Listeners are weakly referenced."""
+        if inspect.ismethod(listener):
+            ref = weakref.WeakMethod(listener)
+        else:
+            ref = weakref.ref(listener)
+
+        FiiRepository._write_listeners.append(ref)
+
+    @staticmethod
+    def remove_write_listener(listener: WriteListener) -> None:
+        FiiRepository._write_listeners = [
+            ref for ref in FiiRepository._write_listeners if ref() is not None and ref() != listener
+        ]
+
+    async def _notify_write(self, fii: FiiDomain, previous: Optional[FiiDomain] = None) -> None:
+        for ref in list(FiiRepository._write_listeners):
+            listener = ref()
+            if listener is None:
+                FiiRepository._write_listeners.remove(ref)
+                continue
+
+            try:
+                result = listener(self, fii, previous)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Write listener failed for FII {fii.ticker}: {e}")
@@ -0,0 +1,146 @@
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from app.domain.fii_domain import FiiDomain, FiiRollingStats, ticker_key
+from app.domain.fii_history import FiiHistorySeries, to_timestamp
+from app.domain.fii_rolling_stats import FiiRollingAccumulator
+from app.libs.logger import logger
+from app.repositories.fii_history_repository import FiiHistoryRepository
+from app.repositories.fii_history_repository_factory import FiiHistoryRepositoryFactory
+from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_repository_factory import FiiRepositoryFactory
+
+
+class FiiRollingStatsStore:
+    """Rolling statistics per ticker, updated in O(1) by every stored write between ``start`` and ``stop``.
+
+    Tickers are keyed case-insensitively, so lookups match however the ticker was scraped or written.
+
+    History is read once by ``warm_up`` to seed the windows. Writes arriving meanwhile are held back and
+    applied afterwards unless the history read already included them.
+    """
+
+    WARM_UP_PERIOD = timedelta(days=400)
+
+    def __init__(
+        self,
+        fii_repository: FiiRepository = None,
+        fii_history_repository: FiiHistoryRepository = None,
+        clock: Callable[[], datetime] = None,
+    ) -> None:
+        self._fii_repository = fii_repository
+        self._fii_history_repository = fii_history_repository
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._accumulators: Dict[str, FiiRollingAccumulator] = {}
+        self._pending: List[Tuple[datetime, FiiDomain]] = []
+        self._ready = False
+        self._version = 0
+
+    @property
+    def fii_repository(self) -> FiiRepository:
+        return self._fii_repository or FiiRepositoryFactory.create()
+
+    @property
+    def fii_history_repository(self) -> FiiHistoryRepository:
+        if self._fii_history_repository is None:
+            self._fii_history_repository = FiiHistoryRepositoryFactory.create()
+
+        return self._fii_history_repository
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    @property
+    def version(self) -> int:
+        """Bumped whenever any statistics may have changed, including writes of unchanged FIIs."""
+        return self._version
+
+    def start(self) -> None:
+        FiiRepository.add_write_listener(self._on_write)
+
+    def stop(self) -> None:
+        FiiRepository.remove_write_listener(self._on_write)
+
+    def get(self, ticker: str) -> Optional[FiiRollingStats]:
+        accumulator = self._accumulators.get(ticker_key(ticker))
+        return accumulator.stats() if accumulator is not None else None
+
+    def enrich(self, fiis: List[FiiDomain]) -> List[FiiDomain]:
+        """Copies of the FIIs carrying their rolling statistics; FIIs without observations are kept as they are."""
+        enriched = []
+        for fii in fiis:
+            stats = self.get(fii.ticker)
+            enriched.append(fii if stats is None else fii.model_copy(update={"rolling_stats": stats}))
+
+        return enriched
+
+    async def warm_up(self) -> None:
+        until = self._clock()
+        try:
+            tickers = [fii.ticker for fii in await self.fii_repository.list()]
+            histories = await self.fii_history_repository.range_many(tickers, start=until - self.WARM_UP_PERIOD)
+        except Exception as e:
+            # the statistics are auxiliary: without history they simply start from the live writes
+            logger.error(f"Error warming up rolling statistics: {e}")
+            histories = {}
+
+        self.load(histories, until)
+
+    def load(self, histories: Mapping[str, FiiHistorySeries], until: datetime) -> None:
+        self._accumulators = {}
+        for ticker, series in histories.items():
+            series = series.between(None, until)
+            if not len(series):
+                continue
+
+            accumulator = FiiRollingAccumulator()
+            # only the tail that fits in the largest window can influence the statistics
+            tail = slice(-FiiRollingAccumulator.DIVIDEND_WINDOW, None)
+            skipped = max(len(series) - FiiRollingAccumulator.DIVIDEND_WINDOW, 0)
+            accumulator.observations = skipped
+            for values in zip(*(series.columns[field][tail] for field in ("last_price", "last_dividend", "dy_12"))):
+                accumulator.push_values(*values)
+            self._accumulators[ticker_key(ticker)] = accumulator
+
+        pending, self._pending = self._pending, []
+        cutoff = to_timestamp(until)
+        for recorded_at, fii in pending:
+            if to_timestamp(recorded_at) > cutoff:
+                self._push(fii)
+
+        self._ready = True
+        self._version += 1
+        logger.info(f"Rolling statistics seeded for {len(self._accumulators)} FIIs")
+
+    def _on_write(self, repository: FiiRepository, fii: FiiDomain, previous: Optional[FiiDomain]) -> None:
+        if self._fii_repository is not None and repository is not self._fii_repository:
+            return
+
+        if not self._ready:
+            self._pending.append((self._clock(), fii))
+            return
+
+        self._push(fii)
+
+    def _push(self, fii: FiiDomain) -> None:
+        key = ticker_key(fii.ticker)
+        accumulator = self._accumulators.get(key)
+        if accumulator is None:
+            accumulator = self._accumulators[key] = FiiRollingAccumulator()
+
+        accumulator.push(fii)
+        self._version += 1
+
+
+fii_rolling_stats_store = FiiRollingStatsStore()
+
+
+class FiiRollingStatsStoreFactory:
+
+    @staticmethod
+    def create(fii_repository: FiiRepository = None) -> FiiRollingStatsStore:
+        if fii_repository is None:
+            return fii_rolling_stats_store
+
+        return FiiRollingStatsStore(fii_repository=fii_repository)
@@ -0,0 +1,108 @@
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from app.domain.fii_domain import FiiDomain
+from app.domain.fii_snapshot import FiiSnapshot
+from app.domain.fii_validator import FiiValidatorFactory
+from app.libs.logger import logger
+from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+
+
+class FiiScreeningResult(BaseModel):
+    ticker: str
+    passed: bool
+    rejection_reasons: List[str] = []
+    magic_number: Optional[int] = None
+    fii: FiiDomain
+
+
+class FiiScreeningView:
+    """Screening results derived from the shared snapshot, re-evaluated only when its version changes.
+
+    A new version re-evaluates just the FIIs that changed and reuses the results of the others, so the
+    universe is loaded once (through the snapshot cache) and writes never race a separate copy of it.
+    """
+
+    POSITIVE_DIVIDEND_MESSAGE = "Last dividend must be positive"
+    POSITIVE_PRICE_MESSAGE = "Last price must be positive"
+
+    def __init__(
+        self,
+        fii_snapshot_cache: FiiSnapshotCache = None,
+        fii_validator_factory: FiiValidatorFactory = None,
+    ) -> None:
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create()
+        self.fii_validator_factory = fii_validator_factory or FiiValidatorFactory
+        self._snapshot: Optional[FiiSnapshot] = None
+        self._results: Dict[str, FiiScreeningResult] = {}
+        self._passing: Dict[str, FiiScreeningResult] = {}
+
+    async def passing(self) -> List[FiiScreeningResult]:
+        await self._refresh()
+        return list(self._passing.values())
+
+    async def results(self) -> List[FiiScreeningResult]:
+        await self._refresh()
+        return list(self._results.values())
+
+    async def get(self, ticker: str) -> Optional[FiiScreeningResult]:
+        await self._refresh()
+        return self._results.get(ticker)
+
+    def evaluate(self, fii: FiiDomain) -> FiiScreeningResult:
+        validator = self.fii_validator_factory.build()
+        is_valid = validator.validate(fii)
+        rejection_reasons = [] if is_valid else list(validator.rejection_reasons(fii))
+
+        if fii.last_dividend <= 0:
+            rejection_reasons.append(self.POSITIVE_DIVIDEND_MESSAGE)
+        if fii.last_price <= 0:
+            rejection_reasons.append(self.POSITIVE_PRICE_MESSAGE)
+
+        return FiiScreeningResult(
+            ticker=fii.ticker,
+            passed=is_valid and fii.last_dividend > 0 and fii.last_price > 0,
+            rejection_reasons=rejection_reasons,
+            magic_number=int(fii.last_price / fii.last_dividend) if fii.last_dividend > Decimal(0) else None,
+            fii=fii,
+        )
+
+    async def _refresh(self) -> None:
+        snapshot = await self.fii_snapshot_cache.get()
+        if snapshot is self._snapshot:
+            return
+
+        results: Dict[str, FiiScreeningResult] = {}
+        for fii in snapshot.fiis:
+            current = self._results.get(fii.ticker)
+            results[fii.ticker] = current if current is not None and current.fii == fii else self.evaluate(fii)
+
+        self._snapshot = snapshot
+        self._results = results
+        self._passing = {ticker: result for ticker, result in results.items() if result.passed}
+        logger.info(f"Screening view at version {snapshot.version}: {len(self._passing)}/{len(results)} FIIs passing")
+
+
+fii_screening_view = FiiScreeningView()
+
+
+class FiiScreeningViewFactory:
+
+    @staticmethod
+    def create(
+        fii_repository: FiiRepository = None,
+        fii_validator_factory: FiiValidatorFactory = None,
+    ) -> FiiScreeningView:
+        if fii_repository is None and fii_validator_factory is None:
+            return fii_screening_view
+
+        return FiiScreeningView(
+            fii_snapshot_cache=FiiSnapshotCacheFactory.create(fii_repository=fii_repository),
+            fii_validator_factory=fii_validator_factory,
+        )
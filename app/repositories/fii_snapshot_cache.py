@@ -0,0 +1,109 @@
+import uuid
+from typing import Dict, Optional
+
+from app.domain.fii_domain import FiiDomain
+from app.domain.fii_snapshot import FiiSnapshot
+from app.libs.logger import logger
+from app.libs.single_flight import SingleFlight
+from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_repository_factory import FiiRepositoryFactory
+
+
+class FiiSnapshotCache:
+    """Loads the universe once and bumps a data version on every changed write.
+
+    Snapshots are rebuilt in memory at most once per version, so reads never go back to the repository.
+    ``data_version`` prefixes the counter with a per-instance epoch, so it never repeats across restarts.
+
+    Writes arriving before the universe is loaded, including while the load is scanning the repository, are
+    held back and applied on top of the scan, which may or may not have seen them.
+    """
+
+    def __init__(self, fii_repository: FiiRepository = None) -> None:
+        self._fii_repository = fii_repository
+        self._fiis: Dict[str, FiiDomain] = {}
+        self._snapshot: Optional[FiiSnapshot] = None
+        self._pending: Dict[str, FiiDomain] = {}
+        self._loaded = False
+        self._version = 0
+        self._epoch = uuid.uuid4().hex[:8]
+        self._loads = SingleFlight("fii_snapshot_cache")
+
+        FiiRepository.add_write_listener(self._on_write)
+
+    @property
+    def fii_repository(self) -> FiiRepository:
+        return self._fii_repository or FiiRepositoryFactory.create()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def data_version(self) -> Optional[str]:
+        return f"{self._epoch}.{self._version}" if self._loaded else None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    async def get(self) -> FiiSnapshot:
+        if not self._loaded:
+            # requests arriving before the first load wait for it instead of loading again
+            await self._loads.do("load", self._load)
+
+        if self._snapshot is None or self._snapshot.version != self._version:
+            self._snapshot = FiiSnapshot(self._version, self._fiis.values())
+
+        return self._snapshot
+
+    async def warm_up(self) -> None:
+        # page renders read the snapshot, so it is loaded at startup instead of on the first request
+        try:
+            await self.get()
+        except Exception as e:
+            logger.error(f"Error warming up snapshot cache: {e}")
+
+    async def _load(self) -> None:
+        self.load(await self.fii_repository.list())
+
+    def load(self, fiis) -> None:
+        self._fiis = {fii.ticker: fii for fii in fiis}
+        pending, self._pending = self._pending, {}
+        self._fiis.update(pending)
+        self._loaded = True
+        self._version += 1
+        logger.info(f"Snapshot cache loaded {len(self._fiis)} FIIs at version {self._version}")
+
+    def invalidate(self) -> None:
+        self._fiis = {}
+        self._snapshot = None
+        self._loaded = False
+
+    def _on_write(self, repository: FiiRepository, fii: FiiDomain, previous: Optional[FiiDomain]) -> None:
+        if self._fii_repository is not None and repository is not self._fii_repository:
+            return
+
+        if not self._loaded:
+            # the last write of each ticker is at least as recent as whatever the load reads for it
+            self._pending[fii.ticker] = fii
+            return
+
+        if self._fiis.get(fii.ticker) == fii:
+            return
+
+        self._fiis[fii.ticker] = fii
+        self._version += 1
+
+
+fii_snapshot_cache = FiiSnapshotCache()
+
+
+class FiiSnapshotCacheFactory:
+
+    @staticmethod
+    def create(fii_repository: FiiRepository = None) -> FiiSnapshotCache:
+        if fii_repository is None:
+            return fii_snapshot_cache
+
+        return FiiSnapshotCache(fii_repository=fii_repository)
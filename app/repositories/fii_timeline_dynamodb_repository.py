@@ -0,0 +1,190 @@
+import json
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from aioboto3 import Session
+
+from app.config.database import DatabaseConfig
+from app.domain.fii_domain import FiiDomain
+from app.domain.fii_timeline import FiiCheckpoint, FiiDelta
+from app.libs.logger import logger
+from app.repositories.fii_timeline_repository import FiiTimelineRepository
+
+
+class FiiTimelineDynamoDBRepository(FiiTimelineRepository):
+    """Checkpoints and deltas of the FII universe in one table.
+
+    Checkpoints share the ``checkpoint`` partition, sorted by time, so the latest one before a moment is a
+    single reversed query. Deltas are partitioned by day, sorted by ``<recorded_at>#<ticker>``.
+    """
+
+    CHECKPOINT_PARTITION = "checkpoint"
+    TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+    def __init__(self, table_name: str = None):
+        self.table_name = table_name or f"{DatabaseConfig.get_dynamodb_table_name()}_timeline"
+        self.region_name = DatabaseConfig.get_aws_region()
+        self.endpoint_url = DatabaseConfig.get_dynamodb_endpoint()
+        credentials = DatabaseConfig.get_aws_credentials()
+
+        # Filter out None values to avoid conflicts
+        self.aws_config = {k: v for k, v in credentials.items() if v is not None}
+        self._session = Session()
+        self._table_ready = False
+
+    async def _get_table(self):
+        async with self._session.resource("dynamodb", endpoint_url=self.endpoint_url, **self.aws_config) as dynamodb:
+            return await dynamodb.Table(self.table_name)
+
+    async def _ensure_table_exists(self):
+        if self._table_ready:
+            return
+
+        try:
+            async with self._session.client("dynamodb", endpoint_url=self.endpoint_url, **self.aws_config) as client:
+                try:
+                    await client.describe_table(TableName=self.table_name)
+                except client.exceptions.ResourceNotFoundException:
+                    logger.info(f"Creating table {self.table_name}")
+                    await client.create_table(
+                        TableName=self.table_name,
+                        KeySchema=[
+                            {"AttributeName": "partition", "KeyType": "HASH"},
+                            {"AttributeName": "position", "KeyType": "RANGE"},
+                        ],
+                        AttributeDefinitions=[
+                            {"AttributeName": "partition", "AttributeType": "S"},
+                            {"AttributeName": "position", "AttributeType": "S"},
+                        ],
+                        BillingMode="PAY_PER_REQUEST",
+                    )
+                    waiter = client.get_waiter("table_exists")
+                    await waiter.wait(TableName=self.table_name)
+                    logger.info(f"Table {self.table_name} created successfully")
+        except Exception as e:
+            logger.error(f"Error ensuring table exists: {e}")
+            raise
+
+        self._table_ready = True
+
+    @classmethod
+    def _format(cls, moment: datetime) -> str:
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+
+        return moment.astimezone(timezone.utc).strftime(cls.TIME_FORMAT)
+
+    @classmethod
+    def _parse(cls, value: str) -> datetime:
+        return datetime.strptime(value, cls.TIME_FORMAT).replace(tzinfo=timezone.utc)
+
+    async def add_checkpoint(self, fiis: List[FiiDomain], recorded_at: datetime) -> int:
+        await self._ensure_table_exists()
+        payload = json.dumps([fii.model_dump(mode="json") for fii in fiis]).encode()
+
+        try:
+            table = await self._get_table()
+            await table.put_item(
+                Item={
+                    "partition": self.CHECKPOINT_PARTITION,
+                    "position": self._format(recorded_at),
+                    "count": len(fiis),
+                    "payload": zlib.compress(payload),
+                }
+            )
+            logger.info(f"Timeline checkpoint with {len(fiis)} FIIs stored at {self._format(recorded_at)}")
+        except Exception as e:
+            logger.error(f"Error storing timeline checkpoint: {e}")
+            raise
+
+        return 1
+
+    async def add_delta(self, fii: FiiDomain, recorded_at: datetime) -> int:
+        await self._ensure_table_exists()
+
+        try:
+            table = await self._get_table()
+            await table.put_item(
+                Item={
+                    "partition": self._delta_partition(recorded_at),
+                    "position": f"{self._format(recorded_at)}#{fii.ticker}",
+                    "payload": fii.model_dump_json(),
+                }
+            )
+        except Exception as e:
+            logger.error(f"Error storing timeline delta for FII {fii.ticker}: {e}")
+            raise
+
+        return 1
+
+    async def latest_checkpoint(self, at_or_before: datetime) -> Optional[FiiCheckpoint]:
+        await self._ensure_table_exists()
+
+        try:
+            table = await self._get_table()
+            response = await table.query(
+                KeyConditionExpression="#partition = :partition AND #position <= :position",
+                ExpressionAttributeNames={"#partition": "partition", "#position": "position"},
+                ExpressionAttributeValues={
+                    ":partition": self.CHECKPOINT_PARTITION,
+                    ":position": self._format(at_or_before),
+                },
+                ScanIndexForward=False,
+                Limit=1,
+            )
+        except Exception as e:
+            logger.error(f"Error querying timeline checkpoint: {e}")
+            raise
+
+        items = response.get("Items", [])
+        if not items:
+            return None
+
+        payload = items[0]["payload"]
+        fiis = json.loads(zlib.decompress(bytes(getattr(payload, "value", payload))))
+        return FiiCheckpoint(
+            recorded_at=self._parse(items[0]["position"]),
+            fiis=[FiiDomain.model_validate(fii) for fii in fiis],
+        )
+
+    async def deltas(self, after: datetime, until: datetime) -> List[FiiDelta]:
+        await self._ensure_table_exists()
+        deltas: List[FiiDelta] = []
+
+        try:
+            table = await self._get_table()
+            day = after.astimezone(timezone.utc).date() if after.tzinfo else after.date()
+            last_day = until.astimezone(timezone.utc).date() if until.tzinfo else until.date()
+
+            while day <= last_day:
+                arguments = {
+                    "KeyConditionExpression": "#partition = :partition AND #position BETWEEN :after AND :until",
+                    "ExpressionAttributeNames": {"#partition": "partition", "#position": "position"},
+                    "ExpressionAttributeValues": {
+                        ":partition": f"delta#{day.isoformat()}",
+                        ":after": self._format(after),
+                        ":until": f"{self._format(until)}#\uffff",
+                    },
+                }
+                while True:
+                    response = await table.query(**arguments)
+                    for item in response.get("Items", []):
+                        recorded_at = self._parse(item["position"].split("#", 1)[0])
+                        if recorded_at > after:
+                            deltas.append(
+                                FiiDelta(recorded_at=recorded_at, fii=FiiDomain.model_validate_json(item["payload"]))
+                            )
+                    if "LastEvaluatedKey" not in response:
+                        break
+                    arguments["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+                day += timedelta(days=1)
+        except Exception as e:
+            logger.error(f"Error querying timeline deltas: {e}")
+            raise
+
+        return deltas
+
+    def _delta_partition(self, recorded_at: datetime) -> str:
+        return f"delta#{self._format(recorded_at)[:10]}"
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from typing import Callable, List
+
+from app.domain.fii_domain import FiiDomain
+from app.domain.fii_timeline import end_of_day
+from app.libs.logger import logger
+from app.repositories.fii_timeline_repository import FiiTimelineRepository
+from app.repositories.fii_timeline_repository_factory import (
+    FiiTimelineRepositoryFactory,
+)
+
+
+class FiiTimelineReader:
+    """Rebuilds the FII universe at a past date from the latest checkpoint plus the deltas after it.
+
+    Days that are already over cannot change anymore, so their reconstructions are kept in a small LRU.
+    """
+
+    CACHE_SIZE = 32
+
+    def __init__(
+        self, fii_timeline_repository: FiiTimelineRepository = None, clock: Callable[[], datetime] = None
+    ) -> None:
+        self._fii_timeline_repository = fii_timeline_repository
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._cache: "OrderedDict[date, List[FiiDomain]]" = OrderedDict()
+
+    @property
+    def fii_timeline_repository(self) -> FiiTimelineRepository:
+        if self._fii_timeline_repository is None:
+            self._fii_timeline_repository = FiiTimelineRepositoryFactory.create()
+
+        return self._fii_timeline_repository
+
+    async def as_of(self, as_of: date) -> List[FiiDomain]:
+        if as_of in self._cache:
+            self._cache.move_to_end(as_of)
+            return list(self._cache[as_of])
+
+        moment = end_of_day(as_of)
+        checkpoint = await self.fii_timeline_repository.latest_checkpoint(moment)
+
+        if checkpoint is None:
+            logger.info(f"No timeline checkpoint at or before {as_of.isoformat()}")
+            fiis = []
+        else:
+            deltas = await self.fii_timeline_repository.deltas(checkpoint.recorded_at, moment)
+            fiis = checkpoint.replay(deltas)
+            logger.info(f"Rebuilt {len(fiis)} FIIs as of {as_of.isoformat()} with {len(deltas)} deltas")
+
+        if moment < self._clock():
+            self._cache[as_of] = fiis
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        return list(fiis)
+
+
+fii_timeline_reader = FiiTimelineReader()
+
+
+class FiiTimelineReaderFactory:
+
+    @staticmethod
+    def create(fii_timeline_repository: FiiTimelineRepository = None) -> FiiTimelineReader:
+        if fii_timeline_repository is None:
+            return fii_timeline_reader
+
+        return FiiTimelineReader(fii_timeline_repository=fii_timeline_repository)
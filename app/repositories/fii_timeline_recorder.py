@@ -0,0 +1,68 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from app.domain.fii_domain import FiiDomain
+from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_timeline_repository import FiiTimelineRepository
+from app.repositories.fii_timeline_repository_factory import (
+    FiiTimelineRepositoryFactory,
+)
+
+
+class FiiTimelineRecorder:
+    """Records changed writes as deltas, replacing one with a full checkpoint once per ``CHECKPOINT_INTERVAL``.
+
+    Deltas therefore never span more than one interval after a checkpoint, which bounds the replay of any
+    point-in-time read.
+    """
+
+    CHECKPOINT_INTERVAL = timedelta(days=1)
+
+    def __init__(
+        self,
+        fii_timeline_repository: FiiTimelineRepository = None,
+        fii_repository: FiiRepository = None,
+        clock: Callable[[], datetime] = None,
+    ) -> None:
+        self._fii_timeline_repository = fii_timeline_repository
+        self._fii_repository = fii_repository
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._last_checkpoint: Optional[datetime] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def fii_timeline_repository(self) -> FiiTimelineRepository:
+        if self._fii_timeline_repository is None:
+            self._fii_timeline_repository = FiiTimelineRepositoryFactory.create()
+
+        return self._fii_timeline_repository
+
+    def start(self) -> None:
+        FiiRepository.add_write_listener(self._on_write)
+
+    def stop(self) -> None:
+        FiiRepository.remove_write_listener(self._on_write)
+
+    async def _on_write(self, repository: FiiRepository, fii: FiiDomain, previous: Optional[FiiDomain]) -> None:
+        if self._fii_repository is not None and repository is not self._fii_repository:
+            return
+
+        if fii == previous:
+            return
+
+        async with self._lock:
+            # taken inside the lock so a delta is never older than a checkpoint written before it
+            recorded_at = self._clock()
+
+            if self._last_checkpoint is None:
+                checkpoint = await self.fii_timeline_repository.latest_checkpoint(recorded_at)
+                self._last_checkpoint = (
+                    checkpoint.recorded_at if checkpoint else datetime.min.replace(tzinfo=timezone.utc)
+                )
+
+            if recorded_at - self._last_checkpoint >= self.CHECKPOINT_INTERVAL:
+                await self.fii_timeline_repository.add_checkpoint(await repository.list(), recorded_at)
+                self._last_checkpoint = recorded_at
+            else:
+                await self.fii_timeline_repository.add_delta(fii, recorded_at)
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from app.domain.fii_domain import FiiDomain
+from app.domain.fii_timeline import FiiCheckpoint, FiiDelta
+
+
+class FiiTimelineRepository(ABC):
+
+    @abstractmethod
+    async def add_checkpoint(self, fiis: List[FiiDomain], recorded_at: datetime) -> int:
+        pass
+
+    @abstractmethod
+    async def add_delta(self, fii: FiiDomain, recorded_at: datetime) -> int:
+        pass
+
+    @abstractmethod
+    async def latest_checkpoint(self, at_or_before: datetime) -> Optional[FiiCheckpoint]:
+        pass
+
+    @abstractmethod
+    async def deltas(self, after: datetime, until: datetime) -> List[FiiDelta]:
+        pass
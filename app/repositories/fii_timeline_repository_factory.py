@@ -0,0 +1,11 @@
+from app.repositories.fii_timeline_dynamodb_repository import (
+    FiiTimelineDynamoDBRepository,
+)
+from app.repositories.fii_timeline_repository import FiiTimelineRepository
+
+
+class FiiTimelineRepositoryFactory:
+
+    @staticmethod
+    def create() -> FiiTimelineRepository:
+        return FiiTimelineDynamoDBRepository()
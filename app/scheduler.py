@@ -88,11 +88,11 @@ class FiiScheduler:
             else:
                 logger.info(f"📊 Updating {len(existing_tickers)} existing FIIs and discovering new ones")
                 try:
-                    scraped_fiis = await usecase.execute()
+                    scraped_fiis = await usecase.execute(refresh=True)
                     logger.info(f"✅ Scheduled update completed: {len(scraped_fiis)} FIIs updated from gateway")
                 except Exception as gateway_error:
                     logger.warning(f"⚠️ Gateway failed, updating existing FIIs only: {gateway_error}")
-                    scraped_fiis = await usecase.execute(tickers=existing_tickers)
+                    scraped_fiis = await usecase.execute(tickers=existing_tickers, refresh=True)
                     logger.info(f"✅ Existing FIIs updated: {len(scraped_fiis)} FIIs")
 
         except Exception as e:
@@ -0,0 +1,118 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.domain.fii_alert import FiiAlert, FiiAlertPage, FiiAlertRule
+from app.repositories.fii_alert_engine import FiiAlertEngine, FiiAlertEngineFactory
+from app.repositories.fii_event_stream import FiiEventStream
+
+
+class AlertRuleRequest(BaseModel):
+    field: str = Field(..., description="Campo numérico do FII, ex: dy_12")
+    operator: str = Field(..., description="Um de >, >=, <, <=")
+    threshold: float = Field(..., description="Valor de referência")
+    ticker: Optional[str] = Field(None, description="Restringe o alerta a um FII")
+    segment: Optional[str] = Field(None, description="Restringe o alerta a um segmento")
+
+
+class FiiAlertRegisterUseCase:
+    def __init__(self, request: AlertRuleRequest, fii_alert_engine: FiiAlertEngine = None) -> None:
+        if request.ticker and request.segment:
+            raise ValueError("An alert applies to a ticker or to a segment, not both")
+
+        # validation errors of the rule are ValueErrors, raised before anything is stored
+        self.rule = FiiAlertRule(id=uuid.uuid4().hex, created_at=datetime.now(timezone.utc), **request.model_dump())
+        self.fii_alert_engine = fii_alert_engine or FiiAlertEngineFactory.create()
+
+    async def execute(self) -> FiiAlertRule:
+        return await self.fii_alert_engine.register(self.rule)
+
+
+class FiiAlertRuleListUseCase:
+    def __init__(self, fii_alert_engine: FiiAlertEngine = None) -> None:
+        self.fii_alert_engine = fii_alert_engine or FiiAlertEngineFactory.create()
+
+    async def execute(self) -> List[FiiAlertRule]:
+        index = await self.fii_alert_engine.index()
+        return sorted(index.rules.values(), key=lambda rule: (rule.created_at is None, rule.created_at, rule.id))
+
+
+class FiiAlertRemoveUseCase:
+    def __init__(self, rule_id: str, fii_alert_engine: FiiAlertEngine = None) -> None:
+        self.rule_id = rule_id
+        self.fii_alert_engine = fii_alert_engine or FiiAlertEngineFactory.create()
+
+    async def execute(self) -> bool:
+        return await self.fii_alert_engine.unregister(self.rule_id)
+
+
+class FiiAlertListUseCase:
+    MAX_LIMIT = 1000
+
+    def __init__(self, after: Optional[str] = None, limit: int = 100, fii_alert_engine: FiiAlertEngine = None) -> None:
+        if not 1 <= limit <= self.MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {self.MAX_LIMIT}")
+
+        self.after = after
+        self.limit = limit
+        self.fii_alert_engine = fii_alert_engine or FiiAlertEngineFactory.create()
+
+    async def execute(self) -> FiiAlertPage:
+        alerts = await self.fii_alert_engine.fii_alert_repository.alerts(self.after, self.limit + 1)
+        page = alerts[: self.limit]
+        return FiiAlertPage(
+            alerts=page,
+            next_after=page[-1].id if page else self.after,
+            has_more=len(alerts) > self.limit,
+        )
+
+
+class FiiAlertStreamUseCase:
+    """Server-sent events of fired alerts, replaying the stored ones after ``after`` before going live.
+
+    A subscriber closed for falling behind ends the stream; the client reconnects with its last event id.
+    """
+
+    HEARTBEAT_SECONDS = 15
+    REPLAY_PAGE = 500
+
+    def __init__(self, after: Optional[str] = None, fii_alert_engine: FiiAlertEngine = None) -> None:
+        self.after = after
+        self.fii_alert_engine = fii_alert_engine or FiiAlertEngineFactory.create()
+
+    async def execute(self) -> AsyncIterator[str]:
+        # subscribing before the replay means nothing fired in between is lost
+        queue = self.fii_alert_engine.subscribe()
+        try:
+            last = self.after
+            if last is not None:
+                while True:
+                    alerts = await self.fii_alert_engine.fii_alert_repository.alerts(last, self.REPLAY_PAGE)
+                    for alert in alerts:
+                        yield self._event(alert)
+                        last = alert.id
+                    if len(alerts) < self.REPLAY_PAGE:
+                        break
+
+            while True:
+                try:
+                    alert = await asyncio.wait_for(queue.get(), timeout=self.HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if alert is FiiEventStream.CLOSED:
+                    return
+                if last is not None and alert.id <= last:
+                    continue
+                yield self._event(alert)
+                last = alert.id
+        finally:
+            self.fii_alert_engine.unsubscribe(queue)
+
+    @staticmethod
+    def _event(alert: FiiAlert) -> str:
+        return f"id: {alert.id}\nevent: alert\ndata: {alert.model_dump_json()}\n\n"
@@ -1,10 +1,19 @@
+from datetime import date
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
 from app.domain.fii_domain import FiiDomain
 from app.domain.fii_validator import FiiValidatorFactory
 from app.repositories.fii_repository import FiiRepository
 from app.repositories.fii_repository_factory import FiiRepositoryFactory
+from app.repositories.fii_screening_view import (
+    FiiScreeningView,
+    FiiScreeningViewFactory,
+)
+from app.repositories.fii_timeline_reader import (
+    FiiTimelineReader,
+    FiiTimelineReaderFactory,
+)
 
 
 class FiiAnalyserUsecase:
@@ -13,12 +22,23 @@ class FiiAnalyserUsecase:
         percentage: Decimal = None,
         fii_validator_factory: FiiValidatorFactory = None,
         fii_repository: FiiRepository = None,
+        fii_screening_view: FiiScreeningView = None,
+        as_of: Optional[date] = None,
+        fii_timeline_reader: FiiTimelineReader = None,
     ) -> None:
         self.percentage = percentage or Decimal(6)
         self.fii_validator_factory = fii_validator_factory or FiiValidatorFactory
         self.fii_repository = fii_repository or FiiRepositoryFactory.create()
+        self.fii_screening_view = fii_screening_view or FiiScreeningViewFactory.create(
+            fii_repository=fii_repository, fii_validator_factory=fii_validator_factory
+        )
+        self.as_of = as_of
+        self.fii_timeline_reader = fii_timeline_reader or FiiTimelineReaderFactory.create()
 
     async def execute(self, tickers: List[str] = None) -> List[FiiDomain]:
+        if self.as_of is not None:
+            return await self._execute_as_of(tickers)
+
         fiis = []
 
         if tickers:
@@ -27,21 +47,29 @@ class FiiAnalyserUsecase:
                 if fii is not None:
                     fiis.append(fii)
         else:
-            all_fiis = await self.fii_repository.list()
-            for fii in all_fiis:
-                is_valid = self.fii_validator_factory.build().validate(fii)
-                if is_valid and fii.dy_12 >= self.percentage and fii.last_dividend > 0 and fii.last_price > 0:
-                    fiis.append(fii)
+            for result in await self.fii_screening_view.passing():
+                if result.fii.dy_12 >= self.percentage:
+                    fiis.append(result.fii)
 
         return fiis
 
+    async def _execute_as_of(self, tickers: List[str] = None) -> List[FiiDomain]:
+        fiis = await self.fii_timeline_reader.as_of(self.as_of)
+
+        if tickers:
+            by_ticker = {fii.ticker: fii for fii in fiis}
+            fiis = [by_ticker[ticker] for ticker in tickers if ticker in by_ticker]
+
+        return [fii for fii in fiis if self._passes(fii)]
+
+    def _passes(self, fii: FiiDomain) -> bool:
+        return self.fii_screening_view.evaluate(fii).passed and fii.dy_12 >= self.percentage
+
     async def _get(self, ticker: str) -> FiiDomain:
         fii = await self.fii_repository.get(ticker)
 
         if fii is None:
             return None
 
-        is_valid = self.fii_validator_factory.build().validate(fii)
-
-        if is_valid and fii.dy_12 >= self.percentage and fii.last_dividend > 0 and fii.last_price > 0:
+        if self._passes(fii):
             return fii
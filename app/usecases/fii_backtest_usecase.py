@@ -0,0 +1,67 @@
+from datetime import date, datetime, time, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.domain.fii_backtester import FiiBacktester, FiiBacktestResult
+from app.domain.fii_domain import FiiDomain
+from app.domain.fii_history_panel import FiiHistoryPanel
+from app.domain.fii_validator import FiiValidatorFactory
+from app.repositories.fii_history_repository import FiiHistoryRepository
+from app.repositories.fii_history_repository_factory import FiiHistoryRepositoryFactory
+from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+
+
+class FiiBacktestUseCase:
+    """Backtests rule profiles over the stored history of the current universe.
+
+    Fields the history does not keep (duration, start date, segment) come from the current data.
+    """
+
+    def __init__(
+        self,
+        years: int = 5,
+        profiles: Optional[List[str]] = None,
+        end: Optional[date] = None,
+        fii_repository: FiiRepository = None,
+        fii_snapshot_cache: FiiSnapshotCache = None,
+        fii_history_repository: FiiHistoryRepository = None,
+        backtester: FiiBacktester = None,
+    ) -> None:
+        self.years = years
+        self.end = end or datetime.now(timezone.utc).date()
+        self.start = date(self.end.year - years, self.end.month, 1)
+        # validated here so an unknown profile fails before any history is read
+        self.validators = {
+            name: FiiValidatorFactory.build_profile(name) for name in profiles or list(FiiValidatorFactory.PROFILES)
+        }
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create(fii_repository=fii_repository)
+        self.fii_history_repository = fii_history_repository or FiiHistoryRepositoryFactory.create()
+        self.backtester = backtester or FiiBacktester()
+
+    async def execute(self) -> FiiBacktestResult:
+        snapshot = await self.fii_snapshot_cache.get()
+        histories = await self.fii_history_repository.range_many(
+            [fii.ticker for fii in snapshot.fiis],
+            datetime.combine(self.start, time.min, tzinfo=timezone.utc),
+            datetime.combine(self.end, time.max, tzinfo=timezone.utc),
+        )
+
+        panel = FiiHistoryPanel.build(histories, self.start, self.end)
+        return self.backtester.run(panel, self._static_columns(snapshot.fiis), self.validators)
+
+    @staticmethod
+    def _static_columns(fiis) -> Dict[str, np.ndarray]:
+        fiis: List[FiiDomain] = list(fiis)
+        return {
+            "duration": np.array([fii.duration for fii in fiis], dtype=object),
+            "segment": np.array([fii.segment for fii in fiis], dtype=object),
+            "start_date": np.array(
+                [np.datetime64(fii.start_date, "D") if fii.start_date else np.datetime64("NaT", "D") for fii in fiis],
+                dtype="datetime64[D]",
+            ),
+        }
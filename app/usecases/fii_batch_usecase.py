@@ -0,0 +1,88 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, TypeAdapter
+
+from app.domain.fii_domain import FiiDomain, ticker_key
+from app.libs.http_cache import EncodedBody
+from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_repository_factory import FiiRepositoryFactory
+from app.repositories.fii_rolling_stats_store import (
+    FiiRollingStatsStore,
+    FiiRollingStatsStoreFactory,
+)
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+from app.usecases.fii_list_usecase import FiiListUseCase
+
+
+class FiiBatchRequest(BaseModel):
+    tickers: List[str]
+
+
+class FiiLookup(BaseModel):
+    ticker: str
+    found: bool
+    fii: Optional[FiiDomain] = None
+
+
+class FiiBatchUseCase:
+    """Looks up an explicit list of tickers, answering in request order with a marker for the missing ones.
+
+    Reads come from the snapshot once it is loaded, and from one batched repository read before that,
+    so the cost follows the number of tickers rather than the universe.
+    """
+
+    MAX_TICKERS = 100
+    SERIALIZER = TypeAdapter(List[FiiLookup])
+
+    def __init__(
+        self,
+        tickers: List[str],
+        fields: Optional[str] = None,
+        fii_repository: FiiRepository = None,
+        fii_snapshot_cache: FiiSnapshotCache = None,
+        fii_rolling_stats_store: FiiRollingStatsStore = None,
+    ) -> None:
+        # repeated tickers are answered once, at their first position, whatever their case
+        requested = {}
+        for ticker in tickers:
+            if ticker.strip():
+                requested.setdefault(ticker_key(ticker), ticker.strip())
+        self.tickers = list(requested.values())
+        if not 1 <= len(self.tickers) <= self.MAX_TICKERS:
+            raise ValueError(f"tickers must list between 1 and {self.MAX_TICKERS} FIIs")
+
+        self.fields = FiiListUseCase.parse_fields(fields)
+        self.fii_repository = fii_repository or FiiRepositoryFactory.create()
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create(fii_repository=fii_repository)
+        self.fii_rolling_stats_store = fii_rolling_stats_store or FiiRollingStatsStoreFactory.create()
+
+    async def execute(self) -> List[FiiLookup]:
+        found = await self._found()
+        lookups = []
+        for ticker in self.tickers:
+            fii = found.get(ticker_key(ticker))
+            # found FIIs answer with the stored ticker, missing ones with the requested one
+            lookups.append(FiiLookup(ticker=fii.ticker if fii else ticker, found=fii is not None, fii=fii))
+
+        return lookups
+
+    async def encoded(self) -> EncodedBody:
+        include = None
+        if self.fields:
+            include = {"__all__": {"ticker": True, "found": True, "fii": set(self.fields)}}
+
+        return EncodedBody(self.SERIALIZER.dump_json(await self.execute(), include=include))
+
+    async def _found(self) -> Dict[str, FiiDomain]:
+        if self.fii_snapshot_cache.is_loaded:
+            snapshot = await self.fii_snapshot_cache.get()
+            fiis = [fii for fii in (snapshot.get(ticker) for ticker in self.tickers) if fii is not None]
+        else:
+            # keys are case-sensitive in the repository, so each ticker is read as written and in both cases
+            candidates = [form for ticker in self.tickers for form in (ticker, ticker.lower(), ticker.upper())]
+            fiis = list((await self.fii_repository.get_many(candidates)).values())
+
+        return {ticker_key(fii.ticker): fii for fii in self.fii_rolling_stats_store.enrich(fiis)}
@@ -0,0 +1,35 @@
+from app.domain.fii_change import FiiChangePage
+from app.repositories.fii_change_repository import FiiChangeRepository
+from app.repositories.fii_change_repository_factory import FiiChangeRepositoryFactory
+
+
+class FiiChangesUseCase:
+    MAX_LIMIT = 1000
+
+    def __init__(self, since: int = 0, limit: int = 100, fii_change_repository: FiiChangeRepository = None) -> None:
+        if since < 0:
+            raise ValueError("since must not be negative")
+        if not 1 <= limit <= self.MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {self.MAX_LIMIT}")
+
+        self.since = since
+        self.limit = limit
+        self.fii_change_repository = fii_change_repository or FiiChangeRepositoryFactory.create()
+
+    async def execute(self) -> FiiChangePage:
+        # one extra change tells whether another page follows without a second query
+        changes = await self.fii_change_repository.since(self.since, self.limit + 1)
+        page = changes[: self.limit]
+        has_more = len(changes) > self.limit
+        if page and not has_more:
+            latest_version = page[-1].version
+        else:
+            latest_version = await self.fii_change_repository.latest_version()
+
+        return FiiChangePage(
+            since=self.since,
+            next_since=page[-1].version if page else self.since,
+            latest_version=latest_version,
+            has_more=has_more,
+            changes=page,
+        )
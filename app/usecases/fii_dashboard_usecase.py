@@ -0,0 +1,164 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from app.domain.fii_domain import FiiDomain
+from app.domain.fii_snapshot import FiiSnapshot
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+from app.usecases.fii_magic_number_usecase import (
+    FiiMagicNumberTable,
+    MagicNumberResponse,
+)
+
+
+class FiiDashboardStats(BaseModel):
+    total_fiis: int
+    positive_dy: int
+    magic_numbers: int
+    avg_liquidity: float
+
+
+class FiiDashboardRow(BaseModel):
+    ticker: str
+    last_price: float
+    p_vp: float
+    dy_12: float
+    dialy_liquidity: float
+    segment: Optional[str] = None
+    duration: Optional[str] = None
+    magic_number: bool
+
+
+class FiiDashboardTablePage(BaseModel):
+    version: int
+    stats: FiiDashboardStats
+    total: int
+    offset: int
+    sort: str
+    order: str
+    rows: List[FiiDashboardRow]
+
+
+class FiiDashboard:
+    """Everything the dashboard page shows, computed once per snapshot version.
+
+    The table is served in pages; every sort order is computed the first time it is asked for and kept
+    for the version, so a page is a slice of positions.
+    """
+
+    INVESTED_VALUE = 10000
+    SORT_FIELDS = ("ticker", "last_price", "p_vp", "dy_12", "dialy_liquidity", "segment", "duration")
+
+    def __init__(self, snapshot: FiiSnapshot) -> None:
+        self.snapshot = snapshot
+        self.version = snapshot.version
+        self.fiis: List[FiiDomain] = list(snapshot.fiis)
+        self.magic_numbers: List[MagicNumberResponse] = FiiMagicNumberTable.for_snapshot(snapshot).responses(
+            self.INVESTED_VALUE
+        )
+        magic_tickers = {magic.ticker for magic in self.magic_numbers}
+        self.magic_mask = np.array([fii.ticker in magic_tickers for fii in self.fiis], dtype=bool)
+        self._orders: Dict[Tuple[str, bool, bool], np.ndarray] = {}
+
+        total = len(snapshot)
+        liquidity = snapshot.columns["dialy_liquidity"]
+        self.stats = FiiDashboardStats(
+            total_fiis=total,
+            positive_dy=int((snapshot.columns["dy_12"] > 0).sum()),
+            magic_numbers=len(self.magic_numbers),
+            avg_liquidity=float(liquidity.sum()) / total / 1000000 if total else 0.0,
+        )
+
+    @classmethod
+    def for_snapshot(cls, snapshot: FiiSnapshot) -> "FiiDashboard":
+        return snapshot.memoize("dashboard", lambda: cls(snapshot))
+
+    def order(self, sort: str = "ticker", descending: bool = False, magic_only: bool = False) -> np.ndarray:
+        if sort not in self.SORT_FIELDS:
+            raise ValueError(f"sort must be one of {', '.join(self.SORT_FIELDS)}")
+
+        key = (sort, descending, magic_only)
+        if key not in self._orders:
+            order = self.snapshot.order(sort, descending)
+            self._orders[key] = order[self.magic_mask[order]] if magic_only else order
+
+        return self._orders[key]
+
+    def page(
+        self, offset: int, limit: int, sort: str = "ticker", descending: bool = False, magic_only: bool = False
+    ) -> FiiDashboardTablePage:
+        order = self.order(sort, descending, magic_only)
+        rows = []
+        for position in order[offset : offset + limit].tolist():
+            fii = self.fiis[position]
+            rows.append(
+                FiiDashboardRow(
+                    ticker=fii.ticker,
+                    last_price=float(fii.last_price or 0),
+                    p_vp=float(fii.p_vp or 0),
+                    dy_12=float(fii.dy_12 or 0),
+                    dialy_liquidity=float(fii.dialy_liquidity or 0),
+                    segment=fii.segment,
+                    duration=fii.duration,
+                    magic_number=bool(self.magic_mask[position]),
+                )
+            )
+
+        return FiiDashboardTablePage(
+            version=self.version,
+            stats=self.stats,
+            total=len(order),
+            offset=offset,
+            sort=sort,
+            order="desc" if descending else "asc",
+            rows=rows,
+        )
+
+
+class FiiDashboardUseCase:
+    def __init__(self, fii_snapshot_cache: FiiSnapshotCache = None) -> None:
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create()
+
+    def etag(self) -> Optional[str]:
+        data_version = self.fii_snapshot_cache.data_version
+        return None if data_version is None else f"dashboard-{data_version}"
+
+    async def execute(self) -> FiiDashboard:
+        return FiiDashboard.for_snapshot(await self.fii_snapshot_cache.get())
+
+
+class FiiDashboardTableUseCase:
+    MAX_LIMIT = 500
+
+    def __init__(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        sort: str = "ticker",
+        order: str = "asc",
+        magic_only: bool = False,
+        fii_snapshot_cache: FiiSnapshotCache = None,
+    ) -> None:
+        if offset < 0:
+            raise ValueError("offset must not be negative")
+        if not 1 <= limit <= self.MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {self.MAX_LIMIT}")
+        if sort not in FiiDashboard.SORT_FIELDS:
+            raise ValueError(f"sort must be one of {', '.join(FiiDashboard.SORT_FIELDS)}")
+        if order not in ("asc", "desc"):
+            raise ValueError("order must be asc or desc")
+
+        self.offset = offset
+        self.limit = limit
+        self.sort = sort
+        self.descending = order == "desc"
+        self.magic_only = magic_only
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create()
+
+    async def execute(self) -> FiiDashboardTablePage:
+        dashboard = FiiDashboard.for_snapshot(await self.fii_snapshot_cache.get())
+        return dashboard.page(self.offset, self.limit, self.sort, self.descending, self.magic_only)
@@ -0,0 +1,79 @@
+import asyncio
+from typing import AsyncIterator, Optional
+
+from app.domain.fii_change import FiiChangeEvent
+from app.domain.fii_scrape_progress import FiiScrapeProgress
+from app.repositories.fii_change_repository import FiiChangeRepository
+from app.repositories.fii_change_repository_factory import FiiChangeRepositoryFactory
+from app.repositories.fii_event_stream import FiiEventStream, FiiEventStreamFactory
+
+
+class FiiEventStreamUseCase:
+    """Server-sent events of data deltas and scrape progress.
+
+    Deltas carry their change feed version as the event id; with ``since``, the changes stored after that
+    version are replayed from the feed before going live. Progress events have no id and are not replayed.
+    A subscriber closed for falling behind ends the stream; the client reconnects with its last event id.
+    """
+
+    HEARTBEAT_SECONDS = 15
+    REPLAY_PAGE = 500
+
+    def __init__(
+        self,
+        since: Optional[int] = None,
+        fii_event_stream: FiiEventStream = None,
+        fii_change_repository: FiiChangeRepository = None,
+    ) -> None:
+        if since is not None and since < 0:
+            raise ValueError("since must not be negative")
+
+        self.since = since
+        self.fii_event_stream = fii_event_stream or FiiEventStreamFactory.create()
+        self._fii_change_repository = fii_change_repository
+
+    @property
+    def fii_change_repository(self) -> FiiChangeRepository:
+        if self._fii_change_repository is None:
+            self._fii_change_repository = FiiChangeRepositoryFactory.create()
+
+        return self._fii_change_repository
+
+    async def execute(self) -> AsyncIterator[str]:
+        # subscribing before the replay means nothing stored in between is lost
+        queue = self.fii_event_stream.subscribe()
+        try:
+            last = self.since
+            if last is not None:
+                while True:
+                    changes = await self.fii_change_repository.since(last, self.REPLAY_PAGE)
+                    for change in changes:
+                        yield self._event(FiiChangeEvent.of(change))
+                        last = change.version
+                    if len(changes) < self.REPLAY_PAGE:
+                        break
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=self.HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if event is FiiEventStream.CLOSED:
+                    return
+
+                if isinstance(event, FiiChangeEvent):
+                    if last is not None and event.version <= last:
+                        continue
+                    last = event.version
+                yield self._event(event)
+        finally:
+            self.fii_event_stream.unsubscribe(queue)
+
+    @staticmethod
+    def _event(event) -> str:
+        if isinstance(event, FiiScrapeProgress):
+            return f"event: progress\ndata: {event.model_dump_json()}\n\n"
+
+        return f"id: {event.version}\nevent: change\ndata: {event.model_dump_json()}\n\n"
@@ -0,0 +1,121 @@
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Tuple
+
+from app.domain.fii_domain import FiiDomain, FiiRollingStats
+from app.domain.fii_export import WRITERS, FiiExportColumn, FiiExportWriter
+from app.domain.fii_history import FiiHistorySeries, as_utc
+from app.repositories.fii_history_repository import FiiHistoryRepository
+from app.repositories.fii_history_repository_factory import FiiHistoryRepositoryFactory
+from app.repositories.fii_rolling_stats_store import (
+    FiiRollingStatsStore,
+    FiiRollingStatsStoreFactory,
+)
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+
+
+class FiiExportUseCase:
+    """Streams the current FIIs, or their history between ``start`` and ``end``, in chunks of rows.
+
+    Only one chunk of rows (and, for history, one batch of series) is held at a time, so memory does not
+    grow with the size of the universe or of the range.
+    """
+
+    CHUNK_SIZE = 500
+    HISTORY_BATCH = 32
+    ROLLING_FIELDS = ("price_moving_average", "dividend_volatility", "dy_trend")
+    CURRENT_COLUMNS: Tuple[FiiExportColumn, ...] = (
+        ("ticker", "text"),
+        ("p_vp", "number"),
+        ("segment", "text"),
+        ("duration", "text"),
+        ("last_12_month_evaluation", "number"),
+        ("current_month_evaluation", "number"),
+        ("last_price", "number"),
+        ("last_dividend", "number"),
+        ("dy_12", "number"),
+        ("start_date", "date"),
+        ("dialy_liquidity", "number"),
+    ) + tuple((field, "number") for field in ROLLING_FIELDS)
+    HISTORY_COLUMNS: Tuple[FiiExportColumn, ...] = (("ticker", "text"), ("scraped_at", "datetime")) + tuple(
+        (field, "number") for field in FiiHistorySeries.FIELDS
+    )
+
+    def __init__(
+        self,
+        file_format: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        fii_snapshot_cache: FiiSnapshotCache = None,
+        fii_history_repository: FiiHistoryRepository = None,
+        fii_rolling_stats_store: FiiRollingStatsStore = None,
+    ) -> None:
+        if file_format not in WRITERS:
+            raise ValueError(f"format must be one of {', '.join(WRITERS)}")
+        # query strings mix "...Z" and bare dates, and aware and naive datetimes do not compare
+        start = as_utc(start) if start is not None else None
+        end = as_utc(end) if end is not None else None
+        if start is not None and end is not None and start > end:
+            raise ValueError("start must not be after end")
+
+        self.start = start
+        self.end = end
+        self.history = start is not None or end is not None
+        # raises FiiExportUnavailableError right away when an optional writer is missing
+        self.writer: FiiExportWriter = WRITERS[file_format](
+            self.HISTORY_COLUMNS if self.history else self.CURRENT_COLUMNS
+        )
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create()
+        self.fii_history_repository = fii_history_repository or FiiHistoryRepositoryFactory.create()
+        self.fii_rolling_stats_store = fii_rolling_stats_store or FiiRollingStatsStoreFactory.create()
+
+    @property
+    def media_type(self) -> str:
+        return self.writer.media_type
+
+    @property
+    def filename(self) -> str:
+        return f"fiis{'-history' if self.history else ''}.{self.writer.extension}"
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        yield self.writer.header()
+        rows = self._history_rows() if self.history else self._current_rows()
+        async for chunk in rows:
+            data = self.writer.write(chunk)
+            if data:
+                yield data
+        yield self.writer.close()
+
+    async def _current_rows(self) -> AsyncIterator[List[tuple]]:
+        snapshot = await self.fii_snapshot_cache.get()
+        for offset in range(0, len(snapshot), self.CHUNK_SIZE):
+            fiis = snapshot.fiis[offset : offset + self.CHUNK_SIZE]
+            yield [self._current_row(fii, self.fii_rolling_stats_store.get(fii.ticker)) for fii in fiis]
+
+    async def _history_rows(self) -> AsyncIterator[List[tuple]]:
+        tickers = sorted((await self.fii_snapshot_cache.get()).positions)
+        chunk: List[tuple] = []
+        for offset in range(0, len(tickers), self.HISTORY_BATCH):
+            batch = tickers[offset : offset + self.HISTORY_BATCH]
+            histories = await self.fii_history_repository.range_many(batch, self.start, self.end)
+            for ticker in batch:
+                series = histories.get(ticker)
+                if series is None:
+                    continue
+                columns = [series.columns[field].tolist() for field in FiiHistorySeries.FIELDS]
+                for position, timestamp in enumerate(series.timestamps.tolist()):
+                    scraped_at = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+                    chunk.append((ticker, scraped_at, *(column[position] for column in columns)))
+                    if len(chunk) == self.CHUNK_SIZE:
+                        yield chunk
+                        chunk = []
+        if chunk:
+            yield chunk
+
+    @classmethod
+    def _current_row(cls, fii: FiiDomain, rolling_stats: Optional[FiiRollingStats]) -> tuple:
+        values = tuple(getattr(fii, name) for name, _ in cls.CURRENT_COLUMNS[: -len(cls.ROLLING_FIELDS)])
+        rolling = tuple(getattr(rolling_stats, field) if rolling_stats else None for field in cls.ROLLING_FIELDS)
+        return values + rolling
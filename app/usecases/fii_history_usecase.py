@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from app.domain.fii_history import FiiHistoryPoint
+from app.repositories.fii_history_repository import FiiHistoryRepository
+from app.repositories.fii_history_repository_factory import FiiHistoryRepositoryFactory
+
+
+class FiiHistoryResponse(BaseModel):
+    ticker: str
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    points: List[FiiHistoryPoint]
+
+
+class FiiHistoryUseCase:
+    def __init__(
+        self,
+        ticker: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        fii_history_repository: FiiHistoryRepository = None,
+    ) -> None:
+        self.ticker = ticker.strip()
+        self.start = start
+        self.end = end
+        self.fii_history_repository = fii_history_repository or FiiHistoryRepositoryFactory.create()
+
+    async def execute(self) -> FiiHistoryResponse:
+        series = await self.fii_history_repository.range(self.ticker, self.start, self.end)
+        return FiiHistoryResponse(ticker=self.ticker, start=self.start, end=self.end, points=series.points())
@@ -1,16 +1,142 @@
-from typing import List
+import hashlib
+from datetime import date
+from typing import List, Optional, Tuple
 
+from pydantic import TypeAdapter
+
+from app.domain.fii_cursor import FiiCursor
 from app.domain.fii_domain import FiiDomain
+from app.domain.fii_snapshot import FiiSnapshot
+from app.libs.http_cache import EncodedBody, EncodedBodyCache, encoded_bodies
 from app.repositories.fii_repository import FiiRepository
 from app.repositories.fii_repository_factory import FiiRepositoryFactory
+from app.repositories.fii_rolling_stats_store import (
+    FiiRollingStatsStore,
+    FiiRollingStatsStoreFactory,
+)
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+from app.repositories.fii_timeline_reader import (
+    FiiTimelineReader,
+    FiiTimelineReaderFactory,
+)
 
 
 class FiiListUseCase:
+    # the same serializer FastAPI applies for response_model=List[FiiDomain], so both paths give the same bytes
+    SERIALIZER = TypeAdapter(List[FiiDomain])
+    FIELDS = tuple(FiiDomain.model_fields)
+    MAX_LIMIT = 1000
+
     def __init__(
         self,
         fii_repository: FiiRepository = None,
+        as_of: Optional[date] = None,
+        fii_timeline_reader: FiiTimelineReader = None,
+        fii_rolling_stats_store: FiiRollingStatsStore = None,
+        fii_snapshot_cache: FiiSnapshotCache = None,
+        encoded_body_cache: EncodedBodyCache = None,
+        fields: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: str = "asc",
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> None:
+        self.fields = self.parse_fields(fields)
+        if sort is not None and sort not in FiiSnapshot.SORT_FIELDS:
+            raise ValueError(f"sort must be one of {', '.join(FiiSnapshot.SORT_FIELDS)}")
+        if order not in ("asc", "desc"):
+            raise ValueError("order must be asc or desc")
+        if limit is not None and not 1 <= limit <= self.MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {self.MAX_LIMIT}")
+
+        self.sort = sort or "ticker"
+        self.descending = order == "desc"
+        self.limit = limit
+        self.cursor = FiiCursor.decode(cursor) if cursor else None
+        if self.cursor is not None and (self.cursor.sort, self.cursor.descending) != (self.sort, self.descending):
+            raise ValueError("cursor belongs to another sort or order")
+        if self.cursor is not None and isinstance(self.cursor.value, str) != (self.sort in FiiSnapshot.TEXT_FIELDS):
+            raise ValueError("invalid cursor")
+        # the plain listing keeps its historical shape and order; anything else is a slice of the snapshot
+        self.sliced = any(option is not None for option in (fields, sort, limit, cursor)) or order != "asc"
+
         self.fii_repository = fii_repository or FiiRepositoryFactory.create()
+        self.as_of = as_of
+        self.fii_timeline_reader = fii_timeline_reader or FiiTimelineReaderFactory.create()
+        self.fii_rolling_stats_store = fii_rolling_stats_store or FiiRollingStatsStoreFactory.create()
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create(fii_repository=fii_repository)
+        self.encoded_body_cache = encoded_body_cache or encoded_bodies
+
+    def etag(self) -> Optional[str]:
+        """Tag of the current data, known without I/O; None for historical reads or before the data is loaded."""
+        data_version = self.fii_snapshot_cache.data_version
+        if self.as_of is not None or data_version is None:
+            return None
+
+        # rolling statistics move on every stored scrape, even when the FII itself is unchanged
+        tag = f"fiis-{data_version}.{self.fii_rolling_stats_store.version}"
+        if not self.sliced:
+            return tag
+
+        options = (self.fields, self.sort, self.descending, self.limit, self.cursor and self.cursor.encode())
+        return f"{tag}-{hashlib.sha1(repr(options).encode()).hexdigest()[:16]}"
 
     async def execute(self) -> List[FiiDomain]:
-        return await self.fii_repository.list()
+        fiis, _ = await self.page()
+        return fiis
+
+    async def page(self) -> Tuple[List[FiiDomain], Optional[FiiCursor]]:
+        """The FIIs to return and the cursor of the next page, if there is one."""
+        if self.as_of is not None:
+            # rolling statistics describe the latest windows, so historical reads come without them
+            fiis = await self.fii_timeline_reader.as_of(self.as_of)
+            return self._slice(FiiSnapshot(0, fiis)) if self.sliced else (fiis, None)
+
+        if not self.sliced:
+            return self.fii_rolling_stats_store.enrich(await self.fii_repository.list()), None
+
+        fiis, cursor = self._slice(await self.fii_snapshot_cache.get())
+        return self.fii_rolling_stats_store.enrich(fiis), cursor
+
+    async def encoded(self, tag: Optional[str]) -> EncodedBody:
+        """The listing serialized once for ``tag``, as returned by :meth:`etag`; later calls reuse the bytes.
+
+        Without a tag the body is built for this request only.
+        """
+
+        async def encode() -> EncodedBody:
+            fiis, cursor = await self.page()
+            include = {"__all__": set(self.fields)} if self.fields else None
+            headers = {"X-Next-Cursor": cursor.encode()} if cursor is not None else None
+            return EncodedBody(self.SERIALIZER.dump_json(fiis, include=include), headers=headers)
+
+        if tag is None:
+            return await encode()
+
+        return await self.encoded_body_cache.get_or_encode(tag, encode)
+
+    def _slice(self, snapshot: FiiSnapshot) -> Tuple[List[FiiDomain], Optional[FiiCursor]]:
+        order = snapshot.order(self.sort, self.descending)
+        start = self.cursor.start(snapshot, order) if self.cursor is not None else 0
+        end = len(order) if self.limit is None else min(start + self.limit, len(order))
+
+        cursor = None
+        if end < len(order):
+            cursor = FiiCursor.after(snapshot, int(order[end - 1]), self.sort, self.descending)
+
+        return snapshot.take(order[start:end].tolist()), cursor
+
+    @classmethod
+    def parse_fields(cls, fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+        if fields is None:
+            return None
+
+        names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+        unknown = [name for name in names if name not in cls.FIELDS]
+        if not names or unknown:
+            raise ValueError(f"fields must be a comma-separated subset of {', '.join(cls.FIELDS)}")
+
+        return names
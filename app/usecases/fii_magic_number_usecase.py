@@ -1,11 +1,24 @@
-from decimal import Decimal
+from collections import OrderedDict
+from datetime import date
+from decimal import ROUND_CEILING, Decimal
 from typing import List, Optional
 
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, TypeAdapter
 
 from app.domain.fii_domain import FiiDomain
+from app.domain.fii_snapshot import FiiSnapshot
+from app.libs.http_cache import EncodedBody, EncodedBodyCache, encoded_bodies
+from app.libs.logger import logger
 from app.repositories.fii_repository import FiiRepository
-from app.repositories.fii_repository_factory import FiiRepositoryFactory
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+from app.repositories.fii_timeline_reader import (
+    FiiTimelineReader,
+    FiiTimelineReaderFactory,
+)
 
 
 class MagicNumberResponse(BaseModel):
@@ -17,36 +30,109 @@ class MagicNumberResponse(BaseModel):
     fii: FiiDomain
 
 
+class FiiMagicNumberTable:
+    """Per-version magic-number invariants; answers any invested value with one vectorized pass.
+
+    FIIs without a positive price and dividend have no magic number and are left out explicitly.
+    """
+
+    PRICE_SCALE = 10**6
+    # largest value whose scaled form still fits the int64 division in quotas_for
+    MAX_INVESTED_VALUE = int(np.iinfo(np.int64).max) // PRICE_SCALE
+    CACHE_SIZE = 64
+
+    def __init__(self, fiis: List[FiiDomain]) -> None:
+        self.fiis = tuple(fii for fii in fiis if fii.last_dividend > 0 and fii.last_price > 0)
+        self.skipped_tickers = tuple(fii.ticker for fii in fiis if fii.last_dividend <= 0 or fii.last_price <= 0)
+        self.magic_numbers = np.array([int(fii.last_price / fii.last_dividend) for fii in self.fiis], dtype=np.int64)
+        self.prices = np.array([float(fii.last_price) for fii in self.fiis], dtype=np.float64)
+        self.dividends = np.array([float(fii.last_dividend) for fii in self.fiis], dtype=np.float64)
+        # prices in integer micro-reais (rounded up) so quota counts are exact integer divisions
+        self.scaled_prices = np.array(
+            [int((fii.last_price * self.PRICE_SCALE).to_integral_value(rounding=ROUND_CEILING)) for fii in self.fiis],
+            dtype=np.int64,
+        )
+        self._responses: "OrderedDict[int, List[MagicNumberResponse]]" = OrderedDict()
+
+        if self.skipped_tickers:
+            logger.info(f"No magic number for {len(self.skipped_tickers)} FIIs without positive price and dividend")
+
+    @classmethod
+    def for_snapshot(cls, snapshot: FiiSnapshot) -> "FiiMagicNumberTable":
+        return snapshot.memoize("magic_number_table", lambda: cls(list(snapshot.fiis)))
+
+    def quotas_for(self, invested_value: int) -> np.ndarray:
+        if invested_value <= 0:
+            return np.zeros(len(self.fiis), dtype=np.int64)
+        if invested_value > self.MAX_INVESTED_VALUE:
+            raise ValueError(f"invested_value must not exceed {self.MAX_INVESTED_VALUE}")
+
+        return (invested_value * self.PRICE_SCALE) // self.scaled_prices
+
+    def responses(self, invested_value: int) -> List[MagicNumberResponse]:
+        if invested_value in self._responses:
+            self._responses.move_to_end(invested_value)
+            return list(self._responses[invested_value])
+
+        quotas = self.quotas_for(invested_value).tolist()
+        magic_numbers = self.magic_numbers.tolist()
+        responses = [
+            MagicNumberResponse(
+                ticker=fii.ticker,
+                magic_number=magic_numbers[position],
+                quotas_for_invested_value=quotas[position],
+                dividend_for_invested_value=Decimal(quotas[position] * fii.last_dividend),
+                invested_value=invested_value,
+                fii=fii,
+            )
+            for position, fii in enumerate(self.fiis)
+        ]
+
+        self._responses[invested_value] = responses
+        if len(self._responses) > self.CACHE_SIZE:
+            self._responses.popitem(last=False)
+
+        return list(responses)
+
+
 class FiiMagicNumberUseCase:
+    SERIALIZER = TypeAdapter(List[MagicNumberResponse])
+
     def __init__(
         self,
         invested_value: Optional[int] = None,
         fii_repository: FiiRepository = None,
+        fii_snapshot_cache: FiiSnapshotCache = None,
+        as_of: Optional[date] = None,
+        fii_timeline_reader: FiiTimelineReader = None,
+        encoded_body_cache: EncodedBodyCache = None,
     ) -> None:
         self.invested_value = invested_value or 10000
-        self.fii_repository = fii_repository or FiiRepositoryFactory.create()
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create(fii_repository=fii_repository)
+        self.as_of = as_of
+        self.fii_timeline_reader = fii_timeline_reader or FiiTimelineReaderFactory.create()
+        self.encoded_body_cache = encoded_body_cache or encoded_bodies
+
+    def etag(self) -> Optional[str]:
+        """Tag of the current data, known without I/O; None for historical reads or before the data is loaded."""
+        data_version = self.fii_snapshot_cache.data_version
+        if self.as_of is not None or data_version is None:
+            return None
+
+        return f"magic-{data_version}.{self.invested_value}"
 
     async def execute(self) -> List[MagicNumberResponse]:
-        fiis = await self.fii_repository.list()
-
-        magic_numbers = []
-        for fii in fiis:
-            magic_numbers.append(self._calculate_magic_number(fii))
-
-        return magic_numbers
-
-    def _calculate_magic_number(self, fii: FiiDomain) -> MagicNumberResponse:
-        quotas_for_invested_value = int(self.invested_value / fii.last_price)
-        magic_number = int(fii.last_price / fii.last_dividend)
-        dividend_for_invested_value = Decimal(quotas_for_invested_value * fii.last_dividend)
-
-        return MagicNumberResponse(
-            **{
-                "ticker": fii.ticker,
-                "magic_number": magic_number,
-                "quotas_for_invested_value": quotas_for_invested_value,
-                "dividend_for_invested_value": dividend_for_invested_value,
-                "invested_value": self.invested_value,
-                "fii": fii,
-            }
-        )
+        if self.as_of is not None:
+            fiis = await self.fii_timeline_reader.as_of(self.as_of)
+            return FiiMagicNumberTable(fiis).responses(self.invested_value)
+
+        snapshot = await self.fii_snapshot_cache.get()
+        return FiiMagicNumberTable.for_snapshot(snapshot).responses(self.invested_value)
+
+    async def encoded(self, tag: str) -> EncodedBody:
+        """The responses serialized once for ``tag``, as returned by :meth:`etag`; later calls reuse the bytes."""
+
+        async def encode() -> EncodedBody:
+            return EncodedBody(self.SERIALIZER.dump_json(await self.execute()))
+
+        return await self.encoded_body_cache.get_or_encode(tag, encode)
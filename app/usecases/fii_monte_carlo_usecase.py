@@ -0,0 +1,192 @@
+import asyncio
+from datetime import datetime, time, timezone
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from app.domain.fii_history_panel import FiiHistoryPanel
+from app.domain.fii_monte_carlo import FiiMonteCarloSimulator
+from app.domain.fii_snapshot import FiiSnapshot
+from app.libs.logger import logger
+from app.repositories.fii_history_repository import FiiHistoryRepository
+from app.repositories.fii_history_repository_factory import FiiHistoryRepositoryFactory
+from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+from app.usecases.fii_magic_number_usecase import FiiMagicNumberTable
+
+
+class MonteCarloRequest(BaseModel):
+    positions: Dict[str, int] = Field(default_factory=dict, description="Quantidade de cotas por ticker")
+    tickers: Optional[List[str]] = Field(None, description="Carteira com invested_value dividido igualmente")
+    invested_value: int = Field(10000, gt=0, description="Valor investido quando positions não é informado")
+    months: int = Field(120, ge=1, le=FiiMonteCarloSimulator.MAX_MONTHS, description="Horizonte em meses")
+    paths: int = Field(10000, ge=1, le=FiiMonteCarloSimulator.MAX_PATHS, description="Quantidade de cenários")
+    seed: int = Field(42, ge=0, description="Semente para resultados reproduzíveis")
+    dividend_volatility: Optional[float] = Field(None, ge=0, le=1, description="Volatilidade mensal do dividendo")
+    price_volatility: Optional[float] = Field(None, ge=0, le=1, description="Volatilidade mensal do preço")
+
+
+class PercentileBand(BaseModel):
+    percentile: float
+    values: List[float]
+
+
+class MonteCarloProjectionResponse(BaseModel):
+    months: int
+    paths: int
+    seed: int
+    positions: Dict[str, int]
+    current_monthly_income: float
+    current_value: float
+    monthly_income: List[PercentileBand]
+    portfolio_value: List[PercentileBand]
+    missing_tickers: List[str] = []
+
+
+class FiiMonteCarloUseCase:
+    """Stochastic income projection for a portfolio, sampled off the event loop.
+
+    Monthly volatilities of the held FIIs are the deviation of their month-over-month log changes over the
+    last ``VOLATILITY_MONTHS`` of history. FIIs with fewer than ``MIN_VOLATILITY_CHANGES`` such changes fall
+    back to ``DEFAULT_*_VOLATILITY``, with the price volatility raised to the latest monthly move when larger.
+    """
+
+    DEFAULT_DIVIDEND_VOLATILITY = 0.05
+    DEFAULT_PRICE_VOLATILITY = 0.04
+    MAX_VOLATILITY = 0.5
+    VOLATILITY_MONTHS = 24
+    MIN_VOLATILITY_CHANGES = 6
+    PERCENTILES = (5, 25, 50, 75, 95)
+
+    def __init__(
+        self,
+        request: MonteCarloRequest,
+        fii_repository: FiiRepository = None,
+        fii_snapshot_cache: FiiSnapshotCache = None,
+        fii_history_repository: FiiHistoryRepository = None,
+        simulator: FiiMonteCarloSimulator = None,
+    ) -> None:
+        self.request = request
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create(fii_repository=fii_repository)
+        self.fii_history_repository = fii_history_repository or FiiHistoryRepositoryFactory.create()
+        self.simulator = simulator or FiiMonteCarloSimulator(seed=request.seed)
+
+    async def execute(self) -> MonteCarloProjectionResponse:
+        snapshot = await self.fii_snapshot_cache.get()
+        table = FiiMagicNumberTable.for_snapshot(snapshot)
+        by_ticker = {fii.ticker.lower(): position for position, fii in enumerate(table.fiis)}
+
+        quotas, missing_tickers = self._quotas(table, by_ticker)
+        dividend_volatility, price_volatility = await self._volatilities(snapshot, table, np.flatnonzero(quotas))
+
+        bands = await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(
+                self.simulator.simulate,
+                quotas=quotas,
+                prices=table.prices,
+                dividends=table.dividends,
+                dividend_volatility=dividend_volatility,
+                price_volatility=price_volatility,
+                months=self.request.months,
+                paths=self.request.paths,
+                percentiles=self.PERCENTILES,
+            ),
+        )
+
+        return MonteCarloProjectionResponse(
+            months=self.request.months,
+            paths=self.request.paths,
+            seed=self.request.seed,
+            positions={table.fiis[position].ticker: int(quotas[position]) for position in np.flatnonzero(quotas)},
+            current_monthly_income=round(float(quotas @ table.dividends), 2),
+            current_value=round(float(quotas @ table.prices), 2),
+            monthly_income=self._bands(bands.percentiles, bands.income),
+            portfolio_value=self._bands(bands.percentiles, bands.value),
+            missing_tickers=missing_tickers,
+        )
+
+    def _quotas(self, table: FiiMagicNumberTable, by_ticker: Dict[str, int]):
+        quotas = np.zeros(len(table.fiis), dtype=np.float64)
+
+        if self.request.positions:
+            missing_tickers = [ticker for ticker in self.request.positions if ticker.lower() not in by_ticker]
+            for ticker, amount in self.request.positions.items():
+                if ticker.lower() in by_ticker:
+                    quotas[by_ticker[ticker.lower()]] += max(amount, 0)
+            return quotas, missing_tickers
+
+        missing_tickers = []
+        positions = np.arange(len(table.fiis))
+        if self.request.tickers:
+            missing_tickers = [ticker for ticker in self.request.tickers if ticker.lower() not in by_ticker]
+            positions = np.array(
+                sorted({by_ticker[ticker.lower()] for ticker in self.request.tickers if ticker.lower() in by_ticker}),
+                dtype=np.int64,
+            )
+
+        if len(positions):
+            share = self.request.invested_value / len(positions)
+            quotas[positions] = np.floor(share / table.prices[positions])
+
+        return quotas, missing_tickers
+
+    async def _volatilities(self, snapshot: FiiSnapshot, table: FiiMagicNumberTable, held: np.ndarray):
+        monthly_moves = snapshot.columns["current_month_evaluation"][
+            [snapshot.positions[fii.ticker] for fii in table.fiis]
+        ]
+        dividend_volatility = np.full(len(table.fiis), self.DEFAULT_DIVIDEND_VOLATILITY)
+        price_volatility = np.maximum(np.abs(monthly_moves) / 100, self.DEFAULT_PRICE_VOLATILITY)
+
+        if self.request.dividend_volatility is None or self.request.price_volatility is None:
+            estimated = await self._history_volatilities([table.fiis[position].ticker for position in held])
+            for volatility, estimate in zip((dividend_volatility, price_volatility), estimated):
+                known = ~np.isnan(estimate)
+                volatility[held[known]] = estimate[known]
+
+        if self.request.dividend_volatility is not None:
+            dividend_volatility[:] = self.request.dividend_volatility
+        if self.request.price_volatility is not None:
+            price_volatility[:] = self.request.price_volatility
+
+        return (
+            np.clip(dividend_volatility, 0, self.MAX_VOLATILITY),
+            np.clip(price_volatility, 0, self.MAX_VOLATILITY),
+        )
+
+    async def _history_volatilities(self, tickers: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Dividend and price volatilities estimated from history, NaN where it is too short."""
+        unknown = np.full(len(tickers), np.nan)
+        if not tickers:
+            return unknown, unknown
+
+        end = datetime.now(timezone.utc).date()
+        start = (np.datetime64(end, "M") - self.VOLATILITY_MONTHS).astype("datetime64[D]").item()
+        try:
+            histories = await self.fii_history_repository.range_many(
+                tickers,
+                datetime.combine(start, time.min, tzinfo=timezone.utc),
+                datetime.combine(end, time.max, tzinfo=timezone.utc),
+            )
+        except Exception as e:
+            # the history only refines the projection: without it the default volatilities apply
+            logger.error(f"Error reading history for the Monte Carlo volatilities: {e}")
+            return unknown, unknown
+
+        panel = FiiHistoryPanel.build({ticker: histories[ticker] for ticker in tickers}, start, end)
+        return (
+            panel.monthly_volatility("last_dividend", self.MIN_VOLATILITY_CHANGES),
+            panel.monthly_volatility("last_price", self.MIN_VOLATILITY_CHANGES),
+        )
+
+    @staticmethod
+    def _bands(percentiles: List[float], values: np.ndarray) -> List[PercentileBand]:
+        return [
+            PercentileBand(percentile=percentile, values=np.round(row, 2).tolist())
+            for percentile, row in zip(percentiles, values)
+        ]
@@ -0,0 +1,55 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+from app.domain.fii_portfolio_optimizer import (
+    FiiPortfolioAllocation,
+    FiiPortfolioOptimizer,
+)
+from app.repositories.fii_screening_view import (
+    FiiScreeningView,
+    FiiScreeningViewFactory,
+)
+
+
+class PortfolioOptimizationRequest(BaseModel):
+    budget: int = Field(gt=0, description="Orçamento em reais")
+    max_per_fii: Optional[int] = Field(None, gt=0, description="Valor máximo em reais por FII")
+    fii_caps: Dict[str, int] = Field(default_factory=dict, description="Valor máximo em reais por ticker")
+    segment_caps: Dict[str, int] = Field(default_factory=dict, description="Valor máximo em reais por segmento")
+    tickers: Optional[List[str]] = Field(None, description="Restringe o universo filtrado a estes tickers")
+
+    @field_validator("fii_caps", "segment_caps")
+    @classmethod
+    def _non_negative_caps(cls, value: Dict[str, int]) -> Dict[str, int]:
+        negative = [key for key, cap in value.items() if cap < 0]
+        if negative:
+            raise ValueError(f"caps must not be negative: {', '.join(negative)}")
+        return value
+
+
+class FiiPortfolioOptimizerUseCase:
+    def __init__(
+        self,
+        request: PortfolioOptimizationRequest,
+        fii_screening_view: FiiScreeningView = None,
+        optimizer: FiiPortfolioOptimizer = None,
+    ) -> None:
+        self.request = request
+        self.fii_screening_view = fii_screening_view or FiiScreeningViewFactory.create()
+        self.optimizer = optimizer or FiiPortfolioOptimizer()
+
+    async def execute(self) -> FiiPortfolioAllocation:
+        fiis = [result.fii for result in await self.fii_screening_view.passing()]
+
+        if self.request.tickers is not None:
+            tickers = {ticker.lower() for ticker in self.request.tickers}
+            fiis = [fii for fii in fiis if fii.ticker.lower() in tickers]
+
+        return self.optimizer.optimize(
+            fiis,
+            budget=self.request.budget,
+            max_per_fii=self.request.max_per_fii,
+            fii_caps=self.request.fii_caps,
+            segment_caps=self.request.segment_caps,
+        )
@@ -0,0 +1,58 @@
+from typing import List, Optional
+
+from app.domain.fii_rank_index import FiiRank, FiiRankEntry, FiiRankIndex
+from app.domain.fii_snapshot import FiiSnapshot
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+
+
+def _validate_field(field: str) -> None:
+    if field not in FiiSnapshot.NUMERIC_FIELDS:
+        raise ValueError(f"field must be one of {', '.join(FiiSnapshot.NUMERIC_FIELDS)}")
+
+
+class FiiRankUseCase:
+    def __init__(
+        self,
+        ticker: str,
+        field: str = "dy_12",
+        within_segment: bool = False,
+        fii_snapshot_cache: FiiSnapshotCache = None,
+    ) -> None:
+        _validate_field(field)
+        self.ticker = ticker
+        self.field = field
+        self.within_segment = within_segment
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create()
+
+    async def execute(self) -> Optional[FiiRank]:
+        index = FiiRankIndex.for_snapshot(await self.fii_snapshot_cache.get())
+        return index.rank(self.ticker, self.field, self.within_segment)
+
+
+class FiiTopUseCase:
+    MAX_K = 500
+
+    def __init__(
+        self,
+        field: str,
+        k: int = 20,
+        segment: Optional[str] = None,
+        descending: bool = True,
+        fii_snapshot_cache: FiiSnapshotCache = None,
+    ) -> None:
+        _validate_field(field)
+        if not 1 <= k <= self.MAX_K:
+            raise ValueError(f"k must be between 1 and {self.MAX_K}")
+
+        self.field = field
+        self.k = k
+        self.segment = segment
+        self.descending = descending
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create()
+
+    async def execute(self) -> List[FiiRankEntry]:
+        index = FiiRankIndex.for_snapshot(await self.fii_snapshot_cache.get())
+        return index.top(self.field, self.k, self.segment, self.descending)
@@ -0,0 +1,132 @@
+from typing import List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from app.domain.fii_reinvestment_simulator import FiiReinvestmentSimulator
+from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+from app.usecases.fii_magic_number_usecase import FiiMagicNumberTable
+
+
+class FiiReinvestmentProjection(BaseModel):
+    ticker: str
+    magic_number: int
+    months_to_magic_number: Optional[int]
+    initial_value: float
+    monthly_contribution: float
+    final_quotas: int
+    final_monthly_income: float
+    final_value: float
+    total_contributed: float
+    quotas_by_year: List[int]
+    monthly_income_by_year: List[float]
+
+
+class PortfolioReinvestmentProjection(BaseModel):
+    tickers: List[str]
+    monthly_income: List[float]
+    total_value: List[float]
+    total_contributed: List[float]
+
+
+class ReinvestmentSimulationResponse(BaseModel):
+    years: int
+    initial_value: int
+    monthly_contribution: int
+    annual_price_growth: float
+    annual_dividend_growth: float
+    fiis: List[FiiReinvestmentProjection]
+    portfolio: Optional[PortfolioReinvestmentProjection] = None
+    missing_tickers: List[str] = []
+
+
+class FiiReinvestmentUseCase:
+    def __init__(
+        self,
+        years: int = 10,
+        initial_value: int = 0,
+        monthly_contribution: int = 1000,
+        tickers: Optional[List[str]] = None,
+        annual_price_growth: float = 0.0,
+        annual_dividend_growth: float = 0.0,
+        fii_repository: FiiRepository = None,
+        fii_snapshot_cache: FiiSnapshotCache = None,
+        simulator: FiiReinvestmentSimulator = None,
+    ) -> None:
+        self.years = years
+        self.initial_value = initial_value
+        self.monthly_contribution = monthly_contribution
+        self.tickers = tickers
+        self.annual_price_growth = annual_price_growth
+        self.annual_dividend_growth = annual_dividend_growth
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create(fii_repository=fii_repository)
+        self.simulator = simulator or FiiReinvestmentSimulator()
+
+    async def execute(self) -> ReinvestmentSimulationResponse:
+        table = FiiMagicNumberTable.for_snapshot(await self.fii_snapshot_cache.get())
+        positions = np.arange(len(table.fiis))
+        missing_tickers = []
+
+        if self.tickers:
+            by_ticker = {fii.ticker.lower(): position for position, fii in enumerate(table.fiis)}
+            missing_tickers = [ticker for ticker in self.tickers if ticker.lower() not in by_ticker]
+            positions = np.array(
+                [by_ticker[ticker.lower()] for ticker in self.tickers if ticker.lower() in by_ticker], dtype=np.int64
+            )
+
+        # a portfolio splits the money evenly; otherwise every FII is projected with the full amounts
+        share = 1 / len(positions) if self.tickers and len(positions) else 1
+        paths = self.simulator.project(
+            prices=table.prices[positions],
+            dividends=table.dividends[positions],
+            months=self.years * 12,
+            initial_values=self.initial_value * share,
+            monthly_contributions=self.monthly_contribution * share,
+            annual_price_growth=self.annual_price_growth,
+            annual_dividend_growth=self.annual_dividend_growth,
+        )
+        magic_numbers = table.magic_numbers[positions]
+        months_to_magic = paths.months_to_reach(magic_numbers)
+        yearly_quotas = paths.quotas[12::12].T.astype(np.int64).tolist()
+        yearly_income = np.round(paths.income[12::12].T, 2).tolist()
+
+        projections = [
+            FiiReinvestmentProjection(
+                ticker=table.fiis[position].ticker,
+                magic_number=int(magic_numbers[column]),
+                months_to_magic_number=int(months_to_magic[column]) if months_to_magic[column] >= 0 else None,
+                initial_value=self.initial_value * share,
+                monthly_contribution=self.monthly_contribution * share,
+                final_quotas=int(paths.quotas[-1, column]),
+                final_monthly_income=round(float(paths.income[-1, column]), 2),
+                final_value=round(float(paths.value[-1, column]), 2),
+                total_contributed=round(float(paths.contributed[-1, column]), 2),
+                quotas_by_year=yearly_quotas[column],
+                monthly_income_by_year=yearly_income[column],
+            )
+            for column, position in enumerate(positions.tolist())
+        ]
+
+        portfolio = None
+        if self.tickers and projections:
+            portfolio = PortfolioReinvestmentProjection(
+                tickers=[projection.ticker for projection in projections],
+                monthly_income=np.round(paths.income.sum(axis=1), 2).tolist(),
+                total_value=np.round(paths.value.sum(axis=1), 2).tolist(),
+                total_contributed=np.round(paths.contributed.sum(axis=1), 2).tolist(),
+            )
+
+        return ReinvestmentSimulationResponse(
+            years=self.years,
+            initial_value=self.initial_value,
+            monthly_contribution=self.monthly_contribution,
+            annual_price_growth=self.annual_price_growth,
+            annual_dividend_growth=self.annual_dividend_growth,
+            fiis=projections,
+            portfolio=portfolio,
+            missing_tickers=missing_tickers,
+        )
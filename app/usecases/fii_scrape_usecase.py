@@ -1,8 +1,11 @@
 import asyncio
+import uuid
 from typing import List, Optional
 
 from app.domain.fii_domain import FiiDomain
+from app.domain.fii_scrape_progress import FiiScrapeProgress
 from app.gateways.status_invest_gateway import FiiGateway, StatusInvestGateway
+from app.repositories.fii_event_stream import FiiEventStream, FiiEventStreamFactory
 from app.repositories.fii_repository import FiiRepository
 from app.repositories.fii_repository_factory import FiiRepositoryFactory
 
@@ -13,33 +16,58 @@ class FiiScrapeUseCase:
         fii_repository: Optional[FiiRepository] = None,
         fii_gateway: Optional[FiiGateway] = None,
         max_concurrent_requests: Optional[int] = None,
+        fii_event_stream: Optional[FiiEventStream] = None,
     ) -> None:
         max_concurrent_requests = max_concurrent_requests or 1
         self.fii_repository = fii_repository or FiiRepositoryFactory.create()
         self.fii_gateway = fii_gateway or StatusInvestGateway()
         self.semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self.fii_event_stream = fii_event_stream or FiiEventStreamFactory.create()
 
-    async def execute(self, tickers: List[str] = None) -> List[FiiDomain]:
+    async def execute(self, tickers: List[str] = None, refresh: bool = False) -> List[FiiDomain]:
+        """Scrapes the tickers missing from the repository; with ``refresh``, stored tickers are scraped again.
+
+        Progress is published to the event stream as the tickers are processed.
+        """
         fiis = []
         if tickers is None:
             tickers = await self.fii_gateway.list()
 
-        for ticker in tickers:
-            fii = await self._get_or_create_with_semaphore(ticker)
-            if fii:
-                fiis.append(fii)
+        progress = FiiScrapeProgress(run_id=uuid.uuid4().hex, state="started", total=len(tickers))
+        self.fii_event_stream.publish(progress)
+
+        try:
+            for ticker in tickers:
+                fii = await self._get_or_create_with_semaphore(ticker, refresh)
+                if fii:
+                    fiis.append(fii)
+
+                progress = progress.model_copy(
+                    update={
+                        "state": "running",
+                        "done": progress.done + 1,
+                        "failed": progress.failed + (fii is None),
+                        "ticker": ticker,
+                    }
+                )
+                self.fii_event_stream.publish(progress)
+        finally:
+            # clients stop showing the run even when it is interrupted
+            self.fii_event_stream.publish(progress.model_copy(update={"state": "finished", "ticker": None}))
 
         await self.fii_gateway.close()
 
         return fiis
 
-    async def _get_or_create_with_semaphore(self, ticker: str) -> Optional[FiiDomain]:
+    async def _get_or_create_with_semaphore(self, ticker: str, refresh: bool = False) -> Optional[FiiDomain]:
         async with self.semaphore:
-            if fii := await self.fii_repository.get(ticker):
-                return fii
+            stored = await self.fii_repository.get(ticker)
+            if stored and not refresh:
+                return stored
 
             if fii := await self.fii_gateway.get(ticker):
                 await self.fii_repository.add(fii)
                 return fii
 
-            return None
+            # a failed refresh keeps serving the stored values
+            return stored
@@ -0,0 +1,24 @@
+from typing import List
+
+from app.domain.fii_domain import FiiDomain
+from app.domain.fii_screen_query import FiiScreenQuery
+from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+
+
+class FiiScreenUseCase:
+    def __init__(
+        self,
+        query: str,
+        fii_repository: FiiRepository = None,
+        fii_snapshot_cache: FiiSnapshotCache = None,
+    ) -> None:
+        self.query = FiiScreenQuery.compile(query)
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create(fii_repository=fii_repository)
+
+    async def execute(self) -> List[FiiDomain]:
+        snapshot = await self.fii_snapshot_cache.get()
+        return snapshot.take(self.query.select(snapshot))
@@ -0,0 +1,25 @@
+from typing import List
+
+from app.domain.fii_search_index import FiiSearchIndex, FiiSearchResult
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+
+
+class FiiSearchUseCase:
+    MAX_LIMIT = 50
+
+    def __init__(self, q: str, limit: int = 10, fii_snapshot_cache: FiiSnapshotCache = None) -> None:
+        if not q or not q.strip():
+            raise ValueError("q must not be empty")
+        if not 1 <= limit <= self.MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {self.MAX_LIMIT}")
+
+        self.q = q
+        self.limit = limit
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create()
+
+    async def execute(self) -> List[FiiSearchResult]:
+        index = FiiSearchIndex.for_snapshot(await self.fii_snapshot_cache.get())
+        return index.search(self.q, self.limit)
@@ -0,0 +1,15 @@
+from typing import List
+
+from app.domain.fii_segment_aggregate import FiiSegmentAggregates, FiiSegmentSummary
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+
+
+class FiiSegmentUseCase:
+    def __init__(self, fii_snapshot_cache: FiiSnapshotCache = None) -> None:
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create()
+
+    async def execute(self) -> List[FiiSegmentSummary]:
+        return FiiSegmentAggregates.for_snapshot(await self.fii_snapshot_cache.get()).summaries
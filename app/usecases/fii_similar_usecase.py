@@ -0,0 +1,30 @@
+from typing import List, Optional
+
+from app.domain.fii_similarity_index import FiiSimilarity, FiiSimilarityIndex
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+)
+
+
+class FiiSimilarUseCase:
+    MAX_K = 50
+
+    def __init__(
+        self,
+        ticker: str,
+        k: int = 10,
+        same_segment: bool = False,
+        fii_snapshot_cache: FiiSnapshotCache = None,
+    ) -> None:
+        if not 1 <= k <= self.MAX_K:
+            raise ValueError(f"k must be between 1 and {self.MAX_K}")
+
+        self.ticker = ticker
+        self.k = k
+        self.same_segment = same_segment
+        self.fii_snapshot_cache = fii_snapshot_cache or FiiSnapshotCacheFactory.create()
+
+    async def execute(self) -> Optional[List[FiiSimilarity]]:
+        index = FiiSimilarityIndex.for_snapshot(await self.fii_snapshot_cache.get())
+        return index.similar(self.ticker, self.k, self.same_segment)
@@ -0,0 +1,83 @@
+"""Benchmark for FiiSimilarityIndex against a brute-force nearest-neighbour scan.
+
+Usage: python -m benchmarks.bench_fii_similarity_index [--sizes 500 5000 50000] [--k 10] [--queries 200]
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+import numpy as np
+
+from app.domain.fii_similarity_index import FiiSimilarityIndex
+from app.domain.fii_snapshot import FiiSnapshot
+from benchmarks.bench_fii_portfolio_optimizer import build_universe
+
+
+def build_snapshot(size: int, seed: int = 42) -> FiiSnapshot:
+    rng = random.Random(seed)
+    fiis = [
+        fii.model_copy(
+            update={
+                "ticker": f"SIM{position:06d}11",
+                "p_vp": Decimal(str(round(rng.uniform(0.5, 1.5), 4))),
+                "dialy_liquidity": Decimal(rng.randint(1_000, 10_000_000)),
+                "last_12_month_evaluation": Decimal(str(round(rng.uniform(-20, 20), 2))),
+                "current_month_evaluation": Decimal(str(round(rng.uniform(-5, 5), 2))),
+            }
+        )
+        for position, fii in enumerate(build_universe(size, seed))
+    ]
+    return FiiSnapshot(1, fiis)
+
+
+def brute_force(index: FiiSimilarityIndex, position: int, k: int) -> list:
+    """Distance from one FII to every other one, with the same segment penalty as the index."""
+    distances = ((index.vectors - index.vectors[position]) ** 2).sum(axis=1)
+    distances += np.where(index.segments == index.segments[position], 0.0, index.segment_penalty)
+    distances[position] = np.inf
+    nearest = np.argpartition(distances, k)[:k]
+    return nearest[np.argsort(distances[nearest])].tolist()
+
+
+def run(size: int, k: int, queries: int) -> None:
+    snapshot = build_snapshot(size)
+    started = time.perf_counter()
+    index = FiiSimilarityIndex(snapshot)
+    build = time.perf_counter() - started
+
+    tickers = [fii.ticker for fii in snapshot.fiis[:queries]]
+    for position, ticker in enumerate(tickers):
+        expected = [snapshot.fiis[neighbour].ticker for neighbour in brute_force(index, position, k)]
+        assert [result.ticker for result in index.similar(ticker, k)] == expected, ticker
+
+    started = time.perf_counter()
+    for ticker in tickers:
+        index.similar(ticker, k)
+    tree = (time.perf_counter() - started) / len(tickers)
+
+    started = time.perf_counter()
+    for position in range(len(tickers)):
+        brute_force(index, position, k)
+    scan = (time.perf_counter() - started) / len(tickers)
+
+    print(
+        f"fiis={size:<8} build={build * 1000:8.1f}ms kd-tree={tree * 1000:7.3f}ms/query "
+        f"brute-force={scan * 1000:7.3f}ms/query speedup={scan / tree:6.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 5_000, 50_000])
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size, args.k, args.queries)
+
+
+if __name__ == "__main__":
+    main()
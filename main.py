@@ -1,19 +1,86 @@
 import asyncio
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from datetime import date, datetime
+from typing import List, Optional, Union
 
 import uvicorn
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 
+from app.domain.fii_alert import FiiAlertPage, FiiAlertRule
+from app.domain.fii_backtester import FiiBacktestResult
+from app.domain.fii_change import FiiChangePage
 from app.domain.fii_domain import FiiDomain
+from app.domain.fii_export import FiiExportUnavailableError
+from app.domain.fii_monte_carlo import FiiMonteCarloSimulator
+from app.domain.fii_portfolio_optimizer import FiiPortfolioAllocation
+from app.domain.fii_rank_index import FiiRank, FiiRankEntry
+from app.domain.fii_screen_query import FiiScreenQueryError
+from app.domain.fii_search_index import FiiSearchResult
+from app.domain.fii_segment_aggregate import FiiSegmentSummary
+from app.domain.fii_similarity_index import FiiSimilarity
+from app.domain.fii_snapshot import FiiSnapshot
+from app.libs.http_cache import (
+    API_CACHE_CONTROL,
+    PAGE_CACHE_CONTROL,
+    cache_headers,
+    is_not_modified,
+    not_modified,
+    strong_etag,
+)
+from app.libs.single_flight import SingleFlight
+from app.repositories.fii_alert_engine import fii_alert_engine
+from app.repositories.fii_change_recorder import FiiChangeRecorder
+from app.repositories.fii_history_recorder import FiiHistoryRecorder
 from app.repositories.fii_repository_factory import FiiRepositoryFactory
+from app.repositories.fii_rolling_stats_store import fii_rolling_stats_store
+from app.repositories.fii_snapshot_cache import fii_snapshot_cache
+from app.repositories.fii_timeline_recorder import FiiTimelineRecorder
+from app.usecases.fii_alert_usecase import (
+    AlertRuleRequest,
+    FiiAlertListUseCase,
+    FiiAlertRegisterUseCase,
+    FiiAlertRemoveUseCase,
+    FiiAlertRuleListUseCase,
+    FiiAlertStreamUseCase,
+)
+from app.usecases.fii_backtest_usecase import FiiBacktestUseCase
+from app.usecases.fii_batch_usecase import FiiBatchRequest, FiiBatchUseCase, FiiLookup
+from app.usecases.fii_changes_usecase import FiiChangesUseCase
+from app.usecases.fii_dashboard_usecase import (
+    FiiDashboard,
+    FiiDashboardTablePage,
+    FiiDashboardTableUseCase,
+    FiiDashboardUseCase,
+)
+from app.usecases.fii_event_stream_usecase import FiiEventStreamUseCase
+from app.usecases.fii_export_usecase import FiiExportUseCase
+from app.usecases.fii_history_usecase import FiiHistoryResponse, FiiHistoryUseCase
 from app.usecases.fii_list_usecase import FiiListUseCase
 from app.usecases.fii_magic_number_usecase import (
+    FiiMagicNumberTable,
     FiiMagicNumberUseCase,
     MagicNumberResponse,
 )
+from app.usecases.fii_monte_carlo_usecase import (
+    FiiMonteCarloUseCase,
+    MonteCarloProjectionResponse,
+    MonteCarloRequest,
+)
+from app.usecases.fii_portfolio_optimizer_usecase import (
+    FiiPortfolioOptimizerUseCase,
+    PortfolioOptimizationRequest,
+)
+from app.usecases.fii_rank_usecase import FiiRankUseCase, FiiTopUseCase
+from app.usecases.fii_reinvestment_usecase import (
+    FiiReinvestmentUseCase,
+    ReinvestmentSimulationResponse,
+)
+from app.usecases.fii_screen_usecase import FiiScreenUseCase
+from app.usecases.fii_search_usecase import FiiSearchUseCase
+from app.usecases.fii_segment_usecase import FiiSegmentUseCase
+from app.usecases.fii_similar_usecase import FiiSimilarUseCase
 from app_config import AppConfig
 
 config = AppConfig()
@@ -24,6 +91,19 @@ templates = Jinja2Templates(directory="templates")
 async def lifespan(app: FastAPI):
     from app.scheduler import FiiBootstrap, FiiScheduler
 
+    # stored scrapes feed the per-ticker history, the as_of timeline and the change feed;
+    # the app state keeps the recorders alive
+    app.state.fii_history_recorder = FiiHistoryRecorder()
+    app.state.fii_history_recorder.start()
+    app.state.fii_timeline_recorder = FiiTimelineRecorder()
+    app.state.fii_timeline_recorder.start()
+    app.state.fii_change_recorder = FiiChangeRecorder()
+    app.state.fii_change_recorder.start()
+    fii_alert_engine.start()
+    fii_rolling_stats_store.start()
+    asyncio.create_task(fii_rolling_stats_store.warm_up())
+    asyncio.create_task(fii_snapshot_cache.warm_up())
+
     scheduler = FiiScheduler()
     scheduler.start()
 
@@ -33,6 +113,12 @@ async def lifespan(app: FastAPI):
 
     yield
     scheduler.stop()
+    app.state.fii_history_recorder.stop()
+    app.state.fii_timeline_recorder.stop()
+    app.state.fii_change_recorder.stop()
+    fii_alert_engine.stop()
+    fii_rolling_stats_store.stop()
+    FiiMonteCarloSimulator.shutdown()
 
 
 app = FastAPI(
@@ -92,8 +178,18 @@ async def root():
     return RedirectResponse(url="/dashboard", status_code=302)
 
 
-@app.get("/fiis", response_model=List[FiiDomain], tags=["FIIs"])
-async def list_fiis():
+@app.get("/fiis", response_model=Union[List[FiiDomain], List[FiiLookup]], tags=["FIIs"])
+async def list_fiis(
+    as_of: Optional[date] = Query(None, description="Data (AAAA-MM-DD) para consulta histórica"),
+    fields: Optional[str] = Query(None, description="Campos retornados, separados por vírgula"),
+    sort: Optional[str] = Query(None, description="Campo de ordenação"),
+    order: str = Query("asc", description="asc ou desc"),
+    limit: Optional[int] = Query(None, description="Máximo de FIIs por página"),
+    cursor: Optional[str] = Query(None, description="Valor de X-Next-Cursor da página anterior"),
+    tickers: Optional[str] = Query(None, description="Tickers separados por vírgula, para busca em lote"),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
     """
     ## 📊 Listar todos os FIIs
 
@@ -107,23 +203,145 @@ async def list_fiis():
     - **last_price**: Último preço de negociação
     - **dy_12**: Dividend Yield dos últimos 12 meses
     - **daily_liquidity**: Liquidez diária média
+    - **rolling_stats**: Estatísticas móveis atualizadas a cada scraping armazenado
+        - **price_moving_average**: Média móvel do preço (~30 dias)
+        - **dividend_volatility**: Coeficiente de variação do dividendo (~12 meses)
+        - **dy_trend**: Variação do DY 12 meses na janela (~3 meses), em pontos percentuais
 
     ### Dados Atualizados:
     Os dados são atualizados automaticamente a cada 8 horas pelo sistema de scraping.
+
+    ### Consulta Histórica:
+    Com **as_of**, retorna os FIIs como estavam ao fim daquele dia (UTC), reconstruídos a partir do último
+    checkpoint diário e das alterações registradas depois dele, sem **rolling_stats**.
+
+    ### Campos, Ordenação e Paginação:
+    - **fields**: retorna só os campos pedidos (ex: `ticker,dy_12,last_price`)
+    - **sort** / **order**: ordena por um campo numérico ou de texto, com o ticker como desempate
+    - **limit** / **cursor**: páginas de até 1000 FIIs; quando há mais, a resposta traz o header
+      **X-Next-Cursor**, que é passado como **cursor** na próxima requisição com a mesma ordenação
+
+    As páginas são fatias do snapshot em memória, sem nova leitura do banco. O cursor aponta para a chave
+    do último FII retornado, então continua válido quando os dados mudam entre uma página e outra.
+
+    ### Busca em Lote:
+    Com **tickers** (até 100), a resposta muda de forma: em vez da lista de FIIs, traz um item por ticker na
+    ordem pedida (`FiiLookup`), com `found` e o FII em `fii` (ou `null` quando não existe), como em
+    `POST /fiis/batch`. Tickers são comparados sem diferenciar maiúsculas. Aceita **fields** para os campos de `fii`,
+    mas não **as_of**, ordenação nem paginação.
+
+    ### Cache:
+    Sem **as_of**, a resposta traz um **ETag** da versão dos dados; com **If-None-Match** igual, a API
+    responde 304 sem consultar o banco. O JSON de cada versão é gerado uma única vez e guardado junto com
+    as versões comprimidas (gzip e, com o pacote `brotli` instalado, br), escolhidas por **Accept-Encoding**.
+
+    ### Exemplo:
+    ```
+    GET /fiis?as_of=2024-06-30
+    GET /fiis?fields=ticker,dy_12,last_price&sort=dy_12&order=desc&limit=50
+    GET /fiis?tickers=HGLG11,KNRI11,MXRF11
+    ```
+    """
+    if tickers is not None:
+        if any(option is not None for option in (as_of, sort, limit, cursor)) or order != "asc":
+            raise HTTPException(status_code=400, detail="tickers only combines with fields")
+        try:
+            usecase = FiiBatchUseCase(tickers=tickers.split(","), fields=fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        body = await usecase.encoded()
+        return body.response(accept_encoding)
+
+    try:
+        usecase = FiiListUseCase(as_of=as_of, fields=fields, sort=sort, order=order, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # the tag is read before the data, so a write in between can only cost an extra full response
+    tag = usecase.etag()
+    headers = None
+    if tag is not None:
+        etag = strong_etag(tag)
+        if is_not_modified(if_none_match, etag):
+            return not_modified(etag, API_CACHE_CONTROL)
+        headers = cache_headers(etag, API_CACHE_CONTROL)
+
+    body = await usecase.encoded(tag)
+    return body.response(accept_encoding, headers)
+
+
+@app.post("/fiis/batch", response_model=List[FiiLookup], tags=["FIIs"])
+async def batch_fiis(request: FiiBatchRequest):
     """
-    usecase = FiiListUseCase()
+    ## 📋 Buscar FIIs em Lote
+
+    Retorna os FIIs de uma lista de tickers (até 100), na ordem pedida. Cada item traz `found` e o FII em
+    `fii`, ou `fii: null` quando o ticker não existe. Tickers repetidos aparecem uma única vez.
+
+    As leituras vêm do snapshot em memória ou, antes de ele ser carregado, de uma leitura em lote no banco,
+    então o custo acompanha o tamanho da lista e não o do universo.
+
+    ### Exemplo:
+    ```json
+    {"tickers": ["HGLG11", "KNRI11", "XXXX11"]}
+    ```
+    """
+    try:
+        usecase = FiiBatchUseCase(tickers=request.tickers)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return await usecase.execute()
+
+
+@app.get("/fiis/screen", response_model=List[FiiDomain], tags=["FIIs", "Análise"])
+async def screen_fiis(q: str = Query("", description="Expressão de filtro, ordenação e limite")):
+    """
+    ## 🔎 Filtrar FIIs por Expressão
+
+    Filtra, ordena e limita os FIIs com uma expressão sobre os campos de `FiiDomain`.
+
+    ### Sintaxe:
+    - **Filtro**: comparações (`>=`, `<=`, `>`, `<`, `=`, `!=`) combinadas com `and`, `or`, `not` e parênteses
+    - **Ordenação**: `order by campo [asc|desc]`, aceitando vários campos separados por vírgula
+    - **Limite**: `limit N`
+    - Campos de texto (`ticker`, `segment`, `duration`) aceitam apenas `=` e `!=`, com valores entre aspas
+
+    ### Desempenho:
+    Cada expressão é compilada uma única vez em um plano vetorizado e mantida em cache pela forma normalizada.
+    Consultas com `limit` usam seleção parcial em vez de ordenar todo o universo.
+
+    ### Exemplo:
+    ```
+    GET /fiis/screen?q=dy_12>=8 and p_vp<1 order by dy_12 desc limit 20
+    ```
+    """
+    try:
+        usecase = FiiScreenUseCase(query=q)
+    except FiiScreenQueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     return await usecase.execute()
 
 
 @app.get("/fiis/magic_numbers", response_model=List[MagicNumberResponse], tags=["FIIs", "Análise"])
-async def get_magic_numbers(invested_value: Optional[int] = None):
+async def get_magic_numbers(
+    invested_value: Optional[int] = Query(
+        None, ge=0, le=FiiMagicNumberTable.MAX_INVESTED_VALUE, description="Valor em reais para simular investimento"
+    ),
+    as_of: Optional[date] = Query(None, description="Data (AAAA-MM-DD) para consulta histórica"),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
     """
     ## 🧮 Calcular Magic Numbers dos FIIs
 
     Calcula os "números mágicos" para análise de investimento em FIIs, baseado em critérios específicos.
 
     ### Parâmetros:
-    - **invested_value** *(opcional)*: Valor em reais para simular investimento
+    - **invested_value** *(opcional)*: Valor em reais para simular investimento (até 9.223.372.036.854)
+    - **as_of** *(opcional)*: Calcula com os dados como estavam ao fim daquele dia
 
     ### Critérios do Magic Number:
     - P/VP menor que 1.0
@@ -138,15 +356,513 @@ async def get_magic_numbers(invested_value: Optional[int] = None):
     - **total_cost**: Custo total do investimento
     - **monthly_dividends**: Dividendos mensais estimados
 
+    FIIs sem preço e dividendo positivos não possuem magic number e ficam fora da lista.
+
+    ### Cache:
+    Sem **as_of**, o JSON de cada versão dos dados e valor investido é gerado uma única vez e servido com
+    **ETag** (304 com **If-None-Match**) e compressão conforme **Accept-Encoding**.
+
     ### Exemplo:
     ```
     GET /fiis/magic_numbers?invested_value=10000
     ```
     """
-    usecase = FiiMagicNumberUseCase(invested_value=invested_value)
+    usecase = FiiMagicNumberUseCase(invested_value=invested_value, as_of=as_of)
+    tag = usecase.etag()
+    if tag is None:
+        return await usecase.execute()
+
+    etag = strong_etag(tag)
+    if is_not_modified(if_none_match, etag):
+        return not_modified(etag, API_CACHE_CONTROL)
+
+    body = await usecase.encoded(tag)
+    return body.response(accept_encoding, cache_headers(etag, API_CACHE_CONTROL))
+
+
+@app.post("/fiis/portfolio/optimize", response_model=FiiPortfolioAllocation, tags=["FIIs", "Análise"])
+async def optimize_portfolio(request: PortfolioOptimizationRequest):
+    """
+    ## 💰 Otimizar Alocação de Orçamento
+
+    Calcula a quantidade inteira de cotas de cada FII aprovado na triagem que maximiza os dividendos mensais
+    para um orçamento.
+
+    ### Parâmetros (corpo JSON):
+    - **budget**: Orçamento em reais
+    - **max_per_fii** *(opcional)*: Valor máximo em reais aplicado a qualquer FII
+    - **fii_caps** *(opcional)*: Valor máximo em reais por ticker
+    - **segment_caps** *(opcional)*: Valor máximo em reais por segmento
+    - **tickers** *(opcional)*: Restringe o universo aos tickers informados
+
+    ### Algoritmo:
+    Branch-and-bound com limite pela relaxação fracionária. Quando o limite de tempo é atingido, retorna a
+    melhor alocação encontrada com `optimal=false`.
+
+    ### Exemplo:
+    ```json
+    {"budget": 100000, "max_per_fii": 10000, "segment_caps": {"logística": 30000}}
+    ```
+    """
+    usecase = FiiPortfolioOptimizerUseCase(request=request)
+    return await usecase.execute()
+
+
+@app.get("/fiis/reinvestment", response_model=ReinvestmentSimulationResponse, tags=["FIIs", "Análise"])
+async def simulate_reinvestment(
+    years: int = Query(10, ge=1, le=30, description="Horizonte em anos"),
+    initial_value: int = Query(0, ge=0, description="Aporte inicial em reais"),
+    monthly_contribution: int = Query(1000, ge=0, description="Aporte mensal em reais"),
+    tickers: Optional[str] = Query(None, description="Tickers da carteira separados por vírgula"),
+    annual_price_growth: float = Query(0.0, gt=-1, description="Variação anual esperada do preço (0.05 = 5%)"),
+    annual_dividend_growth: float = Query(0.0, gt=-1, description="Variação anual esperada do dividendo"),
+):
+    """
+    ## 📈 Simular Reinvestimento de Dividendos
+
+    Projeta mês a mês a quantidade de cotas e a renda mensal reinvestindo os dividendos e fazendo aportes mensais.
+
+    ### Modos:
+    - **Sem tickers**: cada FII é projetado isoladamente com o aporte inteiro
+    - **Com tickers**: carteira com os aportes divididos igualmente entre os FIIs, com séries mensais agregadas
+
+    ### Informações Retornadas:
+    - **months_to_magic_number**: Mês em que a posição atinge o magic number (cotas que se pagam sozinhas)
+    - **quotas_by_year** / **monthly_income_by_year**: Evolução ao fim de cada ano
+    - **portfolio**: Renda mensal, patrimônio e total aportado mês a mês (modo carteira)
+
+    ### Exemplo:
+    ```
+    GET /fiis/reinvestment?years=20&monthly_contribution=1500&tickers=HGLG11,KNRI11
+    ```
+    """
+    usecase = FiiReinvestmentUseCase(
+        years=years,
+        initial_value=initial_value,
+        monthly_contribution=monthly_contribution,
+        tickers=[ticker.strip() for ticker in tickers.split(",") if ticker.strip()] if tickers else None,
+        annual_price_growth=annual_price_growth,
+        annual_dividend_growth=annual_dividend_growth,
+    )
+    return await usecase.execute()
+
+
+@app.post("/fiis/monte-carlo", response_model=MonteCarloProjectionResponse, tags=["FIIs", "Análise"])
+async def project_monte_carlo(request: MonteCarloRequest):
+    """
+    ## 🎲 Projeção Estocástica de Renda (Monte Carlo)
+
+    Simula milhares de cenários de dividendos e preços por FII e retorna faixas de percentis (P5, P25, P50, P75,
+    P95) da renda mensal e do patrimônio da carteira, mês a mês.
+
+    ### Parâmetros (corpo JSON):
+    - **positions** *(opcional)*: Quantidade de cotas por ticker
+    - **tickers** / **invested_value** *(opcional)*: Sem positions, compra cotas inteiras dividindo o valor
+      igualmente entre os tickers (ou entre todos os FIIs)
+    - **months** / **paths**: Horizonte (até 360 meses) e quantidade de cenários (até 100.000)
+    - **seed**: Mesma semente e mesmos parâmetros geram exatamente o mesmo resultado
+    - **dividend_volatility** / **price_volatility** *(opcional)*: Volatilidades mensais; por padrão estimadas
+      pelas variações mensais dos últimos 24 meses de histórico de cada FII. Sem histórico suficiente, 5% para
+      dividendos e a maior entre 4% e a variação do último mês para o preço
+
+    ### Exemplo:
+    ```json
+    {"positions": {"HGLG11": 100, "KNRI11": 50}, "months": 120, "paths": 20000}
+    ```
+    """
+    usecase = FiiMonteCarloUseCase(request=request)
     return await usecase.execute()
 
 
+@app.get("/fiis/backtest", response_model=FiiBacktestResult, tags=["FIIs", "Histórico"])
+async def backtest_profiles(
+    years: int = Query(5, ge=1, le=20, description="Quantidade de anos de histórico"),
+    profiles: Optional[str] = Query(None, description="Perfis de regras separados por vírgula"),
+    end: Optional[date] = Query(None, description="Último mês do backtest (AAAA-MM-DD)"),
+):
+    """
+    ## 🧪 Backtest de Perfis de Regras
+
+    Reaplica perfis de regras do validador sobre o histórico armazenado, mês a mês, e compara a carteira
+    resultante (pesos iguais, rebalanceada mensalmente) com o universo inteiro.
+
+    ### Perfis:
+    - **default**: Todas as regras da análise padrão
+    - **dividend**: Dividendo positivo, DY mínimo e liquidez
+    - **value**: P/VP, dividendo positivo e valorização em 12 meses
+    - **stability**: Variações de preço, liquidez e dividendo positivo
+
+    ### Informações Retornadas (em %):
+    - **total_return** / **annualized_return**: Retorno com dividendos acumulado e anualizado
+    - **price_return**: Apenas a variação de preço
+    - **dividend_yield**: Dividend yield médio anualizado
+    - **excess_return**: Diferença para o universo
+    - **holdings** / **monthly_returns**: Quantidade de FIIs e retorno em cada mês
+
+    ### Exemplo:
+    ```
+    GET /fiis/backtest?years=5&profiles=default,dividend
+    ```
+    """
+    try:
+        usecase = FiiBacktestUseCase(
+            years=years,
+            profiles=[profile.strip() for profile in profiles.split(",") if profile.strip()] if profiles else None,
+            end=end,
+        )
+        return await usecase.execute()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/fiis/changes", response_model=FiiChangePage, tags=["FIIs", "Histórico"])
+async def list_fii_changes(
+    since: int = Query(0, ge=0, description="Última versão já sincronizada pelo cliente"),
+    limit: int = Query(100, ge=1, le=FiiChangesUseCase.MAX_LIMIT, description="Máximo de alterações na página"),
+):
+    """
+    ## 🔁 Feed de Alterações
+
+    Retorna, em ordem de versão, as alterações de FIIs registradas depois de **since**. Cada atualização do
+    scraping compara o FII coletado com o armazenado e publica apenas os campos que mudaram.
+
+    ### Sincronização Incremental:
+    1. Comece com `since=0`
+    2. Aplique as alterações retornadas
+    3. Repita com `since=next_since` enquanto **has_more** for verdadeiro
+    4. Guarde **next_since** para a próxima sincronização
+
+    ### Informações Retornadas:
+    - **version**: Versão da alteração, crescente e única
+    - **kind**: `added` para um FII novo ou `updated` para uma atualização
+    - **fields**: Campos alterados com os valores **previous** e **current**
+    - **latest_version**: Versão mais recente do feed
+
+    ### Exemplo:
+    ```
+    GET /fiis/changes?since=1200&limit=100
+    ```
+    """
+    usecase = FiiChangesUseCase(since=since, limit=limit)
+    return await usecase.execute()
+
+
+@app.get("/fiis/stream", tags=["FIIs", "Histórico"])
+async def stream_fiis(
+    since: Optional[int] = Query(None, ge=0, description="Reenvia as alterações com versão maior que esta"),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    ## 📡 Stream de Atualizações
+
+    Envia como Server-Sent Events as alterações de cada FII assim que são armazenadas (`event: change`,
+    com os novos valores dos campos alterados e a versão do feed de alterações como id) e o progresso das
+    coletas (`event: progress`). Ao reconectar, o navegador envia o cabeçalho **Last-Event-ID** e as
+    alterações perdidas são reenviadas antes das novas.
+
+    ### Exemplo:
+    ```javascript
+    new EventSource("/fiis/stream").addEventListener("change", (event) => console.log(JSON.parse(event.data)))
+    ```
+    """
+    try:
+        usecase = FiiEventStreamUseCase(since=int(last_event_id) if last_event_id else since)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(usecase.execute(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+@app.get("/export.{file_format}", tags=["FIIs", "Exportação"])
+async def export_fiis(
+    file_format: str,
+    start: Optional[datetime] = Query(None, description="Exporta o histórico a partir desta data"),
+    end: Optional[datetime] = Query(None, description="Exporta o histórico até esta data"),
+):
+    """
+    ## 📦 Exportar FIIs
+
+    Exporta todos os FIIs em **ndjson**, **csv** ou **parquet**, enviados em partes (chunked) conforme são
+    gerados, sem montar o arquivo inteiro em memória.
+
+    ### Parâmetros:
+    - **file_format**: `ndjson`, `csv` ou `parquet` (este requer o extra `parquet`, com o pacote `pyarrow`)
+    - **start** / **end** *(opcionais)*: com qualquer um deles, exporta as coletas do histórico no período,
+      uma linha por FII e coleta, em vez dos dados atuais
+
+    ### Exemplo:
+    ```
+    GET /export.csv
+    GET /export.parquet?start=2024-01-01T00:00:00Z&end=2024-06-30T23:59:59Z
+    ```
+    """
+    try:
+        usecase = FiiExportUseCase(file_format=file_format, start=start, end=end)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FiiExportUnavailableError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    return StreamingResponse(
+        usecase.stream(),
+        media_type=usecase.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{usecase.filename}"'},
+    )
+
+
+@app.get("/fiis/search", response_model=List[FiiSearchResult], tags=["FIIs"])
+async def search_fiis(
+    q: str = Query(..., min_length=1, description="Início do ticker ou palavra do segmento"),
+    limit: int = Query(10, ge=1, le=FiiSearchUseCase.MAX_LIMIT, description="Quantidade máxima de resultados"),
+):
+    """
+    ## 🔍 Busca de FIIs
+
+    Busca para autocompletar: ticker exato, depois tickers que começam com o termo, depois FIIs cujo
+    segmento tem uma palavra que começa com o termo e, por fim, tickers parecidos (erros de digitação).
+    O índice é montado uma única vez por versão dos dados e reaproveitado entre as buscas.
+
+    ### Exemplo:
+    ```
+    GET /fiis/search?q=hgl
+    ```
+    """
+    try:
+        usecase = FiiSearchUseCase(q=q, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return await usecase.execute()
+
+
+@app.get("/fiis/top", response_model=List[FiiRankEntry], tags=["FIIs", "Análise"])
+async def top_fiis(
+    field: str = Query(..., description="Campo numérico, ex: dialy_liquidity"),
+    k: int = Query(20, ge=1, le=FiiTopUseCase.MAX_K, description="Quantidade de FIIs"),
+    segment: Optional[str] = Query(None, description="Restringe ao segmento"),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="desc para os maiores, asc para os menores"),
+):
+    """
+    ## 🏆 Top-K por Campo
+
+    Retorna os K FIIs com os maiores (ou menores) valores de um campo numérico, no universo inteiro ou em
+    um segmento, a partir de índices ordenados mantidos por versão dos dados.
+
+    ### Exemplo:
+    ```
+    GET /fiis/top?field=dialy_liquidity&k=20
+    ```
+    """
+    try:
+        usecase = FiiTopUseCase(field=field, k=k, segment=segment, descending=order == "desc")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return await usecase.execute()
+
+
+@app.get("/fiis/{ticker}/rank", response_model=FiiRank, tags=["FIIs", "Análise"])
+async def rank_fii(
+    ticker: str,
+    field: str = Query("dy_12", description="Campo numérico, ex: dy_12"),
+    within_segment: bool = Query(False, description="Compara apenas com o segmento do FII"),
+):
+    """
+    ## 📶 Posição e Percentil de um FII
+
+    Retorna a posição do FII no campo (1 = maior valor, empates dividem a melhor posição) e o percentil,
+    no universo inteiro ou dentro do seu segmento.
+
+    ### Exemplo:
+    ```
+    GET /fiis/HGLG11/rank?field=dy_12&within_segment=true
+    ```
+    """
+    try:
+        usecase = FiiRankUseCase(ticker=ticker, field=field, within_segment=within_segment)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    rank = await usecase.execute()
+    if rank is None:
+        raise HTTPException(status_code=404, detail=f"FII {ticker.upper()} not found")
+
+    return rank
+
+
+@app.get("/fiis/{ticker}/similar", response_model=List[FiiSimilarity], tags=["FIIs", "Análise"])
+async def similar_fiis(
+    ticker: str,
+    k: int = Query(10, ge=1, le=FiiSimilarUseCase.MAX_K, description="Quantidade de FIIs"),
+    same_segment: bool = Query(False, description="Busca apenas no segmento do FII"),
+):
+    """
+    ## 🧭 FIIs Semelhantes
+
+    Retorna os K FIIs mais próximos pelo vetor normalizado de P/VP, DY, liquidez (log), valorizações
+    e segmento (FIIs de outro segmento ficam mais distantes). A busca usa KD-trees construídas uma vez
+    por versão dos dados.
+
+    ### Exemplo:
+    ```
+    GET /fiis/HGLG11/similar?k=5
+    ```
+    """
+    try:
+        usecase = FiiSimilarUseCase(ticker=ticker, k=k, same_segment=same_segment)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    similar = await usecase.execute()
+    if similar is None:
+        raise HTTPException(status_code=404, detail=f"FII {ticker.upper()} not found")
+
+    return similar
+
+
+@app.get("/fiis/{ticker}/history", response_model=FiiHistoryResponse, tags=["FIIs", "Histórico"])
+async def get_fii_history(
+    ticker: str,
+    start: Optional[datetime] = Query(None, description="Início do período (ISO 8601)"),
+    end: Optional[datetime] = Query(None, description="Fim do período (ISO 8601)"),
+):
+    """
+    ## 🕰️ Histórico de um FII
+
+    Retorna todas as coletas armazenadas de um FII no período, em ordem cronológica. Cada atualização do
+    scraping acrescenta um ponto; nada é sobrescrito.
+
+    ### Informações Retornadas:
+    - **scraped_at**: Momento da coleta (UTC)
+    - **last_price**, **last_dividend**, **p_vp**, **dy_12**, **last_12_month_evaluation**,
+      **current_month_evaluation**, **dialy_liquidity**: Valores na coleta
+
+    ### Exemplo:
+    ```
+    GET /fiis/HGLG11/history?start=2024-01-01&end=2024-12-31
+    ```
+    """
+    usecase = FiiHistoryUseCase(ticker=ticker, start=start, end=end)
+    return await usecase.execute()
+
+
+@app.get("/segments", response_model=List[FiiSegmentSummary], tags=["Segmentos", "Análise"])
+async def list_segments():
+    """
+    ## 🧩 Agregados por Segmento
+
+    Retorna, para cada segmento, estatísticas calculadas uma única vez por versão dos dados, sem percorrer
+    todos os FIIs a cada requisição. Segmentos são agrupados sem diferenciar maiúsculas e minúsculas.
+
+    ### Informações Retornadas:
+    - **count**: Quantidade de FIIs
+    - **mean_dy** / **median_dy** / **dy_p25** / **dy_p75**: Média, mediana e quartis do DY 12 meses
+    - **mean_p_vp** / **median_p_vp**: Média e mediana do P/VP
+    - **total_liquidity**: Soma da liquidez diária
+
+    Medianas e quartis vêm de um sketch de quantis com erro relativo de até 1%.
+
+    ### Exemplo:
+    ```
+    GET /segments
+    ```
+    """
+    usecase = FiiSegmentUseCase()
+    return await usecase.execute()
+
+
+@app.post("/alerts/rules", response_model=FiiAlertRule, status_code=201, tags=["Alertas"])
+async def register_alert_rule(request: AlertRuleRequest):
+    """
+    ## 🔔 Registrar Alerta
+
+    Registra uma regra de alerta sobre um campo numérico, para um FII (**ticker**), um segmento
+    (**segment**) ou para todos os FIIs quando nenhum dos dois é informado.
+
+    ### Disparo:
+    O alerta dispara quando uma atualização armazenada faz o campo **cruzar** o limite, por exemplo de
+    DY 9,5 para 10,2 com `dy_12 > 10`. Atualizações que continuam acima do limite não disparam de novo.
+    As regras ficam indexadas por campo e limite ordenado, então cada atualização consulta apenas as
+    regras que podem disparar.
+
+    ### Exemplo:
+    ```json
+    {"field": "dy_12", "operator": ">", "threshold": 10, "segment": "Papéis"}
+    ```
+    """
+    try:
+        usecase = FiiAlertRegisterUseCase(request=request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return await usecase.execute()
+
+
+@app.get("/alerts/rules", response_model=List[FiiAlertRule], tags=["Alertas"])
+async def list_alert_rules():
+    """
+    ## 📋 Regras de Alerta
+
+    Lista todas as regras de alerta registradas, das mais antigas para as mais recentes.
+    """
+    usecase = FiiAlertRuleListUseCase()
+    return await usecase.execute()
+
+
+@app.delete("/alerts/rules/{rule_id}", status_code=204, tags=["Alertas"])
+async def remove_alert_rule(rule_id: str):
+    """
+    ## 🗑️ Remover Alerta
+
+    Remove uma regra de alerta. Alertas já disparados continuam disponíveis em `/alerts`.
+    """
+    usecase = FiiAlertRemoveUseCase(rule_id=rule_id)
+    if not await usecase.execute():
+        raise HTTPException(status_code=404, detail=f"Alert rule {rule_id} not found")
+
+    return Response(status_code=204)
+
+
+@app.get("/alerts", response_model=FiiAlertPage, tags=["Alertas"])
+async def list_alerts(
+    after: Optional[str] = Query(None, description="Id do último alerta já recebido"),
+    limit: int = Query(100, ge=1, le=FiiAlertListUseCase.MAX_LIMIT, description="Máximo de alertas na página"),
+):
+    """
+    ## 🚨 Alertas Disparados
+
+    Retorna os alertas disparados em ordem cronológica, paginados pelo id do último alerta recebido.
+    Repita com `after=next_after` enquanto **has_more** for verdadeiro.
+
+    ### Exemplo:
+    ```
+    GET /alerts?limit=50
+    ```
+    """
+    usecase = FiiAlertListUseCase(after=after, limit=limit)
+    return await usecase.execute()
+
+
+@app.get("/alerts/stream", tags=["Alertas"])
+async def stream_alerts(
+    after: Optional[str] = Query(None, description="Reenvia os alertas disparados depois deste id"),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    ## 📡 Stream de Alertas
+
+    Envia os alertas disparados em tempo real como Server-Sent Events (`event: alert`). Ao reconectar, o
+    navegador envia o cabeçalho **Last-Event-ID** e os alertas perdidos são reenviados antes dos novos.
+
+    ### Exemplo:
+    ```javascript
+    new EventSource("/alerts/stream").addEventListener("alert", (event) => console.log(JSON.parse(event.data)))
+    ```
+    """
+    usecase = FiiAlertStreamUseCase(after=last_event_id or after)
+    return StreamingResponse(usecase.execute(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 @app.get("/database/status", tags=["Sistema", "Monitoramento"])
 async def get_database_status():
     """
@@ -253,7 +969,7 @@ async def health_check():
 
 
 @app.get("/dashboard", response_class=HTMLResponse, tags=["Dashboard"])
-async def dashboard(request: Request):
+async def dashboard(request: Request, if_none_match: Optional[str] = Header(None)):
     """
     ## 📊 Dashboard Visual dos FIIs
 
@@ -262,9 +978,11 @@ async def dashboard(request: Request):
     ### Funcionalidades:
     - 📈 **Estatísticas Gerais**: Total de FIIs, Magic Numbers, liquidez média
     - ⭐ **Magic Numbers**: Lista destacada dos FIIs recomendados
-    - 📋 **Tabela Completa**: Todos os FIIs com dados detalhados
+    - 📋 **Tabela Completa**: Todos os FIIs, paginados por `/dashboard/table` e renderizados em lista virtualizada
     - 🎨 **Material Design**: Interface moderna e responsiva
-    - 🔄 **Auto-refresh**: Atualização automática a cada 5 minutos
+    - 🔄 **Tempo real**: Alterações recebidas por `/fiis/stream` atualizam as linhas no lugar, sem recarregar a página
+    - ⚡ **Snapshot em memória**: Tabela, magic numbers e estatísticas calculados uma vez por versão dos
+      dados, sem acesso ao banco a cada página
 
     ### Indicadores Visuais:
     - **Verde**: Valores positivos (P/VP < 1, DY > 0)
@@ -275,33 +993,49 @@ async def dashboard(request: Request):
     ### Responsivo:
     Otimizado para desktop, tablet e mobile.
     """
-    try:
-        fiis_usecase = FiiListUseCase()
-        fiis = await fiis_usecase.execute()
+    usecase = FiiDashboardUseCase()
+    tag = usecase.etag()
+    headers = {}
+    if tag is not None:
+        etag = strong_etag(tag)
+        if is_not_modified(if_none_match, etag):
+            return not_modified(etag, PAGE_CACHE_CONTROL)
+        headers = cache_headers(etag, PAGE_CACHE_CONTROL)
 
-        magic_usecase = FiiMagicNumberUseCase()
-        magic_numbers = await magic_usecase.execute()
+    try:
+        dashboard = await usecase.execute()
     except Exception:
-        fiis = []
-        magic_numbers = []
+        dashboard = FiiDashboard(FiiSnapshot(0, []))
 
-    total_fiis = len(fiis)
-    positive_dy = len([f for f in fiis if f.dy_12 and f.dy_12 > 0])
-    magic_count = len(magic_numbers)
+    # the HTML only carries the stats; the tables are loaded page by page from /dashboard/table
+    return templates.TemplateResponse("dashboard.html", {"request": request, "stats": dashboard.stats}, headers=headers)
 
-    total_liquidity = sum(f.dialy_liquidity or 0 for f in fiis)
-    avg_liquidity = (total_liquidity / total_fiis / 1000000) if total_fiis > 0 else 0
 
-    stats = {
-        "total_fiis": total_fiis,
-        "positive_dy": positive_dy,
-        "magic_numbers": magic_count,
-        "avg_liquidity": avg_liquidity,
-    }
+@app.get("/dashboard/table", response_model=FiiDashboardTablePage, tags=["Dashboard"])
+async def dashboard_table(
+    offset: int = Query(0, ge=0, description="Posição da primeira linha"),
+    limit: int = Query(100, ge=1, le=FiiDashboardTableUseCase.MAX_LIMIT, description="Quantidade de linhas"),
+    sort: str = Query("ticker", description=f"Um de {', '.join(FiiDashboard.SORT_FIELDS)}"),
+    order: str = Query("asc", pattern="^(asc|desc)$", description="asc ou desc"),
+    magic_only: bool = Query(False, description="Apenas FIIs com magic number"),
+):
+    """
+    ## 📋 Tabela do Dashboard
 
-    return templates.TemplateResponse(
-        "dashboard.html", {"request": request, "fiis": fiis, "magic_numbers": magic_numbers, "stats": stats}
-    )
+    Página ordenada da tabela de FIIs do dashboard, com as estatísticas e a versão dos dados. As ordenações
+    são calculadas uma vez por versão, então cada página é um recorte.
+
+    ### Exemplo:
+    ```
+    GET /dashboard/table?offset=100&limit=100&sort=dy_12&order=desc
+    ```
+    """
+    try:
+        usecase = FiiDashboardTableUseCase(offset=offset, limit=limit, sort=sort, order=order, magic_only=magic_only)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return await usecase.execute()
 
 
 @app.get("/status", tags=["Status"])
@@ -316,6 +1050,8 @@ async def status():
     - **Database**: Status da conexão com DynamoDB
     - **Estatísticas**: Números totais de registros
     - **Última Atualização**: Timestamp da última operação
+    - **Coalescing**: leituras idênticas simultâneas que compartilharam uma mesma execução
+      (`calls`, `executions`, `coalesced`, `in_flight`), por camada
 
     ### Status Codes:
     - **healthy**: Sistema funcionando normalmente
@@ -333,6 +1069,7 @@ async def status():
             "version": "2.0.0",
             "database": {"type": "dynamodb", "status": "healthy", "total_fiis": len(fiis)},
             "services": {"scraper": "healthy", "scheduler": "healthy", "api": "healthy"},
+            "coalescing": [stats.model_dump() for stats in SingleFlight.all_stats()],
         }
     except Exception as e:
         return {
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Backtest rule profiles over the stored FII history.
+
+Usage: python -m scripts.backtest [--years 5] [--profiles default,dividend] [--end 2024-12-31] [--json]
+"""
+import argparse
+import asyncio
+from datetime import date
+
+from app.domain.fii_validator import FiiValidatorFactory
+from app.usecases.fii_backtest_usecase import FiiBacktestUseCase
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--profiles", default=",".join(FiiValidatorFactory.PROFILES))
+    parser.add_argument("--end", type=date.fromisoformat, default=None)
+    parser.add_argument("--json", action="store_true", help="print the full result as JSON")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    usecase = FiiBacktestUseCase(
+        years=args.years,
+        profiles=[profile.strip() for profile in args.profiles.split(",") if profile.strip()],
+        end=args.end,
+    )
+    result = await usecase.execute()
+
+    if args.json:
+        print(result.model_dump_json(indent=2))
+        return
+
+    print(f"Backtest {result.start} -> {result.end}: {result.months} months, {result.tickers} FIIs")
+    print(f"{'profile':<12} {'holdings':>9} {'total %':>9} {'annual %':>9} {'price %':>9} {'DY %':>7} {'excess %':>9}")
+    for performance in [result.universe, *result.profiles]:
+        print(
+            f"{performance.profile:<12} {performance.average_holdings:>9.1f} {performance.total_return:>9.2f} "
+            f"{performance.annualized_return:>9.2f} {performance.price_return:>9.2f} "
+            f"{performance.dividend_yield:>7.2f} {performance.excess_return:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -84,6 +84,12 @@ class TestAPIE2E:
         if len(data) > 0:
             assert data[0]["invested_value"] == custom_value
 
+    @pytest.mark.asyncio
+    async def test_magic_numbers_rejects_invested_value_above_the_limit(self, client):
+        response = await client.get("/fiis/magic_numbers?invested_value=9223372036855")
+
+        assert response.status_code == 422
+
     @pytest.mark.asyncio
     async def test_dashboard_endpoint(self, client):
         response = await client.get("/dashboard")
@@ -0,0 +1,28 @@
+from typing import Dict, List, Optional
+
+from app.domain.fii_alert import FiiAlert, FiiAlertRule
+from app.repositories.fii_alert_repository import FiiAlertRepository
+
+
+class InMemoryFiiAlertRepository(FiiAlertRepository):
+    def __init__(self):
+        self.rule_items: Dict[str, FiiAlertRule] = {}
+        self.fired: List[FiiAlert] = []
+
+    async def add_rule(self, rule: FiiAlertRule) -> int:
+        self.rule_items[rule.id] = rule
+        return 1
+
+    async def remove_rule(self, rule_id: str) -> int:
+        return 1 if self.rule_items.pop(rule_id, None) else 0
+
+    async def rules(self) -> List[FiiAlertRule]:
+        return list(self.rule_items.values())
+
+    async def add_alerts(self, alerts: List[FiiAlert]) -> int:
+        self.fired.extend(alerts)
+        return len(alerts)
+
+    async def alerts(self, after: Optional[str], limit: int) -> List[FiiAlert]:
+        ordered = sorted(self.fired, key=lambda alert: alert.id)
+        return [alert for alert in ordered if after is None or alert.id > after][:limit]
@@ -0,0 +1,20 @@
+from typing import List
+
+from app.domain.fii_change import FiiChange
+from app.repositories.fii_change_repository import FiiChangeRepository
+
+
+class InMemoryFiiChangeRepository(FiiChangeRepository):
+    def __init__(self):
+        self.changes: List[FiiChange] = []
+
+    async def append(self, change: FiiChange) -> FiiChange:
+        versioned = change.model_copy(update={"version": len(self.changes) + 1})
+        self.changes.append(versioned)
+        return versioned
+
+    async def since(self, version: int, limit: int) -> List[FiiChange]:
+        return [change for change in self.changes if change.version > version][:limit]
+
+    async def latest_version(self) -> int:
+        return len(self.changes)
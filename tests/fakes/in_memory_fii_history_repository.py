@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from app.domain.fii_domain import FiiDomain, ticker_key
+from app.domain.fii_history import FiiHistorySeries
+from app.repositories.fii_history_repository import FiiHistoryRepository
+
+
+class InMemoryFiiHistoryRepository(FiiHistoryRepository):
+    def __init__(self):
+        self.buckets: Dict[str, Dict[str, bytes]] = {}
+
+    async def append(self, fii: FiiDomain, scraped_at: datetime) -> int:
+        buckets = self.buckets.setdefault(ticker_key(fii.ticker), {})
+        bucket = scraped_at.strftime("%Y-%m")
+        series = FiiHistorySeries.decode(fii.ticker, buckets[bucket]) if bucket in buckets else None
+        buckets[bucket] = (series or FiiHistorySeries.empty(fii.ticker)).append(fii, scraped_at).encode()
+        return 1
+
+    async def range(
+        self, ticker: str, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> FiiHistorySeries:
+        payloads = self.buckets.get(ticker_key(ticker), {}).values()
+        series = FiiHistorySeries.concat(ticker, (FiiHistorySeries.decode(ticker, payload) for payload in payloads))
+        return series.between(start, end)
+
+    async def range_many(
+        self, tickers: Iterable[str], start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Dict[str, FiiHistorySeries]:
+        return {ticker: await self.range(ticker, start, end) for ticker in tickers}
@@ -0,0 +1,21 @@
+from typing import List, Optional
+
+from app.domain.fii_domain import FiiDomain
+from app.repositories.fii_repository import FiiRepository
+
+
+class InMemoryFiiRepository(FiiRepository):
+    def __init__(self, fiis: List[FiiDomain] = None):
+        self.fiis = {fii.ticker: fii for fii in fiis or []}
+
+    async def add(self, fii: FiiDomain) -> int:
+        previous = self.fiis.get(fii.ticker)
+        self.fiis[fii.ticker] = fii
+        await self._notify_write(fii, previous)
+        return 1
+
+    async def get(self, ticker: str) -> Optional[FiiDomain]:
+        return self.fiis.get(ticker)
+
+    async def list(self) -> List[FiiDomain]:
+        return list(self.fiis.values())
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import List, Optional
+
+from app.domain.fii_domain import FiiDomain
+from app.domain.fii_timeline import FiiCheckpoint, FiiDelta
+from app.repositories.fii_timeline_repository import FiiTimelineRepository
+
+
+class InMemoryFiiTimelineRepository(FiiTimelineRepository):
+    def __init__(self):
+        self.checkpoints: List[FiiCheckpoint] = []
+        self.delta_log: List[FiiDelta] = []
+        self.delta_queries = 0
+
+    async def add_checkpoint(self, fiis: List[FiiDomain], recorded_at: datetime) -> int:
+        self.checkpoints.append(FiiCheckpoint(recorded_at=recorded_at, fiis=list(fiis)))
+        return 1
+
+    async def add_delta(self, fii: FiiDomain, recorded_at: datetime) -> int:
+        self.delta_log.append(FiiDelta(recorded_at=recorded_at, fii=fii))
+        return 1
+
+    async def latest_checkpoint(self, at_or_before: datetime) -> Optional[FiiCheckpoint]:
+        candidates = [checkpoint for checkpoint in self.checkpoints if checkpoint.recorded_at <= at_or_before]
+        return max(candidates, key=lambda checkpoint: checkpoint.recorded_at, default=None)
+
+    async def deltas(self, after: datetime, until: datetime) -> List[FiiDelta]:
+        self.delta_queries += 1
+        return [delta for delta in self.delta_log if after < delta.recorded_at <= until]
@@ -0,0 +1,57 @@
+import os
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.domain.fii_change import change_of
+from app.repositories.fii_change_dynamodb_repository import FiiChangeDynamoDBRepository
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiChangeDynamoDbRepositoryIntegration:
+
+    @pytest.fixture(autouse=True)
+    def setup_dynamodb_env(self):
+        os.environ["DYNAMODB_ENDPOINT"] = "http://localhost:8002"
+        os.environ["AWS_ACCESS_KEY_ID"] = "dummy"
+        os.environ["AWS_SECRET_ACCESS_KEY"] = "dummy"
+        os.environ["AWS_REGION"] = "us-east-1"
+        os.environ["DYNAMODB_TABLE_NAME"] = "fiis_test"
+
+        import importlib
+
+        from app.config import database
+
+        importlib.reload(database)
+
+        yield
+
+    @pytest.fixture
+    def repository(self):
+        table_name = f"fiis_changes_test_{uuid.uuid4().hex[:8]}"
+        return FiiChangeDynamoDBRepository(table_name)
+
+    @pytest.mark.asyncio
+    async def test_append_assigns_versions_and_pages_by_version(self, repository):
+        changed_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for ticker in ("TEST11", "TEST12", "TEST13"):
+            await repository.append(change_of(None, FiiDomainFactory.build(ticker=ticker), changed_at))
+
+        first = await repository.since(0, 2)
+        rest = await repository.since(first[-1].version, 2)
+
+        assert [change.version for change in first] == [1, 2]
+        assert [change.ticker for change in rest] == ["TEST13"]
+        assert await repository.latest_version() == 3
+
+    @pytest.mark.asyncio
+    async def test_a_second_writer_continues_after_the_latest_version(self, repository):
+        changed_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        other = FiiChangeDynamoDBRepository(repository.table_name)
+        await repository.append(change_of(None, FiiDomainFactory.build(ticker="TEST11"), changed_at))
+        await other.append(change_of(None, FiiDomainFactory.build(ticker="TEST12"), changed_at))
+
+        change = await repository.append(change_of(None, FiiDomainFactory.build(ticker="TEST13"), changed_at))
+
+        assert change.version == 3
@@ -0,0 +1,56 @@
+import os
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.repositories.fii_history_dynamodb_repository import (
+    FiiHistoryDynamoDBRepository,
+)
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiHistoryDynamoDbRepositoryIntegration:
+
+    @pytest.fixture(autouse=True)
+    def setup_dynamodb_env(self):
+        os.environ["DYNAMODB_ENDPOINT"] = "http://localhost:8002"
+        os.environ["AWS_ACCESS_KEY_ID"] = "dummy"
+        os.environ["AWS_SECRET_ACCESS_KEY"] = "dummy"
+        os.environ["AWS_REGION"] = "us-east-1"
+        os.environ["DYNAMODB_TABLE_NAME"] = "fiis_test"
+
+        import importlib
+
+        from app.config import database
+
+        importlib.reload(database)
+
+        yield
+
+    @pytest.fixture
+    def repository(self):
+        table_name = f"fiis_history_test_{uuid.uuid4().hex[:8]}"
+        return FiiHistoryDynamoDBRepository(table_name)
+
+    @pytest.mark.asyncio
+    async def test_append_and_range_across_months(self, repository):
+        for month in range(1, 5):
+            fii = FiiDomainFactory.build(ticker="TEST11", last_dividend=month)
+            await repository.append(fii, datetime(2024, month, 10, tzinfo=timezone.utc))
+
+        series = await repository.range(
+            "TEST11", datetime(2024, 2, 1, tzinfo=timezone.utc), datetime(2024, 3, 31, tzinfo=timezone.utc)
+        )
+
+        assert series.columns["last_dividend"].tolist() == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_range_many_returns_every_ticker(self, repository):
+        moment = datetime(2024, 1, 10, tzinfo=timezone.utc)
+        await repository.append(FiiDomainFactory.build(ticker="TEST11"), moment)
+        await repository.append(FiiDomainFactory.build(ticker="TEST12"), moment)
+
+        result = await repository.range_many(["TEST11", "TEST12", "NONE11"])
+
+        assert [len(result[ticker]) for ticker in ("TEST11", "TEST12", "NONE11")] == [1, 1, 0]
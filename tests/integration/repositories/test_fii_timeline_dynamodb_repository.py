@@ -0,0 +1,47 @@
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.repositories.fii_timeline_dynamodb_repository import (
+    FiiTimelineDynamoDBRepository,
+)
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiTimelineDynamoDbRepositoryIntegration:
+
+    @pytest.fixture(autouse=True)
+    def setup_dynamodb_env(self):
+        os.environ["DYNAMODB_ENDPOINT"] = "http://localhost:8002"
+        os.environ["AWS_ACCESS_KEY_ID"] = "dummy"
+        os.environ["AWS_SECRET_ACCESS_KEY"] = "dummy"
+        os.environ["AWS_REGION"] = "us-east-1"
+        os.environ["DYNAMODB_TABLE_NAME"] = "fiis_test"
+
+        import importlib
+
+        from app.config import database
+
+        importlib.reload(database)
+
+        yield
+
+    @pytest.fixture
+    def repository(self):
+        table_name = f"fiis_timeline_test_{uuid.uuid4().hex[:8]}"
+        return FiiTimelineDynamoDBRepository(table_name)
+
+    @pytest.mark.asyncio
+    async def test_latest_checkpoint_and_deltas(self, repository):
+        start = datetime(2024, 1, 1, 20, tzinfo=timezone.utc)
+        await repository.add_checkpoint([FiiDomainFactory.build(ticker="TEST11", last_price=10)], start)
+        await repository.add_delta(FiiDomainFactory.build(ticker="TEST11", last_price=11), start + timedelta(hours=6))
+
+        checkpoint = await repository.latest_checkpoint(start + timedelta(days=1))
+        deltas = await repository.deltas(checkpoint.recorded_at, start + timedelta(days=1))
+
+        assert checkpoint.recorded_at == start
+        assert [fii.last_price for fii in checkpoint.replay(deltas)] == [11]
+        assert await repository.latest_checkpoint(start - timedelta(seconds=1)) is None
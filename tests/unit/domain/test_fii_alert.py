@@ -0,0 +1,87 @@
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from app.domain.fii_alert import FiiAlertIndex, FiiAlertRule
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+def rule(rule_id, operator, threshold, field="dy_12", **scope):
+    return FiiAlertRule(id=rule_id, field=field, operator=operator, threshold=threshold, **scope)
+
+
+def fired(index, previous, current):
+    return sorted(matched.id for matched, _, _ in index.matches(previous, current))
+
+
+class TestFiiAlertRule:
+    def test_rejects_unknown_fields_and_operators(self):
+        with pytest.raises(ValidationError):
+            rule("a", ">", 10, field="segment")
+        with pytest.raises(ValidationError):
+            rule("a", "==", 10)
+
+    def test_scope_is_normalized(self):
+        assert rule("a", ">", 10, ticker=" Test11 ").scope == ("ticker", "test11")
+        assert rule("a", ">", 10, segment="Papéis").scope == ("segment", "papéis")
+        assert rule("a", ">", 10).scope == ("all", "")
+
+
+class TestFiiAlertIndex:
+    @pytest.fixture
+    def fii(self):
+        return FiiDomainFactory.build(ticker="TEST11", segment="Papéis", dy_12=Decimal("9.5"))
+
+    @pytest.mark.parametrize(
+        "operator, threshold, before, after, expected",
+        [
+            (">", 10, "9.5", "10.2", True),
+            (">", 10, "10", "10.2", True),
+            (">", 10, "10.1", "10.2", False),
+            (">", 10, "9.5", "10", False),
+            (">=", 10, "9.5", "10", True),
+            (">=", 10, "10", "10.2", False),
+            ("<", 10, "10.2", "9.5", True),
+            ("<", 10, "10.2", "10", False),
+            ("<=", 10, "10.2", "10", True),
+            ("<=", 10, "10", "9.5", False),
+        ],
+    )
+    def test_fires_only_when_the_threshold_is_crossed(self, fii, operator, threshold, before, after, expected):
+        index = FiiAlertIndex([rule("a", operator, threshold)])
+        previous = fii.model_copy(update={"dy_12": Decimal(before)})
+        current = fii.model_copy(update={"dy_12": Decimal(after)})
+
+        assert fired(index, previous, current) == (["a"] if expected else [])
+
+    def test_new_fii_fires_every_satisfied_rule(self, fii):
+        index = FiiAlertIndex([rule("above", ">", 9), rule("below", "<", 9), rule("at_most", "<=", 9.5)])
+
+        assert fired(index, None, fii) == ["above", "at_most"]
+
+    def test_only_matching_scopes_are_evaluated(self, fii):
+        index = FiiAlertIndex(
+            [
+                rule("ticker", ">", 10, ticker="test11"),
+                rule("other_ticker", ">", 10, ticker="OTHR11"),
+                rule("segment", ">", 10, segment="papéis"),
+                rule("other_segment", ">", 10, segment="Lajes"),
+                rule("all", ">", 10),
+            ]
+        )
+
+        assert fired(index, fii, fii.model_copy(update={"dy_12": Decimal("11")})) == ["all", "segment", "ticker"]
+
+    def test_removed_rules_no_longer_fire(self, fii):
+        index = FiiAlertIndex([rule("a", ">", 10), rule("b", ">", 10)])
+
+        assert index.remove("a").id == "a"
+        assert index.remove("a") is None
+        assert fired(index, fii, fii.model_copy(update={"dy_12": Decimal("11")})) == ["b"]
+
+    def test_many_rules_only_return_the_crossed_range(self, fii):
+        index = FiiAlertIndex([rule(f"r{threshold}", ">", threshold / 100) for threshold in range(50_000)])
+        current = fii.model_copy(update={"dy_12": Decimal("9.53")})
+
+        assert fired(index, fii, current) == ["r950", "r951", "r952"]
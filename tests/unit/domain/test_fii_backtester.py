@@ -0,0 +1,56 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.domain.fii_backtester import FiiBacktester
+from app.domain.fii_history import FiiHistorySeries
+from app.domain.fii_history_panel import FiiHistoryPanel
+from app.domain.fii_validator import FiiValidator
+from app.domain.rules.minimum_dy_rule import MinimumDyRule
+
+
+class TestFiiBacktester:
+    @pytest.fixture
+    def panel(self):
+        months = np.arange(np.datetime64("2024-01"), np.datetime64("2024-04"))
+        values = {field: np.zeros((3, 2)) for field in FiiHistorySeries.FIELDS}
+        values["last_price"] = np.array([[100.0, 10.0], [110.0, 10.0], [121.0, 5.0]])
+        values["last_dividend"] = np.array([[1.0, 0.1], [1.0, 0.1], [1.0, 0.1]])
+        values["dy_12"] = np.array([[9.0, 4.0], [9.0, 9.0], [9.0, 9.0]])
+        return FiiHistoryPanel(months, ["HIGH11", "LOW11"], values)
+
+    @pytest.fixture
+    def static_columns(self):
+        return {"duration": np.array(["indeterminado", "indeterminado"], dtype=object)}
+
+    def test_run_rebalances_monthly_on_the_profile_mask(self, panel, static_columns):
+        result = FiiBacktester().run(panel, static_columns, {"dy": FiiValidator(MinimumDyRule)})
+
+        profile = result.profiles[0]
+        assert result.months == 2
+        assert result.end == date(2024, 3, 31)
+        assert profile.holdings == [1, 2]
+        # month 1: HIGH11 +10% price, +1% dividend; month 2: average of (+10%, +0.91%) and (-50%, +1%)
+        assert profile.monthly_returns == pytest.approx([11.0, (10 + 100 / 110 - 50 + 1) / 2], abs=1e-3)
+
+    def test_run_compares_against_the_universe(self, panel, static_columns):
+        result = FiiBacktester().run(panel, static_columns, {"dy": FiiValidator(MinimumDyRule)})
+
+        assert result.universe.holdings == [2, 2]
+        assert result.profiles[0].excess_return == pytest.approx(
+            result.profiles[0].total_return - result.universe.total_return, abs=1e-3
+        )
+
+    def test_run_stays_in_cash_when_nothing_passes(self, panel, static_columns):
+        panel.values["dy_12"][:] = 1
+
+        result = FiiBacktester().run(panel, static_columns, {"dy": FiiValidator(MinimumDyRule)})
+
+        assert result.profiles[0].total_return == 0
+
+    def test_run_requires_two_months(self, panel, static_columns):
+        short = FiiHistoryPanel(panel.months[:1], panel.tickers, {k: v[:1] for k, v in panel.values.items()})
+
+        with pytest.raises(ValueError):
+            FiiBacktester().run(short, static_columns, {})
@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from app.domain.fii_change import TRACKED_FIELDS, FiiChangeEvent, change_of, diff_fii
+from app.domain.fii_domain import FiiRollingStats
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiChange:
+    CHANGED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def test_diff_lists_only_changed_fields(self):
+        previous = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("10.00"), dy_12=Decimal("8.0"))
+        current = previous.model_copy(update={"last_price": Decimal("10.50")})
+
+        fields = diff_fii(previous, current)
+
+        assert [(field.field, field.previous, field.current) for field in fields] == [("last_price", "10.00", "10.50")]
+
+    def test_new_fii_is_added_with_every_field(self):
+        change = change_of(None, FiiDomainFactory.build(ticker="TEST11"), self.CHANGED_AT)
+
+        assert change.kind == "added"
+        assert [field.field for field in change.fields] == list(TRACKED_FIELDS)
+        assert all(field.previous is None for field in change.fields)
+
+    def test_unchanged_write_has_no_change(self):
+        fii = FiiDomainFactory.build(ticker="TEST11")
+
+        assert change_of(fii, fii.model_copy(), self.CHANGED_AT) is None
+
+    def test_rolling_stats_are_not_tracked(self):
+        fii = FiiDomainFactory.build(ticker="TEST11")
+        enriched = fii.model_copy(update={"rolling_stats": FiiRollingStats(observations=3)})
+
+        assert "rolling_stats" not in TRACKED_FIELDS
+        assert change_of(fii, enriched, self.CHANGED_AT) is None
+
+    def test_change_event_keeps_the_current_values(self):
+        previous = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("10.00"))
+        change = change_of(previous, previous.model_copy(update={"last_price": Decimal("10.50")}), self.CHANGED_AT)
+
+        event = FiiChangeEvent.of(change.model_copy(update={"version": 7}))
+
+        assert event.model_dump() == {
+            "version": 7,
+            "ticker": "TEST11",
+            "kind": "updated",
+            "values": {"last_price": "10.50"},
+        }
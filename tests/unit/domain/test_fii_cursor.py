@@ -0,0 +1,49 @@
+from decimal import Decimal
+
+import pytest
+
+from app.domain.fii_cursor import FiiCursor
+from app.domain.fii_snapshot import FiiSnapshot
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiCursor:
+    @pytest.fixture
+    def snapshot(self):
+        return FiiSnapshot(
+            1,
+            [
+                FiiDomainFactory.build(ticker="AAAA11", dy_12=Decimal("8"), segment="Papéis"),
+                FiiDomainFactory.build(ticker="BBBB11", dy_12=Decimal("10"), segment="Logística"),
+                FiiDomainFactory.build(ticker="CCCC11", dy_12=Decimal("8"), segment="Papéis"),
+                FiiDomainFactory.build(ticker="DDDD11", dy_12=Decimal("12"), segment="Híbrido"),
+            ],
+        )
+
+    def test_encode_round_trips(self, snapshot):
+        cursor = FiiCursor.after(snapshot, 1, "dy_12", True)
+
+        assert FiiCursor.decode(cursor.encode()) == cursor
+        assert "=" not in cursor.encode()
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "e30", "WyJhIl0"])
+    def test_decode_rejects_garbage(self, token):
+        with pytest.raises(ValueError):
+            FiiCursor.decode(token)
+
+    @pytest.mark.parametrize("sort,descending", [("dy_12", False), ("dy_12", True), ("segment", False)])
+    def test_start_follows_the_row_after_the_cursor(self, snapshot, sort, descending):
+        order = snapshot.order(sort, descending)
+
+        for index, position in enumerate(order.tolist()):
+            cursor = FiiCursor.after(snapshot, position, sort, descending)
+            assert cursor.start(snapshot, order) == index + 1
+
+    def test_start_survives_the_row_being_removed(self, snapshot):
+        cursor = FiiCursor.after(snapshot, snapshot.positions["CCCC11"], "dy_12", False)
+        changed = FiiSnapshot(2, [fii for fii in snapshot.fiis if fii.ticker != "CCCC11"])
+        order = changed.order("dy_12", False)
+
+        start = cursor.start(changed, order)
+
+        assert [changed.fiis[position].ticker for position in order[start:].tolist()] == ["BBBB11", "DDDD11"]
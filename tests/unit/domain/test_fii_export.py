@@ -0,0 +1,73 @@
+import io
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.domain import fii_export
+from app.domain.fii_export import (
+    CsvExportWriter,
+    FiiExportUnavailableError,
+    FiiExportWriter,
+    NdjsonExportWriter,
+    ParquetExportWriter,
+)
+
+
+class TestFiiExportWriters:
+    COLUMNS = (("ticker", "text"), ("dy_12", "number"), ("start_date", "date"), ("scraped_at", "datetime"))
+    ROWS = [
+        ("TEST11", Decimal("10.50"), date(2020, 1, 2), datetime(2024, 1, 1, tzinfo=timezone.utc)),
+        ("TESTÉ11", None, None, datetime(2024, 1, 2, tzinfo=timezone.utc)),
+    ]
+
+    def test_ndjson_writes_one_object_per_line(self):
+        writer = NdjsonExportWriter(self.COLUMNS)
+
+        lines = (writer.header() + writer.write(self.ROWS) + writer.close()).decode().splitlines()
+
+        assert [json.loads(line) for line in lines] == [
+            {
+                "ticker": "TEST11",
+                "dy_12": "10.50",
+                "start_date": "2020-01-02",
+                "scraped_at": "2024-01-01T00:00:00+00:00",
+            },
+            {"ticker": "TESTÉ11", "dy_12": None, "start_date": None, "scraped_at": "2024-01-02T00:00:00+00:00"},
+        ]
+
+    def test_csv_writes_the_header_once(self):
+        writer = CsvExportWriter(self.COLUMNS)
+
+        data = writer.header() + writer.write(self.ROWS[:1]) + writer.write(self.ROWS[1:]) + writer.close()
+
+        assert data.decode().splitlines() == [
+            "ticker,dy_12,start_date,scraped_at",
+            "TEST11,10.50,2020-01-02,2024-01-01T00:00:00+00:00",
+            "TESTÉ11,,,2024-01-02T00:00:00+00:00",
+        ]
+
+    def test_writer_without_write_cannot_be_built(self):
+        class HeaderOnlyWriter(FiiExportWriter):
+            pass
+
+        with pytest.raises(TypeError):
+            HeaderOnlyWriter(self.COLUMNS)
+
+    def test_parquet_needs_pyarrow(self, monkeypatch):
+        monkeypatch.setattr(fii_export, "pyarrow", None)
+
+        with pytest.raises(FiiExportUnavailableError):
+            ParquetExportWriter(self.COLUMNS)
+
+    def test_parquet_streams_one_row_group_per_chunk(self):
+        parquet = pytest.importorskip("pyarrow.parquet")
+        writer = ParquetExportWriter(self.COLUMNS)
+
+        data = writer.header() + writer.write(self.ROWS[:1]) + writer.write(self.ROWS[1:]) + writer.close()
+
+        table = parquet.read_table(io.BytesIO(data))
+        assert table.column("ticker").to_pylist() == ["TEST11", "TESTÉ11"]
+        assert table.column("dy_12").to_pylist() == [10.5, None]
+        assert parquet.ParquetFile(io.BytesIO(data)).num_row_groups == 2
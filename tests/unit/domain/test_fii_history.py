@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.domain.fii_history import FiiHistorySeries
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiHistorySeries:
+    @pytest.fixture
+    def series(self):
+        series = FiiHistorySeries.empty("TEST11")
+        for day, price in ((3, "101.5"), (1, "100.25"), (2, "99.1")):
+            fii = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal(price), last_dividend=Decimal("0.85"))
+            series = series.append(fii, datetime(2024, 5, day, tzinfo=timezone.utc))
+        return series
+
+    def test_append_keeps_time_order(self, series):
+        assert series.columns["last_price"].tolist() == [100.25, 99.1, 101.5]
+        assert [point.scraped_at.day for point in series.points()] == [1, 2, 3]
+
+    def test_between_is_inclusive(self, series):
+        window = series.between(datetime(2024, 5, 2, tzinfo=timezone.utc), datetime(2024, 5, 3, tzinfo=timezone.utc))
+
+        assert window.columns["last_price"].tolist() == [99.1, 101.5]
+
+    def test_between_treats_naive_datetimes_as_utc(self, series):
+        assert len(series.between(end=datetime(2024, 5, 1))) == 1
+
+    def test_encode_round_trips(self, series):
+        decoded = FiiHistorySeries.decode("TEST11", series.encode())
+
+        assert np.array_equal(decoded.timestamps, series.timestamps)
+        for field in FiiHistorySeries.FIELDS:
+            assert np.allclose(decoded.columns[field], series.columns[field])
+
+    def test_encode_is_compact_for_slow_moving_series(self):
+        fii = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("100"))
+        series = FiiHistorySeries.empty("TEST11")
+        for hour in range(500):
+            series = series.append(fii, datetime.fromtimestamp(1_700_000_000 + hour * 28800, tz=timezone.utc))
+
+        assert len(series.encode()) < 500 * 8
+
+    def test_decode_rejects_unknown_payload(self):
+        with pytest.raises(ValueError):
+            FiiHistorySeries.decode("TEST11", b"XXXX" + bytes(5))
+
+    def test_concat_merges_buckets(self, series):
+        merged = FiiHistorySeries.concat(
+            "TEST11", [series.between(start=datetime(2024, 5, 2)), series.between(end=datetime(2024, 5, 1))]
+        )
+
+        assert merged.columns["last_price"].tolist() == [100.25, 99.1, 101.5]
@@ -0,0 +1,68 @@
+from datetime import date, datetime, timezone
+
+import numpy as np
+import pytest
+
+from app.domain.fii_history import FiiHistorySeries
+from app.domain.fii_history_panel import FiiHistoryPanel
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+def build_series(ticker, observations):
+    series = FiiHistorySeries.empty(ticker)
+    for moment, price in observations:
+        series = series.append(FiiDomainFactory.build(ticker=ticker, last_price=price), moment)
+    return series
+
+
+class TestFiiHistoryPanel:
+    def test_build_keeps_the_last_observation_of_each_month(self):
+        series = build_series(
+            "TEST11",
+            [
+                (datetime(2024, 1, 5, tzinfo=timezone.utc), 10),
+                (datetime(2024, 1, 25, tzinfo=timezone.utc), 11),
+                (datetime(2024, 2, 10, tzinfo=timezone.utc), 12),
+            ],
+        )
+
+        panel = FiiHistoryPanel.build({"TEST11": series}, date(2024, 1, 1), date(2024, 2, 29))
+
+        assert panel.values["last_price"][:, 0].tolist() == [11, 12]
+        assert panel.month_ends.tolist() == [date(2024, 1, 31), date(2024, 2, 29)]
+
+    def test_build_fills_short_gaps_only(self):
+        series = build_series("TEST11", [(datetime(2024, 1, 5, tzinfo=timezone.utc), 10)])
+
+        panel = FiiHistoryPanel.build(
+            {"TEST11": series, "NONE11": FiiHistorySeries.empty("NONE11")}, date(2023, 12, 1), date(2024, 5, 1)
+        )
+
+        prices = panel.values["last_price"]
+        assert np.isnan(prices[0, 0])
+        assert prices[1:4, 0].tolist() == [10, 10, 10]
+        assert np.isnan(prices[4:, 0]).all()
+        assert np.isnan(prices[:, 1]).all()
+
+    def test_build_ignores_observations_outside_the_range(self):
+        series = build_series(
+            "TEST11",
+            [(datetime(2023, 6, 1, tzinfo=timezone.utc), 5), (datetime(2024, 1, 5, tzinfo=timezone.utc), 10)],
+        )
+
+        panel = FiiHistoryPanel.build({"TEST11": series}, date(2024, 1, 1), date(2024, 1, 31))
+
+        assert panel.values["last_price"].tolist() == [[10]]
+
+    def test_monthly_volatility_of_log_changes(self):
+        prices = [10, 11, 10, 11]
+        series = build_series(
+            "TEST11", [(datetime(2024, month, 10, tzinfo=timezone.utc), price) for month, price in enumerate(prices, 1)]
+        )
+        short = build_series("TEST12", [(datetime(2024, 4, 10, tzinfo=timezone.utc), 10)])
+
+        panel = FiiHistoryPanel.build({"TEST11": series, "TEST12": short}, date(2024, 1, 1), date(2024, 4, 30))
+        volatility = panel.monthly_volatility("last_price", min_changes=3)
+
+        assert volatility[0] == pytest.approx(np.std(np.diff(np.log(prices)), ddof=1))
+        assert np.isnan(volatility[1])
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from app.domain.fii_monte_carlo import FiiMonteCarloSimulator
+
+
+class TestFiiMonteCarloSimulator:
+    @pytest.fixture
+    def inputs(self):
+        return dict(
+            quotas=np.array([10.0, 0.0, 5.0]),
+            prices=np.array([100.0, 50.0, 10.0]),
+            dividends=np.array([1.0, 0.5, 0.1]),
+            dividend_volatility=np.array([0.05, 0.05, 0.1]),
+            price_volatility=np.array([0.04, 0.04, 0.08]),
+            months=12,
+            paths=500,
+        )
+
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        monkeypatch.setattr(FiiMonteCarloSimulator, "CHUNK_ELEMENTS", 12 * 2 * 64)
+        yield
+        FiiMonteCarloSimulator.shutdown()
+
+    def test_simulate_is_deterministic_for_a_seed(self, inputs):
+        first = FiiMonteCarloSimulator(seed=7, max_workers=1).simulate(**inputs)
+        second = FiiMonteCarloSimulator(seed=7, max_workers=1).simulate(**inputs)
+        other = FiiMonteCarloSimulator(seed=8, max_workers=1).simulate(**inputs)
+
+        assert np.array_equal(first.income, second.income)
+        assert not np.array_equal(first.income, other.income)
+
+    def test_simulate_does_not_depend_on_worker_count(self, inputs):
+        inline = FiiMonteCarloSimulator(seed=7, max_workers=1).simulate(**inputs)
+        pooled = FiiMonteCarloSimulator(seed=7, max_workers=2).simulate(**inputs)
+
+        assert np.array_equal(inline.income, pooled.income)
+        assert np.array_equal(inline.value, pooled.value)
+
+    def test_simulate_returns_ordered_bands_per_month(self, inputs):
+        bands = FiiMonteCarloSimulator(max_workers=1).simulate(**inputs)
+
+        assert bands.income.shape == (5, 12)
+        assert np.all(np.diff(bands.income, axis=0) >= 0)
+        assert np.all(np.diff(bands.value, axis=0) >= 0)
+
+    def test_simulate_without_volatility_keeps_current_income(self, inputs):
+        inputs.update(dividend_volatility=np.zeros(3), price_volatility=np.zeros(3))
+
+        bands = FiiMonteCarloSimulator(max_workers=1).simulate(**inputs)
+
+        assert np.allclose(bands.income, 10 * 1.0 + 5 * 0.1)
+        assert np.allclose(bands.value, 10 * 100.0 + 5 * 10.0)
+
+    def test_simulate_rejects_out_of_range_horizon(self, inputs):
+        inputs["months"] = FiiMonteCarloSimulator.MAX_MONTHS + 1
+
+        with pytest.raises(ValueError):
+            FiiMonteCarloSimulator().simulate(**inputs)
@@ -0,0 +1,90 @@
+from decimal import Decimal
+
+import pytest
+
+from app.domain.fii_portfolio_optimizer import FiiPortfolioOptimizer
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiPortfolioOptimizer:
+    @pytest.fixture
+    def optimizer(self):
+        return FiiPortfolioOptimizer()
+
+    def _quotas(self, result):
+        return {allocation.ticker: allocation.quotas for allocation in result.allocations}
+
+    def test_beats_greedy_when_leftover_matters(self, optimizer):
+        # greedy by ratio buys one A (R$60) and leaves R$40 unused; two B's use the whole budget
+        fiis = [
+            FiiDomainFactory.build(ticker="A11", segment="a", last_price=Decimal("60"), last_dividend=Decimal("0.66")),
+            FiiDomainFactory.build(ticker="B11", segment="b", last_price=Decimal("50"), last_dividend=Decimal("0.50")),
+        ]
+
+        result = optimizer.optimize(fiis, budget=100)
+
+        assert self._quotas(result) == {"B11": 2}
+        assert result.monthly_dividends == Decimal("1.00")
+        assert result.leftover == Decimal("0")
+        assert result.optimal is True
+
+    def test_respects_per_fii_and_segment_caps(self, optimizer):
+        fiis = [
+            FiiDomainFactory.build(
+                ticker="A11", segment="Logística", last_price=Decimal("10"), last_dividend=Decimal("0.2")
+            ),
+            FiiDomainFactory.build(
+                ticker="B11", segment="logística", last_price=Decimal("10"), last_dividend=Decimal("0.15")
+            ),
+            FiiDomainFactory.build(
+                ticker="C11", segment="shoppings", last_price=Decimal("10"), last_dividend=Decimal("0.1")
+            ),
+        ]
+
+        result = optimizer.optimize(
+            fiis, budget=1000, fii_caps={"A11": 300}, max_per_fii=600, segment_caps={"logística": 500}
+        )
+
+        assert self._quotas(result) == {"A11": 30, "B11": 20, "C11": 50}
+        assert result.total_cost == Decimal("1000")
+
+    def test_fii_caps_match_tickers_regardless_of_case(self, optimizer):
+        fiis = [
+            FiiDomainFactory.build(
+                ticker="a11", segment="logística", last_price=Decimal("10"), last_dividend=Decimal("0.2")
+            ),
+            FiiDomainFactory.build(
+                ticker="b11", segment="shoppings", last_price=Decimal("10"), last_dividend=Decimal("0.1")
+            ),
+        ]
+
+        result = optimizer.optimize(fiis, budget=1000, fii_caps={"A11": 300})
+
+        assert self._quotas(result) == {"a11": 30, "b11": 70}
+
+    def test_ignores_fiis_without_positive_price_or_dividend(self, optimizer):
+        fiis = [
+            FiiDomainFactory.build(ticker="ZERO11", last_price=Decimal("10"), last_dividend=Decimal("0")),
+            FiiDomainFactory.build(ticker="GOOD11", last_price=Decimal("10"), last_dividend=Decimal("0.1")),
+        ]
+
+        result = optimizer.optimize(fiis, budget=25)
+
+        assert self._quotas(result) == {"GOOD11": 2}
+
+    def test_empty_universe(self, optimizer):
+        result = optimizer.optimize([], budget=1000)
+
+        assert result.allocations == []
+        assert result.leftover == Decimal("1000")
+
+    def test_node_limit_returns_best_found(self):
+        fiis = [
+            FiiDomainFactory.build(ticker=f"T{i}11", last_price=Decimal(10 + i), last_dividend=Decimal("0.1"))
+            for i in range(20)
+        ]
+
+        result = FiiPortfolioOptimizer(max_nodes=1).optimize(fiis, budget=1000)
+
+        assert result.optimal is False
+        assert result.total_cost <= Decimal("1000")
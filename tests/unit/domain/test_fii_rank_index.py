@@ -0,0 +1,73 @@
+from decimal import Decimal
+
+import pytest
+
+from app.domain.fii_rank_index import FiiRankIndex
+from app.domain.fii_snapshot import FiiSnapshot
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiRankIndex:
+    @pytest.fixture
+    def snapshot(self):
+        return FiiSnapshot(
+            1,
+            [
+                FiiDomainFactory.build(ticker="PAPE11", segment="Papéis", dy_12=Decimal("12")),
+                FiiDomainFactory.build(ticker="PAPE12", segment="Papéis", dy_12=Decimal("10")),
+                FiiDomainFactory.build(ticker="LOGI11", segment="Logística", dy_12=Decimal("10")),
+                FiiDomainFactory.build(ticker="LOGI12", segment="Logística", dy_12=Decimal("6")),
+            ],
+        )
+
+    def test_rank_and_percentile_in_the_universe(self, snapshot):
+        index = FiiRankIndex(snapshot)
+
+        top = index.rank("PAPE11", "dy_12")
+        tied = index.rank("LOGI11", "dy_12")
+        bottom = index.rank("LOGI12", "dy_12")
+
+        assert (top.rank, top.total, top.percentile) == (1, 4, 87.5)
+        assert (tied.rank, tied.percentile) == (2, 50.0)
+        assert index.rank("PAPE12", "dy_12").rank == 2
+        assert (bottom.rank, bottom.percentile) == (4, 12.5)
+
+    def test_rank_within_segment(self, snapshot):
+        rank = FiiRankIndex(snapshot).rank("LOGI11", "dy_12", within_segment=True)
+
+        assert (rank.rank, rank.total, rank.segment) == (1, 2, "Logística")
+
+    def test_rank_ignores_the_ticker_case(self):
+        snapshot = FiiSnapshot(1, [FiiDomainFactory.build(ticker="hglg11", dy_12=Decimal("9"))])
+
+        rank = FiiRankIndex(snapshot).rank("HGLG11", "dy_12")
+
+        assert (rank.ticker, rank.rank) == ("hglg11", 1)
+
+    def test_unknown_ticker_has_no_rank(self, snapshot):
+        assert FiiRankIndex(snapshot).rank("NONE11", "dy_12") is None
+
+    def test_unknown_field_is_rejected(self, snapshot):
+        with pytest.raises(ValueError):
+            FiiRankIndex(snapshot).rank("PAPE11", "segment")
+
+    def test_top_k_in_both_orders(self, snapshot):
+        index = FiiRankIndex(snapshot)
+
+        highest = index.top("dy_12", 2)
+        lowest = index.top("dy_12", 2, descending=False)
+
+        assert [entry.ticker for entry in highest][0] == "PAPE11"
+        assert [entry.rank for entry in highest] == [1, 2]
+        assert [(entry.ticker, entry.rank) for entry in lowest] == [("LOGI12", 1), ("PAPE12", 2)]
+
+    def test_top_k_in_a_segment_ignores_case(self, snapshot):
+        entries = FiiRankIndex(snapshot).top("dy_12", 5, segment="papéis")
+
+        assert [entry.ticker for entry in entries] == ["PAPE11", "PAPE12"]
+
+    def test_index_is_shared_per_snapshot(self, snapshot):
+        index = FiiRankIndex.for_snapshot(snapshot)
+
+        assert FiiRankIndex.for_snapshot(snapshot) is index
+        assert index.column("dy_12") is index.column("dy_12")
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from app.domain.fii_reinvestment_simulator import FiiReinvestmentSimulator
+
+
+class TestFiiReinvestmentSimulator:
+    @pytest.fixture
+    def simulator(self):
+        return FiiReinvestmentSimulator()
+
+    def test_project_reinvests_dividends_and_contributions(self, simulator):
+        paths = simulator.project(
+            prices=np.array([10.0]),
+            dividends=np.array([1.0]),
+            months=2,
+            initial_values=np.array([100.0]),
+            monthly_contributions=np.array([5.0]),
+        )
+
+        # month 0: 10 quotas; month 1: 5 + 10 = 15 cash -> 1 quota, 5 left; month 2: 5 + 5 + 11 = 21 -> 2 quotas
+        assert paths.quotas[:, 0].tolist() == [10, 11, 13]
+        assert paths.cash[:, 0].tolist() == [0, 5, 1]
+        assert paths.income[:, 0].tolist() == [0, 10, 11]
+        assert paths.contributed[:, 0].tolist() == [100, 105, 110]
+
+    def test_project_is_vectorized_across_fiis(self, simulator):
+        prices = np.array([10.0, 20.0, 50.0])
+        dividends = np.array([0.1, 0.3, 0.4])
+
+        together = simulator.project(prices, dividends, 24, 1000.0, 100.0)
+        alone = simulator.project(prices[1:2], dividends[1:2], 24, 1000.0, 100.0)
+
+        assert together.quotas.shape == (25, 3)
+        np.testing.assert_allclose(together.quotas[:, 1], alone.quotas[:, 0])
+
+    def test_months_to_reach(self, simulator):
+        paths = simulator.project(np.array([10.0, 10.0]), np.array([1.0, 0.0]), 12, 100.0, 0.0)
+
+        assert paths.months_to_reach(np.array([12, 12])).tolist() == [2, -1]
+
+    def test_price_growth_makes_quotas_more_expensive(self, simulator):
+        flat = simulator.project(np.array([10.0]), np.array([0.1]), 120, 0.0, 100.0)
+        growing = simulator.project(np.array([10.0]), np.array([0.1]), 120, 0.0, 100.0, annual_price_growth=0.1)
+
+        assert growing.quotas[-1, 0] < flat.quotas[-1, 0]
+
+    @pytest.mark.parametrize("months", [0, 361])
+    def test_project_rejects_invalid_horizon(self, simulator, months):
+        with pytest.raises(ValueError):
+            simulator.project(np.array([10.0]), np.array([0.1]), months, 0.0, 100.0)
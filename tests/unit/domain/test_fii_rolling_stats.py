@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.domain.fii_rolling_stats import FiiRollingAccumulator, RollingWindow
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestRollingWindow:
+    def test_capacity_must_hold_two_values(self):
+        with pytest.raises(ValueError):
+            RollingWindow(1)
+
+    def test_empty_window_has_no_statistics(self):
+        window = RollingWindow(3)
+
+        assert window.mean() is None
+        assert window.std() is None
+        assert window.slope() is None
+
+    def test_evicts_the_oldest_values(self):
+        window = RollingWindow(3)
+        window.extend([1, 2, 3, 4, 5])
+
+        assert len(window) == 3
+        assert window.values().tolist() == [3, 4, 5]
+        assert window.mean() == pytest.approx(4)
+
+    def test_matches_statistics_recomputed_from_the_window(self):
+        values = np.random.default_rng(7).normal(10, 2, 1000)
+        window = RollingWindow(64)
+
+        for end, value in enumerate(values, start=1):
+            window.push(value)
+            expected = values[max(end - 64, 0) : end]
+            assert window.mean() == pytest.approx(expected.mean())
+            if len(expected) > 1:
+                assert window.std() == pytest.approx(expected.std())
+                assert window.slope() == pytest.approx(np.polyfit(np.arange(len(expected)), expected, 1)[0])
+
+    def test_slope_of_a_line(self):
+        window = RollingWindow(5)
+        window.extend([10, 12, 14, 16, 18, 20, 22])
+
+        assert window.slope() == pytest.approx(2)
+
+
+class TestFiiRollingAccumulator:
+    def test_stats_from_pushed_fiis(self):
+        accumulator = FiiRollingAccumulator()
+        for price, dividend, dy in ((100, 1.0, 10.0), (110, 1.0, 10.5), (120, 1.0, 11.0)):
+            accumulator.push(
+                FiiDomainFactory.build(last_price=Decimal(price), last_dividend=Decimal(dividend), dy_12=Decimal(dy))
+            )
+
+        stats = accumulator.stats()
+
+        assert stats.observations == 3
+        assert stats.price_moving_average == pytest.approx(110)
+        assert stats.dividend_volatility == pytest.approx(0)
+        assert stats.dy_trend == pytest.approx(1.0)
+
+    def test_dividend_volatility_is_relative_to_the_mean(self):
+        accumulator = FiiRollingAccumulator()
+        for dividend in (0.5, 1.5):
+            accumulator.push_values(100, dividend, 10)
+
+        assert accumulator.stats().dividend_volatility == pytest.approx(0.5)
+
+    def test_without_positive_dividends_volatility_is_unknown(self):
+        accumulator = FiiRollingAccumulator()
+        accumulator.push_values(100, 0, 10)
+        accumulator.push_values(100, 0, 10)
+
+        assert accumulator.stats().dividend_volatility is None
+
+    def test_single_observation_has_no_trend(self):
+        accumulator = FiiRollingAccumulator()
+        accumulator.push_values(100, 1, 10)
+
+        stats = accumulator.stats()
+
+        assert stats.price_moving_average == 100
+        assert stats.dy_trend is None
+        assert stats.dividend_volatility is None
@@ -0,0 +1,68 @@
+from decimal import Decimal
+
+import pytest
+
+from app.domain.fii_screen_query import FiiScreenQuery, FiiScreenQueryError
+from app.domain.fii_snapshot import FiiSnapshot
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiScreenQuery:
+    @pytest.fixture
+    def snapshot(self):
+        return FiiSnapshot(
+            1,
+            [
+                FiiDomainFactory.build(
+                    ticker="AAAA11", dy_12=Decimal("9.0"), p_vp=Decimal("0.95"), segment="logística"
+                ),
+                FiiDomainFactory.build(
+                    ticker="BBBB11", dy_12=Decimal("12.0"), p_vp=Decimal("1.05"), segment="shoppings"
+                ),
+                FiiDomainFactory.build(
+                    ticker="CCCC11", dy_12=Decimal("7.0"), p_vp=Decimal("0.80"), segment="logística"
+                ),
+                FiiDomainFactory.build(ticker="DDDD11", dy_12=Decimal("11.0"), p_vp=Decimal("0.90"), segment="híbrido"),
+            ],
+        )
+
+    def _tickers(self, query, snapshot):
+        return [fii.ticker for fii in snapshot.take(FiiScreenQuery.compile(query).select(snapshot))]
+
+    def test_filter_and_order_with_limit(self, snapshot):
+        result = self._tickers("dy_12>=8 and p_vp<1 order by dy_12 desc limit 20", snapshot)
+
+        assert result == ["DDDD11", "AAAA11"]
+
+    def test_top_n_uses_partial_selection_order(self, snapshot):
+        result = self._tickers("order by dy_12 desc limit 2", snapshot)
+
+        assert result == ["BBBB11", "DDDD11"]
+
+    def test_or_not_and_parentheses(self, snapshot):
+        result = self._tickers("not (segment = 'logística') or dy_12 < 8", snapshot)
+
+        assert result == ["BBBB11", "CCCC11", "DDDD11"]
+
+    def test_order_by_text_then_number(self, snapshot):
+        result = self._tickers("order by segment asc, dy_12 desc limit 3", snapshot)
+
+        assert result == ["DDDD11", "AAAA11", "CCCC11"]
+
+    def test_empty_expression_returns_everything(self, snapshot):
+        assert len(self._tickers("", snapshot)) == 4
+
+    def test_compiled_plans_are_cached_by_normalized_expression(self):
+        first = FiiScreenQuery.compile("dy_12>=8   AND p_vp < 1")
+        second = FiiScreenQuery.compile("DY_12 >= 8 and p_vp<1")
+
+        assert first is second
+        assert FiiScreenQuery.normalize("DY_12 >= 8 and p_vp<1") == "dy_12 >= 8 and p_vp < 1"
+
+    @pytest.mark.parametrize(
+        "expression",
+        ["unknown > 1", "dy_12 >= 'high'", "segment > 'x'", "dy_12 >= 8 limit -1", "dy_12 >= 8 and", "(dy_12 > 1"],
+    )
+    def test_invalid_expressions_raise(self, expression):
+        with pytest.raises(FiiScreenQueryError):
+            FiiScreenQuery.compile(expression)
@@ -0,0 +1,99 @@
+import time
+
+from app.domain.fii_search_index import FiiSearchIndex, normalize, trigrams
+from app.domain.fii_snapshot import FiiSnapshot
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiSearchIndex:
+    def _index(self):
+        return FiiSearchIndex(
+            [
+                FiiDomainFactory.build(ticker="HGLG11", segment="Logística"),
+                FiiDomainFactory.build(ticker="HGLG11B", segment="Logística"),
+                FiiDomainFactory.build(ticker="HGRE11", segment="Lajes Corporativas"),
+                FiiDomainFactory.build(ticker="MXRF11", segment="Papéis"),
+            ]
+        )
+
+    def test_normalize_strips_accents_and_case(self):
+        assert normalize(" Logística ") == "logistica"
+        assert normalize("HGLG-11") == "hglg11"
+
+    def test_trigrams_are_padded(self):
+        assert trigrams("ab") == {"  a", " ab", "ab "}
+
+    def test_exact_ticker_ranks_first(self):
+        results = self._index().search("hglg11")
+
+        assert [(result.ticker, result.match) for result in results[:2]] == [
+            ("HGLG11", "exact"),
+            ("HGLG11B", "prefix"),
+        ]
+
+    def test_prefix_prefers_shorter_tickers(self):
+        results = self._index().search("HG")
+
+        assert [result.ticker for result in results] == ["HGLG11", "HGRE11", "HGLG11B"]
+        assert {result.match for result in results} == {"prefix"}
+
+    def test_segment_words_match_by_prefix(self):
+        results = self._index().search("logist")
+
+        assert [(result.ticker, result.match) for result in results] == [("HGLG11", "term"), ("HGLG11B", "term")]
+
+    def test_every_word_must_match(self):
+        results = self._index().search("lajes corp")
+
+        assert [result.ticker for result in results] == ["HGRE11"]
+
+    def test_typos_match_by_trigrams(self):
+        results = self._index().search("MXRG11")
+
+        assert results[0].ticker == "MXRF11"
+        assert results[0].match == "fuzzy"
+
+    def test_limit_and_empty_query(self):
+        index = self._index()
+
+        assert len(index.search("h", limit=1)) == 1
+        assert index.search("  ") == []
+        assert index.search("ZZZZ") == []
+
+    def test_add_replaces_terms_of_the_ticker(self):
+        index = self._index()
+
+        index.add(FiiDomainFactory.build(ticker="MXRF11", segment="Híbrido"))
+
+        assert [result.ticker for result in index.search("hibrido")] == ["MXRF11"]
+        assert index.search("papeis") == []
+        assert len(index) == 4
+
+    def test_remove(self):
+        index = self._index()
+
+        index.remove("HGLG11B")
+        index.remove("UNKNOWN")
+
+        assert [result.ticker for result in index.search("hglg")] == ["HGLG11"]
+
+    def test_built_once_per_snapshot(self):
+        snapshot = FiiSnapshot(1, [FiiDomainFactory.build(ticker="HGLG11")])
+
+        index = FiiSearchIndex.for_snapshot(snapshot)
+
+        assert FiiSearchIndex.for_snapshot(snapshot) is index
+        assert [result.ticker for result in index.search("hglg")] == ["HGLG11"]
+
+    def test_search_is_sub_millisecond_on_a_large_universe(self):
+        index = FiiSearchIndex(
+            FiiDomainFactory.build(ticker=f"{chr(65 + i % 26)}{chr(65 + i // 26 % 26)}{i:04d}", segment="Papéis")
+            for i in range(2000)
+        )
+
+        started = time.perf_counter()
+        for _ in range(100):
+            index.search("ab", limit=10)
+        elapsed = (time.perf_counter() - started) / 100
+
+        assert elapsed < 0.001
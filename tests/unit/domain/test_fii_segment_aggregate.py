@@ -0,0 +1,118 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.domain.fii_segment_aggregate import (
+    FiiQuantileSketch,
+    FiiSegmentAggregate,
+    FiiSegmentAggregates,
+)
+from app.domain.fii_snapshot import FiiSnapshot
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiQuantileSketch:
+    def test_quantiles_stay_within_the_relative_accuracy(self):
+        values = np.random.default_rng(3).lognormal(2, 0.5, 5000)
+        sketch = FiiQuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.05, 0.25, 0.5, 0.75, 0.95):
+            expected = np.quantile(values, q, method="lower")
+            assert abs(sketch.quantile(q) - expected) <= 0.01 * expected
+
+    def test_removed_values_leave_the_quantiles(self):
+        sketch = FiiQuantileSketch()
+        for value in (1, 2, 3, 100, 200):
+            sketch.add(value)
+
+        sketch.remove(100)
+        sketch.remove(200)
+
+        assert len(sketch) == 3
+        assert sketch.quantile(0.5) == pytest.approx(2, rel=0.01)
+        assert sketch.quantile(1) == pytest.approx(3, rel=0.01)
+
+    def test_handles_zero_and_negative_values(self):
+        sketch = FiiQuantileSketch()
+        for value in (-5, 0, 5):
+            sketch.add(value)
+
+        assert sketch.quantile(0) == pytest.approx(-5, rel=0.01)
+        assert sketch.quantile(0.5) == 0
+        assert sketch.quantile(1) == pytest.approx(5, rel=0.01)
+
+    def test_removing_a_missing_value_fails(self):
+        sketch = FiiQuantileSketch()
+
+        with pytest.raises(ValueError):
+            sketch.remove(1)
+        with pytest.raises(ValueError):
+            sketch.remove(0)
+
+    def test_empty_sketch_has_no_quantiles(self):
+        assert FiiQuantileSketch().quantile(0.5) is None
+
+
+class TestFiiSegmentAggregate:
+    def test_summary_after_adds_and_removes(self):
+        aggregate = FiiSegmentAggregate()
+        fiis = [
+            FiiDomainFactory.build(dy_12=Decimal(dy), p_vp=Decimal("0.9"), dialy_liquidity=Decimal(1000))
+            for dy in ("8", "10", "12")
+        ]
+        for fii in fiis:
+            aggregate.add(fii)
+        aggregate.remove(fiis[2])
+
+        summary = aggregate.summary("Papéis")
+
+        assert summary.count == 2
+        assert summary.mean_dy == 9
+        assert summary.median_dy == pytest.approx(8, rel=0.01)
+        assert summary.mean_p_vp == 0.9
+        assert summary.total_liquidity == 2000
+
+    def test_empty_summary(self):
+        summary = FiiSegmentAggregate().summary("Papéis")
+
+        assert summary.count == 0
+        assert summary.mean_dy is None
+        assert summary.median_dy is None
+
+
+class TestFiiSegmentAggregates:
+    @pytest.fixture
+    def fiis(self):
+        return [
+            FiiDomainFactory.build(ticker="PAPE11", segment="Papéis", dy_12=Decimal("12"), dialy_liquidity=Decimal(10)),
+            FiiDomainFactory.build(
+                ticker="PAPE12", segment="papéis ", dy_12=Decimal("10"), dialy_liquidity=Decimal(20)
+            ),
+            FiiDomainFactory.build(
+                ticker="LOGI11", segment="Logística", dy_12=Decimal("8"), dialy_liquidity=Decimal(5)
+            ),
+        ]
+
+    def test_summaries_group_segments_regardless_of_case(self, fiis):
+        summaries = {summary.segment: summary for summary in FiiSegmentAggregates(fiis).summaries}
+
+        assert list(summaries) == ["logística", "papéis"]
+        assert summaries["papéis"].count == 2
+        assert summaries["papéis"].mean_dy == 11
+        assert summaries["papéis"].total_liquidity == 30
+
+    def test_missing_segment_is_grouped(self):
+        aggregates = FiiSegmentAggregates([FiiDomainFactory.build(ticker="TEST11", segment=" ")])
+
+        assert [summary.segment for summary in aggregates.summaries] == [FiiSegmentAggregates.UNKNOWN_SEGMENT]
+
+    def test_built_once_per_snapshot(self, fiis):
+        snapshot = FiiSnapshot(1, fiis)
+
+        assert FiiSegmentAggregates.for_snapshot(snapshot) is FiiSegmentAggregates.for_snapshot(snapshot)
+        assert FiiSegmentAggregates.for_snapshot(FiiSnapshot(2, fiis)) is not FiiSegmentAggregates.for_snapshot(
+            snapshot
+        )
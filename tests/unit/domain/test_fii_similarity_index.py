@@ -0,0 +1,106 @@
+import random
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.domain.fii_similarity_index import FiiSimilarityIndex
+from app.domain.fii_snapshot import FiiSnapshot
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+def _fii(ticker, segment, p_vp="1", dy_12="10"):
+    return FiiDomainFactory.build(
+        ticker=ticker,
+        segment=segment,
+        p_vp=Decimal(p_vp),
+        dy_12=Decimal(dy_12),
+        dialy_liquidity=Decimal(1000),
+        last_12_month_evaluation=Decimal(0),
+        current_month_evaluation=Decimal(0),
+    )
+
+
+class TestFiiSimilarityIndex:
+    @pytest.fixture
+    def snapshot(self):
+        return FiiSnapshot(
+            1,
+            [
+                _fii("LOGI11", "Logística", p_vp="0.9", dy_12="9"),
+                _fii("LOGI12", "Logística", p_vp="1.0", dy_12="8"),
+                _fii("PAPE11", "Papéis", p_vp="0.9", dy_12="9"),
+                _fii("PAPE12", "Papéis", p_vp="1.0", dy_12="12"),
+            ],
+        )
+
+    @pytest.fixture
+    def universe(self):
+        rng = random.Random(7)
+        return FiiSnapshot(
+            1,
+            [
+                FiiDomainFactory.build(
+                    ticker=f"TEST{position:03d}",
+                    segment=rng.choice(["Logística", "Papéis", "Shoppings"]),
+                    p_vp=Decimal(str(round(rng.uniform(0.5, 1.5), 3))),
+                    dy_12=Decimal(str(round(rng.uniform(4, 16), 3))),
+                    dialy_liquidity=Decimal(rng.randint(1_000, 5_000_000)),
+                    last_12_month_evaluation=Decimal(str(round(rng.uniform(-20, 20), 3))),
+                    current_month_evaluation=Decimal(str(round(rng.uniform(-5, 5), 3))),
+                )
+                for position in range(600)
+            ],
+        )
+
+    @staticmethod
+    def _brute_force(index, position, k):
+        distances = ((index.vectors - index.vectors[position]) ** 2).sum(axis=1)
+        distances += np.where(index.segments == index.segments[position], 0.0, index.segment_penalty)
+        distances[position] = np.inf
+        return [index.snapshot.fiis[neighbour].ticker for neighbour in np.argsort(distances, kind="stable")[:k]]
+
+    def test_matches_brute_force(self, universe):
+        index = FiiSimilarityIndex(universe)
+
+        for position in range(0, len(universe), 37):
+            ticker = universe.fiis[position].ticker
+            assert [result.ticker for result in index.similar(ticker, 10)] == self._brute_force(index, position, 10)
+
+    def test_same_segment_only(self, universe):
+        index = FiiSimilarityIndex(universe)
+        fii = universe.fiis[0]
+
+        results = index.similar(fii.ticker, 20, same_segment=True)
+
+        assert len(results) == 20
+        assert {result.segment for result in results} == {fii.segment}
+
+    def test_other_segments_are_further_away(self, snapshot):
+        results = FiiSimilarityIndex(snapshot).similar("LOGI11", 3)
+
+        # PAPE11 has the same features but another segment, so it only gets the segment penalty
+        assert [result.ticker for result in results] == ["PAPE11", "LOGI12", "PAPE12"]
+        assert results[0].distance == pytest.approx(np.sqrt(2))
+
+    def test_results_are_sorted_and_exclude_the_fii(self, universe):
+        results = FiiSimilarityIndex(universe).similar("TEST000", 15)
+
+        assert "TEST000" not in [result.ticker for result in results]
+        assert [result.distance for result in results] == sorted(result.distance for result in results)
+
+    def test_k_larger_than_universe(self, snapshot):
+        assert len(FiiSimilarityIndex(snapshot).similar("PAPE11", 10)) == 3
+
+    def test_unknown_ticker(self, snapshot):
+        assert FiiSimilarityIndex(snapshot).similar("MISSING11", 5) is None
+
+    def test_constant_features_do_not_break_normalization(self):
+        snapshot = FiiSnapshot(1, [_fii(f"TEST1{i}", "Papéis") for i in range(3)])
+
+        results = FiiSimilarityIndex(snapshot).similar("TEST10", 2)
+
+        assert [result.distance for result in results] == [0.0, 0.0]
+
+    def test_for_snapshot_is_memoized(self, snapshot):
+        assert FiiSimilarityIndex.for_snapshot(snapshot) is FiiSimilarityIndex.for_snapshot(snapshot)
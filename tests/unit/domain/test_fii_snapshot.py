@@ -0,0 +1,11 @@
+from app.domain.fii_snapshot import FiiSnapshot
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiSnapshot:
+    def test_lookups_ignore_the_ticker_case(self):
+        snapshot = FiiSnapshot(1, [FiiDomainFactory.build(ticker="hglg11"), FiiDomainFactory.build(ticker="KNRI11")])
+
+        assert snapshot.get("HGLG11").ticker == "hglg11"
+        assert snapshot.position(" knri11 ") == 1
+        assert snapshot.get("MXRF11") is None
@@ -0,0 +1,35 @@
+from datetime import date, datetime, timezone
+
+from app.domain.fii_timeline import FiiCheckpoint, FiiDelta, end_of_day
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiCheckpoint:
+    def test_replay_applies_later_deltas_in_time_order(self):
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        checkpoint = FiiCheckpoint(
+            recorded_at=start,
+            fiis=[FiiDomainFactory.build(ticker="TEST11", last_price=10), FiiDomainFactory.build(ticker="TEST12")],
+        )
+        deltas = [
+            FiiDelta(
+                recorded_at=datetime(2024, 1, 1, 3, tzinfo=timezone.utc),
+                fii=FiiDomainFactory.build(ticker="TEST11", last_price=12),
+            ),
+            FiiDelta(
+                recorded_at=datetime(2024, 1, 1, 2, tzinfo=timezone.utc),
+                fii=FiiDomainFactory.build(ticker="TEST11", last_price=11),
+            ),
+            FiiDelta(recorded_at=start, fii=FiiDomainFactory.build(ticker="TEST11", last_price=99)),
+            FiiDelta(
+                recorded_at=datetime(2024, 1, 1, 4, tzinfo=timezone.utc), fii=FiiDomainFactory.build(ticker="NEW11")
+            ),
+        ]
+
+        fiis = {fii.ticker: fii for fii in checkpoint.replay(deltas)}
+
+        assert fiis["TEST11"].last_price == 12
+        assert set(fiis) == {"TEST11", "TEST12", "NEW11"}
+
+    def test_end_of_day_covers_the_whole_day(self):
+        assert end_of_day(date(2024, 1, 1)) > datetime(2024, 1, 1, 23, 59, 59, tzinfo=timezone.utc)
@@ -1,9 +1,17 @@
+from datetime import date
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
+from app.domain.fii_domain import FiiRollingStats
+from app.domain.fii_snapshot import FiiSnapshot
 from app.domain.fii_validator import FiiValidator, FiiValidatorFactory
+from app.domain.rules.dividend_stability_rule import DividendStabilityRule
+from app.domain.rules.dy_trend_rule import DyTrendRule
 from app.domain.rules.fii_rule import FiiRule
+from app.domain.rules.old_than_rule import OldThanRule
 from tests.factories.fii_domain_factory import FiiDomainFactory
 
 
@@ -73,6 +81,19 @@ class TestFiiValidator:
 
         assert result is True
 
+    def test_rejection_reasons_lists_every_failing_rule(self, mock_rule_passes, mock_rule_fails):
+        validator = FiiValidator(mock_rule_fails, mock_rule_passes, mock_rule_fails)
+        fii = FiiDomainFactory.build()
+
+        result = validator.rejection_reasons(fii)
+
+        assert result == ["Mock rule fails", "Mock rule fails"]
+
+    def test_rejection_reasons_empty_when_all_rules_pass(self, validator_with_passing_rules):
+        fii = FiiDomainFactory.build()
+
+        assert validator_with_passing_rules.rejection_reasons(fii) == []
+
     def test_validator_initialization_with_multiple_rules(self, mock_rule_passes, mock_rule_fails):
         validator = FiiValidator(mock_rule_passes, mock_rule_fails)
 
@@ -103,3 +124,85 @@ class TestFiiValidatorFactory:
         validator2 = FiiValidatorFactory.build()
 
         assert len(validator1.rules) == len(validator2.rules)
+
+    def test_build_profile_uses_named_rules(self):
+        validator = FiiValidatorFactory.build_profile("dividend")
+
+        assert validator.rules == FiiValidatorFactory.PROFILES["dividend"]
+
+    def test_build_profile_rejects_unknown_names(self):
+        with pytest.raises(ValueError):
+            FiiValidatorFactory.build_profile("unknown")
+
+
+class TestFiiValidatorMask:
+    @staticmethod
+    def _columns(fiis):
+        columns = {
+            field: np.array([float(getattr(fii, field)) for fii in fiis]) for field in FiiSnapshot.NUMERIC_FIELDS
+        }
+        columns["duration"] = np.array([fii.duration for fii in fiis], dtype=object)
+        columns["start_date"] = np.array(
+            [np.datetime64(fii.start_date or "NaT", "D") for fii in fiis], dtype="datetime64[D]"
+        )
+        return columns
+
+    def test_mask_matches_validate_for_every_rule(self):
+        fiis = [FiiDomainFactory.build() for _ in range(50)]
+        fiis += [
+            FiiDomainFactory.build(
+                p_vp=Decimal("0.95"), duration="indeterminado", dy_12=Decimal("9"), dialy_liquidity=Decimal("900000")
+            ),
+            FiiDomainFactory.build(current_month_evaluation=Decimal("-20"), last_dividend=Decimal("0")),
+        ]
+        columns = self._columns(fiis)
+        as_of = np.datetime64(date.today(), "D")
+
+        for rule in FiiValidatorFactory.PROFILES[FiiValidatorFactory.DEFAULT_PROFILE]:
+            assert rule.mask(columns, as_of).tolist() == [rule.validate(fii) for fii in fiis], rule.__name__
+
+    def test_old_than_rule_mask_uses_the_evaluation_date(self):
+        fiis = [FiiDomainFactory.build(start_date=date(2020, 6, 1)), FiiDomainFactory.build(start_date=None)]
+        columns = self._columns(fiis)
+        as_of = np.array([[np.datetime64("2021-01-01")], [np.datetime64("2021-12-31")]])
+
+        mask = OldThanRule.mask(columns, as_of)
+
+        assert mask.tolist() == [[False, True], [True, True]]
+
+    def test_validator_mask_combines_rules_over_2d_columns(self):
+        validator = FiiValidatorFactory.build_profile("dividend")
+        columns = {
+            "last_dividend": np.array([[1.0, 0.0], [1.0, 1.0]]),
+            "dy_12": np.array([[8.0, 8.0], [5.0, 8.0]]),
+            "dialy_liquidity": np.array([[1e6, 1e6], [1e6, np.nan]]),
+        }
+
+        assert validator.mask(columns, None).tolist() == [[True, False], [False, True]]
+
+    def test_rolling_stats_rules_match_validate(self):
+        stats = [
+            None,
+            FiiRollingStats(observations=1),
+            FiiRollingStats(observations=90, dividend_volatility=0.1, dy_trend=0.5),
+            FiiRollingStats(observations=90, dividend_volatility=0.4, dy_trend=-2.0),
+        ]
+        fiis = [FiiDomainFactory.build(rolling_stats=item) for item in stats]
+        columns = {
+            field: np.array(
+                [np.nan if item is None or getattr(item, field) is None else getattr(item, field) for item in stats]
+            )
+            for field in ("dividend_volatility", "dy_trend")
+        }
+
+        for rule in (DividendStabilityRule, DyTrendRule):
+            assert rule.mask(columns, None).tolist() == [rule.validate(fii) for fii in fiis], rule.__name__
+            assert rule.mask(columns, None).tolist() == [True, True, True, False], rule.__name__
+
+    def test_rules_without_a_vectorized_form_are_rejected(self):
+        with pytest.raises(TypeError, match="must implement mask"):
+
+            class ScalarOnlyRule(FiiRule):
+                @classmethod
+                def validate(cls, fii):
+                    return True
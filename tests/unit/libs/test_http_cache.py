@@ -0,0 +1,153 @@
+import asyncio
+import gzip
+
+import pytest
+
+from app.libs import http_cache
+from app.libs.http_cache import (
+    API_CACHE_CONTROL,
+    EncodedBody,
+    EncodedBodyCache,
+    accepted_encodings,
+    cache_headers,
+    coded_etag,
+    is_not_modified,
+    not_modified,
+    strong_etag,
+)
+
+
+class TestHttpCache:
+    ETAG = strong_etag("fiis-abc.1.0")
+
+    @pytest.mark.parametrize(
+        "if_none_match,expected",
+        [
+            (None, False),
+            ("", False),
+            ('"fiis-abc.1.0"', True),
+            ('W/"fiis-abc.1.0"', True),
+            ('"other", "fiis-abc.1.0"', True),
+            ("*", True),
+            ('"fiis-abc.2.0"', False),
+            ('"fiis-abc.1.0-gzip"', True),
+            ('W/"fiis-abc.1.0-br"', True),
+            ('"fiis-abc.1.0-deflate"', False),
+            ('"fiis-abc.2.0-gzip"', False),
+        ],
+    )
+    def test_is_not_modified(self, if_none_match, expected):
+        assert is_not_modified(if_none_match, self.ETAG) is expected
+
+    @pytest.mark.parametrize("coding,expected", [(None, '"fiis-abc.1.0"'), ("gzip", '"fiis-abc.1.0-gzip"')])
+    def test_coded_etag(self, coding, expected):
+        assert coded_etag(self.ETAG, coding) == expected
+
+    def test_not_modified_response(self):
+        response = not_modified(self.ETAG, API_CACHE_CONTROL)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == self.ETAG
+        assert response.headers["cache-control"] == API_CACHE_CONTROL
+
+
+class TestEncodedBody:
+    BODY = b'[{"ticker":"TEST11"}' + b',{"ticker":"TEST11"}' * 100 + b"]"
+
+    @pytest.mark.parametrize(
+        "accept_encoding,expected",
+        [
+            (None, {}),
+            ("gzip, deflate", {"gzip": 1.0, "deflate": 1.0}),
+            ("br;q=0.5, GZIP;q=0", {"br": 0.5, "gzip": 0.0}),
+            ("*;q=bad", {"*": 0.0}),
+        ],
+    )
+    def test_accepted_encodings(self, accept_encoding, expected):
+        assert accepted_encodings(accept_encoding) == expected
+
+    def test_gzip_is_built_once_and_decompresses_to_the_body(self):
+        body = EncodedBody(self.BODY)
+
+        assert body.negotiate("gzip, deflate") == "gzip"
+        compressed = body.encoded("gzip")
+        assert gzip.decompress(compressed) == self.BODY
+        assert body.encoded("gzip") is compressed
+
+    @pytest.mark.parametrize("accept_encoding", [None, "identity", "gzip;q=0", "deflate"])
+    def test_identity_when_no_supported_coding_is_accepted(self, accept_encoding):
+        assert EncodedBody(self.BODY).negotiate(accept_encoding) is None
+
+    def test_small_bodies_are_not_compressed(self):
+        assert EncodedBody(b"[]").negotiate("gzip") is None
+
+    def test_brotli_is_preferred_only_when_installed(self, monkeypatch):
+        monkeypatch.setattr(http_cache, "brotli", None)
+
+        assert EncodedBody(self.BODY).negotiate("br, gzip") == "gzip"
+        assert EncodedBody(self.BODY).negotiate("br") is None
+
+    def test_response_carries_coding_and_vary(self):
+        response = EncodedBody(self.BODY).response("gzip", cache_headers(strong_etag("x"), API_CACHE_CONTROL))
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == '"x-gzip"'
+        assert response.media_type == "application/json"
+        assert gzip.decompress(response.body) == self.BODY
+
+    def test_each_coding_has_its_own_etag(self, monkeypatch):
+        monkeypatch.setattr(http_cache, "brotli", None)
+        body = EncodedBody(self.BODY)
+        headers = cache_headers(strong_etag("x"), API_CACHE_CONTROL)
+
+        etags = [body.response(accept_encoding, headers).headers["etag"] for accept_encoding in (None, "gzip")]
+
+        assert etags == ['"x"', '"x-gzip"']
+        assert headers["ETag"] == '"x"'
+        assert all(is_not_modified(etag, strong_etag("x")) for etag in etags)
+
+    def test_response_merges_the_body_headers(self):
+        response = EncodedBody(b"[]", headers={"X-Next-Cursor": "abc"}).response(None, {"ETag": '"x"'})
+
+        assert response.headers["x-next-cursor"] == "abc"
+        assert response.headers["etag"] == '"x"'
+        assert "content-encoding" not in response.headers
+
+
+class TestEncodedBodyCache:
+    @pytest.mark.asyncio
+    async def test_encodes_once_per_tag_and_evicts_the_least_recent(self):
+        calls = []
+
+        async def encode():
+            calls.append(1)
+            return EncodedBody(b"[]")
+
+        cache = EncodedBodyCache(max_entries=2)
+        first = await cache.get_or_encode("a", encode)
+        assert await cache.get_or_encode("a", encode) is first
+        await cache.get_or_encode("b", encode)
+        await cache.get_or_encode("a", encode)
+        await cache.get_or_encode("c", encode)
+
+        assert len(calls) == 3
+        assert await cache.get_or_encode("a", encode) is first
+        await cache.get_or_encode("b", encode)
+        assert len(calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_encode_once(self):
+        calls = []
+
+        async def encode():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return EncodedBody(b"[]")
+
+        cache = EncodedBodyCache()
+        bodies = await asyncio.gather(*(cache.get_or_encode("a", encode) for _ in range(3)))
+
+        assert len(calls) == 1
+        assert bodies[0] is bodies[1] is bodies[2]
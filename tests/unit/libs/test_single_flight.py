@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from app.libs.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight("test")
+        started = []
+
+        async def call():
+            started.append(1)
+            await asyncio.sleep(0.01)
+            return object()
+
+        results = await asyncio.gather(*(flight.do("key", call) for _ in range(5)))
+
+        assert len(started) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.stats().model_dump() == {
+            "name": "test",
+            "calls": 5,
+            "executions": 1,
+            "coalesced": 4,
+            "in_flight": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_different_keys_and_later_calls_execute_again(self):
+        flight = SingleFlight("test")
+
+        async def call():
+            await asyncio.sleep(0)
+            return 1
+
+        await asyncio.gather(flight.do("a", call), flight.do("b", call))
+        await flight.do("a", call)
+
+        assert flight.stats().executions == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        flight = SingleFlight("test")
+
+        async def call():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(flight.do("key", call), flight.do("key", call), return_exceptions=True)
+
+        assert [str(result) for result in results] == ["boom", "boom"]
+        assert flight.stats().in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_the_others(self):
+        flight = SingleFlight("test")
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("key", call))
+        second = asyncio.ensure_future(flight.do("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+
+    def test_all_stats_lists_named_flights(self):
+        flight = SingleFlight("test_listed")
+
+        assert flight.stats() in SingleFlight.all_stats()
@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.domain.fii_alert import FiiAlertRule
+from app.repositories.fii_alert_engine import (
+    FiiAlertEngine,
+    FiiAlertEngineFactory,
+    fii_alert_engine,
+)
+from app.repositories.fii_event_stream import FiiEventStream
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_alert_repository import InMemoryFiiAlertRepository
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiAlertEngine:
+    @pytest.fixture
+    def repository(self):
+        return InMemoryFiiRepository()
+
+    @pytest.fixture
+    def alert_repository(self):
+        return InMemoryFiiAlertRepository()
+
+    @pytest.fixture
+    def engine(self, repository, alert_repository):
+        engine = FiiAlertEngine(
+            alert_repository, fii_repository=repository, clock=lambda: datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+        engine.start()
+        yield engine
+        engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_stored_rules_fire_on_writes(self, engine, repository, alert_repository):
+        await alert_repository.add_rule(FiiAlertRule(id="high", field="dy_12", operator=">", threshold=10))
+        fii = FiiDomainFactory.build(ticker="TEST11", dy_12=Decimal("9"))
+        await repository.add(fii)
+
+        await repository.add(fii.model_copy(update={"dy_12": Decimal("11")}))
+
+        assert [(alert.rule_id, alert.value, alert.previous_value) for alert in alert_repository.fired] == [
+            ("high", 11.0, 9.0)
+        ]
+        assert alert_repository.fired[0].id == "2024-01-01T00:00:00.000000Z#TEST11#high"
+
+    @pytest.mark.asyncio
+    async def test_registered_rules_are_stored_and_indexed(self, engine, repository, alert_repository):
+        await engine.register(FiiAlertRule(id="cheap", field="p_vp", operator="<", threshold=0.9))
+
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", p_vp=Decimal("0.8")))
+
+        assert "cheap" in alert_repository.rule_items
+        assert [alert.rule_id for alert in alert_repository.fired] == ["cheap"]
+
+    @pytest.mark.asyncio
+    async def test_unregistered_rules_stop_firing(self, engine, repository, alert_repository):
+        await engine.register(FiiAlertRule(id="cheap", field="p_vp", operator="<", threshold=0.9))
+
+        assert await engine.unregister("cheap")
+        assert not await engine.unregister("cheap")
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", p_vp=Decimal("0.8")))
+
+        assert alert_repository.fired == []
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_fired_alerts(self, engine, repository):
+        await engine.register(FiiAlertRule(id="cheap", field="p_vp", operator="<", threshold=0.9))
+        queue = engine.subscribe()
+
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", p_vp=Decimal("0.8")))
+        engine.unsubscribe(queue)
+        await repository.add(FiiDomainFactory.build(ticker="TEST12", p_vp=Decimal("0.8")))
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait().ticker == "TEST11"
+
+    @pytest.mark.asyncio
+    async def test_lagging_subscribers_are_closed(self, engine, repository, monkeypatch):
+        monkeypatch.setattr(FiiEventStream, "SUBSCRIBER_QUEUE_SIZE", 1)
+        await engine.register(FiiAlertRule(id="cheap", field="p_vp", operator="<", threshold=0.9))
+        queue = engine.subscribe()
+
+        for ticker in ("TEST11", "TEST12", "TEST13"):
+            await repository.add(FiiDomainFactory.build(ticker=ticker, p_vp=Decimal("0.8")))
+
+        assert queue.get_nowait().ticker == "TEST11"
+        assert queue.get_nowait() is FiiEventStream.CLOSED
+        assert queue.empty() and engine.subscriber_count == 0
+
+    def test_factory_returns_shared_engine_by_default(self):
+        assert FiiAlertEngineFactory.create() is fii_alert_engine
@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.repositories.fii_change_recorder import FiiChangeRecorder
+from app.repositories.fii_event_stream import FiiEventStream
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_change_repository import InMemoryFiiChangeRepository
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiChangeRecorder:
+    @pytest.fixture
+    def repository(self):
+        return InMemoryFiiRepository()
+
+    @pytest.fixture
+    def change_repository(self):
+        return InMemoryFiiChangeRepository()
+
+    @pytest.fixture
+    def event_stream(self):
+        return FiiEventStream()
+
+    @pytest.fixture
+    def recorder(self, repository, change_repository, event_stream):
+        recorder = FiiChangeRecorder(
+            change_repository,
+            fii_repository=repository,
+            clock=lambda: datetime(2024, 1, 1, tzinfo=timezone.utc),
+            fii_event_stream=event_stream,
+        )
+        recorder.start()
+        yield recorder
+        recorder.stop()
+
+    @pytest.mark.asyncio
+    async def test_changed_writes_are_published_in_order(self, recorder, repository, change_repository):
+        fii = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("10.00"))
+        await repository.add(fii)
+        await repository.add(fii.model_copy())
+        await repository.add(fii.model_copy(update={"last_price": Decimal("11.00")}))
+
+        assert [(change.version, change.kind) for change in change_repository.changes] == [
+            (1, "added"),
+            (2, "updated"),
+        ]
+        assert [field.field for field in change_repository.changes[1].fields] == ["last_price"]
+
+    @pytest.mark.asyncio
+    async def test_writes_to_other_repositories_are_ignored(self, recorder, change_repository):
+        await InMemoryFiiRepository().add(FiiDomainFactory.build(ticker="TEST11"))
+
+        assert change_repository.changes == []
+
+    @pytest.mark.asyncio
+    async def test_stored_changes_are_pushed_with_their_version(self, recorder, repository, event_stream):
+        queue = event_stream.subscribe()
+        fii = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("10.00"))
+
+        await repository.add(fii)
+        await repository.add(fii.model_copy(update={"last_price": Decimal("11.00")}))
+
+        first, second = queue.get_nowait(), queue.get_nowait()
+        assert (first.version, first.kind) == (1, "added")
+        assert (second.version, second.values) == (2, {"last_price": "11.00"})
+        assert queue.empty()
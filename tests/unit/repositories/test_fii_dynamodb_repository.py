@@ -0,0 +1,84 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.repositories.fii_dynamodb_repository import FiiDynamoDBRepository
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiDynamoDBRepository:
+    @pytest.mark.asyncio
+    async def test_concurrent_lists_share_one_scan(self, monkeypatch):
+        fiis = [FiiDomainFactory.build(ticker="TEST11")]
+        scans = []
+
+        async def scan(self):
+            scans.append(self)
+            await asyncio.sleep(0.01)
+            return fiis
+
+        monkeypatch.setattr(FiiDynamoDBRepository, "_scan", scan)
+        repositories = [FiiDynamoDBRepository(table_name="coalescing_test") for _ in range(3)]
+
+        results = await asyncio.gather(*(repository.list() for repository in repositories))
+
+        assert len(scans) == 1
+        assert all(result == fiis for result in results)
+        assert results[0] is not results[1]
+
+    @pytest.mark.asyncio
+    async def test_gets_coalesce_per_ticker(self, monkeypatch):
+        reads = []
+
+        async def get_item(self, ticker):
+            reads.append(ticker)
+            await asyncio.sleep(0.01)
+            return None
+
+        monkeypatch.setattr(FiiDynamoDBRepository, "_get_item", get_item)
+        repository = FiiDynamoDBRepository(table_name="coalescing_test")
+
+        await asyncio.gather(repository.get("TEST11"), repository.get("TEST11"), repository.get("TEST12"))
+
+        assert sorted(reads) == ["TEST11", "TEST12"]
+
+    @pytest.mark.asyncio
+    async def test_get_many_batches_keys_and_retries_unprocessed_ones(self, monkeypatch):
+        monkeypatch.setattr(FiiDynamoDBRepository, "BATCH_SIZE", 2)
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+        repository = FiiDynamoDBRepository(table_name="batch_test")
+        repository._ensure_table_exists = AsyncMock()
+        item = {"ticker": "TEST11", "segment": "Papéis", "duration": "Indeterminado"}
+        item.update({field: "1" for field in ("p_vp", "last_12_month_evaluation", "current_month_evaluation")})
+        item.update({field: "1" for field in ("last_price", "last_dividend", "dy_12")})
+        dynamodb = MagicMock()
+        dynamodb.batch_get_item = AsyncMock(
+            side_effect=[
+                {
+                    "Responses": {"batch_test": [item]},
+                    "UnprocessedKeys": {"batch_test": {"Keys": [{"ticker": "TEST12"}]}},
+                },
+                {"Responses": {"batch_test": []}},
+                {"Responses": {"batch_test": []}},
+            ]
+        )
+
+        @asynccontextmanager
+        async def resource(*args, **kwargs):
+            yield dynamodb
+
+        repository._session = MagicMock(resource=resource)
+
+        fiis = await repository.get_many(["TEST11", "TEST12", "TEST13"])
+
+        assert list(fiis) == ["TEST11"]
+        requested = [
+            call.kwargs["RequestItems"]["batch_test"]["Keys"] for call in dynamodb.batch_get_item.call_args_list
+        ]
+        assert requested == [
+            [{"ticker": "TEST11"}, {"ticker": "TEST12"}],
+            [{"ticker": "TEST12"}],
+            [{"ticker": "TEST13"}],
+        ]
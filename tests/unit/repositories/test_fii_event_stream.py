@@ -0,0 +1,46 @@
+from app.domain.fii_scrape_progress import FiiScrapeProgress
+from app.repositories.fii_event_stream import (
+    FiiEventStream,
+    FiiEventStreamFactory,
+    fii_event_stream,
+)
+
+
+class TestFiiEventStream:
+    def test_events_reach_every_subscriber(self):
+        stream = FiiEventStream()
+        first, second = stream.subscribe(), stream.subscribe()
+        event = FiiScrapeProgress(run_id="run", state="started", total=2)
+
+        stream.publish(event)
+
+        assert first.get_nowait() is event
+        assert second.get_nowait() is event
+
+    def test_unsubscribed_queues_get_nothing(self):
+        stream = FiiEventStream()
+        queue = stream.subscribe()
+        stream.unsubscribe(queue)
+
+        stream.publish(FiiScrapeProgress(run_id="run", state="started", total=1))
+
+        assert queue.empty()
+        assert stream.subscriber_count == 0
+
+    def test_slow_subscribers_are_closed(self):
+        stream = FiiEventStream()
+        stream.SUBSCRIBER_QUEUE_SIZE = 2
+        slow, other = stream.subscribe(), stream.subscribe()
+
+        for done in range(3):
+            stream.publish(FiiScrapeProgress(run_id="run", state="running", total=3, done=done))
+            other.get_nowait()
+        stream.publish(FiiScrapeProgress(run_id="run", state="running", total=3, done=3))
+
+        events = [slow.get_nowait() for _ in range(slow.qsize())]
+        assert [event.done for event in events[:-1]] == [0, 1]
+        assert events[-1] is FiiEventStream.CLOSED
+        assert stream.subscriber_count == 1 and other.get_nowait().done == 3
+
+    def test_factory_returns_shared_stream(self):
+        assert FiiEventStreamFactory.create() is fii_event_stream
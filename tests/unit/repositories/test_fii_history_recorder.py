@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.repositories.fii_history_recorder import FiiHistoryRecorder
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_history_repository import InMemoryFiiHistoryRepository
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiHistoryRecorder:
+    @pytest.fixture
+    def repository(self):
+        return InMemoryFiiRepository()
+
+    @pytest.fixture
+    def history_repository(self):
+        return InMemoryFiiHistoryRepository()
+
+    @pytest.fixture
+    def recorder(self, repository, history_repository):
+        moments = iter(datetime(2024, month, 1, tzinfo=timezone.utc) for month in range(1, 13))
+        recorder = FiiHistoryRecorder(history_repository, fii_repository=repository, clock=lambda: next(moments))
+        recorder.start()
+        yield recorder
+        recorder.stop()
+
+    @pytest.mark.asyncio
+    async def test_every_write_is_appended(self, recorder, repository, history_repository):
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", last_price=10))
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", last_price=11))
+
+        series = await history_repository.range("TEST11")
+
+        assert series.columns["last_price"].tolist() == [10, 11]
+        assert sorted(history_repository.buckets["test11"]) == ["2024-01", "2024-02"]
+
+    @pytest.mark.asyncio
+    async def test_writes_to_other_repositories_are_ignored(self, recorder, history_repository):
+        await InMemoryFiiRepository().add(FiiDomainFactory.build(ticker="TEST11"))
+
+        assert history_repository.buckets == {}
+
+    @pytest.mark.asyncio
+    async def test_stop_detaches_the_recorder(self, recorder, repository, history_repository):
+        recorder.stop()
+
+        await repository.add(FiiDomainFactory.build(ticker="TEST11"))
+
+        assert history_repository.buckets == {}
@@ -0,0 +1,14 @@
+import pytest
+
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiRepository:
+    @pytest.mark.asyncio
+    async def test_get_many_defaults_to_concurrent_gets(self):
+        repository = InMemoryFiiRepository([FiiDomainFactory.build(ticker="TEST11")])
+
+        fiis = await repository.get_many(["TEST11", "MISS11", "TEST11"])
+
+        assert list(fiis) == ["TEST11"]
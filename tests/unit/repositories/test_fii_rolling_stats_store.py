@@ -0,0 +1,128 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.repositories.fii_rolling_stats_store import (
+    FiiRollingStatsStore,
+    FiiRollingStatsStoreFactory,
+    fii_rolling_stats_store,
+)
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_history_repository import InMemoryFiiHistoryRepository
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiRollingStatsStore:
+    @pytest.fixture
+    def repository(self):
+        return InMemoryFiiRepository()
+
+    @pytest.fixture
+    def history_repository(self):
+        return InMemoryFiiHistoryRepository()
+
+    @pytest.fixture
+    def now(self):
+        return datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+    @pytest.fixture
+    def store(self, repository, history_repository, now):
+        store = FiiRollingStatsStore(repository, history_repository, clock=lambda: now)
+        store.start()
+        yield store
+        store.stop()
+
+    @pytest.mark.asyncio
+    async def test_writes_update_the_windows_after_warm_up(self, store, repository):
+        await store.warm_up()
+
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", last_price=Decimal(10)))
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", last_price=Decimal(20)))
+
+        stats = store.get("test11")
+        assert stats.observations == 2
+        assert stats.price_moving_average == 15
+
+    @pytest.mark.asyncio
+    async def test_lowercase_tickers_are_found_in_any_case(self, store, repository, history_repository):
+        await history_repository.append(
+            FiiDomainFactory.build(ticker="hglg11", last_price=Decimal(10)), datetime(2024, 3, 1, tzinfo=timezone.utc)
+        )
+        store.load(await history_repository.range_many(["hglg11"]), datetime(2024, 5, 31, tzinfo=timezone.utc))
+        await repository.add(FiiDomainFactory.build(ticker="hglg11", last_price=Decimal(20)))
+        await repository.add(FiiDomainFactory.build(ticker="knri11", last_price=Decimal(5)))
+
+        assert store.get("hglg11").price_moving_average == 15
+        assert store.get("HGLG11").observations == 2
+        assert store.enrich([FiiDomainFactory.build(ticker="knri11")])[0].rolling_stats.observations == 1
+
+    @pytest.mark.asyncio
+    async def test_version_moves_on_every_applied_write(self, store, repository):
+        fii = FiiDomainFactory.build(ticker="TEST11")
+        await repository.add(fii)
+        assert store.version == 0
+
+        await store.warm_up()
+        warmed = store.version
+        await repository.add(fii.model_copy())
+
+        assert store.version == warmed + 1
+
+    @pytest.mark.asyncio
+    async def test_warm_up_seeds_from_history(self, store, repository, history_repository):
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", last_price=Decimal(30)))
+        for month, price in ((3, 10), (4, 20)):
+            await history_repository.append(
+                FiiDomainFactory.build(ticker="TEST11", last_price=Decimal(price)),
+                datetime(2024, month, 1, tzinfo=timezone.utc),
+            )
+
+        await store.warm_up()
+
+        stats = store.get("TEST11")
+        # the write before the warm up is already part of the history it read
+        assert stats.observations == 2
+        assert stats.price_moving_average == 15
+
+    @pytest.mark.asyncio
+    async def test_writes_during_warm_up_are_applied_afterwards(self, store, repository, now):
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", last_price=Decimal(10)))
+
+        store.load({}, datetime(2024, 5, 31, tzinfo=timezone.utc))
+
+        assert store.is_ready
+        assert store.get("TEST11").price_moving_average == 10
+
+    @pytest.mark.asyncio
+    async def test_warm_up_survives_history_errors(self, store, history_repository):
+        history_repository.range_many = AsyncMock(side_effect=RuntimeError("unavailable"))
+
+        await store.warm_up()
+
+        assert store.is_ready
+        assert store.get("TEST11") is None
+
+    @pytest.mark.asyncio
+    async def test_enrich_attaches_stats_to_known_tickers(self, store, repository):
+        await store.warm_up()
+        known = FiiDomainFactory.build(ticker="TEST11")
+        await repository.add(known)
+        unknown = FiiDomainFactory.build(ticker="TEST12")
+
+        enriched = store.enrich([known, unknown])
+
+        assert enriched[0].rolling_stats.observations == 1
+        assert enriched[1] is unknown
+
+    @pytest.mark.asyncio
+    async def test_writes_to_other_repositories_are_ignored(self, store):
+        await store.warm_up()
+
+        await InMemoryFiiRepository().add(FiiDomainFactory.build(ticker="TEST11"))
+
+        assert store.get("TEST11") is None
+
+    def test_factory_returns_shared_store_by_default(self):
+        assert FiiRollingStatsStoreFactory.create() is fii_rolling_stats_store
@@ -0,0 +1,174 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.domain.fii_validator import FiiValidatorFactory
+from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_screening_view import (
+    FiiScreeningView,
+    FiiScreeningViewFactory,
+    fii_screening_view,
+)
+from app.repositories.fii_snapshot_cache import FiiSnapshotCache
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiScreeningView:
+    @pytest.fixture
+    def mock_validator_factory(self):
+        validator_factory = MagicMock(spec=FiiValidatorFactory)
+        validator = MagicMock()
+        validator.validate.side_effect = lambda fii: fii.dy_12 >= Decimal("6.0")
+        validator.rejection_reasons.return_value = ["DY too low"]
+        validator_factory.build.return_value = validator
+        return validator_factory
+
+    @pytest.fixture
+    def good_fii(self):
+        return FiiDomainFactory.build(
+            ticker="GOOD11", dy_12=Decimal("8.0"), last_price=Decimal("100.0"), last_dividend=Decimal("1.0")
+        )
+
+    @pytest.fixture
+    def bad_fii(self):
+        return FiiDomainFactory.build(
+            ticker="BAD11", dy_12=Decimal("3.0"), last_price=Decimal("100.0"), last_dividend=Decimal("1.0")
+        )
+
+    @pytest.mark.asyncio
+    async def test_passing_loads_once_from_repository(self, mock_validator_factory, good_fii, bad_fii):
+        repository = MagicMock(spec=FiiRepository)
+        repository.list = AsyncMock(return_value=[good_fii, bad_fii])
+        view = FiiScreeningView(
+            fii_snapshot_cache=FiiSnapshotCache(fii_repository=repository), fii_validator_factory=mock_validator_factory
+        )
+
+        first = await view.passing()
+        second = await view.passing()
+
+        assert [result.ticker for result in first] == ["GOOD11"]
+        assert [result.ticker for result in second] == ["GOOD11"]
+        repository.list.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_results_keep_rejection_reasons_and_magic_number(self, mock_validator_factory, good_fii, bad_fii):
+        repository = InMemoryFiiRepository([good_fii, bad_fii])
+        view = FiiScreeningView(
+            fii_snapshot_cache=FiiSnapshotCache(fii_repository=repository), fii_validator_factory=mock_validator_factory
+        )
+
+        good = await view.get("GOOD11")
+        bad = await view.get("BAD11")
+
+        assert good.passed is True
+        assert good.rejection_reasons == []
+        assert good.magic_number == 100
+        assert bad.passed is False
+        assert bad.rejection_reasons == ["DY too low"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_reads_load_once(self, mock_validator_factory, good_fii, bad_fii):
+        repository = MagicMock(spec=FiiRepository)
+        repository.list = AsyncMock(return_value=[good_fii, bad_fii])
+        view = FiiScreeningView(
+            fii_snapshot_cache=FiiSnapshotCache(fii_repository=repository), fii_validator_factory=mock_validator_factory
+        )
+
+        results = await asyncio.gather(view.passing(), view.results(), view.get("GOOD11"))
+
+        assert [result.ticker for result in results[0]] == ["GOOD11"]
+        assert len(results[1]) == 2
+        assert results[2].passed is True
+        repository.list.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_writes_during_first_load_are_kept(self, mock_validator_factory, good_fii, bad_fii):
+        repository = InMemoryFiiRepository([good_fii])
+        listed = asyncio.Event()
+        release = asyncio.Event()
+        list_fiis = repository.list
+
+        async def slow_list():
+            fiis = await list_fiis()
+            listed.set()
+            await release.wait()
+            return fiis
+
+        repository.list = slow_list
+        view = FiiScreeningView(
+            fii_snapshot_cache=FiiSnapshotCache(fii_repository=repository), fii_validator_factory=mock_validator_factory
+        )
+        reading = asyncio.create_task(view.passing())
+        await listed.wait()
+
+        await repository.add(bad_fii.model_copy(update={"dy_12": Decimal("9.0")}))
+        release.set()
+
+        assert sorted(result.ticker for result in await reading) == ["BAD11", "GOOD11"]
+
+    @pytest.mark.asyncio
+    async def test_repository_write_updates_view_incrementally(self, mock_validator_factory, good_fii, bad_fii):
+        repository = InMemoryFiiRepository([good_fii, bad_fii])
+        view = FiiScreeningView(
+            fii_snapshot_cache=FiiSnapshotCache(fii_repository=repository), fii_validator_factory=mock_validator_factory
+        )
+        await view.passing()
+
+        await repository.add(bad_fii.model_copy(update={"dy_12": Decimal("9.0")}))
+        await repository.add(good_fii.model_copy(update={"dy_12": Decimal("2.0")}))
+
+        assert [result.ticker for result in await view.passing()] == ["BAD11"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_write_is_not_reevaluated(self, mock_validator_factory, good_fii):
+        repository = InMemoryFiiRepository([good_fii])
+        view = FiiScreeningView(
+            fii_snapshot_cache=FiiSnapshotCache(fii_repository=repository), fii_validator_factory=mock_validator_factory
+        )
+        await view.passing()
+        build_count = mock_validator_factory.build.call_count
+
+        await repository.add(good_fii.model_copy())
+
+        assert mock_validator_factory.build.call_count == build_count
+
+    @pytest.mark.asyncio
+    async def test_writes_to_other_repositories_are_ignored(self, mock_validator_factory, good_fii, bad_fii):
+        repository = InMemoryFiiRepository([good_fii])
+        other_repository = InMemoryFiiRepository()
+        view = FiiScreeningView(
+            fii_snapshot_cache=FiiSnapshotCache(fii_repository=repository), fii_validator_factory=mock_validator_factory
+        )
+        await view.passing()
+
+        await other_repository.add(bad_fii.model_copy(update={"dy_12": Decimal("9.0")}))
+
+        assert [result.ticker for result in await view.passing()] == ["GOOD11"]
+
+    def test_evaluate_rejects_non_positive_dividend(self, mock_validator_factory):
+        view = FiiScreeningView(
+            fii_snapshot_cache=MagicMock(spec=FiiSnapshotCache), fii_validator_factory=mock_validator_factory
+        )
+        fii = FiiDomainFactory.build(dy_12=Decimal("8.0"), last_price=Decimal("100.0"), last_dividend=Decimal("0"))
+
+        result = view.evaluate(fii)
+
+        assert result.passed is False
+        assert result.magic_number is None
+        assert FiiScreeningView.POSITIVE_DIVIDEND_MESSAGE in result.rejection_reasons
+
+
+class TestFiiScreeningViewFactory:
+    def test_create_returns_shared_view_by_default(self):
+        assert FiiScreeningViewFactory.create() is fii_screening_view
+
+    def test_create_returns_private_view_for_injected_dependencies(self):
+        repository = MagicMock(spec=FiiRepository)
+
+        view = FiiScreeningViewFactory.create(fii_repository=repository)
+
+        assert view is not fii_screening_view
+        assert view.fii_snapshot_cache.fii_repository is repository
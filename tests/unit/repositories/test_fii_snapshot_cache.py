@@ -0,0 +1,131 @@
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_snapshot_cache import (
+    FiiSnapshotCache,
+    FiiSnapshotCacheFactory,
+    fii_snapshot_cache,
+)
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiSnapshotCache:
+    @pytest.mark.asyncio
+    async def test_get_loads_repository_once(self):
+        repository = MagicMock(spec=FiiRepository)
+        repository.list = AsyncMock(return_value=[FiiDomainFactory.build(ticker="TEST11")])
+        cache = FiiSnapshotCache(fii_repository=repository)
+
+        first = await cache.get()
+        second = await cache.get()
+
+        assert first is second
+        assert first.get("TEST11") is not None
+        repository.list.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_gets_load_once(self):
+        repository = MagicMock(spec=FiiRepository)
+
+        async def slow_list():
+            await asyncio.sleep(0.01)
+            return [FiiDomainFactory.build(ticker="TEST11")]
+
+        repository.list = AsyncMock(side_effect=slow_list)
+        cache = FiiSnapshotCache(fii_repository=repository)
+
+        snapshots = await asyncio.gather(cache.get(), cache.get(), cache.get())
+
+        repository.list.assert_awaited_once()
+        assert cache.version == 1
+        assert snapshots[0] is snapshots[1] is snapshots[2]
+
+    @pytest.mark.asyncio
+    async def test_changed_write_bumps_version_and_rebuilds_snapshot(self):
+        fii = FiiDomainFactory.build(ticker="TEST11", dy_12=Decimal("8.0"))
+        repository = InMemoryFiiRepository([fii])
+        cache = FiiSnapshotCache(fii_repository=repository)
+        first = await cache.get()
+
+        await repository.add(fii.model_copy(update={"dy_12": Decimal("9.0")}))
+        second = await cache.get()
+
+        assert second.version == first.version + 1
+        assert second.get("TEST11").dy_12 == Decimal("9.0")
+        assert second.columns["dy_12"].tolist() == [9.0]
+
+    @pytest.mark.asyncio
+    async def test_write_during_the_load_scan_is_kept(self):
+        fii = FiiDomainFactory.build(ticker="TEST11", dy_12=Decimal("8.0"))
+        repository = InMemoryFiiRepository([fii])
+        scanned = repository.list
+
+        async def list_racing_a_write():
+            fiis = await scanned()
+            # the scan has read the old value by the time this write lands
+            await repository.add(fii.model_copy(update={"dy_12": Decimal("9.0")}))
+            return fiis
+
+        repository.list = list_racing_a_write
+        cache = FiiSnapshotCache(fii_repository=repository)
+
+        snapshot = await cache.get()
+
+        assert snapshot.get("TEST11").dy_12 == Decimal("9.0")
+
+    @pytest.mark.asyncio
+    async def test_unchanged_write_keeps_version(self):
+        fii = FiiDomainFactory.build(ticker="TEST11")
+        repository = InMemoryFiiRepository([fii])
+        cache = FiiSnapshotCache(fii_repository=repository)
+        first = await cache.get()
+
+        await repository.add(fii.model_copy())
+
+        assert (await cache.get()) is first
+
+    def test_factory_returns_shared_cache_by_default(self):
+        assert FiiSnapshotCacheFactory.create() is fii_snapshot_cache
+
+    @pytest.mark.asyncio
+    async def test_warm_up_loads_the_snapshot(self):
+        repository = MagicMock(spec=FiiRepository)
+        repository.list = AsyncMock(return_value=[FiiDomainFactory.build(ticker="TEST11")])
+        cache = FiiSnapshotCache(fii_repository=repository)
+
+        await cache.warm_up()
+
+        assert cache.is_loaded
+        await cache.get()
+        repository.list.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_failure_is_logged(self):
+        repository = MagicMock(spec=FiiRepository)
+        repository.list = AsyncMock(side_effect=RuntimeError("unavailable"))
+        cache = FiiSnapshotCache(fii_repository=repository)
+
+        await cache.warm_up()
+
+        assert not cache.is_loaded
+
+    @pytest.mark.asyncio
+    async def test_data_version_follows_changed_writes(self):
+        fii = FiiDomainFactory.build(ticker="TEST11", dy_12=Decimal("10"))
+        repository = InMemoryFiiRepository([fii])
+        cache = FiiSnapshotCache(fii_repository=repository)
+        assert cache.data_version is None
+
+        await cache.get()
+        loaded = cache.data_version
+        await repository.add(fii.model_copy())
+        assert cache.data_version == loaded
+
+        await repository.add(fii.model_copy(update={"dy_12": Decimal("11")}))
+        assert cache.data_version != loaded
+        assert cache.data_version != FiiSnapshotCache(fii_repository=repository).data_version
@@ -0,0 +1,48 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from app.repositories.fii_timeline_reader import FiiTimelineReader
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_timeline_repository import InMemoryFiiTimelineRepository
+
+
+class TestFiiTimelineReader:
+    @pytest.fixture
+    async def timeline_repository(self):
+        repository = InMemoryFiiTimelineRepository()
+        await repository.add_checkpoint(
+            [FiiDomainFactory.build(ticker="TEST11", last_price=10)], datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+        await repository.add_delta(
+            FiiDomainFactory.build(ticker="TEST11", last_price=11), datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        )
+        await repository.add_checkpoint(
+            [FiiDomainFactory.build(ticker="TEST11", last_price=20)], datetime(2024, 1, 2, 9, tzinfo=timezone.utc)
+        )
+        await repository.add_delta(
+            FiiDomainFactory.build(ticker="TEST11", last_price=21), datetime(2024, 1, 3, 6, tzinfo=timezone.utc)
+        )
+        return repository
+
+    @pytest.fixture
+    def reader(self, timeline_repository):
+        return FiiTimelineReader(timeline_repository, clock=lambda: datetime(2024, 1, 3, 8, tzinfo=timezone.utc))
+
+    @pytest.mark.asyncio
+    async def test_as_of_replays_deltas_after_the_latest_checkpoint(self, reader):
+        assert [fii.last_price for fii in await reader.as_of(date(2024, 1, 1))] == [11]
+        assert [fii.last_price for fii in await reader.as_of(date(2024, 1, 2))] == [20]
+
+    @pytest.mark.asyncio
+    async def test_as_of_before_the_first_checkpoint_is_empty(self, reader):
+        assert await reader.as_of(date(2023, 12, 31)) == []
+
+    @pytest.mark.asyncio
+    async def test_as_of_caches_only_finished_days(self, reader, timeline_repository):
+        await reader.as_of(date(2024, 1, 1))
+        await reader.as_of(date(2024, 1, 1))
+        await reader.as_of(date(2024, 1, 3))
+        await reader.as_of(date(2024, 1, 3))
+
+        assert timeline_repository.delta_queries == 3
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.repositories.fii_timeline_recorder import FiiTimelineRecorder
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+from tests.fakes.in_memory_fii_timeline_repository import InMemoryFiiTimelineRepository
+
+
+class TestFiiTimelineRecorder:
+    @pytest.fixture
+    def clock(self):
+        class Clock:
+            now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+            def __call__(self):
+                return self.now
+
+        return Clock()
+
+    @pytest.fixture
+    def repository(self):
+        return InMemoryFiiRepository([FiiDomainFactory.build(ticker="TEST12")])
+
+    @pytest.fixture
+    def timeline_repository(self):
+        return InMemoryFiiTimelineRepository()
+
+    @pytest.fixture
+    def recorder(self, repository, timeline_repository, clock):
+        recorder = FiiTimelineRecorder(timeline_repository, fii_repository=repository, clock=clock)
+        recorder.start()
+        yield recorder
+        recorder.stop()
+
+    @pytest.mark.asyncio
+    async def test_first_write_stores_a_full_checkpoint(self, recorder, repository, timeline_repository):
+        await repository.add(FiiDomainFactory.build(ticker="TEST11"))
+
+        assert len(timeline_repository.checkpoints) == 1
+        assert {fii.ticker for fii in timeline_repository.checkpoints[0].fiis} == {"TEST11", "TEST12"}
+        assert timeline_repository.delta_log == []
+
+    @pytest.mark.asyncio
+    async def test_changes_within_the_interval_are_deltas(self, recorder, repository, timeline_repository, clock):
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", last_price=10))
+        clock.now += timedelta(hours=8)
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", last_price=11))
+
+        assert len(timeline_repository.checkpoints) == 1
+        assert [delta.fii.last_price for delta in timeline_repository.delta_log] == [11]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_writes_are_not_recorded(self, recorder, repository, timeline_repository, clock):
+        fii = FiiDomainFactory.build(ticker="TEST11")
+        await repository.add(fii)
+        clock.now += timedelta(hours=1)
+        await repository.add(fii.model_copy())
+
+        assert timeline_repository.delta_log == []
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_again_after_the_interval(self, recorder, repository, timeline_repository, clock):
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", last_price=10))
+        clock.now += FiiTimelineRecorder.CHECKPOINT_INTERVAL
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", last_price=11))
+
+        assert len(timeline_repository.checkpoints) == 2
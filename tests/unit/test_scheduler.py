@@ -99,6 +99,18 @@ class TestFiiScheduler:
         assert hasattr(scheduler, "start")
         assert hasattr(scheduler, "stop")
 
+    @pytest.mark.asyncio
+    async def test_scheduled_update_refreshes_existing_fiis(self, scheduler):
+        usecase = MagicMock(spec=FiiScrapeUseCase)
+        usecase.fii_repository = MagicMock()
+        usecase.fii_repository.list = AsyncMock(return_value=[FiiDomainFactory.build(ticker="TEST11")])
+        usecase.execute = AsyncMock(return_value=[])
+
+        with patch("app.scheduler.FiiScrapeUseCase", return_value=usecase):
+            await scheduler.scheduled_update()
+
+        usecase.execute.assert_awaited_once_with(refresh=True)
+
 
 class TestBootstrapAndStartScheduler:
     @pytest.fixture
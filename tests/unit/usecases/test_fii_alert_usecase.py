@@ -0,0 +1,101 @@
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.domain.fii_alert import FiiAlertRule
+from app.repositories.fii_alert_engine import FiiAlertEngine
+from app.repositories.fii_event_stream import FiiEventStream
+from app.usecases.fii_alert_usecase import (
+    AlertRuleRequest,
+    FiiAlertListUseCase,
+    FiiAlertRegisterUseCase,
+    FiiAlertRemoveUseCase,
+    FiiAlertRuleListUseCase,
+    FiiAlertStreamUseCase,
+)
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_alert_repository import InMemoryFiiAlertRepository
+
+
+class TestFiiAlertUseCases:
+    @pytest.fixture
+    def engine(self):
+        moments = iter(datetime(2024, 1, day, tzinfo=timezone.utc) for day in range(1, 29))
+        return FiiAlertEngine(InMemoryFiiAlertRepository(), clock=lambda: next(moments))
+
+    async def fire(self, engine, ticker):
+        return await engine.evaluate(None, FiiDomainFactory.build(ticker=ticker, dy_12=Decimal("12")))
+
+    @pytest.mark.asyncio
+    async def test_register_list_and_remove_rules(self, engine):
+        request = AlertRuleRequest(field="dy_12", operator=">", threshold=10, segment="Papéis")
+
+        registered = await FiiAlertRegisterUseCase(request, fii_alert_engine=engine).execute()
+        rules = await FiiAlertRuleListUseCase(fii_alert_engine=engine).execute()
+        removed = await FiiAlertRemoveUseCase(registered.id, fii_alert_engine=engine).execute()
+
+        assert [rule.id for rule in rules] == [registered.id]
+        assert registered.segment == "papéis"
+        assert removed
+        assert await FiiAlertRuleListUseCase(fii_alert_engine=engine).execute() == []
+
+    def test_register_rejects_invalid_rules(self, engine):
+        with pytest.raises(ValueError):
+            FiiAlertRegisterUseCase(AlertRuleRequest(field="dy_12", operator="=", threshold=10), engine)
+        with pytest.raises(ValueError):
+            FiiAlertRegisterUseCase(
+                AlertRuleRequest(field="dy_12", operator=">", threshold=10, ticker="TEST11", segment="Papéis"), engine
+            )
+
+    @pytest.mark.asyncio
+    async def test_list_pages_after_the_last_alert(self, engine):
+        await engine.register(FiiAlertRule(id="high", field="dy_12", operator=">", threshold=10))
+        for ticker in ("TEST11", "TEST12", "TEST13"):
+            await self.fire(engine, ticker)
+
+        first = await FiiAlertListUseCase(limit=2, fii_alert_engine=engine).execute()
+        second = await FiiAlertListUseCase(after=first.next_after, limit=2, fii_alert_engine=engine).execute()
+
+        assert [alert.ticker for alert in first.alerts] == ["TEST11", "TEST12"]
+        assert first.has_more
+        assert [alert.ticker for alert in second.alerts] == ["TEST13"]
+        assert not second.has_more
+
+    def test_list_rejects_invalid_limits(self, engine):
+        with pytest.raises(ValueError):
+            FiiAlertListUseCase(limit=0, fii_alert_engine=engine)
+
+    @pytest.mark.asyncio
+    async def test_stream_replays_then_follows_live_alerts(self, engine):
+        await engine.register(FiiAlertRule(id="high", field="dy_12", operator=">", threshold=10))
+        first = (await self.fire(engine, "TEST11"))[0]
+        await self.fire(engine, "TEST12")
+
+        stream = FiiAlertStreamUseCase(after=first.id, fii_alert_engine=engine).execute()
+        replayed = await stream.__anext__()
+        await self.fire(engine, "TEST13")
+        live = await stream.__anext__()
+        await stream.aclose()
+
+        assert "event: alert" in replayed and "TEST12" in replayed
+        assert live.startswith("id: ") and "TEST13" in live
+        assert engine.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_ends_when_the_subscriber_falls_behind(self, engine, monkeypatch):
+        monkeypatch.setattr(FiiEventStream, "SUBSCRIBER_QUEUE_SIZE", 1)
+        await engine.register(FiiAlertRule(id="high", field="dy_12", operator=">", threshold=10))
+        stream = FiiAlertStreamUseCase(fii_alert_engine=engine).execute()
+        pending = asyncio.ensure_future(stream.__anext__())
+        while not engine.subscriber_count:
+            await asyncio.sleep(0)
+
+        for ticker in ("TEST11", "TEST12", "TEST13"):
+            await self.fire(engine, ticker)
+
+        assert "TEST11" in await asyncio.wait_for(pending, timeout=1)
+        with pytest.raises(StopAsyncIteration):
+            await asyncio.wait_for(stream.__anext__(), timeout=1)
+        assert engine.subscriber_count == 0
@@ -1,5 +1,6 @@
+from datetime import date
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -158,3 +159,24 @@ class TestFiiAnalyserUsecase:
         result = await analyser_usecase._get("TEST11")
 
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_execute_as_of_screens_the_reconstructed_universe(self, mock_fii_repository, mock_validator_factory):
+        good_fii = FiiDomainFactory.build(
+            ticker="GOOD11", dy_12=Decimal("8.0"), last_dividend=Decimal("1.0"), last_price=Decimal("100.0")
+        )
+        low_fii = FiiDomainFactory.build(
+            ticker="LOW11", dy_12=Decimal("3.0"), last_dividend=Decimal("1.0"), last_price=Decimal("100.0")
+        )
+        reader = MagicMock()
+        reader.as_of = AsyncMock(return_value=[good_fii, low_fii])
+        usecase = FiiAnalyserUsecase(
+            fii_repository=mock_fii_repository,
+            fii_validator_factory=mock_validator_factory,
+            as_of=date(2024, 1, 1),
+            fii_timeline_reader=reader,
+        )
+
+        assert await usecase.execute() == [good_fii]
+        assert await usecase.execute(tickers=["LOW11", "GOOD11", "NONE11"]) == [good_fii]
+        mock_fii_repository.get.assert_not_called()
@@ -0,0 +1,49 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.usecases.fii_backtest_usecase import FiiBacktestUseCase
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_history_repository import InMemoryFiiHistoryRepository
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiBacktestUseCase:
+    @pytest.fixture
+    def repository(self):
+        return InMemoryFiiRepository([FiiDomainFactory.build(ticker="TEST11", duration="indeterminado")])
+
+    @pytest.fixture
+    async def history_repository(self):
+        repository = InMemoryFiiHistoryRepository()
+        for month, price in ((1, "100"), (2, "102"), (3, "104")):
+            fii = FiiDomainFactory.build(
+                ticker="TEST11",
+                last_price=Decimal(price),
+                last_dividend=Decimal("1"),
+                dy_12=Decimal("12"),
+                dialy_liquidity=Decimal("1000000"),
+            )
+            await repository.append(fii, datetime(2024, month, 10, tzinfo=timezone.utc))
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_execute_backtests_requested_profiles(self, repository, history_repository):
+        usecase = FiiBacktestUseCase(
+            years=1,
+            profiles=["dividend"],
+            end=date(2024, 3, 31),
+            fii_repository=repository,
+            fii_history_repository=history_repository,
+        )
+
+        result = await usecase.execute()
+
+        assert [profile.profile for profile in result.profiles] == ["dividend"]
+        assert result.profiles[0].holdings[-2:] == [1, 1]
+        assert result.profiles[0].total_return > 0
+
+    def test_unknown_profile_is_rejected_before_reading(self, repository):
+        with pytest.raises(ValueError):
+            FiiBacktestUseCase(profiles=["nope"], fii_repository=repository)
@@ -0,0 +1,95 @@
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.repositories.fii_rolling_stats_store import FiiRollingStatsStore
+from app.repositories.fii_snapshot_cache import FiiSnapshotCache
+from app.usecases.fii_batch_usecase import FiiBatchUseCase
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiBatchUseCase:
+    @pytest.fixture
+    def repository(self):
+        return InMemoryFiiRepository([FiiDomainFactory.build(ticker=f"TEST{index}1") for index in range(5)])
+
+    def _usecase(self, repository, tickers, **options):
+        return FiiBatchUseCase(
+            tickers=tickers,
+            fii_repository=repository,
+            fii_snapshot_cache=FiiSnapshotCache(fii_repository=repository),
+            fii_rolling_stats_store=FiiRollingStatsStore(fii_repository=repository),
+            **options,
+        )
+
+    @pytest.mark.asyncio
+    async def test_answers_in_request_order_with_not_found_markers(self, repository):
+        usecase = self._usecase(repository, ["test31", " MISS11", "TEST01", "TEST31"])
+
+        result = await usecase.execute()
+
+        assert [(lookup.ticker, lookup.found) for lookup in result] == [
+            ("TEST31", True),
+            ("MISS11", False),
+            ("TEST01", True),
+        ]
+        assert result[0].fii.ticker == "TEST31" and result[1].fii is None
+
+    @pytest.mark.parametrize("loaded", [True, False])
+    @pytest.mark.asyncio
+    async def test_lowercase_stored_tickers_are_found(self, loaded):
+        repository = InMemoryFiiRepository([FiiDomainFactory.build(ticker="hglg11")])
+        cache = FiiSnapshotCache(fii_repository=repository)
+        if loaded:
+            await cache.get()
+        usecase = FiiBatchUseCase(tickers=["HGLG11", "hglg11"], fii_repository=repository, fii_snapshot_cache=cache)
+
+        result = await usecase.execute()
+
+        assert [(lookup.ticker, lookup.found) for lookup in result] == [("hglg11", True)]
+        assert result[0].fii.ticker == "hglg11"
+
+    @pytest.mark.asyncio
+    async def test_batched_read_before_the_snapshot_is_loaded(self, repository):
+        repository.list = AsyncMock()
+        repository.get_many = AsyncMock(wraps=repository.get_many)
+        usecase = self._usecase(repository, ["TEST11", "TEST21"])
+
+        result = await usecase.execute()
+
+        assert all(lookup.found for lookup in result)
+        repository.get_many.assert_awaited_once()
+        repository.list.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reads_the_snapshot_once_loaded(self, repository):
+        cache = FiiSnapshotCache(fii_repository=repository)
+        await cache.get()
+        repository.get_many = AsyncMock()
+        usecase = FiiBatchUseCase(tickers=["TEST11"], fii_repository=repository, fii_snapshot_cache=cache)
+
+        result = await usecase.execute()
+
+        assert result[0].found
+        repository.get_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_encoded_projects_the_fii_fields(self, repository):
+        usecase = self._usecase(repository, ["TEST11", "MISS11"], fields="ticker")
+
+        body = await usecase.encoded()
+
+        assert json.loads(body.body) == [
+            {"ticker": "TEST11", "found": True, "fii": {"ticker": "TEST11"}},
+            {"ticker": "MISS11", "found": False, "fii": None},
+        ]
+
+    @pytest.mark.parametrize(
+        "tickers,options",
+        [([], {}), ([" ", ""], {}), ([f"T{index}" for index in range(101)], {}), (["TEST11"], {"fields": "nope"})],
+    )
+    def test_rejects_invalid_requests(self, repository, tickers, options):
+        with pytest.raises(ValueError):
+            self._usecase(repository, tickers, **options)
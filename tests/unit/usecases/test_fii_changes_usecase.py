@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.domain.fii_change import change_of
+from app.usecases.fii_changes_usecase import FiiChangesUseCase
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_change_repository import InMemoryFiiChangeRepository
+
+
+class TestFiiChangesUseCase:
+    @pytest.fixture
+    async def change_repository(self):
+        repository = InMemoryFiiChangeRepository()
+        for index in range(5):
+            fii = FiiDomainFactory.build(ticker=f"TEST{index}")
+            await repository.append(change_of(None, fii, datetime(2024, 1, 1, tzinfo=timezone.utc)))
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_the_cursor(self, change_repository):
+        first = await FiiChangesUseCase(since=0, limit=2, fii_change_repository=change_repository).execute()
+        second = await FiiChangesUseCase(
+            since=first.next_since, limit=3, fii_change_repository=change_repository
+        ).execute()
+
+        assert [change.version for change in first.changes] == [1, 2]
+        assert first.has_more
+        assert first.latest_version == 5
+        assert [change.version for change in second.changes] == [3, 4, 5]
+        assert not second.has_more
+        assert second.next_since == 5
+
+    @pytest.mark.asyncio
+    async def test_up_to_date_client_gets_an_empty_page(self, change_repository):
+        page = await FiiChangesUseCase(since=5, fii_change_repository=change_repository).execute()
+
+        assert page.changes == []
+        assert page.next_since == 5
+        assert page.latest_version == 5
+        assert not page.has_more
+
+    def test_rejects_invalid_arguments(self, change_repository):
+        with pytest.raises(ValueError):
+            FiiChangesUseCase(since=-1, fii_change_repository=change_repository)
+        with pytest.raises(ValueError):
+            FiiChangesUseCase(limit=0, fii_change_repository=change_repository)
@@ -0,0 +1,185 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.domain.fii_snapshot import FiiSnapshot
+from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_snapshot_cache import FiiSnapshotCache
+from app.usecases.fii_dashboard_usecase import (
+    FiiDashboard,
+    FiiDashboardTableUseCase,
+    FiiDashboardUseCase,
+)
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiDashboardUseCase:
+    @pytest.fixture
+    def fiis(self):
+        return [
+            FiiDomainFactory.build(
+                ticker="TEST11",
+                dy_12=Decimal("10"),
+                dialy_liquidity=Decimal("2000000"),
+                last_price=Decimal("100"),
+                last_dividend=Decimal("1"),
+            ),
+            FiiDomainFactory.build(
+                ticker="TEST12",
+                dy_12=Decimal("0"),
+                dialy_liquidity=Decimal("4000000"),
+                last_price=Decimal("10"),
+                last_dividend=Decimal("0"),
+            ),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_execute_builds_table_magic_numbers_and_stats(self, fiis):
+        cache = FiiSnapshotCache(fii_repository=InMemoryFiiRepository(fiis))
+
+        dashboard = await FiiDashboardUseCase(fii_snapshot_cache=cache).execute()
+
+        assert [fii.ticker for fii in dashboard.fiis] == ["TEST11", "TEST12"]
+        assert [magic.ticker for magic in dashboard.magic_numbers] == ["TEST11"]
+        assert dashboard.magic_numbers[0].invested_value == FiiDashboard.INVESTED_VALUE
+        assert dashboard.stats.model_dump() == {
+            "total_fiis": 2,
+            "positive_dy": 1,
+            "magic_numbers": 1,
+            "avg_liquidity": 3.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_dashboard_is_built_once_per_version_without_repository_reads(self, fiis):
+        repository = MagicMock(spec=FiiRepository)
+        repository.list = AsyncMock(return_value=fiis)
+        cache = FiiSnapshotCache(fii_repository=repository)
+        usecase = FiiDashboardUseCase(fii_snapshot_cache=cache)
+
+        first = await usecase.execute()
+        second = await usecase.execute()
+
+        assert first is second
+        repository.list.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_writes_produce_a_new_dashboard(self, fiis):
+        repository = InMemoryFiiRepository(fiis)
+        usecase = FiiDashboardUseCase(fii_snapshot_cache=FiiSnapshotCache(fii_repository=repository))
+        first = await usecase.execute()
+
+        await repository.add(FiiDomainFactory.build(ticker="TEST13", dy_12=Decimal("5")))
+        second = await usecase.execute()
+
+        assert second is not first
+        assert second.version > first.version
+        assert second.stats.total_fiis == 3
+
+    @pytest.mark.asyncio
+    async def test_etag_is_known_once_the_snapshot_is_loaded(self, fiis):
+        repository = InMemoryFiiRepository(fiis)
+        usecase = FiiDashboardUseCase(fii_snapshot_cache=FiiSnapshotCache(fii_repository=repository))
+        assert usecase.etag() is None
+
+        await usecase.execute()
+        loaded = usecase.etag()
+        await repository.add(FiiDomainFactory.build(ticker="TEST13"))
+
+        assert loaded.startswith("dashboard-")
+        assert usecase.etag() != loaded
+
+    def test_empty_snapshot(self):
+        dashboard = FiiDashboard(FiiSnapshot(0, []))
+
+        assert dashboard.fiis == []
+        assert dashboard.stats.total_fiis == 0
+        assert dashboard.stats.avg_liquidity == 0
+
+
+class TestFiiDashboardTable:
+    @pytest.fixture
+    def snapshot(self):
+        return FiiSnapshot(
+            1,
+            [
+                FiiDomainFactory.build(
+                    ticker="TEST13", segment="Papéis", dy_12=Decimal("8"), last_price=Decimal("10"), last_dividend=0
+                ),
+                FiiDomainFactory.build(
+                    ticker="TEST11",
+                    segment="Logística",
+                    dy_12=Decimal("12"),
+                    last_price=Decimal("100"),
+                    last_dividend=1,
+                ),
+                FiiDomainFactory.build(
+                    ticker="TEST12", segment="Papéis", dy_12=Decimal("8"), last_price=Decimal("50"), last_dividend=1
+                ),
+            ],
+        )
+
+    def test_pages_are_slices_of_the_sorted_table(self, snapshot):
+        dashboard = FiiDashboard(snapshot)
+
+        first = dashboard.page(0, 2)
+        second = dashboard.page(2, 2)
+
+        assert [row.ticker for row in first.rows + second.rows] == ["TEST11", "TEST12", "TEST13"]
+        assert (first.total, first.version, second.offset) == (3, 1, 2)
+        assert first.stats == dashboard.stats
+
+    def test_sort_by_number_keeps_ticker_order_for_ties(self, snapshot):
+        dashboard = FiiDashboard(snapshot)
+
+        ascending = dashboard.page(0, 10, sort="dy_12")
+        descending = dashboard.page(0, 10, sort="dy_12", descending=True)
+
+        assert [row.ticker for row in ascending.rows] == ["TEST12", "TEST13", "TEST11"]
+        assert [row.ticker for row in descending.rows] == ["TEST11", "TEST12", "TEST13"]
+        assert descending.order == "desc"
+
+    def test_sort_by_text(self, snapshot):
+        rows = FiiDashboard(snapshot).page(0, 10, sort="segment", descending=True).rows
+
+        assert [row.ticker for row in rows] == ["TEST12", "TEST13", "TEST11"]
+
+    def test_magic_only(self, snapshot):
+        page = FiiDashboard(snapshot).page(0, 10, sort="last_price", magic_only=True)
+
+        assert [row.ticker for row in page.rows] == ["TEST12", "TEST11"]
+        assert page.total == 2
+        assert all(row.magic_number for row in page.rows)
+
+    def test_orders_are_computed_once(self, snapshot):
+        dashboard = FiiDashboard(snapshot)
+
+        assert dashboard.order("p_vp", True) is dashboard.order("p_vp", True)
+
+    def test_empty_table(self):
+        page = FiiDashboard(FiiSnapshot(0, [])).page(0, 10, sort="segment")
+
+        assert (page.total, page.rows) == (0, [])
+
+    @pytest.mark.asyncio
+    async def test_usecase_reads_the_snapshot(self, snapshot):
+        cache = FiiSnapshotCache(fii_repository=InMemoryFiiRepository(list(snapshot.fiis)))
+
+        page = await FiiDashboardTableUseCase(limit=1, sort="ticker", order="desc", fii_snapshot_cache=cache).execute()
+
+        assert [row.ticker for row in page.rows] == ["TEST13"]
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [
+            {"offset": -1},
+            {"limit": 0},
+            {"limit": FiiDashboardTableUseCase.MAX_LIMIT + 1},
+            {"sort": "magic"},
+            {"order": "up"},
+        ],
+    )
+    def test_rejects_invalid_arguments(self, arguments):
+        with pytest.raises(ValueError):
+            FiiDashboardTableUseCase(**arguments)
@@ -0,0 +1,88 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.domain.fii_change import FiiChange, FiiChangeEvent, FiiFieldChange
+from app.domain.fii_scrape_progress import FiiScrapeProgress
+from app.repositories.fii_event_stream import FiiEventStream
+from app.usecases.fii_event_stream_usecase import FiiEventStreamUseCase
+from tests.fakes.in_memory_fii_change_repository import InMemoryFiiChangeRepository
+
+
+class TestFiiEventStreamUseCase:
+    @pytest.fixture
+    def event_stream(self):
+        return FiiEventStream()
+
+    @pytest.fixture
+    async def change_repository(self):
+        repository = InMemoryFiiChangeRepository()
+        for price in ("10.00", "11.00"):
+            await repository.append(
+                FiiChange(
+                    ticker="TEST11",
+                    kind="updated",
+                    changed_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    fields=[FiiFieldChange(field="last_price", current=price)],
+                )
+            )
+        return repository
+
+    @staticmethod
+    async def _next(events):
+        return await asyncio.wait_for(events.__anext__(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_replays_stored_changes_then_goes_live(self, event_stream, change_repository):
+        events = FiiEventStreamUseCase(
+            since=1, fii_event_stream=event_stream, fii_change_repository=change_repository
+        ).execute()
+
+        replayed = await self._next(events)
+        assert replayed.startswith("id: 2\nevent: change\n")
+        assert '"values":{"last_price":"11.00"}' in replayed
+
+        # a live delta already replayed is skipped
+        event_stream.publish(FiiChangeEvent(version=2, ticker="TEST11", kind="updated", values={}))
+        event_stream.publish(FiiChangeEvent(version=3, ticker="TEST12", kind="added", values={"ticker": "TEST12"}))
+        assert (await self._next(events)).startswith("id: 3\nevent: change\n")
+        await events.aclose()
+
+        assert event_stream.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_progress_events_have_no_id(self, event_stream, change_repository):
+        events = FiiEventStreamUseCase(fii_event_stream=event_stream, fii_change_repository=change_repository).execute()
+        pending = asyncio.ensure_future(self._next(events))
+        while not event_stream.subscriber_count:
+            await asyncio.sleep(0)
+
+        event_stream.publish(FiiScrapeProgress(run_id="run", state="running", total=2, done=1, ticker="TEST11"))
+
+        event = await pending
+        assert event.startswith("event: progress\ndata: ")
+        assert '"done":1' in event
+        await events.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stream_ends_when_the_subscriber_falls_behind(self, event_stream, change_repository):
+        event_stream.SUBSCRIBER_QUEUE_SIZE = 1
+        events = FiiEventStreamUseCase(
+            since=2, fii_event_stream=event_stream, fii_change_repository=change_repository
+        ).execute()
+        pending = asyncio.ensure_future(self._next(events))
+        while not event_stream.subscriber_count:
+            await asyncio.sleep(0)
+
+        for version in (3, 4, 5):
+            event_stream.publish(FiiChangeEvent(version=version, ticker="TEST11", kind="updated", values={}))
+
+        assert (await pending).startswith("id: 3\n")
+        with pytest.raises(StopAsyncIteration):
+            await self._next(events)
+        assert event_stream.subscriber_count == 0
+
+    def test_rejects_negative_since(self, event_stream):
+        with pytest.raises(ValueError):
+            FiiEventStreamUseCase(since=-1, fii_event_stream=event_stream)
@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.repositories.fii_rolling_stats_store import FiiRollingStatsStore
+from app.repositories.fii_snapshot_cache import FiiSnapshotCache
+from app.usecases.fii_export_usecase import FiiExportUseCase
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_history_repository import InMemoryFiiHistoryRepository
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiExportUseCase:
+    @pytest.fixture
+    def fiis(self):
+        return [
+            FiiDomainFactory.build(ticker=f"TEST{index:02d}", dy_12=Decimal(index), rolling_stats=None)
+            for index in range(5)
+        ]
+
+    @pytest.fixture
+    def history(self):
+        return InMemoryFiiHistoryRepository()
+
+    @pytest.fixture
+    def dependencies(self, fiis, history):
+        repository = InMemoryFiiRepository(fiis)
+        return {
+            "fii_snapshot_cache": FiiSnapshotCache(fii_repository=repository),
+            "fii_history_repository": history,
+            "fii_rolling_stats_store": FiiRollingStatsStore(fii_repository=repository, fii_history_repository=history),
+        }
+
+    @staticmethod
+    async def _read(usecase):
+        chunks = [chunk async for chunk in usecase.stream()]
+        return chunks, b"".join(chunks)
+
+    @pytest.mark.asyncio
+    async def test_current_rows_stream_in_chunks(self, dependencies, monkeypatch):
+        monkeypatch.setattr(FiiExportUseCase, "CHUNK_SIZE", 2)
+        usecase = FiiExportUseCase("ndjson", **dependencies)
+
+        chunks, data = await self._read(usecase)
+
+        rows = [json.loads(line) for line in data.decode().splitlines()]
+        assert [row["ticker"] for row in rows] == [f"TEST{index:02d}" for index in range(5)]
+        assert rows[3]["dy_12"] == "3" and rows[3]["price_moving_average"] is None
+        assert len([chunk for chunk in chunks if chunk]) == 3
+        assert usecase.media_type == "application/x-ndjson" and usecase.filename == "fiis.ndjson"
+
+    @pytest.mark.asyncio
+    async def test_history_rows_cover_the_range(self, dependencies, fiis, history):
+        for day in (1, 2, 3):
+            await history.append(fiis[0], datetime(2024, 1, day, tzinfo=timezone.utc))
+        await history.append(fiis[1], datetime(2024, 1, 2, tzinfo=timezone.utc))
+        usecase = FiiExportUseCase(
+            "csv",
+            start=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            end=datetime(2024, 1, 31, tzinfo=timezone.utc),
+            **dependencies,
+        )
+
+        _, data = await self._read(usecase)
+
+        rows = list(csv.DictReader(io.StringIO(data.decode())))
+        assert [(row["ticker"], row["scraped_at"][:10]) for row in rows] == [
+            ("TEST00", "2024-01-02"),
+            ("TEST00", "2024-01-03"),
+            ("TEST01", "2024-01-02"),
+        ]
+        assert usecase.filename == "fiis-history.csv"
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"file_format": "xlsx"},
+            {"file_format": "csv", "start": datetime(2024, 2, 1), "end": datetime(2024, 1, 1)},
+            {"file_format": "csv", "start": datetime(2024, 2, 1, tzinfo=timezone.utc), "end": datetime(2024, 1, 1)},
+        ],
+    )
+    def test_rejects_invalid_options(self, dependencies, options):
+        with pytest.raises(ValueError):
+            FiiExportUseCase(**options, **dependencies)
+
+    def test_accepts_aware_and_naive_bounds_together(self, dependencies):
+        usecase = FiiExportUseCase(
+            "csv", start=datetime(2024, 1, 1, tzinfo=timezone.utc), end=datetime(2024, 6, 30), **dependencies
+        )
+
+        assert usecase.start.tzinfo is not None and usecase.end == datetime(2024, 6, 30, tzinfo=timezone.utc)
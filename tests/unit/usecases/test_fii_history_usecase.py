@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.usecases.fii_history_usecase import FiiHistoryUseCase
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_history_repository import InMemoryFiiHistoryRepository
+
+
+class TestFiiHistoryUseCase:
+    @pytest.fixture
+    async def history_repository(self):
+        repository = InMemoryFiiHistoryRepository()
+        for month in range(1, 7):
+            fii = FiiDomainFactory.build(ticker="TEST11", last_dividend=month / 10)
+            await repository.append(fii, datetime(2024, month, 15, tzinfo=timezone.utc))
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_points_in_range(self, history_repository):
+        usecase = FiiHistoryUseCase(
+            "TEST11",
+            start=datetime(2024, 2, 1, tzinfo=timezone.utc),
+            end=datetime(2024, 4, 30, tzinfo=timezone.utc),
+            fii_history_repository=history_repository,
+        )
+
+        result = await usecase.execute()
+
+        assert result.ticker == "TEST11"
+        assert [point.last_dividend for point in result.points] == [0.2, 0.3, 0.4]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stored, requested", [("test11", "TEST11"), ("TEST11", "test11"), ("test11", " Test11 ")])
+    async def test_execute_finds_history_regardless_of_ticker_case(self, stored, requested):
+        repository = InMemoryFiiHistoryRepository()
+        fii = FiiDomainFactory.build(ticker=stored, last_dividend=0.5)
+        await repository.append(fii, datetime(2024, 1, 15, tzinfo=timezone.utc))
+
+        result = await FiiHistoryUseCase(requested, fii_history_repository=repository).execute()
+
+        assert [point.last_dividend for point in result.points] == [0.5]
+
+    @pytest.mark.asyncio
+    async def test_execute_unknown_ticker_is_empty(self, history_repository):
+        result = await FiiHistoryUseCase("NONE11", fii_history_repository=history_repository).execute()
+
+        assert result.points == []
@@ -1,8 +1,16 @@
-from unittest.mock import MagicMock
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.domain.fii_cursor import FiiCursor
+from app.domain.fii_domain import FiiRollingStats
+from app.libs.http_cache import EncodedBodyCache
 from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_rolling_stats_store import FiiRollingStatsStore
+from app.repositories.fii_snapshot_cache import FiiSnapshotCache
 from app.usecases.fii_list_usecase import FiiListUseCase
 from tests.factories.fii_domain_factory import FiiDomainFactory
 
@@ -54,3 +62,150 @@ class TestFiiListUseCase:
         await list_usecase.execute()
 
         assert mock_fii_repository.list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_as_of_reads_the_timeline(self, mock_fii_repository):
+        fiis = [FiiDomainFactory.build()]
+        reader = MagicMock()
+        reader.as_of = AsyncMock(return_value=fiis)
+
+        result = await FiiListUseCase(
+            fii_repository=mock_fii_repository, as_of=date(2024, 1, 1), fii_timeline_reader=reader
+        ).execute()
+
+        assert result == fiis
+        reader.as_of.assert_awaited_once_with(date(2024, 1, 1))
+        mock_fii_repository.list.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_attaches_rolling_stats(self, mock_fii_repository):
+        fii = FiiDomainFactory.build(ticker="TEST11")
+        mock_fii_repository.list.return_value = [fii]
+        store = FiiRollingStatsStore(fii_repository=mock_fii_repository)
+        store._on_write(mock_fii_repository, fii, None)
+        store.load({}, datetime(2000, 1, 1, tzinfo=timezone.utc))
+
+        result = await FiiListUseCase(fii_repository=mock_fii_repository, fii_rolling_stats_store=store).execute()
+
+        assert result[0].ticker == "TEST11"
+        assert result[0].rolling_stats == FiiRollingStats(
+            observations=1,
+            price_moving_average=float(fii.last_price),
+            dy_trend=None,
+            dividend_volatility=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_etag_follows_data_and_rolling_stats_without_reading(self, mock_fii_repository):
+        fii = FiiDomainFactory.build(ticker="TEST11")
+        mock_fii_repository.list = AsyncMock(return_value=[fii])
+        cache = FiiSnapshotCache(fii_repository=mock_fii_repository)
+        store = FiiRollingStatsStore(fii_repository=mock_fii_repository)
+        usecase = FiiListUseCase(
+            fii_repository=mock_fii_repository, fii_rolling_stats_store=store, fii_snapshot_cache=cache
+        )
+        assert usecase.etag() is None
+
+        await cache.get()
+        mock_fii_repository.list.reset_mock()
+        loaded = usecase.etag()
+        assert loaded == usecase.etag()
+
+        store._on_write(mock_fii_repository, fii, None)
+        store.load({}, datetime(2000, 1, 1, tzinfo=timezone.utc))
+        assert usecase.etag() != loaded
+        mock_fii_repository.list.assert_not_called()
+
+    def test_historical_reads_have_no_etag(self, mock_fii_repository):
+        cache = FiiSnapshotCache(fii_repository=mock_fii_repository)
+        cache.load([])
+
+        usecase = FiiListUseCase(fii_repository=mock_fii_repository, as_of=date(2024, 1, 1), fii_snapshot_cache=cache)
+
+        assert usecase.etag() is None
+
+    @pytest.mark.asyncio
+    async def test_encoded_serializes_once_per_tag(self, mock_fii_repository):
+        fiis = [FiiDomainFactory.build(ticker="TEST11"), FiiDomainFactory.build(ticker="TEST12")]
+        mock_fii_repository.list = AsyncMock(return_value=fiis)
+        usecase = FiiListUseCase(
+            fii_repository=mock_fii_repository,
+            fii_rolling_stats_store=FiiRollingStatsStore(fii_repository=mock_fii_repository),
+            encoded_body_cache=EncodedBodyCache(),
+        )
+
+        first = await usecase.encoded("fiis-a.1.0")
+        assert await usecase.encoded("fiis-a.1.0") is first
+        mock_fii_repository.list.assert_awaited_once()
+
+        assert first.body == FiiListUseCase.SERIALIZER.dump_json(fiis)
+        assert [fii["ticker"] for fii in json.loads(first.body)] == ["TEST11", "TEST12"]
+
+        await usecase.encoded("fiis-a.2.0")
+        assert mock_fii_repository.list.await_count == 2
+
+    @pytest.fixture
+    def loaded(self, mock_fii_repository):
+        fiis = [
+            FiiDomainFactory.build(ticker=f"TEST{index}1", dy_12=Decimal(dy))
+            for index, dy in enumerate(["8", "12", "10", "9", "11"])
+        ]
+        mock_fii_repository.list = AsyncMock(return_value=fiis)
+        cache = FiiSnapshotCache(fii_repository=mock_fii_repository)
+        cache.load(fiis)
+        return {
+            "fii_repository": mock_fii_repository,
+            "fii_snapshot_cache": cache,
+            "fii_rolling_stats_store": FiiRollingStatsStore(fii_repository=mock_fii_repository),
+            "encoded_body_cache": EncodedBodyCache(),
+        }
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_walk_the_sorted_snapshot(self, loaded):
+        tickers, cursor = [], None
+        while True:
+            usecase = FiiListUseCase(sort="dy_12", order="desc", limit=2, cursor=cursor, **loaded)
+            fiis, next_cursor = await usecase.page()
+            tickers += [fii.ticker for fii in fiis]
+            if next_cursor is None:
+                break
+            cursor = next_cursor.encode()
+
+        assert tickers == ["TEST11", "TEST41", "TEST21", "TEST31", "TEST01"]
+        loaded["fii_repository"].list.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_encoded_projects_fields_and_sends_the_next_cursor(self, loaded):
+        usecase = FiiListUseCase(fields="ticker, dy_12", limit=2, **loaded)
+
+        body = await usecase.encoded(usecase.etag())
+
+        assert json.loads(body.body) == [{"ticker": "TEST01", "dy_12": "8"}, {"ticker": "TEST11", "dy_12": "12"}]
+        cursor = FiiCursor.decode(body.headers["X-Next-Cursor"])
+        assert (cursor.sort, cursor.ticker) == ("ticker", "test11")
+
+    def test_etag_depends_on_the_slice(self, loaded):
+        plain = FiiListUseCase(**loaded).etag()
+        projected = FiiListUseCase(fields="ticker", **loaded).etag()
+
+        assert projected.startswith(plain) and projected != plain
+        assert FiiListUseCase(fields="ticker", **loaded).etag() == projected
+        assert FiiListUseCase(fields="ticker", limit=10, **loaded).etag() != projected
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"fields": "ticker,unknown"},
+            {"fields": ","},
+            {"sort": "rolling_stats"},
+            {"order": "up"},
+            {"limit": 0},
+            {"limit": FiiListUseCase.MAX_LIMIT + 1},
+            {"cursor": "garbage"},
+            {"sort": "dy_12", "cursor": FiiCursor(sort="ticker", descending=False, value="a", ticker="a").encode()},
+            {"sort": "dy_12", "cursor": FiiCursor(sort="dy_12", descending=False, value="a", ticker="a").encode()},
+        ],
+    )
+    def test_rejects_invalid_options(self, mock_fii_repository, options):
+        with pytest.raises(ValueError):
+            FiiListUseCase(fii_repository=mock_fii_repository, **options)
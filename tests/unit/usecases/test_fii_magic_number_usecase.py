@@ -1,14 +1,20 @@
+import json
+from datetime import date
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.libs.http_cache import EncodedBodyCache
 from app.repositories.fii_repository import FiiRepository
+from app.repositories.fii_snapshot_cache import FiiSnapshotCache
 from app.usecases.fii_magic_number_usecase import (
+    FiiMagicNumberTable,
     FiiMagicNumberUseCase,
     MagicNumberResponse,
 )
 from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
 
 
 class TestFiiMagicNumberUseCase:
@@ -59,11 +65,33 @@ class TestFiiMagicNumberUseCase:
         assert len(result) == 1
         assert result[0].ticker == "TEST11"
 
-    def test_calculate_magic_number(self):
-        usecase = FiiMagicNumberUseCase(invested_value=10000)
+    def test_etag_depends_on_data_version_and_invested_value(self, mock_fii_repository):
+        cache = FiiSnapshotCache(fii_repository=mock_fii_repository)
+        cache.load([FiiDomainFactory.build(ticker="TEST11")])
+
+        first = FiiMagicNumberUseCase(invested_value=1000, fii_snapshot_cache=cache).etag()
+        second = FiiMagicNumberUseCase(invested_value=2000, fii_snapshot_cache=cache).etag()
+        historical = FiiMagicNumberUseCase(fii_snapshot_cache=cache, as_of=date(2024, 1, 1)).etag()
+
+        assert first.startswith("magic-") and first != second
+        assert historical is None
+
+    @pytest.mark.asyncio
+    async def test_encoded_serializes_once_per_tag(self, mock_fii_repository):
+        cache = FiiSnapshotCache(fii_repository=mock_fii_repository)
+        cache.load([FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("100"), last_dividend=Decimal("1"))])
+        usecase = FiiMagicNumberUseCase(fii_snapshot_cache=cache, encoded_body_cache=EncodedBodyCache())
+        tag = usecase.etag()
+
+        body = await usecase.encoded(tag)
+
+        assert await usecase.encoded(tag) is body
+        assert json.loads(body.body)[0]["magic_number"] == 100
+
+    def test_table_magic_number(self):
         fii = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("100.0"), last_dividend=Decimal("10.0"))
 
-        result = usecase._calculate_magic_number(fii)
+        result = FiiMagicNumberTable([fii]).responses(10000)[0]
 
         assert result.ticker == "TEST11"
         assert result.magic_number == 10
@@ -71,11 +99,10 @@ class TestFiiMagicNumberUseCase:
         assert result.dividend_for_invested_value == Decimal("1000.0")
         assert result.invested_value == 10000
 
-    def test_calculate_magic_number_with_fractional_values(self):
-        usecase = FiiMagicNumberUseCase(invested_value=15000)
+    def test_table_magic_number_with_fractional_values(self):
         fii = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("120.5"), last_dividend=Decimal("8.25"))
 
-        result = usecase._calculate_magic_number(fii)
+        result = FiiMagicNumberTable([fii]).responses(15000)[0]
 
         assert result.ticker == "TEST11"
         assert result.magic_number == 14
@@ -83,25 +110,94 @@ class TestFiiMagicNumberUseCase:
         assert result.dividend_for_invested_value == Decimal("1023.0")
         assert result.invested_value == 15000
 
-    def test_calculate_magic_number_with_zero_dividend(self):
-        usecase = FiiMagicNumberUseCase(invested_value=10000)
+    def test_table_magic_number_with_zero_dividend(self):
         fii = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("100.0"), last_dividend=Decimal("0.01"))
 
-        result = usecase._calculate_magic_number(fii)
+        result = FiiMagicNumberTable([fii]).responses(10000)[0]
 
         assert result.magic_number == 10000
 
-    def test_calculate_magic_number_with_high_price(self):
-        usecase = FiiMagicNumberUseCase(invested_value=1000)
+    def test_table_magic_number_with_high_price(self):
         fii = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("2000.0"), last_dividend=Decimal("100.0"))
 
-        result = usecase._calculate_magic_number(fii)
+        result = FiiMagicNumberTable([fii]).responses(1000)[0]
 
         assert result.quotas_for_invested_value == 0
         assert result.dividend_for_invested_value == Decimal("0.0")
 
+    def test_table_quotas_up_to_the_largest_invested_value(self):
+        fii = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("0.01"), last_dividend=Decimal("0.001"))
+        table = FiiMagicNumberTable([fii])
+
+        assert table.quotas_for(FiiMagicNumberTable.MAX_INVESTED_VALUE).tolist() == [
+            FiiMagicNumberTable.MAX_INVESTED_VALUE * 100
+        ]
+        with pytest.raises(ValueError):
+            table.quotas_for(FiiMagicNumberTable.MAX_INVESTED_VALUE + 1)
+
     def test_default_invested_value(self, magic_number_usecase_default_value):
         assert magic_number_usecase_default_value.invested_value == 10000
 
     def test_custom_invested_value(self, magic_number_usecase):
         assert magic_number_usecase.invested_value == 10000
+
+    @pytest.mark.asyncio
+    async def test_execute_skips_non_positive_dividends(self, magic_number_usecase, mock_fii_repository):
+        fii = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("100.0"), last_dividend=Decimal("1.0"))
+        zero = FiiDomainFactory.build(ticker="ZERO11", last_price=Decimal("100.0"), last_dividend=Decimal("0"))
+        negative = FiiDomainFactory.build(ticker="NEG11", last_price=Decimal("100.0"), last_dividend=Decimal("-1.0"))
+        mock_fii_repository.list.return_value = [zero, fii, negative]
+
+        result = await magic_number_usecase.execute()
+
+        assert [item.ticker for item in result] == ["TEST11"]
+
+    @pytest.mark.asyncio
+    async def test_execute_reuses_table_until_data_changes(self):
+        fii = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("100.0"), last_dividend=Decimal("1.0"))
+        repository = InMemoryFiiRepository([fii])
+        usecase = FiiMagicNumberUseCase(fii_repository=repository, invested_value=1000)
+
+        first = await usecase.execute()
+        second = await usecase.execute()
+        await repository.add(fii.model_copy(update={"last_price": Decimal("50.0")}))
+        third = await usecase.execute()
+
+        assert first[0] is second[0]
+        assert third[0].quotas_for_invested_value == 20
+        assert third[0].magic_number == 50
+
+    def test_table_quotas_are_exact_for_inexact_float_prices(self):
+        fii = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("100.1"), last_dividend=Decimal("1.0"))
+        table = FiiMagicNumberTable([fii])
+
+        assert table.quotas_for(10010).tolist() == [100]
+        assert table.quotas_for(10009).tolist() == [99]
+        assert table.quotas_for(-5).tolist() == [0]
+
+    def test_table_lru_is_bounded(self):
+        fii = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("10.0"), last_dividend=Decimal("1.0"))
+        table = FiiMagicNumberTable([fii])
+
+        for invested_value in range(FiiMagicNumberTable.CACHE_SIZE + 10):
+            table.responses(invested_value)
+
+        assert len(table._responses) == FiiMagicNumberTable.CACHE_SIZE
+
+    @pytest.mark.asyncio
+    async def test_execute_as_of_uses_the_reconstructed_universe(self):
+        past = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("80.0"), last_dividend=Decimal("1.0"))
+        current = FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("100.0"), last_dividend=Decimal("1.0"))
+        reader = MagicMock()
+        reader.as_of = AsyncMock(return_value=[past])
+        usecase = FiiMagicNumberUseCase(
+            fii_repository=InMemoryFiiRepository([current]),
+            invested_value=1000,
+            as_of=date(2024, 1, 1),
+            fii_timeline_reader=reader,
+        )
+
+        result = await usecase.execute()
+
+        assert result[0].magic_number == 80
+        assert result[0].quotas_for_invested_value == 12
@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.domain.fii_monte_carlo import FiiMonteCarloSimulator
+from app.usecases.fii_monte_carlo_usecase import FiiMonteCarloUseCase, MonteCarloRequest
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_history_repository import InMemoryFiiHistoryRepository
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiMonteCarloUseCase:
+    @pytest.fixture
+    def repository(self):
+        return InMemoryFiiRepository(
+            [
+                FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("10"), last_dividend=Decimal("0.1")),
+                FiiDomainFactory.build(ticker="TEST12", last_price=Decimal("100"), last_dividend=Decimal("1")),
+            ]
+        )
+
+    @pytest.fixture
+    def history(self):
+        return InMemoryFiiHistoryRepository()
+
+    def _usecase(self, repository, history=None, **fields):
+        request = MonteCarloRequest(months=6, paths=200, **fields)
+        return FiiMonteCarloUseCase(
+            request=request,
+            fii_repository=repository,
+            fii_history_repository=history or InMemoryFiiHistoryRepository(),
+            simulator=FiiMonteCarloSimulator(seed=request.seed, max_workers=1),
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_projects_given_positions(self, repository):
+        result = await self._usecase(repository, positions={"test11": 100, "MISSING11": 5}).execute()
+
+        assert result.positions == {"TEST11": 100}
+        assert result.missing_tickers == ["MISSING11"]
+        assert result.current_monthly_income == 10
+        assert [band.percentile for band in result.monthly_income] == [5, 25, 50, 75, 95]
+        assert all(len(band.values) == 6 for band in result.portfolio_value)
+
+    @pytest.mark.asyncio
+    async def test_execute_splits_invested_value_between_tickers(self, repository):
+        result = await self._usecase(repository, tickers=["TEST11", "TEST12"], invested_value=1000).execute()
+
+        assert result.positions == {"TEST11": 50, "TEST12": 5}
+        assert result.current_value == 1000
+
+    @pytest.mark.asyncio
+    async def test_execute_is_reproducible(self, repository):
+        first = await self._usecase(repository, positions={"TEST12": 10}, seed=3).execute()
+        second = await self._usecase(repository, positions={"TEST12": 10}, seed=3).execute()
+
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_execute_without_volatility_is_flat(self, repository):
+        result = await self._usecase(
+            repository, positions={"TEST12": 10}, dividend_volatility=0, price_volatility=0
+        ).execute()
+
+        assert all(value == 10 for band in result.monthly_income for value in band.values)
+
+    @pytest.mark.asyncio
+    async def test_execute_estimates_volatilities_from_history(self, repository, history):
+        fii = FiiDomainFactory.build(ticker="test12", last_price=Decimal("100"), last_dividend=Decimal("1"))
+        now = datetime.now(timezone.utc)
+        for months_ago in range(12, 0, -1):
+            await history.append(fii, now - timedelta(days=30 * months_ago))
+
+        result = await self._usecase(repository, history, positions={"TEST12": 10}).execute()
+
+        # a flat history means no volatility at all instead of the defaults
+        assert all(value == 10 for band in result.monthly_income for value in band.values)
+        assert all(value == 1000 for band in result.portfolio_value for value in band.values)
+
+    @pytest.mark.asyncio
+    async def test_execute_without_history_uses_default_volatilities(self, repository):
+        result = await self._usecase(repository, positions={"TEST12": 10}).execute()
+
+        assert result.monthly_income[0].values[-1] < 10 < result.monthly_income[-1].values[-1]
@@ -0,0 +1,53 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.repositories.fii_screening_view import FiiScreeningResult, FiiScreeningView
+from app.usecases.fii_portfolio_optimizer_usecase import (
+    FiiPortfolioOptimizerUseCase,
+    PortfolioOptimizationRequest,
+)
+from tests.factories.fii_domain_factory import FiiDomainFactory
+
+
+class TestFiiPortfolioOptimizerUseCase:
+    @pytest.fixture
+    def mock_screening_view(self):
+        fiis = [
+            FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("10"), last_dividend=Decimal("0.1")),
+            FiiDomainFactory.build(ticker="TEST12", last_price=Decimal("10"), last_dividend=Decimal("0.2")),
+        ]
+        view = MagicMock(spec=FiiScreeningView)
+        view.passing = AsyncMock(
+            return_value=[FiiScreeningResult(ticker=fii.ticker, passed=True, fii=fii) for fii in fiis]
+        )
+        return view
+
+    @pytest.mark.asyncio
+    async def test_execute_optimizes_screened_universe(self, mock_screening_view):
+        request = PortfolioOptimizationRequest(budget=100)
+        usecase = FiiPortfolioOptimizerUseCase(request=request, fii_screening_view=mock_screening_view)
+
+        result = await usecase.execute()
+
+        assert [(allocation.ticker, allocation.quotas) for allocation in result.allocations] == [("TEST12", 10)]
+        mock_screening_view.passing.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_restricts_to_requested_tickers(self, mock_screening_view):
+        request = PortfolioOptimizationRequest(budget=100, tickers=["test11"])
+        usecase = FiiPortfolioOptimizerUseCase(request=request, fii_screening_view=mock_screening_view)
+
+        result = await usecase.execute()
+
+        assert [allocation.ticker for allocation in result.allocations] == ["TEST11"]
+
+    def test_request_rejects_non_positive_budget(self):
+        with pytest.raises(ValueError):
+            PortfolioOptimizationRequest(budget=0)
+
+    @pytest.mark.parametrize("caps", [{"fii_caps": {"TEST11": -1}}, {"segment_caps": {"logística": -100}}])
+    def test_request_rejects_negative_caps(self, caps):
+        with pytest.raises(ValueError):
+            PortfolioOptimizationRequest(budget=1000, **caps)
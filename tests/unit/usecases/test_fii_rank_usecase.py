@@ -0,0 +1,44 @@
+from decimal import Decimal
+
+import pytest
+
+from app.repositories.fii_snapshot_cache import FiiSnapshotCache
+from app.usecases.fii_rank_usecase import FiiRankUseCase, FiiTopUseCase
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiRankUseCase:
+    @pytest.fixture
+    def repository(self):
+        return InMemoryFiiRepository(
+            [
+                FiiDomainFactory.build(ticker="TEST11", dialy_liquidity=Decimal("1000")),
+                FiiDomainFactory.build(ticker="TEST12", dialy_liquidity=Decimal("3000")),
+            ]
+        )
+
+    @pytest.fixture
+    def cache(self, repository):
+        return FiiSnapshotCache(fii_repository=repository)
+
+    @pytest.mark.asyncio
+    async def test_rank_follows_repository_writes(self, repository, cache):
+        usecase = FiiRankUseCase(ticker="test11", field="dialy_liquidity", fii_snapshot_cache=cache)
+        assert (await usecase.execute()).rank == 2
+
+        await repository.add(FiiDomainFactory.build(ticker="TEST11", dialy_liquidity=Decimal("5000")))
+
+        assert (await usecase.execute()).rank == 1
+
+    @pytest.mark.asyncio
+    async def test_top_returns_the_highest_values(self, cache):
+        result = await FiiTopUseCase(field="dialy_liquidity", k=1, fii_snapshot_cache=cache).execute()
+
+        assert [entry.ticker for entry in result] == ["TEST12"]
+
+    def test_rejects_invalid_arguments(self, cache):
+        with pytest.raises(ValueError):
+            FiiRankUseCase(ticker="TEST11", field="ticker", fii_snapshot_cache=cache)
+        with pytest.raises(ValueError):
+            FiiTopUseCase(field="dy_12", k=0, fii_snapshot_cache=cache)
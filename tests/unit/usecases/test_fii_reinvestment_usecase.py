@@ -0,0 +1,44 @@
+from decimal import Decimal
+
+import pytest
+
+from app.usecases.fii_reinvestment_usecase import FiiReinvestmentUseCase
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiReinvestmentUseCase:
+    @pytest.fixture
+    def repository(self):
+        return InMemoryFiiRepository(
+            [
+                FiiDomainFactory.build(ticker="TEST11", last_price=Decimal("10"), last_dividend=Decimal("0.1")),
+                FiiDomainFactory.build(ticker="TEST12", last_price=Decimal("100"), last_dividend=Decimal("1")),
+                FiiDomainFactory.build(ticker="ZERO11", last_price=Decimal("100"), last_dividend=Decimal("0")),
+            ]
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_projects_every_fii_with_positive_dividend(self, repository):
+        usecase = FiiReinvestmentUseCase(years=2, monthly_contribution=1000, fii_repository=repository)
+
+        result = await usecase.execute()
+
+        assert [projection.ticker for projection in result.fiis] == ["TEST11", "TEST12"]
+        assert all(len(projection.quotas_by_year) == 2 for projection in result.fiis)
+        assert result.fiis[0].months_to_magic_number == 1
+        assert result.portfolio is None
+
+    @pytest.mark.asyncio
+    async def test_execute_portfolio_splits_contributions(self, repository):
+        usecase = FiiReinvestmentUseCase(
+            years=1, monthly_contribution=1000, tickers=["test11", "TEST12", "MISSING11"], fii_repository=repository
+        )
+
+        result = await usecase.execute()
+
+        assert [projection.monthly_contribution for projection in result.fiis] == [500, 500]
+        assert result.missing_tickers == ["MISSING11"]
+        assert result.portfolio.tickers == ["TEST11", "TEST12"]
+        assert len(result.portfolio.monthly_income) == 13
+        assert result.portfolio.total_contributed[-1] == 12000
@@ -4,6 +4,7 @@ import pytest
 
 from app.domain.fii_domain import FiiDomain
 from app.gateways.status_invest_gateway import FiiGateway
+from app.repositories.fii_event_stream import FiiEventStream
 from app.repositories.fii_repository import FiiRepository
 from app.usecases.fii_scrape_usecase import FiiScrapeUseCase
 from tests.factories.fii_domain_factory import FiiDomainFactory
@@ -128,3 +129,48 @@ class TestFiiScrapeUseCase:
 
         assert result is None
         mock_fii_repository.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_with_refresh_scrapes_existing_fiis(
+        self, scrape_usecase, mock_fii_repository, mock_fii_gateway
+    ):
+        refreshed_fii = FiiDomainFactory.build()
+        mock_fii_repository.get.return_value = FiiDomainFactory.build()
+        mock_fii_gateway.get.return_value = refreshed_fii
+
+        result = await scrape_usecase.execute(tickers=["TEST11"], refresh=True)
+
+        assert result == [refreshed_fii]
+        mock_fii_repository.add.assert_called_once_with(refreshed_fii)
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_the_stored_fii(self, scrape_usecase, mock_fii_repository, mock_fii_gateway):
+        existing_fii = FiiDomainFactory.build()
+        mock_fii_repository.get.return_value = existing_fii
+        mock_fii_gateway.get.return_value = None
+
+        result = await scrape_usecase.execute(tickers=["TEST11"], refresh=True)
+
+        assert result == [existing_fii]
+        mock_fii_repository.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_publishes_progress(self, mock_fii_repository, mock_fii_gateway):
+        event_stream = FiiEventStream()
+        queue = event_stream.subscribe()
+        mock_fii_gateway.get.side_effect = [FiiDomainFactory.build(), None]
+        usecase = FiiScrapeUseCase(
+            fii_repository=mock_fii_repository, fii_gateway=mock_fii_gateway, fii_event_stream=event_stream
+        )
+
+        await usecase.execute(tickers=["TEST11", "TEST12"])
+
+        events = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert [(event.state, event.done, event.failed, event.ticker) for event in events] == [
+            ("started", 0, 0, None),
+            ("running", 1, 0, "TEST11"),
+            ("running", 2, 1, "TEST12"),
+            ("finished", 2, 1, None),
+        ]
+        assert len({event.run_id for event in events}) == 1
+        assert all(event.total == 2 for event in events)
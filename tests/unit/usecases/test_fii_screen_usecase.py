@@ -0,0 +1,41 @@
+from decimal import Decimal
+
+import pytest
+
+from app.domain.fii_screen_query import FiiScreenQueryError
+from app.usecases.fii_screen_usecase import FiiScreenUseCase
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiScreenUseCase:
+    @pytest.fixture
+    def repository(self):
+        return InMemoryFiiRepository(
+            [
+                FiiDomainFactory.build(ticker="TEST11", dy_12=Decimal("9.0"), p_vp=Decimal("0.95")),
+                FiiDomainFactory.build(ticker="TEST12", dy_12=Decimal("5.0"), p_vp=Decimal("0.90")),
+                FiiDomainFactory.build(ticker="TEST13", dy_12=Decimal("10.0"), p_vp=Decimal("1.20")),
+            ]
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_matching_fiis(self, repository):
+        usecase = FiiScreenUseCase(query="dy_12 >= 8 order by dy_12 desc", fii_repository=repository)
+
+        result = await usecase.execute()
+
+        assert [fii.ticker for fii in result] == ["TEST13", "TEST11"]
+
+    @pytest.mark.asyncio
+    async def test_execute_reflects_repository_writes(self, repository):
+        usecase = FiiScreenUseCase(query="p_vp < 1 and dy_12 >= 8", fii_repository=repository)
+        await usecase.execute()
+
+        await repository.add(FiiDomainFactory.build(ticker="TEST14", dy_12=Decimal("8.5"), p_vp=Decimal("0.85")))
+
+        assert [fii.ticker for fii in await usecase.execute()] == ["TEST11", "TEST14"]
+
+    def test_invalid_query_raises(self, repository):
+        with pytest.raises(FiiScreenQueryError):
+            FiiScreenUseCase(query="dy_12 >>> 8", fii_repository=repository)
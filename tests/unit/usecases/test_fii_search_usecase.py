@@ -0,0 +1,37 @@
+import pytest
+
+from app.repositories.fii_snapshot_cache import FiiSnapshotCache
+from app.usecases.fii_search_usecase import FiiSearchUseCase
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiSearchUseCase:
+    @pytest.fixture
+    def repository(self):
+        return InMemoryFiiRepository([FiiDomainFactory.build(ticker="HGLG11"), FiiDomainFactory.build(ticker="HGRE11")])
+
+    @pytest.fixture
+    def cache(self, repository):
+        return FiiSnapshotCache(fii_repository=repository)
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_ranked_matches(self, cache):
+        result = await FiiSearchUseCase("hglg11", fii_snapshot_cache=cache).execute()
+
+        assert result[0].ticker == "HGLG11"
+        assert result[0].match == "exact"
+
+    @pytest.mark.asyncio
+    async def test_new_tickers_become_searchable_on_write(self, repository, cache):
+        await FiiSearchUseCase("hglg", fii_snapshot_cache=cache).execute()
+
+        await repository.add(FiiDomainFactory.build(ticker="HGLG12"))
+
+        result = await FiiSearchUseCase("hglg", fii_snapshot_cache=cache).execute()
+        assert [match.ticker for match in result] == ["HGLG11", "HGLG12"]
+
+    @pytest.mark.parametrize("q,limit", [(" ", 10), ("hg", 0), ("hg", FiiSearchUseCase.MAX_LIMIT + 1)])
+    def test_invalid_arguments(self, cache, q, limit):
+        with pytest.raises(ValueError):
+            FiiSearchUseCase(q, limit=limit, fii_snapshot_cache=cache)
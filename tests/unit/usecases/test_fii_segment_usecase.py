@@ -0,0 +1,33 @@
+from decimal import Decimal
+
+import pytest
+
+from app.repositories.fii_snapshot_cache import FiiSnapshotCache
+from app.usecases.fii_segment_usecase import FiiSegmentUseCase
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+class TestFiiSegmentUseCase:
+    @pytest.mark.asyncio
+    async def test_execute_returns_segment_summaries(self):
+        repository = InMemoryFiiRepository(
+            [FiiDomainFactory.build(ticker="TEST11", segment="Papéis", dy_12=Decimal("10"))]
+        )
+
+        result = await FiiSegmentUseCase(FiiSnapshotCache(fii_repository=repository)).execute()
+
+        assert [(summary.segment, summary.count, summary.mean_dy) for summary in result] == [("papéis", 1, 10)]
+
+    @pytest.mark.asyncio
+    async def test_execute_follows_changed_writes(self):
+        fii = FiiDomainFactory.build(ticker="TEST11", segment="Papéis", dy_12=Decimal("10"))
+        repository = InMemoryFiiRepository([fii])
+        usecase = FiiSegmentUseCase(FiiSnapshotCache(fii_repository=repository))
+        first = await usecase.execute()
+
+        await repository.add(fii.model_copy())
+        assert await usecase.execute() is first
+
+        await repository.add(fii.model_copy(update={"segment": "Logística"}))
+        assert [(summary.segment, summary.count) for summary in await usecase.execute()] == [("logística", 1)]
@@ -0,0 +1,52 @@
+from decimal import Decimal
+
+import pytest
+
+from app.repositories.fii_snapshot_cache import FiiSnapshotCache
+from app.usecases.fii_similar_usecase import FiiSimilarUseCase
+from tests.factories.fii_domain_factory import FiiDomainFactory
+from tests.fakes.in_memory_fii_repository import InMemoryFiiRepository
+
+
+def _fii(ticker: str, dy_12: str):
+    # every feature but the DY is pinned, so the DY alone decides the order
+    return FiiDomainFactory.build(
+        ticker=ticker,
+        segment="Papéis",
+        dy_12=Decimal(dy_12),
+        p_vp=Decimal("1"),
+        dialy_liquidity=Decimal("1000"),
+        last_12_month_evaluation=Decimal("0"),
+        current_month_evaluation=Decimal("0"),
+    )
+
+
+class TestFiiSimilarUseCase:
+    @pytest.fixture
+    def cache(self):
+        return FiiSnapshotCache(
+            fii_repository=InMemoryFiiRepository([_fii("TEST11", "10"), _fii("TEST12", "11"), _fii("TEST13", "15")])
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_nearest_fiis(self, cache):
+        result = await FiiSimilarUseCase(ticker="test11", k=2, fii_snapshot_cache=cache).execute()
+
+        assert [similar.ticker for similar in result] == ["TEST12", "TEST13"]
+
+    @pytest.mark.asyncio
+    async def test_lowercase_stored_tickers_are_found(self):
+        cache = FiiSnapshotCache(fii_repository=InMemoryFiiRepository([_fii("hglg11", "10"), _fii("knri11", "11")]))
+
+        result = await FiiSimilarUseCase(ticker="HGLG11", k=1, fii_snapshot_cache=cache).execute()
+
+        assert [similar.ticker for similar in result] == ["knri11"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_ticker_returns_none(self, cache):
+        assert await FiiSimilarUseCase(ticker="MISSING11", fii_snapshot_cache=cache).execute() is None
+
+    @pytest.mark.parametrize("k", [0, FiiSimilarUseCase.MAX_K + 1])
+    def test_rejects_invalid_k(self, cache, k):
+        with pytest.raises(ValueError):
+            FiiSimilarUseCase(ticker="TEST11", k=k, fii_snapshot_cache=cache)